@@ -0,0 +1,609 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import io
+import logging
+import os
+import time
+import urllib.parse
+import uuid
+import weakref
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import Unpack
+
+from azure.core.credentials import AccessToken, AzureSasCredential, TokenCredential
+from azure.core.credentials_async import AsyncTokenCredential
+import azure.core.exceptions
+import azure.storage.blob
+import azure.storage.blob.aio
+from azure.storage.blob._shared.response_handlers import process_storage_error
+from azure.core.pipeline.transport import AsyncHttpTransport
+
+from azstoragetorch import _client
+
+
+_LOGGER = logging.getLogger(__name__)
+
+ASYNC_SDK_CREDENTIAL_TYPE = Optional[
+    Union[
+        AzureSasCredential,
+        AsyncTokenCredential,
+    ]
+]
+AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = Union[
+    ASYNC_SDK_CREDENTIAL_TYPE, TokenCredential, Literal[False]
+]
+STAGE_BLOCK_TASK_TYPE = asyncio.Task[str]
+_SUBMIT_RESULT_TYPE = TypeVar("_SUBMIT_RESULT_TYPE")
+_RETRY_RESULT_TYPE = TypeVar("_RETRY_RESULT_TYPE")
+
+
+class AsyncBlobClientKwargsType(TypedDict, total=False):
+    max_in_flight_requests: int
+    partition_planner: _client.PartitionPlanner
+    retry_policy: _client.RetryPolicy
+
+
+def _get_aiohttp_transport_cls() -> type:
+    try:
+        from azure.core.pipeline.transport import AioHttpTransport
+    except ImportError as e:
+        raise ImportError(
+            "The aiohttp package is required for asynchronous access to Azure Blob Storage. "
+            'Install it with: pip install "azstoragetorch[aio]"'
+        ) from e
+    return AioHttpTransport
+
+
+class _AsyncTokenCredentialAdapter:
+    # Allows synchronous token credentials (e.g., azure.identity.DefaultAzureCredential) to be used
+    # with the SDK's asyncio clients. Retrieving a token may block on network requests, so it is done
+    # from a worker thread instead of the event loop.
+    def __init__(self, credential: TokenCredential):
+        self._credential = credential
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        return await asyncio.to_thread(self._credential.get_token, *scopes, **kwargs)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "_AsyncTokenCredentialAdapter":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class AsyncAzStorageTorchBlobClientFactory(
+    _client._BaseAzStorageTorchBlobClientFactory
+):
+    # Unlike requests sessions, aiohttp sessions can only be used from the event loop they were
+    # created in. So instead of using the process-wide connection pools, each factory lazily creates
+    # its own transport, which is shared by all clients from the factory, and closes it in close().
+    _SOCKET_CONNECTION_TIMEOUT = 20
+    _SOCKET_READ_TIMEOUT = 60
+    _CONNECTION_DATA_BLOCK_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        credential: AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+        transport: Optional[AsyncHttpTransport] = None,
+    ):
+        if transport is None:
+            # Checked up front as the default credential also requires aiohttp.
+            _get_aiohttp_transport_cls()
+        super().__init__(self._get_sdk_credential(credential))
+        # Only credentials and transports created by the factory are closed by it.
+        self._owns_credential = credential is None
+        self._owns_transport = transport is None
+        self._transport = transport
+
+    def get_blob_client_from_url(
+        self, blob_url: str, **client_kwargs: Unpack[AsyncBlobClientKwargsType]
+    ) -> "AsyncAzStorageTorchBlobClient":
+        blob_sdk_client = self._get_sdk_blob_client_from_url(blob_url)
+        return AsyncAzStorageTorchBlobClient(blob_sdk_client, **client_kwargs)
+
+    async def yield_blob_clients_from_container_url(
+        self, container_url: str, prefix: Optional[str] = None
+    ) -> AsyncIterator["AsyncAzStorageTorchBlobClient"]:
+        container_sdk_client = self._get_sdk_container_client_from_container_url(
+            container_url
+        )
+        blob_names = container_sdk_client.list_blob_names(name_starts_with=prefix)
+        async for blob_name in blob_names:
+            blob_client = container_sdk_client.get_blob_client(blob_name)
+            # Throwaway the blob client for it's URL so that the blob client is created
+            # the same way as any other blob client from the factory (e.g., reusing the
+            # factory's cached pipeline).
+            yield self.get_blob_client_from_url(blob_client.url)
+
+    async def close(self) -> None:
+        if self._owns_transport and self._transport is not None:
+            await self._transport.close()
+        self._transport = None
+        if self._owns_credential and self._sdk_credential is not None:
+            await self._sdk_credential.close()
+
+    def _get_sdk_credential(
+        self, credential: AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE
+    ) -> ASYNC_SDK_CREDENTIAL_TYPE:
+        if credential is False:
+            return None
+        if credential is None:
+            from azure.identity.aio import DefaultAzureCredential
+
+            return DefaultAzureCredential()
+        # Asynchronous credentials also satisfy the synchronous credential protocol, so they
+        # must be checked for first.
+        if isinstance(credential, (AzureSasCredential, AsyncTokenCredential)):
+            return credential
+        if isinstance(credential, TokenCredential):
+            return _AsyncTokenCredentialAdapter(credential)
+        raise TypeError(f"Unsupported credential: {type(credential)}")
+
+    def _get_transport(self, resource_url: str) -> AsyncHttpTransport:
+        if self._transport is None:
+            self._transport = _get_aiohttp_transport_cls()(
+                connection_timeout=self._SOCKET_CONNECTION_TIMEOUT,
+                read_timeout=self._SOCKET_READ_TIMEOUT,
+                connection_data_block_size=self._CONNECTION_DATA_BLOCK_SIZE,
+            )
+        return self._transport
+
+    def _get_sdk_blob_client_from_url(
+        self, blob_url: str
+    ) -> azure.storage.blob.aio.BlobClient:
+        client = azure.storage.blob.aio.BlobClient.from_blob_url(
+            blob_url,
+            **self._get_sdk_blob_client_kwargs(blob_url),
+        )
+        self._cache_pipeline_if_needed(client, blob_url)
+        return client
+
+    def _get_sdk_container_client_from_container_url(
+        self, container_url: str
+    ) -> azure.storage.blob.aio.ContainerClient:
+        return azure.storage.blob.aio.ContainerClient.from_container_url(
+            container_url,
+            **self._get_sdk_client_kwargs(container_url),
+        )
+
+
+class AsyncBlobClientFactoryCache:
+    # Counterpart of BlobClientFactoryCache for asyncio clients. Factories are cached per running
+    # event loop, keyed by account and credential, since their transports can only be used from the
+    # loop they were created in. A loop's factories are closed when the loop shuts down its
+    # asynchronous generators (e.g., when asyncio.run() returns) so that connections are not leaked.
+    def __init__(self) -> None:
+        self._factories: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            Dict[Tuple[str, int], AsyncAzStorageTorchBlobClientFactory],
+        ] = weakref.WeakKeyDictionary()
+        self._closers: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncGenerator[None, None]
+        ] = weakref.WeakKeyDictionary()
+
+    def get_blob_client_from_url(
+        self,
+        blob_url: str,
+        credential: AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+        **client_kwargs: Unpack[AsyncBlobClientKwargsType],
+    ) -> "AsyncAzStorageTorchBlobClient":
+        return self.get_factory(blob_url, credential).get_blob_client_from_url(
+            blob_url, **client_kwargs
+        )
+
+    def get_factory(
+        self,
+        resource_url: str,
+        credential: AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+    ) -> AsyncAzStorageTorchBlobClientFactory:
+        # Only accessed from the thread running the loop, so no lock is needed.
+        loop = asyncio.get_running_loop()
+        factories = self._factories.get(loop)
+        if factories is None:
+            factories = {}
+            self._factories[loop] = factories
+            self._close_factories_on_loop_shutdown(loop, factories)
+        key = (urllib.parse.urlparse(resource_url).netloc.lower(), id(credential))
+        if key not in factories:
+            factories[key] = AsyncAzStorageTorchBlobClientFactory(credential=credential)
+        return factories[key]
+
+    def reset(self) -> None:
+        self._factories = weakref.WeakKeyDictionary()
+        self._closers = weakref.WeakKeyDictionary()
+
+    def _close_factories_on_loop_shutdown(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        factories: Dict[Tuple[str, int], AsyncAzStorageTorchBlobClientFactory],
+    ) -> None:
+        # Event loops track the asynchronous generators started in them and close any still open
+        # when shutting down. So a generator that closes the factories when it exits is started and
+        # left suspended for the lifetime of the loop.
+        closer = self._close_factories(factories)
+        self._closers[loop] = closer
+        asyncio.ensure_future(closer.__anext__())
+
+    async def _close_factories(
+        self,
+        factories: Dict[Tuple[str, int], AsyncAzStorageTorchBlobClientFactory],
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            for factory in list(factories.values()):
+                await factory.close()
+            factories.clear()
+
+
+ASYNC_BLOB_CLIENT_FACTORY_CACHE = AsyncBlobClientFactoryCache()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ASYNC_BLOB_CLIENT_FACTORY_CACHE.reset)
+
+
+async def _empty_download_stream() -> AsyncIterator[bytes]:
+    yield b""
+
+
+class AsyncAzStorageTorchBlobClient(_client._BaseAzStorageTorchBlobClient):
+    # Counterpart of AzStorageTorchBlobClient that performs transfers as coroutines on the running
+    # event loop instead of on threads. Downloads are partitioned and resumed, and requests are
+    # retried, the same way as the synchronous client. Hedging, speculative partitions, bandwidth
+    # pacing and fast downloads are specific to the threaded transport and are not supported.
+    _sdk_blob_client: azure.storage.blob.aio.BlobClient
+
+    def __init__(
+        self,
+        sdk_blob_client: azure.storage.blob.aio.BlobClient,
+        max_in_flight_requests: Optional[int] = None,
+        partition_planner: Optional[_client.PartitionPlanner] = None,
+        retry_policy: Optional[_client.RetryPolicy] = None,
+    ):
+        super().__init__(sdk_blob_client, partition_planner, retry_policy)
+        self._max_in_flight_requests = max_in_flight_requests
+        self._in_flight_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def get_blob_size(self) -> int:
+        return (await self._get_blob_properties()).size
+
+    async def download(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        initial_content = b""
+        if self._blob_properties is None:
+            initial_content = await self._download_from_unknown_blob_size(
+                offset, length
+            )
+            offset = len(initial_content) + offset
+            if length is not None:
+                length = length - len(initial_content)
+            if not self._more_to_download(offset, length):
+                return initial_content
+        length = await self._update_download_length_from_blob_size(offset, length)
+        if length <= 0:
+            return initial_content
+        partitions = self._plan_download_partitions(offset, length)
+        if len(partitions) == 1 and not initial_content:
+            return await self._download_with_retries(offset, length)
+        # Like the client in _client.py, the content is allocated once by a BytesIO so that
+        # getvalue() can return it without copying it.
+        content = self._allocate_download_content(initial_content, length)
+        view = content.getbuffer()
+        try:
+            written = await self._download_partitions_into(
+                view[len(initial_content) :], offset, partitions
+            )
+        finally:
+            view.release()
+        if written < length:
+            return content.getvalue()[: len(initial_content) + written]
+        return content.getvalue()
+
+    async def download_into(
+        self,
+        buffer: _client.SUPPORTED_READ_INTO_BUFFER_TYPE,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> int:
+        view = self._get_writable_view(buffer)
+        if length is None:
+            length = len(view)
+        if length > len(view):
+            raise ValueError(
+                f"Length: {length} is larger than the provided buffer size: {len(view)}"
+            )
+        view = view[:length]
+        written = 0
+        if self._blob_properties is None:
+            written = await self._download_into_from_unknown_blob_size(view, offset)
+            if not self._more_to_download(offset + written, length - written):
+                return written
+        remaining = await self._update_download_length_from_blob_size(
+            offset + written, length - written
+        )
+        if remaining <= 0:
+            return written
+        written += await self._download_into(
+            view[written : written + remaining], offset + written
+        )
+        return written
+
+    async def stage_blocks(
+        self, data: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE
+    ) -> List[STAGE_BLOCK_TASK_TYPE]:
+        # Returns once all blocks are submitted, which waits for in-flight requests to complete
+        # when the limit is reached so that the amount of data waiting to be uploaded is bounded.
+        if not data:
+            raise ValueError("Data must not be empty.")
+        tasks = []
+        for pos, length in self._get_stage_block_partitions(data):
+            tasks.append(
+                await self._submit(self._stage_block, data[pos : pos + length])
+            )
+        return tasks
+
+    async def commit_block_list(self, block_ids: List[str]) -> None:
+        blob_blocks = [azure.storage.blob.BlobBlock(block_id) for block_id in block_ids]
+        await self._sdk_blob_client.commit_block_list(blob_blocks)
+
+    def _get_concurrency(self) -> int:
+        if self._max_in_flight_requests is not None:
+            return self._max_in_flight_requests
+        return _client.IO_SCHEDULER.get_concurrency(self._get_account())
+
+    def _plan_download_partitions(
+        self, offset: int, length: int
+    ) -> List[Tuple[int, int]]:
+        return self._get_partition_planner().plan(
+            offset, length, self._get_concurrency()
+        )
+
+    async def _get_blob_properties(self) -> azure.storage.blob.BlobProperties:
+        if self._blob_properties is None:
+            self._blob_properties = await self._sdk_blob_client.get_blob_properties()
+        return self._blob_properties
+
+    async def _update_download_length_from_blob_size(
+        self, offset: int, length: Optional[int] = None
+    ) -> int:
+        length_from_offset = await self.get_blob_size() - offset
+        if length is not None:
+            return min(length, length_from_offset)
+        return length_from_offset
+
+    async def _submit(
+        self,
+        fn: Callable[..., Awaitable[_SUBMIT_RESULT_TYPE]],
+        /,
+        *args,
+    ) -> "asyncio.Task[_SUBMIT_RESULT_TYPE]":
+        # Similar to IOScheduler.submit(), waits for an in-flight slot before starting the request
+        # so that the number of concurrent requests made by the client is bounded.
+        if self._in_flight_semaphore is None:
+            self._in_flight_semaphore = asyncio.Semaphore(self._get_concurrency())
+        semaphore = self._in_flight_semaphore
+        await semaphore.acquire()
+        try:
+            task = asyncio.ensure_future(fn(*args))
+        except BaseException:
+            semaphore.release()
+            raise
+        task.add_done_callback(lambda _: semaphore.release())
+        return task
+
+    async def _download_into(self, buffer: memoryview, offset: int) -> int:
+        partitions = self._plan_download_partitions(offset, len(buffer))
+        return await self._download_partitions_into(buffer, offset, partitions)
+
+    async def _download_partitions_into(
+        self, buffer: memoryview, offset: int, partitions: List[Tuple[int, int]]
+    ) -> int:
+        if len(partitions) == 1:
+            return await self._download_into_with_retries(buffer, offset)
+        return await self._partitioned_download_into(buffer, offset, partitions)
+
+    async def _partitioned_download_into(
+        self, buffer: memoryview, offset: int, partitions: List[Tuple[int, int]]
+    ) -> int:
+        tasks: List[asyncio.Task[int]] = []
+        errors: List[BaseException] = []
+
+        def record_error(task: asyncio.Task[int]) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())  # type: ignore[arg-type]
+
+        try:
+            for pos, length in partitions:
+                if errors:
+                    # Stop submitting partitions once one has failed.
+                    raise errors[0]
+                buffer_pos = pos - offset
+                task = await self._submit(
+                    self._download_into_with_retries,
+                    buffer[buffer_pos : buffer_pos + length],
+                    pos,
+                )
+                task.add_done_callback(record_error)
+                tasks.append(task)
+            return sum(await asyncio.gather(*tasks))
+        except BaseException:
+            # Stop any partitions still in progress and wait for them so that none are
+            # writing into the buffer once the download returns.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _download_from_unknown_blob_size(
+        self, offset: int, length: Optional[int] = None
+    ) -> bytes:
+        # Only the first planned range is requested as speculative partitions are not supported.
+        pos, first_length = self._get_partition_planner().plan_unknown_size(
+            offset, length
+        )[0]
+        return await self._download_with_retries(pos, first_length)
+
+    async def _download_into_from_unknown_blob_size(
+        self, buffer: memoryview, offset: int
+    ) -> int:
+        _, first_length = self._get_partition_planner().plan_unknown_size(
+            offset, len(buffer)
+        )[0]
+        return await self._download_into_with_retries(buffer[:first_length], offset)
+
+    async def _download_with_retries(
+        self, pos: int, length: int, set_blob_properties: bool = True
+    ) -> bytes:
+        content = io.BytesIO()
+
+        def write_chunk(chunk_pos: int, chunk: bytes) -> None:
+            content.write(chunk)
+
+        await self._call_with_download_retries(
+            pos, length, write_chunk, set_blob_properties
+        )
+        return content.getvalue()
+
+    async def _download_into_with_retries(
+        self, buffer: memoryview, pos: int, set_blob_properties: bool = True
+    ) -> int:
+        def write_chunk(chunk_pos: int, chunk: bytes) -> None:
+            buffer[chunk_pos : chunk_pos + len(chunk)] = chunk
+
+        return await self._call_with_download_retries(
+            pos, len(buffer), write_chunk, set_blob_properties
+        )
+
+    async def _call_with_download_retries(
+        self,
+        pos: int,
+        length: int,
+        write_chunk: Callable[[int, bytes], None],
+        set_blob_properties: bool = True,
+    ) -> int:
+        # Same as AzStorageTorchBlobClient._call_with_download_retries(): interrupted downloads are
+        # resumed from the last received byte with requests conditioned on the blob's ETag.
+        retry_policy = self._get_retry_policy()
+        account = self._get_account()
+        received = 0
+        attempt = 0
+        while True:
+            start_time = time.monotonic()
+            attempt_start = received
+            try:
+                stream = await self._get_download_stream(
+                    pos + received, length - received, set_blob_properties
+                )
+                blob_size = self._get_blob_size_from_download(stream)
+                if blob_size is not None:
+                    length = min(length, blob_size - pos)
+                async for chunk in stream:
+                    write_chunk(received, chunk)
+                    received += len(chunk)
+            except azure.core.exceptions.AzureError as e:
+                if received and received >= length:
+                    return received
+                if retry_policy.is_throttling_error(e):
+                    _client.IO_SCHEDULER.record_throttled(account)
+                backoff_time = retry_policy.get_retry_delay(account, e, attempt)
+                if backoff_time is None:
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "Sleeping %s seconds and resuming download at byte %s from caught exception (retry stats: %s).",
+                    backoff_time,
+                    pos + received,
+                    retry_policy.get_stats(account),
+                    exc_info=True,
+                )
+                await asyncio.sleep(backoff_time)
+                continue
+            retry_policy.record_success(account)
+            elapsed_time = time.monotonic() - start_time
+            self._get_partition_planner().record_throughput(
+                received - attempt_start, elapsed_time
+            )
+            _client.IO_SCHEDULER.record_transfer(
+                account, received - attempt_start, elapsed_time
+            )
+            return received
+
+    async def _call_with_retries(
+        self,
+        fn: Callable[[], Awaitable[_RETRY_RESULT_TYPE]],
+        num_bytes: int = 0,
+    ) -> _RETRY_RESULT_TYPE:
+        retry_policy = self._get_retry_policy()
+        account = self._get_account()
+        attempt = 0
+        while True:
+            start_time = time.monotonic()
+            try:
+                result = await fn()
+            except azure.core.exceptions.AzureError as e:
+                if retry_policy.is_throttling_error(e):
+                    _client.IO_SCHEDULER.record_throttled(account)
+                backoff_time = retry_policy.get_retry_delay(account, e, attempt)
+                if backoff_time is None:
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "Sleeping %s seconds and retrying request from caught exception (retry stats: %s).",
+                    backoff_time,
+                    retry_policy.get_stats(account),
+                    exc_info=True,
+                )
+                await asyncio.sleep(backoff_time)
+                continue
+            retry_policy.record_success(account)
+            _client.IO_SCHEDULER.record_transfer(
+                account, num_bytes, time.monotonic() - start_time
+            )
+            return result
+
+    async def _get_download_stream(
+        self, pos: int, length: int, set_blob_properties: bool = True
+    ) -> AsyncIterator[bytes]:
+        try:
+            response = await self._generated_sdk_storage_client.blob.download(
+                **self._get_download_kwargs(pos, length)
+            )
+            if self._blob_properties is None and set_blob_properties:
+                self._set_blob_properties_from_download(response)
+            return response
+        except azure.core.exceptions.HttpResponseError as e:
+            if self._set_empty_blob_properties_if_needed(e, set_blob_properties):
+                return _empty_download_stream()
+            process_storage_error(e)
+
+    async def _stage_block(self, data: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> str:
+        block_id = str(uuid.uuid4())
+
+        async def stage_block() -> None:
+            # The SDK annotates data as AnyStr, which excludes the other bytes-like types accepted.
+            await self._sdk_blob_client.stage_block(block_id, data, retry_total=0)  # type: ignore[type-var]
+
+        # Staging a block with the same ID again overwrites it, so failed requests can be retried.
+        await self._call_with_retries(stage_block, len(data))
+        return block_id
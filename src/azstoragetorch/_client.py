@@ -4,28 +4,53 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import collections
 import concurrent.futures
+import datetime
+import email.utils
 import functools
+import http.client
 import io
+import itertools
 import logging
 import math
 import os
 import random
+import socket
 import threading
 import time
 import urllib.parse
 import uuid
 from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
     Optional,
     List,
     Tuple,
     Iterator,
     Union,
     Literal,
+    NamedTuple,
+    NoReturn,
     TypedDict,
+    TypeVar,
 )
 
+from typing_extensions import Buffer, Unpack
+
+import requests
+import requests.adapters
+import requests.utils
+import urllib3.connection
+import urllib3.exceptions
+import urllib3.util
+
 from azure.core.credentials import (
+    AccessToken,
     AzureSasCredential,
     TokenCredential,
 )
@@ -33,10 +58,19 @@ import azure.core.exceptions
 from azure.identity import DefaultAzureCredential
 import azure.storage.blob
 import azure.storage.blob._generated.models
+import azure.storage.blob.aio
 from azure.storage.blob._shared.response_handlers import process_storage_error
-from azure.core.pipeline import Pipeline
+from azure.core.pipeline import AsyncPipeline, Pipeline
 from azure.core.pipeline.policies import SansIOHTTPPolicy
-from azure.core.pipeline.transport import RequestsTransport
+from azure.core.pipeline.transport import (
+    AsyncHttpTransport,
+    HttpRequest,
+    RequestsTransport,
+)
+from azure.core.pipeline.transport._bigger_block_size_http_adapters import (
+    BiggerBlockSizeHTTPAdapter,
+)
+from azure.core.pipeline.transport._requests_basic import RequestsTransportResponse
 
 from azstoragetorch._version import __version__
 from azstoragetorch.exceptions import ClientRequestIdMismatchError
@@ -52,29 +86,50 @@ SDK_CREDENTIAL_TYPE = Optional[
 ]
 AZSTORAGETORCH_CREDENTIAL_TYPE = Union[SDK_CREDENTIAL_TYPE, Literal[False]]
 SUPPORTED_WRITE_BYTES_LIKE_TYPE = Union[bytes, bytearray, memoryview]
+# Any object exposing a writable buffer (e.g., bytearray, memoryview, mmap.mmap, numpy.ndarray)
+# can be downloaded into. Writability is validated at runtime as it is not expressible in the type.
+SUPPORTED_READ_INTO_BUFFER_TYPE = Buffer
 STAGE_BLOCK_FUTURE_TYPE = concurrent.futures.Future[str]
+DOWNLOAD_FUTURE_TYPE = concurrent.futures.Future[bytes]
+_READ_STREAM_RESULT_TYPE = TypeVar("_READ_STREAM_RESULT_TYPE", bytes, int)
+_SUBMIT_RESULT_TYPE = TypeVar("_SUBMIT_RESULT_TYPE")
+_PARTITION_RESULT_TYPE = TypeVar("_PARTITION_RESULT_TYPE")
+_RETRY_RESULT_TYPE = TypeVar("_RETRY_RESULT_TYPE")
+_ERROR_CLASS_TYPE = Literal["throttling", "transient", "fatal"]
+IO_PRIORITY_TYPE = Literal["interactive", "bulk"]
 
 
 class SDKKwargsType(TypedDict, total=False):
     connection_data_block_size: int
-    transport: RequestsTransport
+    transport: Union[RequestsTransport, AsyncHttpTransport]
     user_agent: str
-    credential: SDK_CREDENTIAL_TYPE
+    credential: Any
     _additional_pipeline_policies: List[SansIOHTTPPolicy]
-    _pipeline: Pipeline
+    _pipeline: Union[Pipeline, AsyncPipeline]
+    version_id: str
+
+
+class BlobClientKwargsType(TypedDict, total=False):
+    partition_planner: "PartitionPlanner"
+    request_hedger: "RequestHedger"
+    retry_policy: "RetryPolicy"
+    bandwidth_limiter: "BandwidthLimiter"
+    fast_download_transport: "FastDownloadTransport"
 
 
 class DownloadKwargsType(TypedDict, total=False):
     range: str
+    retry_total: int
     modified_access_conditions: (
         azure.storage.blob._generated.models.ModifiedAccessConditions
     )
+    version_id: str
 
 
-# Policy to ensure that request made by the client matches responses returned. This
-# is an extra guard rail to ensure when using an azstoragetorch interface with processes
-# customers will not successfully process a response from a different request because
-# the underlying connection resource was shared as part of forking:
+# Policy to ensure that request made by the client matches responses returned. Connection
+# pools are rebuilt in forked child processes (see ConnectionPoolManager), so connections
+# should never be shared across processes. This is an extra guard rail to ensure that, if they
+# ever are, customers will not successfully process a response from a different request:
 # https://github.com/psf/requests/issues/4323
 #
 # The SDK has a policy that injects the client request ID but does not validate it echoes
@@ -103,94 +158,244 @@ class EchoClientRequestIdPolicy(SansIOHTTPPolicy):
             )
 
 
-class AzStorageTorchBlobClientFactory:
+def _get_partitions(
+    offset: int, length: int, partition_size: int
+) -> List[Tuple[int, int]]:
+    end = offset + length
+    num_partitions = math.ceil(length / partition_size)
+    partitions = []
+    for i in range(num_partitions):
+        start = offset + i * partition_size
+        if start >= end:
+            break
+        size = min(partition_size, end - start)
+        partitions.append((start, size))
+    return partitions
+
+
+def _get_cpu_count() -> int:
+    # Number of CPUs available to the process, accounting for CPU quotas set through cgroups (e.g.,
+    # the CPU limit of a Kubernetes pod), which are not reflected in os.cpu_count().
+    cpu_count_fn = getattr(os, "process_cpu_count", os.cpu_count)
+    cpu_count = cpu_count_fn() or 1
+    cgroup_cpu_quota = _get_cgroup_cpu_quota()
+    if cgroup_cpu_quota is not None:
+        cpu_count = min(cpu_count, max(math.ceil(cgroup_cpu_quota), 1))
+    return cpu_count
+
+
+def _get_cgroup_cpu_quota() -> Optional[float]:
+    try:
+        # cgroup v2
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = f.read().strip()
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = f.read().strip()
+        if int(quota) <= 0:
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        return None
+
+
+class _KeepAliveHTTPAdapter(BiggerBlockSizeHTTPAdapter):
+    # Enables TCP keepalive on pooled connections. Connections commonly sit idle between batches
+    # (e.g., while a training step runs), and, without keepalive probes, NATs and load balancers
+    # silently drop idle connections, which are then only found to be dead when reused.
+    _KEEPALIVE_IDLE_SECONDS = 60
+    _KEEPALIVE_INTERVAL_SECONDS = 15
+    _KEEPALIVE_PROBE_COUNT = 4
+
+    def init_poolmanager(self, *args, **pool_kwargs) -> None:
+        pool_kwargs.setdefault("socket_options", self._get_socket_options())
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def _get_socket_options(self) -> List[Tuple[int, int, int]]:
+        socket_options = list(urllib3.connection.HTTPConnection.default_socket_options)
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Not all platforms support tuning the probes (e.g., TCP_KEEPIDLE is not available
+        # on macOS), in which case the system defaults are used.
+        for option_name, value in (
+            ("TCP_KEEPIDLE", self._KEEPALIVE_IDLE_SECONDS),
+            ("TCP_KEEPINTVL", self._KEEPALIVE_INTERVAL_SECONDS),
+            ("TCP_KEEPCNT", self._KEEPALIVE_PROBE_COUNT),
+        ):
+            if hasattr(socket, option_name):
+                socket_options.append(
+                    (socket.IPPROTO_TCP, getattr(socket, option_name), value)
+                )
+        return socket_options
+
+
+class ConnectionPoolManager:
+    # Process-wide transports keyed by account. Each transport's connection pool is sized to the
+    # number of requests that can be in flight at once. Otherwise, connections opened beyond the
+    # default pool size of 10 are discarded once their request completes and the next request pays
+    # for a new connection and TLS handshake.
+    #
     # Socket timeouts set to match the default timeouts in Python SDK
     _SOCKET_CONNECTION_TIMEOUT = 20
     _SOCKET_READ_TIMEOUT = 60
     _CONNECTION_DATA_BLOCK_SIZE = 256 * 1024
+    # Extra pooled connections for requests made outside of the IO scheduler (e.g., the first
+    # download of a BlobIO, which is made from the thread reading it).
+    _POOL_SIZE_HEADROOM = 4
 
-    def __init__(
-        self,
-        credential: AZSTORAGETORCH_CREDENTIAL_TYPE = None,
-    ):
-        self._sdk_credential = self._get_sdk_credential(credential)
-        self._transport = self._get_transport()
-        self._pipeline: Optional[Pipeline] = None
+    def __init__(self, pool_size: Optional[int] = None):
+        self._configured_pool_size = pool_size
+        self._pool_size = pool_size
+        self._lock = threading.Lock()
+        self._transports: Dict[str, RequestsTransport] = {}
 
-    def get_blob_client_from_url(self, blob_url: str) -> "AzStorageTorchBlobClient":
-        blob_sdk_client = self._get_sdk_blob_client_from_url(blob_url)
-        return AzStorageTorchBlobClient(blob_sdk_client)
+    @property
+    def pool_size(self) -> int:
+        if self._pool_size is None:
+            self._pool_size = (
+                IO_SCHEDULER.max_in_flight_requests + self._POOL_SIZE_HEADROOM
+            )
+        return self._pool_size
 
-    def yield_blob_clients_from_container_url(
-        self, container_url: str, prefix: Optional[str] = None
-    ) -> Iterator["AzStorageTorchBlobClient"]:
-        container_sdk_client = self._get_sdk_container_client_from_container_url(
-            container_url
-        )
-        blob_names = container_sdk_client.list_blob_names(name_starts_with=prefix)
-        for blob_name in blob_names:
-            blob_client = container_sdk_client.get_blob_client(blob_name)
-            # Throwaway the blob client for it's URL to ensure we are **not**
-            # sharing transports as list_blob_names() may happen in the parent
-            # process and calling fork() after can lead to unintentional resource
-            # sharing in child processes.
-            yield self.get_blob_client_from_url(blob_client.url)
+    def get_transport(self, resource_url: str) -> RequestsTransport:
+        account = self._get_account(resource_url)
+        with self._lock:
+            if account not in self._transports:
+                self._transports[account] = self._create_transport()
+            return self._transports[account]
 
-    def _get_sdk_credential(
-        self, credential: AZSTORAGETORCH_CREDENTIAL_TYPE
-    ) -> SDK_CREDENTIAL_TYPE:
-        if credential is False:
-            return None
-        if credential is None:
-            return DefaultAzureCredential()
-        if isinstance(credential, (AzureSasCredential, TokenCredential)):
-            return credential
-        raise TypeError(f"Unsupported credential: {type(credential)}")
+    def warm_up(self, resource_url: str, num_connections: Optional[int] = None) -> None:
+        # Opens connections to the account ahead of time so that the first requests made do
+        # not have to wait on TCP and TLS handshakes. Requests are made at the same time so that
+        # each one opens its own connection instead of reusing the connection of a request that
+        # already finished. They are unauthenticated requests to the account's endpoint, which
+        # are rejected by the service, but still leave the connection open and in the pool.
+        if num_connections is None:
+            num_connections = IO_SCHEDULER.get_concurrency(
+                self._get_account(resource_url)
+            )
+        num_connections = min(num_connections, self.pool_size)
+        if num_connections < 1:
+            return
+        transport = self.get_transport(resource_url)
+        transport.open()
+        parsed_url = urllib.parse.urlparse(resource_url)
+        account_url = f"{parsed_url.scheme}://{parsed_url.netloc}/"
+        start_barrier = threading.Barrier(num_connections)
+        with concurrent.futures.ThreadPoolExecutor(num_connections) as executor:
+            for _ in range(num_connections):
+                executor.submit(
+                    self._open_connection, transport.session, account_url, start_barrier
+                )
+
+    def reset(self) -> None:
+        # Drops transports without closing them as they may still be used by existing clients.
+        self._lock = threading.Lock()
+        self._transports = {}
+        self._pool_size = self._configured_pool_size
+
+    def reset_connection_pools(self) -> None:
+        # Replaces the session, and with it the connection pool, of each transport instead of
+        # dropping the transports. In a forked child process, transports created before the fork
+        # are still referenced by existing clients and pipelines (e.g., a dataset's client factory
+        # or a container client listing blobs), which can then keep being used in the child
+        # without sharing connections with the parent. The previous sessions are not closed as
+        # their connections belong to the parent. The pool size is recalculated as well since it
+        # follows the in-flight request limit, which may be different in the child.
+        self._lock = threading.Lock()
+        self._pool_size = self._configured_pool_size
+        for transport in self._transports.values():
+            transport.session = self._create_session()
 
-    def _get_transport(self) -> RequestsTransport:
+    def _create_transport(self) -> RequestsTransport:
         return RequestsTransport(
+            session=self._create_session(),
+            session_owner=True,
             connection_timeout=self._SOCKET_CONNECTION_TIMEOUT,
             read_timeout=self._SOCKET_READ_TIMEOUT,
             connection_data_block_size=self._CONNECTION_DATA_BLOCK_SIZE,
         )
 
-    def _get_sdk_blob_client_from_url(
-        self, blob_url: str
-    ) -> azure.storage.blob.BlobClient:
-        client = azure.storage.blob.BlobClient.from_blob_url(
-            blob_url,
-            **self._get_sdk_client_kwargs(blob_url),
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # Match the SDK's default session, which does not retry nor follow redirects in requests
+        # as retries are handled by the pipeline.
+        adapter = _KeepAliveHTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            max_retries=urllib3.util.Retry(
+                total=False, redirect=False, raise_on_status=False
+            ),
         )
-        self._cache_pipeline_if_needed(client, blob_url)
-        return client
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _open_connection(
+        self, session: requests.Session, url: str, start_barrier: threading.Barrier
+    ) -> None:
+        try:
+            start_barrier.wait(self._SOCKET_CONNECTION_TIMEOUT)
+        except threading.BrokenBarrierError:
+            pass
+        try:
+            session.head(
+                url,
+                headers={"User-Agent": f"azstoragetorch/{__version__}"},
+                timeout=(self._SOCKET_CONNECTION_TIMEOUT, self._SOCKET_READ_TIMEOUT),
+            )
+        except requests.RequestException as e:
+            # Warming up is best effort. If the account cannot be reached, the error is
+            # surfaced by the request that actually needs the connection.
+            _LOGGER.debug("Failed to open connection to %s: %s", url, e)
+
+    def _get_account(self, resource_url: str) -> str:
+        return urllib.parse.urlparse(resource_url).netloc.lower()
 
-    def _get_sdk_container_client_from_container_url(
-        self, container_url: str
-    ) -> azure.storage.blob.ContainerClient:
-        client = azure.storage.blob.ContainerClient.from_container_url(
-            container_url,
-            **self._get_sdk_client_kwargs(container_url, share_transport=False),
-        )
-        return client
 
-    def _get_sdk_client_kwargs(
-        self, resource_url: str, share_transport: bool = True
-    ) -> SDKKwargsType:
+# Pooled connections must not be shared across processes:
+# https://github.com/psf/requests/issues/4323
+# So connection pools are rebuilt in forked child processes, which will then open their own
+# connections.
+CONNECTION_POOL_MANAGER = ConnectionPoolManager()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=CONNECTION_POOL_MANAGER.reset_connection_pools)
+
+
+class _BaseAzStorageTorchBlobClientFactory:
+    # Builds Azure SDK client keyword arguments for the factory below and the asyncio factory in
+    # _aio_client.py. Subclasses provide the credential and transport for their SDK clients.
+    def __init__(self, sdk_credential: Any):
+        self._sdk_credential = sdk_credential
+        self._pipeline: Optional[Union[Pipeline, AsyncPipeline]] = None
+
+    def _get_transport(
+        self, resource_url: str
+    ) -> Union[RequestsTransport, AsyncHttpTransport]:
+        raise NotImplementedError("_get_transport")
+
+    def _get_sdk_client_kwargs(self, resource_url: str) -> SDKKwargsType:
         kwargs: SDKKwargsType = {
             "user_agent": f"azstoragetorch/{__version__}",
             "_additional_pipeline_policies": [
                 EchoClientRequestIdPolicy(),
             ],
         }
-        if share_transport:
-            kwargs["transport"] = self._transport
+        kwargs["transport"] = self._get_transport(resource_url)
         credential = self._sdk_credential
         if self._url_has_sas_token(resource_url):
             # The SDK prefers the explict credential over the one in the URL. So if a SAS token is
             # in the URL, we do not want the factory to automatically inject its credential, especially
             # if it would have been the default credential.
             credential = None
-        elif share_transport and self._pipeline is not None:
+        elif self._pipeline is not None:
             # We only want to share pipelines if we previously created a shareable pipeline and if
             # the resource URL provided does not have a SAS token override, which would require a new
             # pipeline since different credential policies are used based on credential provided.
@@ -204,6 +409,22 @@ class AzStorageTorchBlobClientFactory:
         kwargs["credential"] = credential
         return kwargs
 
+    def _get_sdk_blob_client_kwargs(self, blob_url: str) -> SDKKwargsType:
+        kwargs = self._get_sdk_client_kwargs(blob_url)
+        # The SDK drops the version ID from the URL instead of parsing it out. So it is provided
+        # explicitly to make sure requests are made against the version in the URL.
+        version_id = self._get_version_id(blob_url)
+        if version_id is not None:
+            kwargs["version_id"] = version_id
+        return kwargs
+
+    def _get_version_id(self, blob_url: str) -> Optional[str]:
+        parsed_qs = urllib.parse.parse_qs(urllib.parse.urlparse(blob_url).query)
+        version_ids = parsed_qs.get("versionid")
+        if not version_ids:
+            return None
+        return version_ids[0]
+
     def _url_has_sas_token(self, resource_url: str) -> bool:
         parsed_url = urllib.parse.urlparse(resource_url)
         if parsed_url.query is None:
@@ -215,9 +436,7 @@ class AzStorageTorchBlobClientFactory:
 
     def _cache_pipeline_if_needed(
         self,
-        client: Union[
-            azure.storage.blob.ContainerClient, azure.storage.blob.BlobClient
-        ],
+        client: Union[azure.storage.blob.BlobClient, azure.storage.blob.aio.BlobClient],
         resource_url: str,
     ) -> None:
         if not self._url_has_sas_token(resource_url) and self._pipeline is None:
@@ -226,99 +445,441 @@ class AzStorageTorchBlobClientFactory:
             self._pipeline = client._pipeline
 
 
-class AzStorageTorchBlobClient:
-    _PARTITIONED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
-    _PARTITION_SIZE = 16 * 1024 * 1024
-    _NUM_DOWNLOAD_ATTEMPTS = 3
-    _STAGE_BLOCK_SIZE = 32 * 1024 * 1024
-    _RETRYABLE_READ_EXCEPTIONS = (
-        azure.core.exceptions.IncompleteReadError,
-        azure.core.exceptions.HttpResponseError,
-        azure.core.exceptions.DecodeError,
-    )
-    _QS_PARAMETERS_TO_INCLUDE = [
-        "snapshot",
-        "versionid",
-    ]
-
+class AzStorageTorchBlobClientFactory(_BaseAzStorageTorchBlobClientFactory):
     def __init__(
         self,
-        sdk_blob_client: azure.storage.blob.BlobClient,
-        executor: Optional[concurrent.futures.Executor] = None,
-        max_in_flight_requests: Optional[int] = None,
+        credential: AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        connection_pool_manager: Optional[ConnectionPoolManager] = None,
     ):
-        self._sdk_blob_client = sdk_blob_client
-        self._generated_sdk_storage_client = self._sdk_blob_client._client
+        super().__init__(self._get_sdk_credential(credential))
+        self._connection_pool_manager = connection_pool_manager
 
-        if max_in_flight_requests is None:
-            max_in_flight_requests = self._get_max_in_flight_requests()
-        self._max_in_flight_requests = max_in_flight_requests
-        self._executor = executor
-        self._blob_properties: Optional[azure.storage.blob.BlobProperties] = None
+    def get_blob_client_from_url(
+        self, blob_url: str, **client_kwargs: Unpack[BlobClientKwargsType]
+    ) -> "AzStorageTorchBlobClient":
+        blob_sdk_client = self._get_sdk_blob_client_from_url(blob_url)
+        return AzStorageTorchBlobClient(blob_sdk_client, **client_kwargs)
 
-    @property
-    def url(self) -> str:
-        blob_sdk_url = self._sdk_blob_client.url
-        parsed_url = urllib.parse.urlparse(blob_sdk_url)
-        if parsed_url.query is None:
-            return blob_sdk_url
-        return self._get_url_without_query_string(parsed_url)
+    def yield_blob_clients_from_container_url(
+        self, container_url: str, prefix: Optional[str] = None
+    ) -> Iterator["AzStorageTorchBlobClient"]:
+        container_sdk_client = self._get_sdk_container_client_from_container_url(
+            container_url
+        )
+        blob_names = container_sdk_client.list_blob_names(name_starts_with=prefix)
+        for blob_name in blob_names:
+            blob_client = container_sdk_client.get_blob_client(blob_name)
+            # Throwaway the blob client for it's URL so that the blob client is created
+            # the same way as any other blob client from the factory (e.g., reusing the
+            # factory's cached pipeline).
+            yield self.get_blob_client_from_url(blob_client.url)
+
+    def _get_sdk_credential(
+        self, credential: AZSTORAGETORCH_CREDENTIAL_TYPE
+    ) -> SDK_CREDENTIAL_TYPE:
+        if credential is False:
+            return None
+        if credential is None:
+            return DefaultAzureCredential()
+        if isinstance(credential, (AzureSasCredential, TokenCredential)):
+            return credential
+        raise TypeError(f"Unsupported credential: {type(credential)}")
+
+    def _get_transport(self, resource_url: str) -> RequestsTransport:
+        connection_pool_manager = self._connection_pool_manager
+        if connection_pool_manager is None:
+            connection_pool_manager = CONNECTION_POOL_MANAGER
+        return connection_pool_manager.get_transport(resource_url)
+
+    def _get_sdk_blob_client_from_url(
+        self, blob_url: str
+    ) -> azure.storage.blob.BlobClient:
+        client = azure.storage.blob.BlobClient.from_blob_url(
+            blob_url,
+            **self._get_sdk_blob_client_kwargs(blob_url),
+        )
+        self._cache_pipeline_if_needed(client, blob_url)
+        return client
+
+    def _get_sdk_container_client_from_container_url(
+        self, container_url: str
+    ) -> azure.storage.blob.ContainerClient:
+        client = azure.storage.blob.ContainerClient.from_container_url(
+            container_url,
+            **self._get_sdk_client_kwargs(container_url),
+        )
+        return client
+
+
+class BlobClientFactoryCache:
+    # Process-wide cache of client factories keyed by account and credential. Each factory holds
+    # a credential and pipeline, so reusing it across clients for the same account reuses cached
+    # tokens and pooled connections instead of setting them up again for each client. Clients
+    # themselves are not cached as they hold per-blob state.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._factories: Dict[Tuple[str, int], AzStorageTorchBlobClientFactory] = {}
+
+    def get_blob_client_from_url(
+        self,
+        blob_url: str,
+        credential: AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        **client_kwargs: Unpack[BlobClientKwargsType],
+    ) -> "AzStorageTorchBlobClient":
+        return self.get_factory(blob_url, credential).get_blob_client_from_url(
+            blob_url, **client_kwargs
+        )
+
+    def get_factory(
+        self, resource_url: str, credential: AZSTORAGETORCH_CREDENTIAL_TYPE = None
+    ) -> AzStorageTorchBlobClientFactory:
+        # Credentials are keyed by identity since two credential instances could represent different
+        # identities. The cached factory references the credential, so its id is not reused while cached.
+        key = (self._get_account(resource_url), id(credential))
+        with self._lock:
+            if key not in self._factories:
+                self._factories[key] = AzStorageTorchBlobClientFactory(
+                    credential=credential
+                )
+            return self._factories[key]
+
+    def reset(self) -> None:
+        # Replaces the lock as well as a forked child process may have inherited it while held by
+        # a thread that does not exist in the child.
+        self._lock = threading.Lock()
+        self._factories = {}
+
+    def _get_account(self, resource_url: str) -> str:
+        return urllib.parse.urlparse(resource_url).netloc.lower()
+
+
+# Transports and their pooled connections must not be shared across processes:
+# https://github.com/psf/requests/issues/4323
+# So the cache is reset in forked child processes, which will then create their own factories.
+BLOB_CLIENT_FACTORY_CACHE = BlobClientFactoryCache()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BLOB_CLIENT_FACTORY_CACHE.reset)
+
+
+class _AccountConcurrency:
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.round_start = time.monotonic()
+        self.round_bytes = 0
+        self.round_transfers = 0
+        self.previous_round_throughput: Optional[float] = None
+        self.rounds_without_increase = 0
+        self.decreased_in_round = False
+        self.seconds_per_byte: Optional[float] = None
+
+
+class ConcurrencyController:
+    # Adjusts the number of concurrent requests made to each storage account using additive increase,
+    # multiplicative decrease (AIMD) instead of relying on a single, static limit:
+    #
+    # * Additive increase - Transfers are grouped into rounds of as many transfers as the current
+    #   limit. If the throughput of a round improved on the previous round, the limit is increased by
+    #   one. If it did not, the limit is held, but is still periodically increased to check whether
+    #   more concurrency helps now that conditions may have changed.
+    #
+    # * Multiplicative decrease - The limit is halved when a request is throttled (e.g., 503
+    #   ServerBusy) or a transfer takes much longer than recent transfers (i.e., a latency spike).
+    #   Transfers already in flight were started at the previous limit, so the limit is decreased at
+    #   most once per round.
+    #
+    # Limits start at the same default as the thread pool executor, but account for CPU quotas of the
+    # process, and may grow up to a multiple of it for hosts with more network bandwidth than CPUs.
+    _MIN_LATENCY_SAMPLE_SIZE = 1024 * 1024
+    _LATENCY_SMOOTHING_FACTOR = 0.2
+    _LATENCY_SPIKE_FACTOR = 3.0
+    _THROUGHPUT_INCREASE_THRESHOLD = 0.05
+    _DECREASE_FACTOR = 0.5
+    _PROBE_INTERVAL_ROUNDS = 8
+    _MAX_LIMIT_CEILING = 64
+
+    def __init__(
+        self,
+        initial_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        min_limit: int = 1,
+    ):
+        if min_limit < 1:
+            raise ValueError(f"Min limit must be at least 1. Got: {min_limit}")
+        for name, limit in (("Initial", initial_limit), ("Max", max_limit)):
+            if limit is not None and limit < min_limit:
+                raise ValueError(
+                    f"{name} limit must be at least the min limit of {min_limit}. Got: {limit}"
+                )
+        self._configured_initial_limit = initial_limit
+        self._configured_max_limit = max_limit
+        self._initial_limit = initial_limit
+        self._max_limit = max_limit
+        self._min_limit = min_limit
+        self._condition = threading.Condition()
+        self._accounts: Dict[str, _AccountConcurrency] = {}
 
     @property
-    def blob_name(self) -> str:
-        return self._sdk_blob_client.blob_name  # type: ignore[attr-defined]
+    def initial_limit(self) -> int:
+        if self._initial_limit is None:
+            self._initial_limit = min(
+                self.max_limit, max(min(32, _get_cpu_count() + 4), self._min_limit)
+            )
+        return self._initial_limit
 
     @property
-    def container_name(self) -> str:
-        return self._sdk_blob_client.container_name  # type: ignore[attr-defined]
+    def max_limit(self) -> int:
+        if self._max_limit is None:
+            default_initial_limit = min(32, _get_cpu_count() + 4)
+            if self._configured_initial_limit is not None:
+                default_initial_limit = self._configured_initial_limit
+            self._max_limit = max(
+                min(self._MAX_LIMIT_CEILING, 4 * default_initial_limit),
+                default_initial_limit,
+                self._min_limit,
+            )
+        return self._max_limit
 
-    def get_blob_size(self) -> int:
-        return self._get_blob_properties().size
+    def get_limit(self, account: str) -> int:
+        with self._condition:
+            return int(self._get_account_concurrency(account).limit)
 
-    def download(self, offset: int = 0, length: Optional[int] = None) -> bytes:
-        initial_content = b""
-        if self._blob_properties is None:
-            initial_content = self._download_from_unknown_blob_size(offset, length)
-            offset = len(initial_content) + offset
-            if length is not None:
-                length = length - len(initial_content)
-            if not self._more_to_download(offset, length):
-                return initial_content
-        length = self._update_download_length_from_blob_size(offset, length)
-        if length < self._PARTITIONED_DOWNLOAD_THRESHOLD:
-            return b"".join(
-                [initial_content, self._download_with_retries(offset, length)]
+    def acquire(self, account: str) -> None:
+        with self._condition:
+            account_concurrency = self._get_account_concurrency(account)
+            while account_concurrency.in_flight >= int(account_concurrency.limit):
+                self._condition.wait()
+            account_concurrency.in_flight += 1
+
+    def release(self, account: str) -> None:
+        with self._condition:
+            self._get_account_concurrency(account).in_flight -= 1
+            self._condition.notify_all()
+
+    def record_transfer(
+        self, account: str, num_bytes: int, elapsed_time: float
+    ) -> None:
+        with self._condition:
+            account_concurrency = self._get_account_concurrency(account)
+            if self._is_latency_spike(account_concurrency, num_bytes, elapsed_time):
+                _LOGGER.debug(
+                    "Decreasing concurrency for %s from latency spike of %s seconds for %s bytes.",
+                    account,
+                    elapsed_time,
+                    num_bytes,
+                )
+                self._decrease(account_concurrency)
+                return
+            account_concurrency.round_bytes += num_bytes
+            account_concurrency.round_transfers += 1
+            if account_concurrency.round_transfers >= int(account_concurrency.limit):
+                self._complete_round(account_concurrency)
+
+    def record_throttled(self, account: str) -> None:
+        with self._condition:
+            _LOGGER.debug("Decreasing concurrency for %s from throttling.", account)
+            self._decrease(self._get_account_concurrency(account))
+
+    def reset(self) -> None:
+        # Also replaces the condition as a forked child process may have inherited its lock while
+        # held by a thread that does not exist in the child. Default limits are recalculated as the
+        # child may be limited to a different set of CPUs.
+        self._condition = threading.Condition()
+        self._accounts = {}
+        self._initial_limit = self._configured_initial_limit
+        self._max_limit = self._configured_max_limit
+
+    def _get_account_concurrency(self, account: str) -> _AccountConcurrency:
+        if account not in self._accounts:
+            self._accounts[account] = _AccountConcurrency(self.initial_limit)
+        return self._accounts[account]
+
+    def _is_latency_spike(
+        self,
+        account_concurrency: _AccountConcurrency,
+        num_bytes: int,
+        elapsed_time: float,
+    ) -> bool:
+        # Smaller transfers are dominated by request latency instead of transfer time so they
+        # are not measured.
+        if num_bytes < self._MIN_LATENCY_SAMPLE_SIZE or elapsed_time <= 0:
+            return False
+        sample = elapsed_time / num_bytes
+        smoothed = account_concurrency.seconds_per_byte
+        if smoothed is None:
+            account_concurrency.seconds_per_byte = sample
+            return False
+        account_concurrency.seconds_per_byte = (
+            smoothed + self._LATENCY_SMOOTHING_FACTOR * (sample - smoothed)
+        )
+        return sample > self._LATENCY_SPIKE_FACTOR * smoothed
+
+    def _complete_round(self, account_concurrency: _AccountConcurrency) -> None:
+        elapsed_time = time.monotonic() - account_concurrency.round_start
+        throughput = account_concurrency.round_bytes / max(elapsed_time, 1e-9)
+        previous_throughput = account_concurrency.previous_round_throughput
+        if (
+            previous_throughput is None
+            or throughput
+            > previous_throughput * (1 + self._THROUGHPUT_INCREASE_THRESHOLD)
+            or account_concurrency.rounds_without_increase
+            >= self._PROBE_INTERVAL_ROUNDS
+        ):
+            account_concurrency.limit = min(
+                account_concurrency.limit + 1, self.max_limit
             )
+            account_concurrency.rounds_without_increase = 0
+            self._condition.notify_all()
         else:
-            return b"".join(
-                [initial_content, self._partitioned_download(offset, length)]
-            )
+            account_concurrency.rounds_without_increase += 1
+        account_concurrency.previous_round_throughput = throughput
+        self._start_round(account_concurrency)
 
-    def stage_blocks(
-        self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE
-    ) -> List[STAGE_BLOCK_FUTURE_TYPE]:
-        if not data:
-            raise ValueError("Data must not be empty.")
-        stage_block_partitions = self._get_stage_block_partitions(data)
-        futures = []
-        for pos, length in stage_block_partitions:
-            self._max_in_flight_semaphore.acquire()
-            future = self._get_executor().submit(
-                self._stage_block, data[pos : pos + length]
+    def _decrease(self, account_concurrency: _AccountConcurrency) -> None:
+        if account_concurrency.decreased_in_round:
+            return
+        account_concurrency.limit = max(
+            account_concurrency.limit * self._DECREASE_FACTOR, self._min_limit
+        )
+        account_concurrency.previous_round_throughput = None
+        self._start_round(account_concurrency)
+        account_concurrency.decreased_in_round = True
+
+    def _start_round(self, account_concurrency: _AccountConcurrency) -> None:
+        account_concurrency.round_start = time.monotonic()
+        account_concurrency.round_bytes = 0
+        account_concurrency.round_transfers = 0
+        account_concurrency.decreased_in_round = False
+
+
+# Shared by all clients using the process-wide scheduler so that concurrency adapts to the load
+# the whole process places on each account.
+CONCURRENCY_CONTROLLER = ConcurrencyController()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=CONCURRENCY_CONTROLLER.reset)
+
+
+class IOScheduler:
+    # Executes transfer tasks (e.g., download partitions and stage block requests) submitted by
+    # clients. By default, a single process-wide scheduler is shared by all clients so that threads
+    # are not created and torn down for each client and the total number of in-flight requests
+    # across all clients is bounded.
+    #
+    # If a concurrency controller is provided, the number of in-flight requests to each account is
+    # further limited by the controller, which adapts it to the throughput and throttling observed
+    # for the account. The maximum number of in-flight requests then defaults to the controller's
+    # maximum limit so that there are enough workers for the limit to grow into.
+    def __init__(
+        self,
+        max_in_flight_requests: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        concurrency_controller: Optional[ConcurrencyController] = None,
+    ):
+        self._configured_max_in_flight_requests = max_in_flight_requests
+        self._max_in_flight_requests = max_in_flight_requests
+        self._executor = executor
+        self._concurrency_controller = concurrency_controller
+        self._in_flight_semaphore: Optional[threading.Semaphore] = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_in_flight_requests(self) -> int:
+        if self._max_in_flight_requests is None:
+            self._max_in_flight_requests = self._get_default_max_in_flight_requests()
+        return self._max_in_flight_requests
+
+    def get_concurrency(self, account: Optional[str] = None) -> int:
+        # Number of requests that can currently be in flight to the account.
+        if self._concurrency_controller is None or account is None:
+            return self.max_in_flight_requests
+        return min(
+            self._concurrency_controller.get_limit(account),
+            self.max_in_flight_requests,
+        )
+
+    def submit(
+        self,
+        fn: Callable[..., _SUBMIT_RESULT_TYPE],
+        /,
+        *args,
+        account: Optional[str] = None,
+    ) -> concurrent.futures.Future[_SUBMIT_RESULT_TYPE]:
+        concurrency_controller = self._concurrency_controller
+        if concurrency_controller is None or account is None:
+            return self._submit(fn, *args)
+        concurrency_controller.acquire(account)
+        try:
+            future = self._submit(fn, *args)
+        except BaseException:
+            concurrency_controller.release(account)
+            raise
+        future.add_done_callback(lambda _: concurrency_controller.release(account))
+        return future
+
+    def record_transfer(
+        self, account: str, num_bytes: int, elapsed_time: float
+    ) -> None:
+        if self._concurrency_controller is not None:
+            self._concurrency_controller.record_transfer(
+                account, num_bytes, elapsed_time
             )
-            future.add_done_callback(self._release_in_flight_semaphore)
-            futures.append(future)
-        return futures
 
-    def commit_block_list(self, block_ids: List[str]) -> None:
-        blob_blocks = [azure.storage.blob.BlobBlock(block_id) for block_id in block_ids]
-        self._sdk_blob_client.commit_block_list(blob_blocks)
+    def record_throttled(self, account: str) -> None:
+        if self._concurrency_controller is not None:
+            self._concurrency_controller.record_throttled(account)
 
-    def close(self) -> None:
+    def _submit(
+        self, fn: Callable[..., _SUBMIT_RESULT_TYPE], /, *args
+    ) -> concurrent.futures.Future[_SUBMIT_RESULT_TYPE]:
+        executor, in_flight_semaphore = self._get_executor_and_semaphore()
+        # The standard thread pool executor does not bound the number of tasks submitted to it.
+        # The semaphore introduces a bound so that the number of submitted, in-progress futures is
+        # not greater than the available workers. This is important for cases where we buffer data
+        # into memory for uploads as it prevents large amounts of memory from being submitted to the
+        # executor when there are no workers available to upload it.
+        in_flight_semaphore.acquire()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            in_flight_semaphore.release()
+            raise
+        future.add_done_callback(lambda _: in_flight_semaphore.release())
+        return future
+
+    def shutdown(self) -> None:
         if self._executor is not None:
             self._executor.shutdown()
 
-    def _get_max_in_flight_requests(self) -> int:
+    def reset(self) -> None:
+        # Drops the executor without shutting it down since, in a forked child process, its worker
+        # threads do not exist. The lock is replaced as well since it may have been inherited while
+        # held by a thread that does not exist in the child. The default in-flight limit is also
+        # recalculated as the child may be limited to a different set of CPUs.
+        self._lock = threading.Lock()
+        self._executor = None
+        self._in_flight_semaphore = None
+        self._max_in_flight_requests = self._configured_max_in_flight_requests
+
+    def _get_executor_and_semaphore(
+        self,
+    ) -> Tuple[concurrent.futures.Executor, threading.Semaphore]:
+        # We want executor creation to be lazy instead of instantiating immediately because
+        # threads should only be started once they are needed and, for the process-wide scheduler,
+        # in the process that needs them (e.g., after PyTorch's DataLoader spawns worker processes).
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_in_flight_requests
+                )
+            if self._in_flight_semaphore is None:
+                self._in_flight_semaphore = threading.Semaphore(
+                    self.max_in_flight_requests
+                )
+            return self._executor, self._in_flight_semaphore
+
+    def _get_default_max_in_flight_requests(self) -> int:
+        if self._concurrency_controller is not None:
+            return self._concurrency_controller.max_limit
         # Ideally we would just match this value to the max workers of the executor. However
         # the executor class does not publicly expose its max worker count. So, instead we copy
         # the max worker calculation from the executor class and inject it into both the executor
@@ -331,65 +892,980 @@ class AzStorageTorchBlobClient:
         cpu_count_fn = getattr(os, "process_cpu_count", os.cpu_count)
         return min(32, (cpu_count_fn() or 1) + 4)
 
-    def _get_executor(self) -> concurrent.futures.Executor:
-        # We want executor creation to be lazy instead of instantiating immediately in
-        # the constructor because the executor itself is not pickleable. This is an issue
-        # when workers are used by PyTorch's DataLoader as workers are spawned as processes.
-        # So we delay executor creation until it is needed for reading/writing data which will
-        # happen after processes are spawned.
-        if self._executor is None:
-            self._executor = concurrent.futures.ThreadPoolExecutor(
-                self._max_in_flight_requests
-            )
-        return self._executor
 
-    @functools.cached_property
-    def _max_in_flight_semaphore(self) -> threading.Semaphore:
-        # The standard thread pool executor does not bound the number of tasks submitted to it.
-        # This semaphore introduces bound so that the number of submitted, in-progress
-        # futures are not greater than the available workers. This is important for cases where we
-        # buffer data into memory for uploads as is prevents large amounts of memory from being
-        # submitted to the executor when there are no workers available to upload it.
-        return threading.Semaphore(self._max_in_flight_requests)
+IO_SCHEDULER = IOScheduler(concurrency_controller=CONCURRENCY_CONTROLLER)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=IO_SCHEDULER.reset)
 
-    def _get_blob_properties(self) -> azure.storage.blob.BlobProperties:
-        if self._blob_properties is None:
-            self._blob_properties = self._sdk_blob_client.get_blob_properties()
-        return self._blob_properties
 
-    def _update_download_length_from_blob_size(
-        self, offset: int, length: Optional[int] = None
-    ) -> int:
-        length_from_offset = self.get_blob_size() - offset
-        if length is not None:
-            return min(length, length_from_offset)
-        return length_from_offset
+class PartitionPlanner:
+    # Plans how a download is split into ranges that are downloaded concurrently. Unless a fixed
+    # partition size is provided, partition sizes are chosen from:
+    #
+    # * The size of the download and available concurrency - Downloads are split into enough
+    #   partitions to use all available connections, but partitions are never smaller than a minimum
+    #   size so that per-request overhead does not dominate.
+    #
+    # * The measured per-connection throughput - Partitions are sized to take roughly a target amount
+    #   of time to download so that large downloads make fewer, larger requests on fast connections and
+    #   smaller, more evenly spread requests on slow connections.
+    _MIN_PARTITION_SIZE = 4 * 1024 * 1024
+    _MAX_PARTITION_SIZE = 64 * 1024 * 1024
+    # Used until throughput has been measured. Matches the previously fixed partition size.
+    _DEFAULT_PARTITION_SIZE = 16 * 1024 * 1024
+    _TARGET_PARTITION_DOWNLOAD_TIME = 0.5
+    # Smaller requests are dominated by latency instead of throughput so they are not measured.
+    _MIN_THROUGHPUT_SAMPLE_SIZE = 1024 * 1024
+    _THROUGHPUT_SMOOTHING_FACTOR = 0.2
 
-    def _partitioned_download(self, offset: int, length: int) -> bytes:
-        futures = []
-        for read_partition in self._get_partitions(
-            offset, length, self._PARTITION_SIZE
-        ):
-            futures.append(
-                self._get_executor().submit(
-                    self._download_with_retries, *read_partition
-                )
+    def __init__(
+        self, partition_size: Optional[int] = None, speculative_partitions: int = 1
+    ):
+        if partition_size is not None and partition_size <= 0:
+            raise ValueError(
+                f"Partition size must be greater than 0. Got: {partition_size}"
             )
-        return b"".join(f.result() for f in futures)
+        if speculative_partitions < 1:
+            raise ValueError(
+                f"Speculative partitions must be at least 1. Got: {speculative_partitions}"
+            )
+        self._partition_size = partition_size
+        self._speculative_partitions = speculative_partitions
+        self._throughput: Optional[float] = None
+        self._lock = threading.Lock()
 
-    def _get_partitions(
-        self, offset: int, length: int, partition_size: int
+    @property
+    def throughput(self) -> Optional[float]:
+        # Smoothed per-connection throughput in bytes per second or None if not yet measured.
+        return self._throughput
+
+    def plan(
+        self, offset: int, length: int, max_concurrency: int
+    ) -> List[Tuple[int, int]]:
+        partition_size = self._get_partition_size(length, max_concurrency)
+        if length <= partition_size:
+            return [(offset, length)]
+        return _get_partitions(offset, length, partition_size)
+
+    def plan_unknown_size(
+        self, offset: int, length: Optional[int] = None
     ) -> List[Tuple[int, int]]:
-        end = offset + length
-        num_partitions = math.ceil(length / partition_size)
-        partitions = []
-        for i in range(num_partitions):
-            start = offset + i * partition_size
-            if start >= end:
-                break
-            size = min(partition_size, end - start)
-            partitions.append((start, size))
-        return partitions
+        # Plans the first requests of a download when the size of the blob is not yet known. The
+        # first partition determines the blob size. Any additional partitions are requested at the
+        # same time, speculating that the blob extends past the first partition, so that large
+        # downloads do not wait on a full round trip and transfer before downloading concurrently.
+        partition_size = self._partition_size
+        if partition_size is None:
+            partition_size = self._get_preferred_partition_size()
+        first_wave_length = self._speculative_partitions * partition_size
+        if length is not None:
+            first_wave_length = min(length, first_wave_length)
+        if first_wave_length <= partition_size:
+            return [(offset, first_wave_length)]
+        return _get_partitions(offset, first_wave_length, partition_size)
+
+    def record_throughput(self, num_bytes: int, elapsed_time: float) -> None:
+        if num_bytes < self._MIN_THROUGHPUT_SAMPLE_SIZE or elapsed_time <= 0:
+            return
+        sample = num_bytes / elapsed_time
+        with self._lock:
+            if self._throughput is None:
+                self._throughput = sample
+            else:
+                self._throughput += self._THROUGHPUT_SMOOTHING_FACTOR * (
+                    sample - self._throughput
+                )
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._throughput = None
+
+    def _get_partition_size(self, length: int, max_concurrency: int) -> int:
+        if self._partition_size is not None:
+            return self._partition_size
+        partition_size = max(
+            self._MIN_PARTITION_SIZE,
+            min(
+                self._get_preferred_partition_size(),
+                math.ceil(length / max(max_concurrency, 1)),
+            ),
+        )
+        if length <= partition_size:
+            return partition_size
+        # Even out partition sizes so the download does not end with a much smaller partition
+        # (e.g., a 20 MiB download is split into 2 10 MiB partitions instead of 16 MiB and 4 MiB)
+        # while still keeping partitions at or above the minimum size.
+        num_partitions = min(
+            math.ceil(length / partition_size), length // self._MIN_PARTITION_SIZE
+        )
+        return math.ceil(length / num_partitions)
+
+    def _get_preferred_partition_size(self) -> int:
+        throughput = self._throughput
+        if throughput is None:
+            return self._DEFAULT_PARTITION_SIZE
+        return min(
+            self._MAX_PARTITION_SIZE,
+            max(
+                self._MIN_PARTITION_SIZE,
+                int(throughput * self._TARGET_PARTITION_DOWNLOAD_TIME),
+            ),
+        )
+
+
+# Throughput measured by any client is shared by all clients that do not have their own planner
+# so that later downloads, including those from newly created clients, benefit from it.
+DOWNLOAD_PARTITION_PLANNER = PartitionPlanner()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=DOWNLOAD_PARTITION_PLANNER.reset)
+
+
+class HedgeStats(NamedTuple):
+    hedged_requests: int
+    hedges_won: int
+    hedged_bytes: int
+
+
+class RequestHedger:
+    # Reduces the tail latency of partitioned downloads, which are only as fast as their slowest
+    # partition. If a partition takes longer than a percentile of the time previous partitions took
+    # (scaled to the partition's size), a duplicate request is made for it and whichever request
+    # finishes first is used. The bytes requested by duplicate requests are capped to a ratio of the
+    # bytes downloaded so that hedging cannot significantly amplify the load on the account.
+    _MIN_SAMPLES = 20
+    _MAX_SAMPLES = 1000
+    # Avoids hedging requests that are only slow relative to near-instant previous requests.
+    _MIN_DEADLINE = 0.05
+
+    def __init__(self, percentile: float = 95.0, max_hedged_bytes_ratio: float = 0.1):
+        if not 0 < percentile < 100:
+            raise ValueError(
+                f"Percentile must be between 0 and 100 exclusive. Got: {percentile}"
+            )
+        if max_hedged_bytes_ratio < 0:
+            raise ValueError(
+                f"Max hedged bytes ratio must not be negative. Got: {max_hedged_bytes_ratio}"
+            )
+        self._percentile = percentile
+        self._max_hedged_bytes_ratio = max_hedged_bytes_ratio
+        self._lock = threading.Lock()
+        self._seconds_per_byte: Deque[float] = collections.deque(
+            maxlen=self._MAX_SAMPLES
+        )
+        self._downloaded_bytes = 0
+        self._hedged_requests = 0
+        self._hedges_won = 0
+        self._hedged_bytes = 0
+
+    @property
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(
+                self._hedged_requests, self._hedges_won, self._hedged_bytes
+            )
+
+    def get_deadline(self, length: int) -> Optional[float]:
+        # Returns how long a partition of the given length can take before it is hedged or None if
+        # not enough partitions have been downloaded to determine it.
+        with self._lock:
+            if len(self._seconds_per_byte) < self._MIN_SAMPLES:
+                return None
+            samples = sorted(self._seconds_per_byte)
+        index = math.ceil(self._percentile / 100 * len(samples)) - 1
+        return max(samples[index] * length, self._MIN_DEADLINE)
+
+    def record_download(self, num_bytes: int, elapsed_time: float) -> None:
+        if num_bytes <= 0:
+            return
+        with self._lock:
+            self._seconds_per_byte.append(elapsed_time / num_bytes)
+            self._downloaded_bytes += num_bytes
+
+    def try_reserve_hedge(self, length: int) -> bool:
+        with self._lock:
+            if (
+                self._hedged_bytes + length
+                > self._max_hedged_bytes_ratio * self._downloaded_bytes
+            ):
+                return False
+            self._hedged_requests += 1
+            self._hedged_bytes += length
+        return True
+
+    def record_hedge_won(self) -> None:
+        with self._lock:
+            self._hedges_won += 1
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._seconds_per_byte.clear()
+        self._downloaded_bytes = 0
+        self._hedged_requests = 0
+        self._hedges_won = 0
+        self._hedged_bytes = 0
+
+
+# Shared by clients that enable hedging so that latencies measured by any client inform when
+# partitions are hedged for all clients.
+REQUEST_HEDGER = RequestHedger()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=REQUEST_HEDGER.reset)
+
+
+class RetryStats(NamedTuple):
+    retries: int
+    throttled_retries: int
+    retries_over_budget: int
+
+
+class RetryPolicy:
+    # Decides whether failed download and stage block requests are retried and how long to wait
+    # before retrying. Errors are classified as:
+    #
+    # * Throttling - The account is over one of its scalability targets (e.g., a 503 ServerBusy
+    #   response when egress is over the account limit). If the response includes a Retry-After
+    #   hint, retries wait at least that long. Otherwise, they back off longer than for transient
+    #   errors and are allowed more attempts as throttling is expected to clear once load drops.
+    #
+    # * Transient - Connection errors, errors while streaming a response, and 5xx responses other
+    #   than throttling that are likely to succeed if retried.
+    #
+    # * Fatal - All other errors (e.g., 403, 404, 412) which are raised without retrying.
+    #
+    # All backoff times include jitter so that many clients failing at the same time (e.g., a large
+    # number of DataLoader workers hitting the account's egress limit) do not retry in lockstep.
+    # Retries also draw from a per-account budget that is refilled by successful requests. Once
+    # exhausted, errors are raised instead of retried so that retries cannot multiply the load on an
+    # account that is already overloaded.
+    _THROTTLING_STATUS_CODES = (429, 503)
+    _TRANSIENT_STATUS_CODES = (408, 500, 502, 504)
+    _MAX_TRANSIENT_BACKOFF = 20
+    _THROTTLING_BACKOFF_BASE = 4
+    _MAX_THROTTLING_BACKOFF = 60
+    _RETRY_AFTER_HEADERS = (
+        ("retry-after-ms", 0.001),
+        ("x-ms-retry-after-ms", 0.001),
+        ("Retry-After", 1),
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        max_throttled_attempts: int = 10,
+        retry_budget: float = 100.0,
+        retry_budget_refill_ratio: float = 0.1,
+    ):
+        if max_attempts < 1 or max_throttled_attempts < 1:
+            raise ValueError(
+                f"Max attempts must be at least 1. Got: {max_attempts} and {max_throttled_attempts}"
+            )
+        if retry_budget < 0 or retry_budget_refill_ratio < 0:
+            raise ValueError(
+                f"Retry budget and refill ratio must not be negative. Got: {retry_budget} and {retry_budget_refill_ratio}"
+            )
+        self._max_attempts = max_attempts
+        self._max_throttled_attempts = max_throttled_attempts
+        self._retry_budget = retry_budget
+        self._retry_budget_refill_ratio = retry_budget_refill_ratio
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, float] = {}
+        self._stats: Dict[str, RetryStats] = {}
+
+    def get_stats(self, account: str) -> RetryStats:
+        with self._lock:
+            return self._stats.get(account, RetryStats(0, 0, 0))
+
+    def get_retry_delay(
+        self, account: str, error: BaseException, attempt_number: int
+    ) -> Optional[float]:
+        # Returns how long to wait before retrying a request whose attempt (starting from 0) failed
+        # with the error or None if the error should be raised instead.
+        error_class = self._classify_error(error)
+        if error_class == "fatal":
+            return None
+        throttled = error_class == "throttling"
+        max_attempts = self._max_throttled_attempts if throttled else self._max_attempts
+        if attempt_number + 1 >= max_attempts:
+            return None
+        with self._lock:
+            stats = self._stats.get(account, RetryStats(0, 0, 0))
+            budget = self._budgets.get(account, self._retry_budget)
+            if budget < 1:
+                self._stats[account] = stats._replace(
+                    retries_over_budget=stats.retries_over_budget + 1
+                )
+                return None
+            self._budgets[account] = budget - 1
+            self._stats[account] = stats._replace(
+                retries=stats.retries + 1,
+                throttled_retries=stats.throttled_retries + throttled,
+            )
+        if throttled:
+            return self._get_throttling_backoff_time(error, attempt_number)
+        return self._get_transient_backoff_time(attempt_number)
+
+    def is_throttling_error(self, error: BaseException) -> bool:
+        return self._classify_error(error) == "throttling"
+
+    def record_success(self, account: str) -> None:
+        with self._lock:
+            # Accounts without a budget entry have not retried, so their budget is already full.
+            if account in self._budgets:
+                self._budgets[account] = min(
+                    self._retry_budget,
+                    self._budgets[account] + self._retry_budget_refill_ratio,
+                )
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._budgets = {}
+        self._stats = {}
+
+    def _classify_error(self, error: BaseException) -> _ERROR_CLASS_TYPE:
+        if isinstance(
+            error,
+            (
+                azure.core.exceptions.ServiceRequestError,
+                azure.core.exceptions.ServiceResponseError,
+            ),
+        ):
+            return "transient"
+        if not isinstance(error, azure.core.exceptions.HttpResponseError):
+            return "fatal"
+        status_code = error.status_code
+        if status_code is None or status_code < 400:
+            # The error happened while streaming the content of a successful response (e.g.,
+            # an IncompleteReadError).
+            return "transient"
+        if status_code in self._THROTTLING_STATUS_CODES:
+            return "throttling"
+        if status_code in self._TRANSIENT_STATUS_CODES:
+            return "transient"
+        return "fatal"
+
+    def _get_transient_backoff_time(self, attempt_number: int) -> float:
+        # Backoff time uses exponential backoff with full jitter as a starting point to have at least
+        # some delay before retrying. For exceptions that we get while streaming data, it will likely be
+        # because of environment's network (e.g. high network load) so the approach will give some amount
+        # of backoff and randomness before attempting to stream again. Stream reading speeds can also be
+        # paced by setting bandwidth limits (see BandwidthLimiter) to reduce occurrences of connection
+        # errors due to an overwhelmed network.
+        return min(random.uniform(0, 2**attempt_number), self._MAX_TRANSIENT_BACKOFF)
+
+    def _get_throttling_backoff_time(
+        self, error: BaseException, attempt_number: int
+    ) -> float:
+        retry_after = self._get_retry_after(error)
+        if retry_after is not None:
+            # Retrying any earlier would likely be throttled again. Jitter is added on top of the
+            # hint since clients throttled at the same time are likely to get the same hint.
+            return retry_after + random.uniform(0, max(retry_after, 1) / 2)
+        return random.uniform(
+            1,
+            min(
+                self._THROTTLING_BACKOFF_BASE * 2**attempt_number,
+                self._MAX_THROTTLING_BACKOFF,
+            ),
+        )
+
+    def _get_retry_after(self, error: BaseException) -> Optional[float]:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+        for header_name, seconds_per_unit in self._RETRY_AFTER_HEADERS:
+            value = headers.get(header_name)
+            if value is None:
+                continue
+            try:
+                return max(float(value) * seconds_per_unit, 0)
+            except (TypeError, ValueError):
+                pass
+            # The Retry-After header may also be an HTTP date instead of a number of seconds.
+            try:
+                retry_after_date = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                continue
+            return max(
+                (
+                    retry_after_date - datetime.datetime.now(datetime.timezone.utc)
+                ).total_seconds(),
+                0,
+            )
+        return None
+
+
+# Shared by clients that do not have their own policy so that the retry budget for an account is
+# shared by all requests made to it from the process.
+RETRY_POLICY = RetryPolicy()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=RETRY_POLICY.reset)
+
+
+class BandwidthLimiter:
+    # Paces the bytes transferred by all clients in the process using token buckets, so that
+    # transfers do not saturate the network when limits are set. Transfers have a priority:
+    #
+    # * interactive - Reads that a consumer is waiting on (e.g., dataset samples or checkpoints
+    #   being loaded). These are only limited by the overall limit.
+    #
+    # * bulk - Transfers that can run in the background (e.g., staging blocks of a checkpoint being
+    #   saved). These are limited by both the overall and the bulk limit and wait for any interactive
+    #   transfers that are waiting on the overall limit, so a background upload cannot starve reads.
+    #
+    # Each bucket holds at most a fraction of a second of its limit so that bursts stay short. A
+    # transfer only waits for the bucket to be non-empty and may then take it below zero, so that
+    # transfers larger than the bucket (e.g., a staged block) are paced instead of never fitting.
+    #
+    # Unless provided, limits are read from the AZSTORAGETORCH_MAX_BANDWIDTH and
+    # AZSTORAGETORCH_MAX_UPLOAD_BANDWIDTH environment variables, in bytes per second, so that they
+    # also apply in worker processes (e.g., those started by PyTorch's DataLoader). No limits are
+    # set by default.
+    _MAX_BANDWIDTH_ENV_VAR = "AZSTORAGETORCH_MAX_BANDWIDTH"
+    _MAX_BULK_BANDWIDTH_ENV_VAR = "AZSTORAGETORCH_MAX_UPLOAD_BANDWIDTH"
+    _BURST_SECONDS = 0.1
+
+    def __init__(
+        self,
+        max_bytes_per_second: Optional[float] = None,
+        max_bulk_bytes_per_second: Optional[float] = None,
+    ):
+        for name, limit in (
+            ("Max bytes per second", max_bytes_per_second),
+            ("Max bulk bytes per second", max_bulk_bytes_per_second),
+        ):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{name} must be greater than 0. Got: {limit}")
+        self._configured_limits = (max_bytes_per_second, max_bulk_bytes_per_second)
+        self._condition = threading.Condition()
+        self._limits_loaded = False
+        self._overall_bucket: Optional[_TokenBucket] = None
+        self._bulk_bucket: Optional[_TokenBucket] = None
+        self._interactive_waiters = 0
+
+    def acquire(self, num_bytes: int, priority: IO_PRIORITY_TYPE) -> None:
+        # Waits until the bytes can be transferred without exceeding the limits.
+        if num_bytes <= 0 or not self._has_limits():
+            return
+        with self._condition:
+            buckets = self._get_buckets(priority)
+            if priority == "interactive":
+                self._interactive_waiters += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait_time = max(
+                        (bucket.get_wait_time(now) for bucket in buckets), default=0
+                    )
+                    if priority == "bulk" and self._interactive_waiters:
+                        # Interactive transfers notify waiters once they acquire, so this only
+                        # bounds how long to wait.
+                        wait_time = max(wait_time, self._BURST_SECONDS)
+                    if wait_time <= 0:
+                        break
+                    self._condition.wait(wait_time)
+                for bucket in buckets:
+                    bucket.take(num_bytes)
+            finally:
+                if priority == "interactive":
+                    self._interactive_waiters -= 1
+                    self._condition.notify_all()
+
+    def reset(self) -> None:
+        # Limits are reloaded as well, since the environment of a forked child process may differ.
+        self._condition = threading.Condition()
+        self._limits_loaded = False
+        self._overall_bucket = None
+        self._bulk_bucket = None
+        self._interactive_waiters = 0
+
+    def _has_limits(self) -> bool:
+        if not self._limits_loaded:
+            with self._condition:
+                if not self._limits_loaded:
+                    self._load_limits()
+        return self._overall_bucket is not None or self._bulk_bucket is not None
+
+    def _get_buckets(self, priority: IO_PRIORITY_TYPE) -> List["_TokenBucket"]:
+        buckets = []
+        if self._overall_bucket is not None:
+            buckets.append(self._overall_bucket)
+        if priority == "bulk" and self._bulk_bucket is not None:
+            buckets.append(self._bulk_bucket)
+        return buckets
+
+    def _load_limits(self) -> None:
+        max_bytes_per_second, max_bulk_bytes_per_second = self._configured_limits
+        if max_bytes_per_second is None:
+            max_bytes_per_second = self._get_limit_from_env(self._MAX_BANDWIDTH_ENV_VAR)
+        if max_bulk_bytes_per_second is None:
+            max_bulk_bytes_per_second = self._get_limit_from_env(
+                self._MAX_BULK_BANDWIDTH_ENV_VAR
+            )
+        self._overall_bucket = self._get_bucket(max_bytes_per_second)
+        self._bulk_bucket = self._get_bucket(max_bulk_bytes_per_second)
+        self._limits_loaded = True
+
+    def _get_bucket(
+        self, bytes_per_second: Optional[float]
+    ) -> Optional["_TokenBucket"]:
+        if bytes_per_second is None:
+            return None
+        return _TokenBucket(bytes_per_second, bytes_per_second * self._BURST_SECONDS)
+
+    def _get_limit_from_env(self, env_var: str) -> Optional[float]:
+        value = os.environ.get(env_var)
+        if not value:
+            return None
+        try:
+            limit = float(value)
+        except ValueError:
+            raise ValueError(
+                f"{env_var} must be a number of bytes per second. Got: {value!r}"
+            )
+        if limit <= 0:
+            raise ValueError(f"{env_var} must be greater than 0. Got: {value!r}")
+        return limit
+
+
+class _TokenBucket:
+    def __init__(self, tokens_per_second: float, capacity: float) -> None:
+        self._tokens_per_second = tokens_per_second
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+
+    def get_wait_time(self, now: float) -> float:
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._last_refill) * self._tokens_per_second,
+        )
+        self._last_refill = now
+        if self._tokens > 0:
+            return 0
+        return (1 - self._tokens) / self._tokens_per_second
+
+    def take(self, num_tokens: int) -> None:
+        self._tokens -= num_tokens
+
+
+# Shared by all clients so that limits apply to the process as a whole.
+BANDWIDTH_LIMITER = BandwidthLimiter()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BANDWIDTH_LIMITER.reset)
+
+
+class FastDownloadTransport:
+    # Sends the ranged GET requests made to download blobs directly with urllib3 instead of through
+    # the SDK's pipeline and requests. When many small blobs are downloaded (e.g., data samples read
+    # by DataLoader workers), the CPU time spent per request in pipeline policies and requests adds
+    # up. Response bodies are also read into a preallocated buffer instead of into a new bytes
+    # object for each chunk.
+    #
+    # Requests are sent over the pooled connections of the client's transport (see
+    # ConnectionPoolManager) and keep the behavior of the pipeline that downloads rely on: requests
+    # are authorized with the client's credential, client request IDs are validated as in
+    # EchoClientRequestIdPolicy, and failures are raised as the same exceptions so that they are
+    # retried the same way. Requests that cannot be sent directly (e.g., through a proxy) or that
+    # need handling only the pipeline provides (e.g., authentication challenges and content
+    # decoding) are sent through the pipeline instead.
+    #
+    # Unless provided, whether the fast path is enabled is read from the
+    # AZSTORAGETORCH_FAST_DOWNLOADS environment variable so that it also applies in worker
+    # processes. It is disabled by default.
+    _ENABLED_ENV_VAR = "AZSTORAGETORCH_FAST_DOWNLOADS"
+    _TOKEN_SCOPE = "https://storage.azure.com/.default"
+    # Matches how long before expiry azure-core's bearer token policy refreshes tokens.
+    _TOKEN_REFRESH_SECONDS = 300
+    # Matches the errors mapped by the SDK's generated client for downloads.
+    _ERROR_MAP = {
+        401: azure.core.exceptions.ClientAuthenticationError,
+        404: azure.core.exceptions.ResourceNotFoundError,
+        409: azure.core.exceptions.ResourceExistsError,
+        304: azure.core.exceptions.ResourceNotModifiedError,
+    }
+    _CLIENT_REQUEST_ID_HEADER_NAME = "x-ms-client-request-id"
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self._configured_enabled = enabled
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._tokens: Dict[int, Tuple[TokenCredential, AccessToken]] = {}
+        self._tls_settings: Dict[
+            Tuple[int, str, str],
+            Tuple[requests.Session, Optional[Tuple[Union[bool, str], Any]]],
+        ] = {}
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            self._enabled = self._get_enabled_from_env()
+        return self._enabled
+
+    def download(
+        self,
+        sdk_blob_client: azure.storage.blob.BlobClient,
+        range_header: str,
+        if_match: Optional[str] = None,
+    ) -> Optional["_FastDownloadStream"]:
+        # Returns None if the request was not sent, in which case it should be sent through the
+        # SDK's pipeline instead.
+        if not self.enabled:
+            return None
+        url = sdk_blob_client.url
+        version_id: Optional[str] = sdk_blob_client.version_id  # type: ignore[attr-defined]
+        if version_id is not None:
+            # The SDK does not keep the version ID in the client's URL. So it needs to be added
+            # back to download the version of the blob the client was created for.
+            url = self._add_to_query_string(
+                url, urllib.parse.urlencode({"versionid": version_id})
+            )
+        headers = {
+            "x-ms-range": range_header,
+            "x-ms-version": sdk_blob_client.api_version,
+            "x-ms-date": email.utils.formatdate(usegmt=True),
+            self._CLIENT_REQUEST_ID_HEADER_NAME: str(uuid.uuid4()),
+            "User-Agent": f"azstoragetorch/{__version__}",
+        }
+        if if_match is not None:
+            headers["If-Match"] = if_match
+        credential = sdk_blob_client.credential
+        if isinstance(credential, AzureSasCredential):
+            url = self._add_sas_token(url, credential.signature)
+        elif credential is not None:
+            if not isinstance(credential, TokenCredential) or not url.startswith(
+                "https://"
+            ):
+                return None
+            headers["Authorization"] = f"Bearer {self._get_token(credential)}"
+
+        transport = self._get_transport(sdk_blob_client)
+        if transport is None:
+            return None
+        tls_settings = self._get_tls_settings(transport.session, url)
+        if tls_settings is None:
+            return None
+        verify, cert = tls_settings
+        prepared_request = requests.PreparedRequest()
+        prepared_request.prepare(method="GET", url=url, headers=headers)
+        adapter = transport.session.get_adapter(url)
+        try:
+            connection_pool = adapter.get_connection_with_tls_context(
+                prepared_request, verify, cert=cert
+            )
+            adapter.cert_verify(connection_pool, url, verify, cert)
+            response = connection_pool.urlopen(
+                method="GET",
+                url=prepared_request.path_url,
+                headers=prepared_request.headers,
+                redirect=False,
+                assert_same_host=False,
+                preload_content=False,
+                decode_content=False,
+                retries=False,
+                timeout=urllib3.util.Timeout(
+                    connect=transport.connection_config.timeout,
+                    read=transport.connection_config.read_timeout,
+                ),
+            )
+        except (urllib3.exceptions.HTTPError, OSError) as e:
+            raise self._to_azure_error(e)
+
+        if response.status == 401 or "Content-Encoding" in response.headers:
+            # Authentication challenges (e.g., for a different tenant) and decoding of encoded
+            # content are handled by the pipeline. The body is not read, so the connection is
+            # closed instead of being reused.
+            response.close()
+            response.release_conn()
+            if isinstance(credential, TokenCredential):
+                self._discard_token(credential)
+            return None
+        if response.status >= 300:
+            self._raise_response_error(
+                transport, adapter, url, prepared_request, response
+            )
+        self._validate_client_request_id(headers, response)
+        return _FastDownloadStream(
+            response, transport.connection_config.data_block_size
+        )
+
+    def reset(self) -> None:
+        # Whether the fast path is enabled is reloaded as well, since the environment of a forked
+        # child process may differ.
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._tls_settings = {}
+        self._enabled = self._configured_enabled
+
+    def _get_enabled_from_env(self) -> bool:
+        value = os.environ.get(self._ENABLED_ENV_VAR, "").strip().lower()
+        if value in ("", "0", "false", "no"):
+            return False
+        if value in ("1", "true", "yes"):
+            return True
+        raise ValueError(
+            f"{self._ENABLED_ENV_VAR} must be one of: 1, true, yes, 0, false, no. Got: {value!r}"
+        )
+
+    def _get_transport(
+        self, sdk_blob_client: azure.storage.blob.BlobClient
+    ) -> Optional[RequestsTransport]:
+        transport = sdk_blob_client._pipeline._transport
+        # Clients created from a container client wrap the container client's transport.
+        transport = getattr(transport, "_transport", transport)
+        if not isinstance(transport, RequestsTransport):
+            return None
+        transport.open()
+        return transport
+
+    def _get_tls_settings(
+        self, session: requests.Session, url: str
+    ) -> Optional[Tuple[Union[bool, str], Any]]:
+        # Returns the TLS settings requests would use for the session and URL, including settings
+        # from the environment (e.g., REQUESTS_CA_BUNDLE), or None if the request cannot be sent
+        # directly. Settings are cached per session and host as resolving them from the
+        # environment on each request is a significant part of the overhead being avoided.
+        parsed_url = urllib.parse.urlparse(url)
+        key = (id(session), parsed_url.scheme, parsed_url.netloc)
+        with self._lock:
+            cached = self._tls_settings.get(key)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+        tls_settings: Optional[Tuple[Union[bool, str], Any]] = None
+        adapter = session.get_adapter(url)
+        if isinstance(adapter, requests.adapters.HTTPAdapter) and hasattr(
+            adapter, "get_connection_with_tls_context"
+        ):
+            settings = session.merge_environment_settings(url, {}, None, None, None)
+            if not settings["proxies"]:
+                tls_settings = (settings["verify"], settings["cert"])
+        with self._lock:
+            self._tls_settings[key] = (session, tls_settings)
+        return tls_settings
+
+    def _add_sas_token(self, url: str, signature: str) -> str:
+        return self._add_to_query_string(url, signature.lstrip("?"))
+
+    def _add_to_query_string(self, url: str, query: str) -> str:
+        parsed_url = urllib.parse.urlparse(url)
+        if parsed_url.query:
+            query = f"{parsed_url.query}&{query}"
+        return urllib.parse.urlunparse(parsed_url._replace(query=query))
+
+    def _get_token(self, credential: TokenCredential) -> str:
+        # Tokens are keyed by the credential's identity. The cached entry references the
+        # credential, so its id is not reused while cached.
+        with self._lock:
+            cached = self._tokens.get(id(credential))
+        if cached is not None:
+            _, access_token = cached
+            if access_token.expires_on - time.time() > self._TOKEN_REFRESH_SECONDS:
+                return access_token.token
+        access_token = credential.get_token(self._TOKEN_SCOPE)
+        with self._lock:
+            self._tokens[id(credential)] = (credential, access_token)
+        return access_token.token
+
+    def _discard_token(self, credential: TokenCredential) -> None:
+        with self._lock:
+            self._tokens.pop(id(credential), None)
+
+    def _validate_client_request_id(
+        self, headers: Dict[str, str], response: urllib3.HTTPResponse
+    ) -> None:
+        request_client_id = headers[self._CLIENT_REQUEST_ID_HEADER_NAME]
+        response_client_id = response.headers.get(self._CLIENT_REQUEST_ID_HEADER_NAME)
+        if request_client_id != response_client_id:
+            # The connection cannot be trusted to be reused.
+            response.close()
+            raise ClientRequestIdMismatchError(
+                request_client_id=request_client_id,
+                response_client_id=str(response_client_id),
+                service_request_id=str(response.headers.get("x-ms-request-id")),
+            )
+
+    def _raise_response_error(
+        self,
+        transport: RequestsTransport,
+        adapter: requests.adapters.HTTPAdapter,
+        url: str,
+        prepared_request: requests.PreparedRequest,
+        response: urllib3.HTTPResponse,
+    ) -> NoReturn:
+        # Errors are rare, so the response is wrapped the same way the pipeline would wrap it
+        # in order to raise the same exceptions, which include the parsed error details.
+        transport_response = RequestsTransportResponse(
+            HttpRequest("GET", url),
+            adapter.build_response(prepared_request, response),
+            transport.connection_config.data_block_size,
+        )
+        transport_response.body()
+        azure.core.exceptions.map_error(
+            status_code=response.status,
+            response=transport_response,
+            error_map=self._ERROR_MAP,
+        )
+        raise azure.core.exceptions.HttpResponseError(response=transport_response)
+
+    def _to_azure_error(self, error: Exception) -> azure.core.exceptions.AzureError:
+        # Matches how requests and RequestsTransport map these errors.
+        if isinstance(
+            error,
+            (urllib3.exceptions.ProtocolError, urllib3.exceptions.ReadTimeoutError),
+        ):
+            return azure.core.exceptions.ServiceResponseError(error, error=error)
+        return azure.core.exceptions.ServiceRequestError(error, error=error)
+
+
+class _FastDownloadStream:
+    # Iterates over the body of a response from FastDownloadTransport. Each chunk is a view of a
+    # buffer that is reused for the next chunk, so chunks must be copied before reading the next.
+    def __init__(self, response: urllib3.HTTPResponse, block_size: int):
+        self.response = response
+        self._block_size = block_size
+
+    def __iter__(self) -> Iterator[memoryview]:
+        buffer = memoryview(bytearray(self._get_buffer_size()))
+        completed = False
+        try:
+            while True:
+                num_read = self._readinto(buffer)
+                if not num_read:
+                    break
+                yield buffer[:num_read]
+            completed = True
+        except (http.client.HTTPException, urllib3.exceptions.HTTPError, OSError) as e:
+            raise azure.core.exceptions.IncompleteReadError(str(e), error=e)
+        finally:
+            if not completed:
+                # The rest of the body was not read, so the connection cannot be reused.
+                self.response.close()
+            self.response.release_conn()
+
+    def _get_buffer_size(self) -> int:
+        content_length = self.response.headers.get("Content-Length")
+        if content_length is None:
+            return self._block_size
+        return max(min(int(content_length), self._block_size), 1)
+
+    def _readinto(self, buffer: memoryview) -> int:
+        # urllib3's readinto() reads into a new bytes object before copying it into the buffer.
+        # Since content is not decoded, reading into the buffer from the underlying http.client
+        # response is equivalent and avoids the copy.
+        fp = getattr(self.response, "_fp", None)
+        if isinstance(fp, http.client.HTTPResponse):
+            return fp.readinto(buffer)
+        data = self.response.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+# Shared by all clients so that tokens are cached across clients.
+FAST_DOWNLOAD_TRANSPORT = FastDownloadTransport()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=FAST_DOWNLOAD_TRANSPORT.reset)
+
+
+class _HedgeLostError(Exception):
+    pass
+
+
+class _HedgedPartition:
+    # Coordinates the original and duplicate requests for a partition. Both requests may write the
+    # same bytes into the same buffer, but once one request completes, the other is stopped before
+    # it can write again. This ensures no writes happen to the buffer after the partition's result
+    # is returned to the caller.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._completed = False
+        self.start_time: Optional[float] = None
+
+    def mark_started(self) -> None:
+        if self.start_time is None:
+            self.start_time = time.monotonic()
+
+    def check(self) -> None:
+        with self._lock:
+            self._raise_if_completed()
+
+    def write(
+        self, buffer: memoryview, pos: int, chunk: Union[bytes, memoryview]
+    ) -> None:
+        with self._lock:
+            self._raise_if_completed()
+            buffer[pos : pos + len(chunk)] = chunk
+
+    def complete(self) -> None:
+        with self._lock:
+            self._raise_if_completed()
+            self._completed = True
+
+    def _raise_if_completed(self) -> None:
+        if self._completed:
+            raise _HedgeLostError()
+
+
+class _InFlightPartition(NamedTuple):
+    partition: Tuple[int, int]
+    hedged_partition: Optional[_HedgedPartition]
+    future: concurrent.futures.Future
+
+
+class _BaseAzStorageTorchBlobClient:
+    # State and helpers shared by the client below and the asyncio client in _aio_client.py, which
+    # differ only in whether transfers block the calling thread or are awaited.
+    _STAGE_BLOCK_SIZE = 32 * 1024 * 1024
+    _QS_PARAMETERS_TO_INCLUDE = [
+        "snapshot",
+        "versionid",
+    ]
+
+    def __init__(
+        self,
+        sdk_blob_client: Union[
+            azure.storage.blob.BlobClient, azure.storage.blob.aio.BlobClient
+        ],
+        partition_planner: Optional[PartitionPlanner] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self._sdk_blob_client = sdk_blob_client
+        self._generated_sdk_storage_client = self._sdk_blob_client._client
+        self._partition_planner = partition_planner
+        self._retry_policy = retry_policy
+        self._blob_properties: Optional[azure.storage.blob.BlobProperties] = None
+
+    @property
+    def url(self) -> str:
+        blob_sdk_url = self._sdk_blob_client.url
+        parsed_url = urllib.parse.urlparse(blob_sdk_url)
+        if parsed_url.query is None:
+            return blob_sdk_url
+        return self._get_url_without_query_string(parsed_url)
+
+    @property
+    def blob_name(self) -> str:
+        return self._sdk_blob_client.blob_name  # type: ignore[union-attr]
+
+    @property
+    def container_name(self) -> str:
+        return self._sdk_blob_client.container_name  # type: ignore[union-attr]
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        # Retries made for all clients in the process that share this client's account and policy.
+        return self._get_retry_policy().get_stats(self._get_account())
+
+    def _get_partition_planner(self) -> PartitionPlanner:
+        if self._partition_planner is not None:
+            return self._partition_planner
+        return DOWNLOAD_PARTITION_PLANNER
+
+    def _get_retry_policy(self) -> RetryPolicy:
+        if self._retry_policy is not None:
+            return self._retry_policy
+        return RETRY_POLICY
+
+    def _get_account(self) -> str:
+        return urllib.parse.urlparse(self._sdk_blob_client.url).netloc.lower()
 
     def _more_to_download(
         self, updated_offset, remaining_length: Optional[int] = None
@@ -400,32 +1876,67 @@ class AzStorageTorchBlobClient:
             return False
         return True
 
-    def _download_from_unknown_blob_size(
-        self, offset: int, length: Optional[int] = None
-    ) -> bytes:
-        if length is None or length > self._PARTITIONED_DOWNLOAD_THRESHOLD:
-            length = self._PARTITIONED_DOWNLOAD_THRESHOLD
-        return self._download_with_retries(offset, length)
+    def _allocate_download_content(
+        self, initial_content: bytes, length: int
+    ) -> io.BytesIO:
+        content = io.BytesIO()
+        content.write(initial_content)
+        if length > 0:
+            # Writing past the end of a BytesIO grows its buffer to the new size in a single allocation.
+            content.seek(len(initial_content) + length - 1)
+            content.write(b"\0")
+        return content
 
-    def _download_with_retries(self, pos: int, length: int) -> bytes:
-        attempt = 0
-        while self._attempts_remaining(attempt):
-            stream = self._get_download_stream(pos, length)
-            try:
-                return self._read_stream(stream)
-            except self._RETRYABLE_READ_EXCEPTIONS:
-                backoff_time = self._get_backoff_time(attempt)
-                attempt += 1
-                if not self._attempts_remaining(attempt):
-                    raise
-                _LOGGER.debug(
-                    "Sleeping %s seconds and retrying download from caught streaming exception (attempts remaining: %s).",
-                    backoff_time,
-                    self._attempts_remaining(attempt),
-                    exc_info=True,
+    def _get_if_match(self) -> Optional[str]:
+        if self._blob_properties is None:
+            return None
+        return self._blob_properties.etag
+
+    def _get_download_kwargs(self, pos: int, length: int) -> DownloadKwargsType:
+        download_kwargs: DownloadKwargsType = {
+            "range": f"bytes={pos}-{pos + length - 1}",
+            # Retries are made by the client's retry policy instead of the SDK's so
+            # that they are not multiplied and honor throttling hints.
+            "retry_total": 0,
+        }
+        version_id: Optional[str] = self._sdk_blob_client.version_id  # type: ignore[union-attr]
+        if version_id is not None:
+            download_kwargs["version_id"] = version_id
+        if self._blob_properties is not None:
+            download_kwargs["modified_access_conditions"] = (
+                azure.storage.blob._generated.models.ModifiedAccessConditions(
+                    if_match=self._get_if_match()
                 )
-                time.sleep(backoff_time)
-        raise RuntimeError("Exhausted all retry attempts to read blob content.")
+            )
+        return download_kwargs
+
+    def _set_empty_blob_properties_if_needed(
+        self,
+        error: azure.core.exceptions.HttpResponseError,
+        set_blob_properties: bool,
+    ) -> bool:
+        # Ranged requests to an empty blob are rejected by the service. Returns whether the error
+        # was from an empty blob, in which case the blob properties are set from it instead.
+        if self._is_invalid_range_from_empty_blob_error(error) and set_blob_properties:
+            self._blob_properties = azure.storage.blob.BlobProperties(
+                **{"Content-Length": 0}
+            )
+            return True
+        return False
+
+    def _get_etag_from_download(self, response) -> Optional[str]:
+        # Downloads of empty blobs are not backed by a response.
+        if not hasattr(response, "response"):
+            return None
+        return response.response.headers.get("ETag")
+
+    def _get_blob_size_from_download(self, response) -> Optional[int]:
+        if not hasattr(response, "response"):
+            return None
+        content_range = response.response.headers.get("Content-Range")
+        if content_range is None:
+            return None
+        return self._get_size_from_range(content_range)
 
     def _set_blob_properties_from_download(self, response) -> None:
         headers = response.response.headers
@@ -434,79 +1945,38 @@ class AzStorageTorchBlobClient:
             **{"Content-Length": blob_size, "ETag": headers.get("ETag")}
         )
 
-    def _get_download_stream(self, pos: int, length: int) -> Iterator[bytes]:
-        try:
-            download_kwargs: DownloadKwargsType = {
-                "range": f"bytes={pos}-{pos + length - 1}",
-            }
-            if self._blob_properties is not None:
-                download_kwargs["modified_access_conditions"] = (
-                    azure.storage.blob._generated.models.ModifiedAccessConditions(
-                        if_match=self._blob_properties.etag
-                    )
-                )
-            response = self._generated_sdk_storage_client.blob.download(
-                **download_kwargs
-            )
-            if self._blob_properties is None:
-                self._set_blob_properties_from_download(response)
-            return response
-        except azure.core.exceptions.HttpResponseError as e:
-            if self._is_invalid_range_from_empty_blob_error(e):
-                self._blob_properties = azure.storage.blob.BlobProperties(
-                    **{"Content-Length": 0}
-                )
-                return iter([b""])
-            # TODO: This is so that we properly map exceptions from the generated client to the correct
-            # exception class and error code. In the future, prior to a GA, we should consider pulling
-            # in this function or a derivative of it if we plan to continue to raise Azure Python SDK
-            # exceptions from this library (i.e. instead of raising our own exception classes).
-            process_storage_error(e)
-
     def _get_size_from_range(self, range_header: str) -> int:
         return int(range_header.split(" ", 1)[1].split("/", 1)[1])
 
     def _is_invalid_range_from_empty_blob_error(
         self, error: azure.core.exceptions.HttpResponseError
+    ) -> bool:
+        return self._is_invalid_range_past_end_of_blob_error(error, 0)
+
+    def _is_invalid_range_past_end_of_blob_error(
+        self, error: azure.core.exceptions.HttpResponseError, pos: int
     ) -> bool:
         return (
             error.response is not None
             and error.status_code == 416
             and hasattr(error.response, "headers")
             and "Content-Range" in error.response.headers
-            and self._get_size_from_range(error.response.headers["Content-Range"]) == 0
+            and self._get_size_from_range(error.response.headers["Content-Range"])
+            <= pos
         )
 
-    def _attempts_remaining(self, attempt_number: int) -> int:
-        return max(self._NUM_DOWNLOAD_ATTEMPTS - attempt_number, 0)
-
-    def _get_backoff_time(self, attempt_number: int) -> float:
-        # Backoff time uses exponential backoff with full jitter as a starting point to have at least
-        # some delay before retrying. For exceptions that we get while streaming data, it will likely be
-        # because of environment's network (e.g. high network load) so the approach will give some amount
-        # of backoff and randomness before attempting to stream again. In the future, we should
-        # consider other approaches such as adapting/throttling stream reading speeds to reduce occurrences
-        # of connection errors due to an overwhelmed network.
-        return min(random.uniform(0, 2**attempt_number), 20)
-
-    def _read_stream(self, stream: Iterator[bytes]) -> bytes:
-        content = io.BytesIO()
-        for chunk in stream:
-            content.write(chunk)
-        return content.getvalue()
+    def _get_writable_view(self, buffer: SUPPORTED_READ_INTO_BUFFER_TYPE) -> memoryview:
+        view = memoryview(buffer)
+        if view.readonly:
+            raise TypeError(f"Buffer must be writable: {type(buffer)}")
+        # Normalize to a flat view of bytes so that slicing is in terms of byte offsets regardless of
+        # the buffer's original item size or shape (e.g., a multi-dimensional NumPy array).
+        return view.cast("B")
 
     def _get_stage_block_partitions(
         self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE
     ) -> List[Tuple[int, int]]:
-        return self._get_partitions(0, len(data), self._STAGE_BLOCK_SIZE)
-
-    def _stage_block(self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> str:
-        block_id = str(uuid.uuid4())
-        self._sdk_blob_client.stage_block(block_id, data)
-        return block_id
-
-    def _release_in_flight_semaphore(self, _: STAGE_BLOCK_FUTURE_TYPE) -> None:
-        self._max_in_flight_semaphore.release()
+        return _get_partitions(0, len(data), self._STAGE_BLOCK_SIZE)
 
     def _get_url_without_query_string(
         self, parsed_url: urllib.parse.ParseResult
@@ -526,3 +1996,650 @@ class AzStorageTorchBlobClient:
                 None,
             )
         )
+
+
+class AzStorageTorchBlobClient(_BaseAzStorageTorchBlobClient):
+    _sdk_blob_client: azure.storage.blob.BlobClient
+
+    def __init__(
+        self,
+        sdk_blob_client: azure.storage.blob.BlobClient,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_in_flight_requests: Optional[int] = None,
+        partition_planner: Optional[PartitionPlanner] = None,
+        request_hedger: Optional[RequestHedger] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        bandwidth_limiter: Optional[BandwidthLimiter] = None,
+        fast_download_transport: Optional[FastDownloadTransport] = None,
+    ):
+        super().__init__(sdk_blob_client, partition_planner, retry_policy)
+        # Clients use the process-wide scheduler unless an executor or in-flight limit specific
+        # to the client is provided. The process-wide scheduler is intentionally not referenced
+        # as an attribute so that clients remain pickleable.
+        self._scheduler: Optional[IOScheduler] = None
+        if executor is not None or max_in_flight_requests is not None:
+            self._scheduler = IOScheduler(max_in_flight_requests, executor)
+        # Hedging is disabled unless a hedger is provided.
+        self._request_hedger = request_hedger
+        self._bandwidth_limiter = bandwidth_limiter
+        self._fast_download_transport = fast_download_transport
+
+    def get_blob_size(self) -> int:
+        return self._get_blob_properties().size
+
+    def download(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        initial_content = b""
+        if self._blob_properties is None:
+            initial_content = self._download_from_unknown_blob_size(offset, length)
+            offset = len(initial_content) + offset
+            if length is not None:
+                length = length - len(initial_content)
+            if not self._more_to_download(offset, length):
+                return initial_content
+        length = self._update_download_length_from_blob_size(offset, length)
+        partitions = self._plan_download_partitions(offset, length)
+        if len(partitions) == 1 and not initial_content:
+            return self._download_with_retries(offset, length)
+        # Allocate the full content once and have each partition write directly into its slice of it
+        # instead of joining together separately downloaded partitions. The content is allocated by a
+        # BytesIO because, once no views of its buffer remain, getvalue() returns the buffer as bytes
+        # without copying it.
+        content = self._allocate_download_content(initial_content, length)
+        view = content.getbuffer()
+        try:
+            written = self._download_partitions_into(
+                view[len(initial_content) :], offset, partitions
+            )
+        finally:
+            view.release()
+        # The buffer is copied instead if views of it remain (e.g., from a hedged request that lost and
+        # has yet to stop), in which case the downloaded content is still correct.
+        if written < length:
+            return content.getvalue()[: len(initial_content) + written]
+        return content.getvalue()
+
+    def download_into(
+        self,
+        buffer: SUPPORTED_READ_INTO_BUFFER_TYPE,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> int:
+        view = self._get_writable_view(buffer)
+        if length is None:
+            length = len(view)
+        if length > len(view):
+            raise ValueError(
+                f"Length: {length} is larger than the provided buffer size: {len(view)}"
+            )
+        view = view[:length]
+        written = 0
+        if self._blob_properties is None:
+            written = self._download_into_from_unknown_blob_size(view, offset)
+            if not self._more_to_download(offset + written, length - written):
+                return written
+        remaining = self._update_download_length_from_blob_size(
+            offset + written, length - written
+        )
+        if remaining <= 0:
+            return written
+        written += self._download_into(
+            view[written : written + remaining], offset + written
+        )
+        return written
+
+    def iter_chunks(
+        self, offset: int = 0, length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        # Partitions are downloaded concurrently but yielded in order, so at most a bounded window
+        # of partitions is held in memory at a time regardless of the size of the range.
+        length = self._update_download_length_from_blob_size(offset, length)
+        if length <= 0:
+            return
+        yield from self._iter_partition_results(
+            self._plan_download_partitions(offset, length),
+            lambda partition, hedged_partition: self._download_with_retries(
+                *partition, hedged_partition=hedged_partition
+            ),
+        )
+
+    def submit_download(self, offset: int, length: int) -> DOWNLOAD_FUTURE_TYPE:
+        # The range is always downloaded as a single GET instead of being partitioned. Partitioned
+        # downloads submit to and wait on the same executor, which could exhaust all workers if
+        # submitted from within the executor itself.
+        return self._get_scheduler().submit(
+            self._download_with_retries, offset, length, account=self._get_account()
+        )
+
+    def stage_blocks(
+        self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE
+    ) -> List[STAGE_BLOCK_FUTURE_TYPE]:
+        if not data:
+            raise ValueError("Data must not be empty.")
+        stage_block_partitions = self._get_stage_block_partitions(data)
+        futures = []
+        for pos, length in stage_block_partitions:
+            futures.append(
+                self._get_scheduler().submit(
+                    self._stage_block,
+                    data[pos : pos + length],
+                    account=self._get_account(),
+                )
+            )
+        return futures
+
+    def commit_block_list(self, block_ids: List[str]) -> None:
+        blob_blocks = [azure.storage.blob.BlobBlock(block_id) for block_id in block_ids]
+        self._sdk_blob_client.commit_block_list(blob_blocks)
+
+    def close(self) -> None:
+        # The process-wide scheduler is shared with other clients so it is only shut down
+        # if the client has its own scheduler.
+        if self._scheduler is not None:
+            self._scheduler.shutdown()
+
+    def _get_scheduler(self) -> IOScheduler:
+        if self._scheduler is not None:
+            return self._scheduler
+        return IO_SCHEDULER
+
+    def _get_bandwidth_limiter(self) -> BandwidthLimiter:
+        if self._bandwidth_limiter is not None:
+            return self._bandwidth_limiter
+        return BANDWIDTH_LIMITER
+
+    def _get_fast_download_transport(self) -> FastDownloadTransport:
+        if self._fast_download_transport is not None:
+            return self._fast_download_transport
+        return FAST_DOWNLOAD_TRANSPORT
+
+    def _plan_download_partitions(
+        self, offset: int, length: int
+    ) -> List[Tuple[int, int]]:
+        return self._get_partition_planner().plan(
+            offset, length, self._get_scheduler().get_concurrency(self._get_account())
+        )
+
+    def _get_blob_properties(self) -> azure.storage.blob.BlobProperties:
+        if self._blob_properties is None:
+            self._blob_properties = self._sdk_blob_client.get_blob_properties()
+        return self._blob_properties
+
+    def _update_download_length_from_blob_size(
+        self, offset: int, length: Optional[int] = None
+    ) -> int:
+        length_from_offset = self.get_blob_size() - offset
+        if length is not None:
+            return min(length, length_from_offset)
+        return length_from_offset
+
+    def _download_into(self, buffer: memoryview, offset: int) -> int:
+        partitions = self._plan_download_partitions(offset, len(buffer))
+        return self._download_partitions_into(buffer, offset, partitions)
+
+    def _download_partitions_into(
+        self, buffer: memoryview, offset: int, partitions: List[Tuple[int, int]]
+    ) -> int:
+        if len(partitions) == 1:
+            return self._download_into_with_retries(buffer, offset)
+        return self._partitioned_download_into(buffer, offset, partitions)
+
+    def _partitioned_download_into(
+        self, buffer: memoryview, offset: int, partitions: List[Tuple[int, int]]
+    ) -> int:
+        def download_partition(
+            partition: Tuple[int, int], hedged_partition: Optional[_HedgedPartition]
+        ) -> int:
+            pos, length = partition
+            buffer_pos = pos - offset
+            return self._download_into_with_retries(
+                buffer[buffer_pos : buffer_pos + length], pos, hedged_partition
+            )
+
+        return sum(self._iter_partition_results(partitions, download_partition))
+
+    def _iter_partition_results(
+        self,
+        partitions: Iterable[Tuple[int, int]],
+        download_partition: Callable[
+            [Tuple[int, int], Optional[_HedgedPartition]], _PARTITION_RESULT_TYPE
+        ],
+        hedge: bool = True,
+    ) -> Generator[_PARTITION_RESULT_TYPE, None, None]:
+        # Yields the results of partitions in order while keeping a bounded window of partitions in
+        # flight, similar to how stage_blocks() bounds uploads. A partition is only submitted once an
+        # earlier one is consumed, so neither the number of futures nor the memory held by completed,
+        # unconsumed partitions grows with the size of the download. The next partition is submitted
+        # before yielding so that transfers continue while the consumer processes a result.
+        request_hedger = self._request_hedger if hedge else None
+        partitions_iter = iter(partitions)
+        window: Deque[_InFlightPartition] = collections.deque()
+
+        def submit_partition(partition: Tuple[int, int]) -> _InFlightPartition:
+            hedged_partition = None
+            if request_hedger is not None:
+                hedged_partition = _HedgedPartition()
+            return _InFlightPartition(
+                partition,
+                hedged_partition,
+                self._submit_partition_download(
+                    download_partition, partition, hedged_partition
+                ),
+            )
+
+        try:
+            for partition in itertools.islice(
+                partitions_iter,
+                self._get_scheduler().get_concurrency(self._get_account()),
+            ):
+                window.append(submit_partition(partition))
+            while window:
+                result = self._get_partition_result(
+                    window.popleft(), download_partition
+                )
+                next_partition = next(partitions_iter, None)
+                if next_partition is not None:
+                    window.append(submit_partition(next_partition))
+                yield result
+        finally:
+            # Stop any partitions that have not started if the consumer stops early or a
+            # partition failed, instead of transferring data that will never be consumed.
+            for in_flight_partition in window:
+                in_flight_partition.future.cancel()
+            # Partitions that already started cannot be cancelled. Wait for them to finish so
+            # that none are still writing into the caller's buffer once this returns.
+            concurrent.futures.wait(
+                [in_flight_partition.future for in_flight_partition in window]
+            )
+
+    def _submit_partition_download(
+        self,
+        download_partition: Callable[
+            [Tuple[int, int], Optional[_HedgedPartition]], _PARTITION_RESULT_TYPE
+        ],
+        partition: Tuple[int, int],
+        hedged_partition: Optional[_HedgedPartition],
+    ) -> concurrent.futures.Future[_PARTITION_RESULT_TYPE]:
+        if hedged_partition is None:
+            return self._get_scheduler().submit(
+                download_partition, partition, None, account=self._get_account()
+            )
+        return self._get_scheduler().submit(
+            self._download_hedged_partition,
+            download_partition,
+            partition,
+            hedged_partition,
+            account=self._get_account(),
+        )
+
+    def _download_hedged_partition(
+        self,
+        download_partition: Callable[
+            [Tuple[int, int], Optional[_HedgedPartition]], _PARTITION_RESULT_TYPE
+        ],
+        partition: Tuple[int, int],
+        hedged_partition: _HedgedPartition,
+    ) -> _PARTITION_RESULT_TYPE:
+        hedged_partition.mark_started()
+        start_time = time.monotonic()
+        result = download_partition(partition, hedged_partition)
+        # Raises if the other request for the partition already completed.
+        hedged_partition.complete()
+        if self._request_hedger is not None:
+            self._request_hedger.record_download(
+                partition[1], time.monotonic() - start_time
+            )
+        return result
+
+    def _get_partition_result(
+        self,
+        in_flight_partition: _InFlightPartition,
+        download_partition: Callable[
+            [Tuple[int, int], Optional[_HedgedPartition]], _PARTITION_RESULT_TYPE
+        ],
+    ) -> _PARTITION_RESULT_TYPE:
+        partition, hedged_partition, future = in_flight_partition
+        request_hedger = self._request_hedger
+        if hedged_partition is None or request_hedger is None:
+            return future.result()
+        deadline = request_hedger.get_deadline(partition[1])
+        if deadline is None or not self._wait_for_hedge_deadline(
+            in_flight_partition, deadline
+        ):
+            return future.result()
+        if not request_hedger.try_reserve_hedge(partition[1]):
+            return future.result()
+        _LOGGER.debug(
+            "Hedging download of range starting at %s with length %s after %s seconds (stats: %s).",
+            partition[0],
+            partition[1],
+            deadline,
+            request_hedger.stats,
+        )
+        hedge_future = self._submit_partition_download(
+            download_partition, partition, hedged_partition
+        )
+        errors = []
+        for completed_future in concurrent.futures.as_completed([future, hedge_future]):
+            try:
+                result = completed_future.result()
+            except _HedgeLostError:
+                continue
+            except BaseException as e:
+                errors.append(e)
+                continue
+            if completed_future is hedge_future:
+                request_hedger.record_hedge_won()
+            return result
+        raise errors[0]
+
+    def _wait_for_hedge_deadline(
+        self, in_flight_partition: _InFlightPartition, deadline: float
+    ) -> bool:
+        # Waits until the partition completes or has been in progress for longer than the deadline.
+        # Returns True if the deadline passed before the partition completed. Time spent waiting for
+        # the partition to start does not count towards the deadline.
+        _, hedged_partition, future = in_flight_partition
+        assert hedged_partition is not None
+        while not future.done():
+            start_time = hedged_partition.start_time
+            if start_time is None:
+                timeout = deadline
+            else:
+                timeout = start_time + deadline - time.monotonic()
+                if timeout <= 0:
+                    return True
+            concurrent.futures.wait([future], timeout=timeout)
+        return False
+
+    def _download_from_unknown_blob_size(
+        self, offset: int, length: Optional[int] = None
+    ) -> bytes:
+        partitions = self._get_partition_planner().plan_unknown_size(offset, length)
+        if len(partitions) == 1:
+            return self._download_with_retries(*partitions[0])
+        return b"".join(
+            self._iter_speculative_partition_results(
+                partitions,
+                lambda pos, length, set_blob_properties, etags: (
+                    self._download_with_retries(
+                        pos,
+                        length,
+                        set_blob_properties=set_blob_properties,
+                        etags=etags,
+                    )
+                ),
+            )
+        )
+
+    def _download_into_from_unknown_blob_size(
+        self, buffer: memoryview, offset: int
+    ) -> int:
+        partitions = self._get_partition_planner().plan_unknown_size(
+            offset, len(buffer)
+        )
+        if len(partitions) == 1:
+            return self._download_into_with_retries(buffer[: partitions[0][1]], offset)
+
+        def download_partition(
+            pos: int,
+            length: int,
+            set_blob_properties: bool,
+            etags: List[Optional[str]],
+        ) -> int:
+            buffer_pos = pos - offset
+            return self._download_into_with_retries(
+                buffer[buffer_pos : buffer_pos + length],
+                pos,
+                set_blob_properties=set_blob_properties,
+                etags=etags,
+            )
+
+        return sum(
+            self._iter_speculative_partition_results(partitions, download_partition)
+        )
+
+    def _iter_speculative_partition_results(
+        self,
+        partitions: List[Tuple[int, int]],
+        download_partition: Callable[
+            [int, int, bool, List[Optional[str]]], _READ_STREAM_RESULT_TYPE
+        ],
+    ) -> Iterator[_READ_STREAM_RESULT_TYPE]:
+        # All partitions are requested at once. Only the first partition sets the blob properties
+        # that later requests are conditioned on, so the remaining partitions are checked to be
+        # from the same version of the blob once the first partition has been downloaded.
+        first_pos = partitions[0][0]
+
+        def download_speculative_partition(
+            partition: Tuple[int, int], hedged_partition: Optional[_HedgedPartition]
+        ) -> Tuple[Optional[_READ_STREAM_RESULT_TYPE], List[Optional[str]]]:
+            pos, length = partition
+            speculative = pos != first_pos
+            etags: List[Optional[str]] = []
+            try:
+                result = download_partition(pos, length, not speculative, etags)
+            except azure.core.exceptions.HttpResponseError as e:
+                if speculative and self._is_invalid_range_past_end_of_blob_error(
+                    e, pos
+                ):
+                    return None, etags
+                raise
+            return result, etags
+
+        # Requests made before the blob size is known are not conditioned on an ETag so they
+        # are not hedged, which could otherwise mix content from different versions of the blob.
+        results = self._iter_partition_results(
+            partitions, download_speculative_partition, hedge=False
+        )
+        try:
+            for (_, length), (result, etags) in zip(partitions, results):
+                if result is None:
+                    # The partition started past the end of the blob.
+                    return
+                self._raise_if_etags_do_not_match(etags)
+                yield result
+                if self._get_num_bytes(result) < length:
+                    # The blob ended within this partition so any remaining partitions
+                    # are past the end of the blob.
+                    return
+        finally:
+            results.close()
+
+    def _raise_if_etags_do_not_match(self, etags: List[Optional[str]]) -> None:
+        if self._blob_properties is None:
+            return
+        for etag in etags:
+            if etag is not None and etag != self._blob_properties.etag:
+                raise azure.core.exceptions.ResourceModifiedError(
+                    message="The blob was modified while it was being downloaded."
+                )
+
+    def _get_num_bytes(self, result: Union[bytes, int]) -> int:
+        if isinstance(result, int):
+            return result
+        return len(result)
+
+    def _download_with_retries(
+        self,
+        pos: int,
+        length: int,
+        hedged_partition: Optional[_HedgedPartition] = None,
+        set_blob_properties: bool = True,
+        etags: Optional[List[Optional[str]]] = None,
+    ) -> bytes:
+        content = io.BytesIO()
+
+        def write_chunk(chunk_pos: int, chunk: Union[bytes, memoryview]) -> None:
+            if hedged_partition is not None:
+                # Stop reading if the other request for the partition already completed.
+                hedged_partition.check()
+            content.write(chunk)
+
+        self._call_with_download_retries(
+            pos, length, write_chunk, set_blob_properties, etags
+        )
+        return content.getvalue()
+
+    def _download_into_with_retries(
+        self,
+        buffer: memoryview,
+        pos: int,
+        hedged_partition: Optional[_HedgedPartition] = None,
+        set_blob_properties: bool = True,
+        etags: Optional[List[Optional[str]]] = None,
+    ) -> int:
+        return self._call_with_download_retries(
+            pos,
+            len(buffer),
+            functools.partial(
+                self._write_chunk_into,
+                buffer=buffer,
+                hedged_partition=hedged_partition,
+            ),
+            set_blob_properties,
+            etags,
+        )
+
+    def _call_with_download_retries(
+        self,
+        pos: int,
+        length: int,
+        write_chunk: Callable[[int, Union[bytes, memoryview]], None],
+        set_blob_properties: bool = True,
+        etags: Optional[List[Optional[str]]] = None,
+    ) -> int:
+        # Downloads the range, passing each chunk to write_chunk() along with its position relative
+        # to the start of the range. If the stream is interrupted, the download is resumed from the
+        # last received byte instead of downloading the whole range again. Resumed requests are
+        # conditioned on the blob's ETag so that content from different versions is never mixed.
+        retry_policy = self._get_retry_policy()
+        bandwidth_limiter = self._get_bandwidth_limiter()
+        account = self._get_account()
+        received = 0
+        attempt = 0
+        while True:
+            start_time = time.monotonic()
+            attempt_start = received
+            try:
+                stream = self._get_download_stream(
+                    pos + received, length - received, set_blob_properties
+                )
+                if etags is not None:
+                    etags.append(self._get_etag_from_download(stream))
+                blob_size = self._get_blob_size_from_download(stream)
+                if blob_size is not None:
+                    # Ranges may extend past the end of the blob. Only the bytes that exist are
+                    # expected so that a resumed request never starts past the end of the blob.
+                    length = min(length, blob_size - pos)
+                for chunk in stream:
+                    # Pacing how quickly the stream is read also paces how quickly the service
+                    # sends the rest of the response.
+                    bandwidth_limiter.acquire(len(chunk), "interactive")
+                    write_chunk(received, chunk)
+                    received += len(chunk)
+            except azure.core.exceptions.AzureError as e:
+                if received and received >= length:
+                    # The stream failed after all of the range was received.
+                    return received
+                if retry_policy.is_throttling_error(e):
+                    self._get_scheduler().record_throttled(account)
+                backoff_time = retry_policy.get_retry_delay(account, e, attempt)
+                if backoff_time is None:
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "Sleeping %s seconds and resuming download at byte %s from caught exception (retry stats: %s).",
+                    backoff_time,
+                    pos + received,
+                    retry_policy.get_stats(account),
+                    exc_info=True,
+                )
+                time.sleep(backoff_time)
+                continue
+            retry_policy.record_success(account)
+            elapsed_time = time.monotonic() - start_time
+            self._get_partition_planner().record_throughput(
+                received - attempt_start, elapsed_time
+            )
+            self._get_scheduler().record_transfer(
+                account, received - attempt_start, elapsed_time
+            )
+            return received
+
+    def _call_with_retries(
+        self, fn: Callable[[], _RETRY_RESULT_TYPE], num_bytes: int = 0
+    ) -> _RETRY_RESULT_TYPE:
+        retry_policy = self._get_retry_policy()
+        account = self._get_account()
+        attempt = 0
+        while True:
+            start_time = time.monotonic()
+            try:
+                result = fn()
+            except azure.core.exceptions.AzureError as e:
+                if retry_policy.is_throttling_error(e):
+                    self._get_scheduler().record_throttled(account)
+                backoff_time = retry_policy.get_retry_delay(account, e, attempt)
+                if backoff_time is None:
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "Sleeping %s seconds and retrying request from caught exception (retry stats: %s).",
+                    backoff_time,
+                    retry_policy.get_stats(account),
+                    exc_info=True,
+                )
+                time.sleep(backoff_time)
+                continue
+            retry_policy.record_success(account)
+            self._get_scheduler().record_transfer(
+                account, num_bytes, time.monotonic() - start_time
+            )
+            return result
+
+    def _get_download_stream(
+        self, pos: int, length: int, set_blob_properties: bool = True
+    ) -> Union[Iterator[bytes], _FastDownloadStream]:
+        try:
+            download_kwargs = self._get_download_kwargs(pos, length)
+            response = self._get_fast_download_transport().download(
+                self._sdk_blob_client, download_kwargs["range"], self._get_if_match()
+            )
+            if response is None:
+                response = self._generated_sdk_storage_client.blob.download(
+                    **download_kwargs
+                )
+            if self._blob_properties is None and set_blob_properties:
+                self._set_blob_properties_from_download(response)
+            return response
+        except azure.core.exceptions.HttpResponseError as e:
+            if self._set_empty_blob_properties_if_needed(e, set_blob_properties):
+                return iter([b""])
+            # TODO: This is so that we properly map exceptions from the generated client to the correct
+            # exception class and error code. In the future, prior to a GA, we should consider pulling
+            # in this function or a derivative of it if we plan to continue to raise Azure Python SDK
+            # exceptions from this library (i.e. instead of raising our own exception classes).
+            process_storage_error(e)
+
+    def _write_chunk_into(
+        self,
+        chunk_pos: int,
+        chunk: Union[bytes, memoryview],
+        buffer: memoryview,
+        hedged_partition: Optional[_HedgedPartition] = None,
+    ) -> None:
+        if hedged_partition is not None:
+            hedged_partition.write(buffer, chunk_pos, chunk)
+        else:
+            buffer[chunk_pos : chunk_pos + len(chunk)] = chunk
+
+    def _stage_block(self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> str:
+        block_id = str(uuid.uuid4())
+
+        def stage_block() -> None:
+            self._get_bandwidth_limiter().acquire(len(data), "bulk")
+            self._sdk_blob_client.stage_block(block_id, data, retry_total=0)
+
+        # Staging a block with the same ID again overwrites it, so failed requests can be retried.
+        self._call_with_retries(stage_block, len(data))
+        return block_id
@@ -0,0 +1,222 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# Minimal parsing of ZIP archive metadata, which is the format torch.save() uses for checkpoints.
+# The standard library's zipfile module requires a file-like object that it can seek and read from
+# directly. Parsing is instead done here on already downloaded byte ranges so that callers are in
+# control of how many and which ranged GETs are made against a blob.
+#
+# See the ZIP specification for the record layouts: https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT
+import struct
+from typing import List, NamedTuple, Optional, Tuple, Union
+from typing_extensions import Buffer
+
+_END_OF_CENTRAL_DIRECTORY_STRUCT = struct.Struct("<4s4H2LH")
+_END_OF_CENTRAL_DIRECTORY_SIGNATURE = b"PK\x05\x06"
+_ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_STRUCT = struct.Struct("<4sLQL")
+_ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_END_OF_CENTRAL_DIRECTORY_STRUCT = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_END_OF_CENTRAL_DIRECTORY_SIGNATURE = b"PK\x06\x06"
+_CENTRAL_DIRECTORY_FILE_HEADER_STRUCT = struct.Struct("<4s6H3L5H2L")
+_CENTRAL_DIRECTORY_FILE_HEADER_SIGNATURE = b"PK\x01\x02"
+_LOCAL_FILE_HEADER_STRUCT = struct.Struct("<4s5H3L2H")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+_EXTRA_FIELD_HEADER_STRUCT = struct.Struct("<2H")
+_ZIP64_EXTRA_FIELD_ID = 0x0001
+_ZIP64_PLACEHOLDER = 0xFFFFFFFF
+_UTF8_FILENAME_FLAG = 0x800
+_MAX_COMMENT_SIZE = 2**16 - 1
+
+LOCAL_FILE_HEADER_SIZE = _LOCAL_FILE_HEADER_STRUCT.size
+
+# The maximum number of bytes at the end of an archive that need to be read to locate the central
+# directory: the end of central directory record with a maximum sized comment, the ZIP64 end of central
+# directory locator, and the ZIP64 end of central directory record.
+MAX_END_OF_CENTRAL_DIRECTORY_SIZE = (
+    _END_OF_CENTRAL_DIRECTORY_STRUCT.size
+    + _MAX_COMMENT_SIZE
+    + _ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_STRUCT.size
+    + _ZIP64_END_OF_CENTRAL_DIRECTORY_STRUCT.size
+)
+
+
+class CentralDirectoryLocation(NamedTuple):
+    offset: int
+    size: int
+    num_entries: int
+
+
+class ZipEntry(NamedTuple):
+    name: str
+    header_offset: int
+    compressed_size: int
+    compress_type: int
+
+
+def find_central_directory(
+    tail: bytes, tail_offset: int
+) -> Optional[CentralDirectoryLocation]:
+    """Locate the central directory from the trailing bytes of an archive.
+
+    :param tail: The last bytes of the archive. Should be at least ``MAX_END_OF_CENTRAL_DIRECTORY_SIZE``
+        bytes (or the entire archive if smaller) to guarantee the end of central directory is found.
+    :param tail_offset: The offset of ``tail`` within the archive.
+
+    :returns: The location of the central directory or ``None`` if ``tail`` does not end with a ZIP
+        end of central directory record.
+    """
+    eocd_pos = _find_end_of_central_directory(tail)
+    if eocd_pos is None:
+        return None
+    (
+        _,
+        _,
+        _,
+        _,
+        num_entries,
+        cd_size,
+        cd_offset,
+        _,
+    ) = _END_OF_CENTRAL_DIRECTORY_STRUCT.unpack_from(tail, eocd_pos)
+    locator_pos = eocd_pos - _ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_STRUCT.size
+    if (
+        locator_pos >= 0
+        and tail[locator_pos : locator_pos + 4]
+        == _ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_SIGNATURE
+    ):
+        _, _, zip64_eocd_offset, _ = (
+            _ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR_STRUCT.unpack_from(
+                tail, locator_pos
+            )
+        )
+        zip64_eocd_pos = zip64_eocd_offset - tail_offset
+        if (
+            zip64_eocd_pos < 0
+            or tail[zip64_eocd_pos : zip64_eocd_pos + 4]
+            != _ZIP64_END_OF_CENTRAL_DIRECTORY_SIGNATURE
+        ):
+            return None
+        (
+            _,
+            _,
+            _,
+            _,
+            _,
+            _,
+            _,
+            num_entries,
+            cd_size,
+            cd_offset,
+        ) = _ZIP64_END_OF_CENTRAL_DIRECTORY_STRUCT.unpack_from(tail, zip64_eocd_pos)
+    return CentralDirectoryLocation(cd_offset, cd_size, num_entries)
+
+
+def _find_end_of_central_directory(tail: bytes) -> Optional[int]:
+    # Most archives, including those written by torch.save(), have no comment. So first check if the
+    # record is at the very end before searching backwards for an archive with a comment.
+    eocd_pos = len(tail) - _END_OF_CENTRAL_DIRECTORY_STRUCT.size
+    while eocd_pos >= 0:
+        if (
+            tail[eocd_pos : eocd_pos + 4] == _END_OF_CENTRAL_DIRECTORY_SIGNATURE
+            and _get_comment_length(tail, eocd_pos)
+            == len(tail) - eocd_pos - _END_OF_CENTRAL_DIRECTORY_STRUCT.size
+        ):
+            return eocd_pos
+        eocd_pos = tail.rfind(_END_OF_CENTRAL_DIRECTORY_SIGNATURE, 0, eocd_pos)
+    return None
+
+
+def _get_comment_length(tail: bytes, eocd_pos: int) -> int:
+    return _END_OF_CENTRAL_DIRECTORY_STRUCT.unpack_from(tail, eocd_pos)[-1]
+
+
+def parse_central_directory(data: Union[bytes, bytearray]) -> List[ZipEntry]:
+    """Parse all file headers in a central directory.
+
+    :param data: The entire content of the central directory.
+
+    :returns: The entries in the archive in the order they appear in the central directory.
+    """
+    entries = []
+    pos = 0
+    while pos + _CENTRAL_DIRECTORY_FILE_HEADER_STRUCT.size <= len(data):
+        (
+            signature,
+            _,
+            _,
+            flags,
+            compress_type,
+            _,
+            _,
+            _,
+            compressed_size,
+            uncompressed_size,
+            name_length,
+            extra_length,
+            comment_length,
+            _,
+            _,
+            _,
+            header_offset,
+        ) = _CENTRAL_DIRECTORY_FILE_HEADER_STRUCT.unpack_from(data, pos)
+        if signature != _CENTRAL_DIRECTORY_FILE_HEADER_SIGNATURE:
+            raise ValueError(f"Invalid central directory file header at offset: {pos}")
+        pos += _CENTRAL_DIRECTORY_FILE_HEADER_STRUCT.size
+        raw_name = bytes(data[pos : pos + name_length])
+        name = raw_name.decode("utf-8" if flags & _UTF8_FILENAME_FLAG else "cp437")
+        pos += name_length
+        compressed_size, header_offset = _apply_zip64_extra_field(
+            data[pos : pos + extra_length],
+            uncompressed_size,
+            compressed_size,
+            header_offset,
+        )
+        pos += extra_length + comment_length
+        entries.append(ZipEntry(name, header_offset, compressed_size, compress_type))
+    return entries
+
+
+def get_local_file_data_offset(local_header: Buffer) -> int:
+    """Get the offset of a file's data relative to the start of its local file header.
+
+    The local file header's extra field can differ from the central directory's (e.g., torch.save()
+    pads it to align data). So the offset can only be determined from the local file header itself.
+
+    :param local_header: Bytes starting at the local file header. Must be at least
+        ``LOCAL_FILE_HEADER_SIZE`` bytes.
+    """
+    signature, *_, name_length, extra_length = _LOCAL_FILE_HEADER_STRUCT.unpack_from(
+        local_header
+    )
+    if signature != _LOCAL_FILE_HEADER_SIGNATURE:
+        raise ValueError("Invalid local file header")
+    return _LOCAL_FILE_HEADER_STRUCT.size + name_length + extra_length
+
+
+def _apply_zip64_extra_field(
+    extra: Union[bytes, bytearray],
+    uncompressed_size: int,
+    compressed_size: int,
+    header_offset: int,
+) -> Tuple[int, int]:
+    pos = 0
+    while pos + _EXTRA_FIELD_HEADER_STRUCT.size <= len(extra):
+        field_id, field_size = _EXTRA_FIELD_HEADER_STRUCT.unpack_from(extra, pos)
+        pos += _EXTRA_FIELD_HEADER_STRUCT.size
+        if field_id == _ZIP64_EXTRA_FIELD_ID:
+            # Values are only present in the ZIP64 extra field if the corresponding value in the
+            # header is set to the placeholder, and they are always in this order.
+            field_pos = pos
+            if uncompressed_size == _ZIP64_PLACEHOLDER:
+                field_pos += 8
+            if compressed_size == _ZIP64_PLACEHOLDER:
+                (compressed_size,) = struct.unpack_from("<Q", extra, field_pos)
+                field_pos += 8
+            if header_offset == _ZIP64_PLACEHOLDER:
+                (header_offset,) = struct.unpack_from("<Q", extra, field_pos)
+            break
+        pos += field_size
+    return compressed_size, header_offset
@@ -0,0 +1,581 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import collections
+import io
+import logging
+import mmap
+import os
+import pickle
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+import weakref
+
+import torch
+import torch.serialization
+
+from azstoragetorch import _client
+from azstoragetorch import _zip
+from azstoragetorch.io import BlobIO
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_ZIP_STORED = 0
+_PICKLE_RECORD_NAME = "data.pkl"
+# Number of additional bytes to download past a record's name when downloading its local file
+# header and data in a single request. The local file header's extra field is not listed in the
+# central directory; torch.save() uses it to pad data to a 64 byte alignment.
+_LOCAL_FILE_HEADER_EXTRA_FIELD_ALLOWANCE = 256
+# Chunk states for LocalCheckpointFile. They are stored in a bytearray with one byte per chunk.
+_CHUNK_MISSING = 0
+_CHUNK_IN_PROGRESS = 1
+_CHUNK_PRESENT = 2
+
+
+def load_lazy(
+    blob_url: str,
+    *,
+    credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+    **_internal_only_kwargs,
+) -> Any:
+    """Load a checkpoint saved with :py:func:`torch.save()` without downloading tensor data.
+
+    Only the checkpoint's index and pickled object structure are downloaded. Each tensor in the
+    returned object is a :py:class:`LazyTensor` that downloads only its own data when
+    :py:meth:`LazyTensor.materialize` is called. Use this to load a subset of a large
+    ``state_dict``. For example::
+
+        from azstoragetorch.checkpoint import load_lazy
+
+        state_dict = load_lazy(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>/<blob-name>"
+        )
+        encoder_state_dict = {
+            key: tensor.materialize()
+            for key, tensor in state_dict.items()
+            if key.startswith("encoder.")
+        }
+
+    Only objects that can be loaded by :py:func:`torch.load()` with ``weights_only=True`` and
+    are composed of containers, primitive types, and dense CPU tensors are supported.
+
+    :param blob_url: The full endpoint URL to the blob. The URL respects
+        SAS tokens, snapshots, and version IDs in its query string.
+    :param credential: The credential to use for authentication. If not specified,
+        :py:class:`azure.identity.DefaultAzureCredential` will be used. When set to
+        ``False``, anonymous requests will be made. If the ``blob_url`` contains a SAS token,
+        this parameter is ignored.
+    :returns: The loaded object with each tensor replaced by a :py:class:`LazyTensor`.
+    """
+    reader = _CheckpointReader(
+        blob_url,
+        BlobIO(blob_url, "rb", credential=credential, **_internal_only_kwargs),
+    )
+    return reader.load()
+
+
+class LocalCheckpointFile:
+    """Local file of a checkpoint in Azure Blob Storage that is filled in the background.
+
+    Use this class to load a checkpoint with :py:func:`torch.load()` using ``mmap=True``, which
+    requires a path to a local file. On instantiation, a sparse file the size of the blob is created
+    at ``path`` and a background thread starts downloading the blob into it using concurrent ranged
+    requests. Other work, such as constructing the model, can proceed while the checkpoint downloads.
+    Call :py:meth:`fill` to wait for the file to be filled before loading it. For example::
+
+        import torch
+        from azstoragetorch.checkpoint import LocalCheckpointFile
+
+        with LocalCheckpointFile(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>/<blob-name>",
+            "/mnt/nvme/model.pth",
+        ) as f:
+            model = MyModel()
+            f.fill()
+            model.load_state_dict(torch.load(f.path, mmap=True))
+
+    Because the file is memory-mapped by :py:func:`torch.load()` instead of read into memory, the
+    checkpoint's data is not duplicated in memory. Reading any part of the file that has not been
+    filled returns zeros, so make sure the ranges being read are filled using :py:meth:`fill`.
+
+    :param blob_url: The full endpoint URL to the blob. The URL respects
+        SAS tokens, snapshots, and version IDs in its query string.
+    :param path: The local path to create the file at. Any existing file at the path is
+        overwritten. The file is **not** removed when closed.
+    :param credential: The credential to use for authentication. If not specified,
+        :py:class:`azure.identity.DefaultAzureCredential` will be used. When set to
+        ``False``, anonymous requests will be made. If the ``blob_url`` contains a SAS token,
+        this parameter is ignored.
+    :param background_fill: Whether to download the blob into the file in a background thread. If
+        ``False``, ranges are only downloaded when requested with :py:meth:`fill`.
+    """
+
+    _CHUNK_SIZE = 16 * 1024 * 1024
+    # Number of consecutive chunks the background fill downloads at once. Each chunk is downloaded
+    # as a separate, concurrent ranged request.
+    _BACKGROUND_FILL_CHUNKS = 8
+
+    def __init__(
+        self,
+        blob_url: str,
+        path: Union[str, os.PathLike],
+        *,
+        credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        background_fill: bool = True,
+        **_internal_only_kwargs,
+    ):
+        self._path = os.fspath(path)
+        self._client = self._get_azstoragetorch_blob_client(
+            blob_url,
+            credential,
+            _internal_only_kwargs.get("_azstoragetorch_blob_client"),
+        )
+        self._size = self._client.get_blob_size()
+        self._file = open(self._path, "wb+")
+        self._mmap: Optional[mmap.mmap] = None
+        try:
+            self._file.truncate(self._size)
+            if self._size > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), self._size)
+        except BaseException:
+            self._file.close()
+            raise
+        self._chunk_states = bytearray(-(-self._size // self._CHUNK_SIZE))
+        self._condition = threading.Condition()
+        self._closed = False
+        self._background_thread: Optional[threading.Thread] = None
+        if background_fill and self._chunk_states:
+            self._background_thread = threading.Thread(
+                target=self._background_fill, daemon=True
+            )
+            self._background_thread.start()
+
+    def __enter__(self) -> "LocalCheckpointFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def path(self) -> str:
+        """The path to the local file."""
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """The size of the file in bytes."""
+        return self._size
+
+    def fill(self, offset: int = 0, length: Optional[int] = None) -> None:
+        """Wait for a range of the file to be filled.
+
+        Any part of the range not yet downloaded by the background fill is downloaded on the
+        calling thread. If the background fill failed, its remaining ranges are downloaded
+        when requested with this method.
+
+        :param offset: The offset of the range to fill. Defaults to the start of the file.
+        :param length: The length of the range to fill. If not specified, the range extends to
+            the end of the file.
+        """
+        self._validate_not_closed()
+        start_chunk, end_chunk = self._get_chunk_range(offset, length)
+        while True:
+            with self._condition:
+                chunks = self._claim_missing_chunks(start_chunk, end_chunk)
+                if chunks is None:
+                    if self._all_chunks_present(start_chunk, end_chunk):
+                        return
+                    self._condition.wait()
+                    continue
+            self._download_chunks(*chunks)
+
+    def is_filled(self, offset: int = 0, length: Optional[int] = None) -> bool:
+        """Whether a range of the file is filled.
+
+        :param offset: The offset of the range to check. Defaults to the start of the file.
+        :param length: The length of the range to check. If not specified, the range extends to
+            the end of the file.
+        """
+        start_chunk, end_chunk = self._get_chunk_range(offset, length)
+        with self._condition:
+            return self._all_chunks_present(start_chunk, end_chunk)
+
+    def close(self) -> None:
+        """Stop the background fill and close the file.
+
+        The file remains at :py:attr:`path`, including any ranges that were not filled.
+        """
+        if self._closed:
+            return
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._background_thread is not None:
+            self._background_thread.join()
+        # The memory map is not explicitly closed because views of it passed to downloads may still
+        # be referenced (e.g., by a traceback), which would cause close() to raise. It is instead
+        # unmapped once no longer referenced.
+        self._mmap = None
+        self._file.close()
+        self._client.close()
+
+    def _get_azstoragetorch_blob_client(
+        self,
+        blob_url: str,
+        credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE,
+        azstoragetorch_blob_client: Optional[_client.AzStorageTorchBlobClient] = None,
+    ) -> _client.AzStorageTorchBlobClient:
+        if azstoragetorch_blob_client is not None:
+            return azstoragetorch_blob_client
+        return _client.BLOB_CLIENT_FACTORY_CACHE.get_blob_client_from_url(
+            blob_url, credential
+        )
+
+    def _validate_not_closed(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file")
+
+    def _get_chunk_range(self, offset: int, length: Optional[int]) -> Tuple[int, int]:
+        if offset < 0:
+            raise ValueError(f"Offset must be non-negative: {offset}")
+        end = self._size if length is None else min(offset + length, self._size)
+        if end <= offset:
+            return 0, 0
+        return offset // self._CHUNK_SIZE, -(-end // self._CHUNK_SIZE)
+
+    def _all_chunks_present(self, start_chunk: int, end_chunk: int) -> bool:
+        return (
+            self._chunk_states.count(_CHUNK_PRESENT, start_chunk, end_chunk)
+            == end_chunk - start_chunk
+        )
+
+    def _claim_missing_chunks(
+        self, start_chunk: int, end_chunk: int, max_chunks: Optional[int] = None
+    ) -> Optional[Tuple[int, int]]:
+        # Must be called while holding the condition's lock. Claims the first run of consecutive
+        # missing chunks in the range so that no other thread downloads them.
+        first = self._chunk_states.find(_CHUNK_MISSING, start_chunk, end_chunk)
+        if first == -1:
+            return None
+        last = first + 1
+        while (
+            last < end_chunk
+            and self._chunk_states[last] == _CHUNK_MISSING
+            and (max_chunks is None or last - first < max_chunks)
+        ):
+            last += 1
+        self._set_chunk_states(first, last, _CHUNK_IN_PROGRESS)
+        return first, last
+
+    def _download_chunks(self, start_chunk: int, end_chunk: int) -> None:
+        assert self._mmap is not None
+        start = start_chunk * self._CHUNK_SIZE
+        end = min(end_chunk * self._CHUNK_SIZE, self._size)
+        try:
+            self._client.download_into(
+                memoryview(self._mmap)[start:end], offset=start, length=end - start
+            )
+        except BaseException:
+            with self._condition:
+                self._set_chunk_states(start_chunk, end_chunk, _CHUNK_MISSING)
+                self._condition.notify_all()
+            raise
+        with self._condition:
+            self._set_chunk_states(start_chunk, end_chunk, _CHUNK_PRESENT)
+            self._condition.notify_all()
+
+    def _set_chunk_states(self, start_chunk: int, end_chunk: int, state: int) -> None:
+        self._chunk_states[start_chunk:end_chunk] = bytes([state]) * (
+            end_chunk - start_chunk
+        )
+
+    def _background_fill(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                chunks = self._claim_missing_chunks(
+                    0, len(self._chunk_states), self._BACKGROUND_FILL_CHUNKS
+                )
+                if chunks is None:
+                    if self._all_chunks_present(0, len(self._chunk_states)):
+                        return
+                    # Remaining chunks are being downloaded by calls to fill(). Wait in case any
+                    # of them fail and need to be retried.
+                    self._condition.wait()
+                    continue
+            try:
+                self._download_chunks(*chunks)
+            except Exception:
+                # Errors are not raised from the background thread. The failed chunks are marked
+                # as missing so that they are downloaded, and any errors raised, by fill().
+                _LOGGER.warning(
+                    "Stopping background download of %s after failing to download chunks.",
+                    self._path,
+                    exc_info=True,
+                )
+                return
+
+
+class LazyTensor:
+    """Tensor from a checkpoint whose data is downloaded when materialized.
+
+    Metadata such as :py:attr:`shape` and :py:attr:`dtype` is available without downloading
+    any data. Instantiating class directly using ``__init__()`` is **not** supported. Use
+    :py:func:`load_lazy` instead.
+    """
+
+    def __init__(
+        self,
+        storage: "_LazyStorage",
+        storage_offset: int,
+        size: Tuple[int, ...],
+        stride: Tuple[int, ...],
+        requires_grad: bool,
+        backward_hooks: Dict[Any, Any],
+    ):
+        self._storage = storage
+        self._storage_offset = storage_offset
+        self._size = torch.Size(size)
+        self._stride = stride
+        self._requires_grad = requires_grad
+        self._backward_hooks = backward_hooks
+        self._parameter_state: Optional[Tuple[bool, Dict[Any, Any], Any]] = None
+
+    def __repr__(self) -> str:
+        return f"LazyTensor(shape={tuple(self.shape)}, dtype={self.dtype})"
+
+    @property
+    def shape(self) -> torch.Size:
+        """The shape of the tensor."""
+        return self._size
+
+    @property
+    def dtype(self) -> torch.dtype:
+        """The data type of the tensor."""
+        return self._storage.dtype
+
+    @property
+    def is_parameter(self) -> bool:
+        """Whether the tensor was saved as a :py:class:`torch.nn.Parameter`."""
+        return self._parameter_state is not None
+
+    def materialize(self) -> torch.Tensor:
+        """Download the tensor's data and return it as a tensor.
+
+        Only the checkpoint record backing the tensor is downloaded. Tensors that were saved
+        sharing the same storage (e.g., views or tied weights) share storage once materialized
+        as long as a previously materialized tensor is still referenced.
+
+        :returns: The tensor on the CPU. If the tensor was saved as a :py:class:`torch.nn.Parameter`,
+            a :py:class:`torch.nn.Parameter` is returned.
+        """
+        tensor = torch._utils._rebuild_tensor_v2(
+            self._storage.materialize(),
+            self._storage_offset,
+            self._size,
+            self._stride,
+            self._requires_grad,
+            self._backward_hooks,
+        )
+        if self._parameter_state is not None:
+            requires_grad, backward_hooks, state = self._parameter_state
+            tensor = torch._utils._rebuild_parameter_with_state(
+                tensor, requires_grad, backward_hooks, state
+            )
+        return tensor
+
+    def _set_parameter_state(
+        self, requires_grad: bool, backward_hooks: Dict[Any, Any], state: Any = None
+    ) -> "LazyTensor":
+        self._parameter_state = (requires_grad, backward_hooks, state)
+        return self
+
+
+class _LazyStorage:
+    def __init__(
+        self,
+        reader: "_CheckpointReader",
+        key: str,
+        dtype: torch.dtype,
+        nbytes: int,
+    ):
+        self._reader = reader
+        self._key = key
+        self.dtype = dtype
+        self._nbytes = nbytes
+
+    def materialize(self) -> torch.storage.TypedStorage:
+        return torch.storage.TypedStorage(
+            wrap_storage=self._reader.get_untyped_storage(self._key, self._nbytes),
+            dtype=self.dtype,
+            _internal=True,
+        )
+
+
+class _CheckpointReader:
+    def __init__(self, blob_url: str, blob_io: BlobIO):
+        self._blob_url = blob_url
+        self._blob_io = blob_io
+        self._lock = threading.Lock()
+        self._record_prefix = ""
+        self._entries: Dict[str, _zip.ZipEntry] = {}
+        self._lazy_storages: Dict[str, _LazyStorage] = {}
+        self._untyped_storages: weakref.WeakValueDictionary[
+            str, torch.UntypedStorage
+        ] = weakref.WeakValueDictionary()
+
+    def load(self) -> Any:
+        self._load_entries()
+        unpickler = _LazyUnpickler(self, self.read_record(_PICKLE_RECORD_NAME))
+        return unpickler.load()
+
+    def get_lazy_storage(
+        self, key: str, dtype: torch.dtype, numel: int
+    ) -> _LazyStorage:
+        if key not in self._lazy_storages:
+            nbytes = numel * torch._utils._element_size(dtype)
+            self._lazy_storages[key] = _LazyStorage(self, key, dtype, nbytes)
+        return self._lazy_storages[key]
+
+    def get_untyped_storage(self, key: str, nbytes: int) -> torch.UntypedStorage:
+        storage = self._untyped_storages.get(key)
+        if storage is None:
+            if nbytes == 0:
+                storage = torch.UntypedStorage(0)
+            else:
+                data = self.read_record(f"data/{key}")
+                storage = torch.frombuffer(data, dtype=torch.uint8).untyped_storage()
+            self._untyped_storages[key] = storage
+        return storage
+
+    def read_record(self, name: str) -> memoryview:
+        entry = self._get_entry(name)
+        if entry.compress_type != _ZIP_STORED:
+            raise ValueError(f"Compressed checkpoint records are not supported: {name}")
+        # Optimistically download the local file header and the record's data in a single request.
+        # A second request is only needed if the header's extra field is larger than expected.
+        content = bytearray(
+            _zip.LOCAL_FILE_HEADER_SIZE
+            + len(entry.name.encode("utf-8"))
+            + _LOCAL_FILE_HEADER_EXTRA_FIELD_ALLOWANCE
+            + entry.compressed_size
+        )
+        num_read = self._readinto(content, entry.header_offset)
+        data_offset = _zip.get_local_file_data_offset(content)
+        data_end = data_offset + entry.compressed_size
+        if data_end <= num_read:
+            return memoryview(content)[data_offset:data_end]
+        data = bytearray(entry.compressed_size)
+        self._readinto(data, entry.header_offset + data_offset)
+        return memoryview(data)
+
+    def _load_entries(self) -> None:
+        with self._lock:
+            blob_size = self._blob_io.seek(0, os.SEEK_END)
+            tail_offset = max(blob_size - _zip.MAX_END_OF_CENTRAL_DIRECTORY_SIZE, 0)
+            self._blob_io.seek(tail_offset)
+            tail = self._blob_io.read()
+        location = _zip.find_central_directory(tail, tail_offset)
+        if location is None:
+            raise ValueError(
+                f"Blob is not a checkpoint saved with torch.save(): {self._blob_url}"
+            )
+        central_directory: Union[bytes, bytearray]
+        if location.offset >= tail_offset:
+            central_directory_start = location.offset - tail_offset
+            central_directory = tail[
+                central_directory_start : central_directory_start + location.size
+            ]
+        else:
+            central_directory = bytearray(location.size)
+            self._readinto(central_directory, location.offset)
+        for entry in _zip.parse_central_directory(central_directory):
+            self._entries[entry.name] = entry
+            if entry.name.endswith(f"/{_PICKLE_RECORD_NAME}"):
+                self._record_prefix = entry.name[: -len(_PICKLE_RECORD_NAME)]
+
+    def _get_entry(self, name: str) -> _zip.ZipEntry:
+        record_name = self._record_prefix + name
+        if record_name not in self._entries:
+            raise ValueError(f"Record not found in checkpoint: {record_name}")
+        return self._entries[record_name]
+
+    def _readinto(self, b: bytearray, offset: int) -> int:
+        with self._lock:
+            self._blob_io.seek(offset)
+            return self._blob_io.readinto(b)
+
+
+def _rebuild_lazy_tensor(
+    storage: _LazyStorage,
+    storage_offset: int,
+    size: Tuple[int, ...],
+    stride: Tuple[int, ...],
+    requires_grad: bool,
+    backward_hooks: Dict[Any, Any],
+    metadata: Any = None,
+) -> LazyTensor:
+    return LazyTensor(
+        storage, storage_offset, size, stride, requires_grad, backward_hooks
+    )
+
+
+def _rebuild_lazy_parameter(
+    data: LazyTensor, requires_grad: bool, backward_hooks: Dict[Any, Any]
+) -> LazyTensor:
+    return data._set_parameter_state(requires_grad, backward_hooks)
+
+
+def _rebuild_lazy_parameter_with_state(
+    data: LazyTensor, requires_grad: bool, backward_hooks: Dict[Any, Any], state: Any
+) -> LazyTensor:
+    return data._set_parameter_state(requires_grad, backward_hooks, state)
+
+
+class _LazyUnpickler(pickle.Unpickler):
+    _ALLOWED_GLOBALS = {
+        ("collections", "OrderedDict"): collections.OrderedDict,
+        ("torch._utils", "_rebuild_tensor_v2"): _rebuild_lazy_tensor,
+        ("torch._utils", "_rebuild_parameter"): _rebuild_lazy_parameter,
+        (
+            "torch._utils",
+            "_rebuild_parameter_with_state",
+        ): _rebuild_lazy_parameter_with_state,
+        ("torch", "Size"): torch.Size,
+        ("torch", "device"): torch.device,
+    }
+
+    def __init__(self, reader: _CheckpointReader, data: memoryview):
+        super().__init__(io.BytesIO(data), encoding="utf-8")
+        self._reader = reader
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in self._ALLOWED_GLOBALS:
+            return self._ALLOWED_GLOBALS[(module, name)]
+        if module == "torch":
+            if name == "UntypedStorage":
+                return torch.UntypedStorage
+            if name.endswith("Storage"):
+                return torch.serialization.StorageType(name)
+            if isinstance(getattr(torch, name, None), torch.dtype):
+                return getattr(torch, name)
+        raise pickle.UnpicklingError(
+            f"Unsupported global in checkpoint for lazy loading: {module}.{name}"
+        )
+
+    def persistent_load(self, pid: Any) -> _LazyStorage:
+        typename, storage_type, key, _, numel = pid
+        if typename != "storage":
+            raise pickle.UnpicklingError(
+                f"Unsupported persistent id in checkpoint: {typename}"
+            )
+        if storage_type is torch.UntypedStorage:
+            dtype = torch.uint8
+        else:
+            dtype = storage_type.dtype
+        return self._reader.get_lazy_storage(key, dtype, numel)
@@ -4,19 +4,40 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from collections.abc import Callable, Iterable, Iterator
-from typing import Optional, Union, TypedDict, cast
+import collections
+import concurrent.futures
+import inspect
+import os
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sized
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    TypedDict,
+    cast,
+    get_args,
+)
 from typing_extensions import Self, TypeVar
 
 import torch.utils.data
 
-from azstoragetorch.io import BlobIO
+from azstoragetorch.io import AsyncBlobIO, BlobIO
+from azstoragetorch import _aio_client
 from azstoragetorch import _client
 
 
 _TransformOutputType_co = TypeVar(
     "_TransformOutputType_co", covariant=True, default="_DefaultTransformOutput"
 )
+_PREFETCH_TYPE = Union[int, Literal["auto"]]
+_TRANSFORM_ORDER_TYPE = Literal["ordered", "unordered"]
 
 
 class _DefaultTransformOutput(TypedDict):
@@ -34,6 +55,16 @@ def _default_transform(blob: "Blob") -> _DefaultTransformOutput:
     return ret
 
 
+async def _default_async_transform(blob: "Blob") -> _DefaultTransformOutput:
+    async with blob.async_reader() as f:
+        content = await f.read()
+    ret: _DefaultTransformOutput = {
+        "url": blob.url,
+        "data": content,
+    }
+    return ret
+
+
 class Blob:
     """Object representing a single blob in a dataset.
 
@@ -53,12 +84,27 @@ class Blob:
         )
         print(type(dataset[0]))  # Type should be: <class 'bytes'>
 
+    When asynchronously iterating over an :py:class:`IterableBlobDataset`, use
+    :py:meth:`async_reader` instead of :py:meth:`reader` to read a blob's content. For example::
+
+        async def to_bytes(blob: Blob) -> bytes:
+            async with blob.async_reader() as f:
+                return await f.read()
 
     Instantiating class directly using ``__init__()`` is **not** supported.
     """
 
-    def __init__(self, blob_client: _client.AzStorageTorchBlobClient):
+    def __init__(
+        self,
+        blob_client: Union[
+            _client.AzStorageTorchBlobClient,
+            _aio_client.AsyncAzStorageTorchBlobClient,
+        ],
+        prefetched_download: Optional[_client.DOWNLOAD_FUTURE_TYPE] = None,
+    ):
         self._blob_client = blob_client
+        self._prefetched_download = prefetched_download
+        self._prefetched_content: Optional[memoryview] = None
 
     @property
     def url(self) -> str:
@@ -83,10 +129,64 @@ class Blob:
 
         :returns: A file-like object for reading the blob's content.
         """
+        if isinstance(self._blob_client, _aio_client.AsyncAzStorageTorchBlobClient):
+            raise RuntimeError(
+                "Blob is from asynchronous iteration over a dataset. Use async_reader() to read it."
+            )
+        prefetched_content = self._get_prefetched_content()
+        if prefetched_content is not None:
+            return BlobIO(
+                self._blob_client.url,
+                "rb",
+                _azstoragetorch_blob_client=self._blob_client,
+                _prefetched_content=prefetched_content,
+            )
         return BlobIO(
             self._blob_client.url, "rb", _azstoragetorch_blob_client=self._blob_client
         )
 
+    def async_reader(self) -> AsyncBlobIO:
+        """Open asynchronous file-like object for reading the blob's content.
+
+        Only supported for blobs from asynchronously iterating over an
+        :py:class:`IterableBlobDataset` (i.e., using ``async for``).
+
+        :returns: An asynchronous file-like object for reading the blob's content.
+        """
+        if not isinstance(self._blob_client, _aio_client.AsyncAzStorageTorchBlobClient):
+            raise RuntimeError(
+                "Blob is not from asynchronous iteration over a dataset. Use reader() to read it."
+            )
+        return AsyncBlobIO(
+            self._blob_client.url, "rb", _azstoragetorch_blob_client=self._blob_client
+        )
+
+    def _get_prefetched_content(self) -> Optional[memoryview]:
+        if self._prefetched_download is None:
+            return None
+        if self._prefetched_content is None:
+            self._prefetched_content = self._complete_prefetched_download(
+                self._prefetched_download.result()
+            )
+        return self._prefetched_content
+
+    def _complete_prefetched_download(self, prefix: bytes) -> memoryview:
+        # Only the start of blobs larger than the prefetched range is downloaded ahead of time. The
+        # rest of those blobs is downloaded into the same buffer, using concurrent ranged requests,
+        # instead of downloading the start of the blob again.
+        blob_client = cast(_client.AzStorageTorchBlobClient, self._blob_client)
+        blob_size = blob_client.get_blob_size()
+        if len(prefix) >= blob_size:
+            return memoryview(prefix)
+        content = memoryview(bytearray(blob_size))
+        content[: len(prefix)] = prefix
+        blob_client.download_into(content[len(prefix) :], offset=len(prefix))
+        return content
+
+    def _cancel_prefetch(self) -> None:
+        if self._prefetched_download is not None:
+            self._prefetched_download.cancel()
+
 
 class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
     """Map-style dataset for blobs in Azure Blob Storage.
@@ -128,12 +228,55 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
 
     To override the output format, provide a ``transform`` callable to either :py:meth:`from_blob_urls`
     or :py:meth:`from_container_url` when creating the dataset.
+
+    **Batched loading**
+
+    When the :py:class:`~torch.utils.data.DataLoader` loads a batch of data samples, all blobs in
+    the batch are downloaded concurrently using :py:meth:`__getitems__` instead of one at a time.
+    To transform a whole batch at once (e.g., to decode all data samples in a single vectorized
+    call), provide a ``batch_transform`` callable. It receives the list of :py:class:`Blob` objects
+    in the batch, whose content is already downloaded when read, and its output is passed to the
+    ``DataLoader``'s ``collate_fn``. For example::
+
+        import numpy as np
+
+        def to_array(blobs: list[Blob]) -> np.ndarray:
+            contents = []
+            for blob in blobs:
+                with blob.reader() as f:
+                    contents.append(f.read())
+            return np.frombuffer(b"".join(contents), dtype=np.uint8).reshape(len(blobs), -1)
+
+        dataset = BlobDataset.from_container_url(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>",
+            batch_transform=to_array,
+        )
+        loader = torch.utils.data.DataLoader(
+            dataset, batch_size=256, collate_fn=lambda batch: batch
+        )
+
+    **Prefetching**
+
+    The order data samples are loaded in is only known by the ``DataLoader``'s sampler. Wrap the
+    sampler with :py:class:`PrefetchSampler` to download upcoming data samples in the background
+    while earlier data samples are transformed, even when data samples are shuffled. See
+    :py:class:`PrefetchSampler` for more information.
+
+    **Parallel transforms**
+
+    By default, ``transform`` is called for each data sample in a batch, one at a time, in the
+    thread loading the batch. Set ``transform_threads`` when creating the dataset to instead
+    call ``transform`` for the data samples in a batch concurrently on a pool of threads. This
+    allows a single process (or ``DataLoader`` worker) to use multiple cores when ``transform``
+    releases the GIL (e.g., decoding images with PIL or ``torchvision.io``).
     """
 
     def __init__(
         self,
         blobs: Iterable[Blob],
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        batch_transform: Optional[Callable[[List[Blob]], Any]] = None,
+        transform_threads: Optional[int] = None,
     ):
         self._blobs = list(blobs)
         if transform is None:
@@ -141,6 +284,18 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
                 Callable[[Blob], _TransformOutputType_co], _default_transform
             )
         self._transform = transform
+        self._batch_transform = batch_transform
+        _validate_transform_threads(transform_threads)
+        self._transform_pool: Optional[_TransformPool] = None
+        if transform_threads is not None:
+            self._transform_pool = _TransformPool(transform_threads)
+        # Blobs prefetched for upcoming indices by a PrefetchSampler, in the order the indices
+        # are expected to be retrieved, along with the process they were prefetched in.
+        self._prefetched_blobs: Deque[Tuple[int, Blob]] = collections.deque()
+        self._prefetched_pid = os.getpid()
+        # Number of data samples retrieved from this copy of the dataset, which lets a PrefetchSampler
+        # tell whether the data samples it returns indices for are retrieved in its process.
+        self._num_retrieved = 0
 
     @classmethod
     def from_blob_urls(
@@ -149,6 +304,8 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         *,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        batch_transform: Optional[Callable[[List[Blob]], Any]] = None,
+        transform_threads: Optional[int] = None,
     ) -> Self:
         """Instantiate dataset from provided blob URLs.
 
@@ -172,11 +329,23 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param batch_transform: A callable that accepts the list of :py:class:`Blob` objects in a
+            batch of data samples loaded with :py:meth:`__getitems__` and returns a transformed
+            output for the whole batch. If specified, it is used instead of ``transform`` when
+            loading batches. See **Batched loading** in :py:class:`BlobDataset` for more information.
+        :param transform_threads: The number of threads to call ``transform`` on concurrently when
+            loading batches of data samples with :py:meth:`__getitems__`. If not specified,
+            ``transform`` is called in the thread loading the batch.
 
         :returns: Dataset formed from the provided blob URLs.
         """
         blobs = _BlobUrlsBlobIterable(blob_urls, credential=credential)
-        return cls(blobs, transform=transform)
+        return cls(
+            blobs,
+            transform=transform,
+            batch_transform=batch_transform,
+            transform_threads=transform_threads,
+        )
 
     @classmethod
     def from_container_url(
@@ -186,6 +355,8 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         prefix: Optional[str] = None,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        batch_transform: Optional[Callable[[List[Blob]], Any]] = None,
+        transform_threads: Optional[int] = None,
     ) -> Self:
         """Instantiate dataset by listing blobs from provided container URL.
 
@@ -208,13 +379,25 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param batch_transform: A callable that accepts the list of :py:class:`Blob` objects in a
+            batch of data samples loaded with :py:meth:`__getitems__` and returns a transformed
+            output for the whole batch. If specified, it is used instead of ``transform`` when
+            loading batches. See **Batched loading** in :py:class:`BlobDataset` for more information.
+        :param transform_threads: The number of threads to call ``transform`` on concurrently when
+            loading batches of data samples with :py:meth:`__getitems__`. If not specified,
+            ``transform`` is called in the thread loading the batch.
 
         :returns: Dataset formed from the blobs in the provided container URL.
         """
         blobs = _ContainerUrlBlobIterable(
             container_url, prefix=prefix, credential=credential
         )
-        return cls(blobs, transform=transform)
+        return cls(
+            blobs,
+            transform=transform,
+            batch_transform=batch_transform,
+            transform_threads=transform_threads,
+        )
 
     def __getitem__(self, index: int) -> _TransformOutputType_co:
         """Retrieve the blob at the specified index in the dataset.
@@ -222,9 +405,32 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         :param index: The index of the blob to retrieve.
         :returns: The blob, with ``transform`` applied, at the specified index.
         """
-        blob = self._blobs[index]
+        blob = self._get_blob(index)
         return self._transform(blob)
 
+    def __getitems__(self, indices: List[int]) -> Any:
+        """Retrieve the blobs at the specified indices in the dataset.
+
+        The blobs are downloaded concurrently. If ``transform_threads`` was specified, ``transform``
+        is also applied to the blobs concurrently. This method is called by the
+        :py:class:`~torch.utils.data.DataLoader` to load batches of data samples.
+
+        :param indices: The indices of the blobs to retrieve.
+        :returns: A list of the blobs, with ``transform`` applied, at the specified indices.
+            If ``batch_transform`` was specified, its output for the list of blobs is returned instead.
+        """
+        blobs = [self._get_blob(index) for index in indices]
+        prefetched_blobs = _BlobPrefetcher(len(blobs)).iter_blobs(blobs)
+        if self._batch_transform is not None:
+            return self._batch_transform(list(prefetched_blobs))
+        if self._transform_pool is not None:
+            return list(
+                _ThreadedTransform(self._transform, self._transform_pool).iter_outputs(
+                    prefetched_blobs
+                )
+            )
+        return [self._transform(blob) for blob in prefetched_blobs]
+
     def __len__(self) -> int:
         """Return the number of blobs in the dataset.
 
@@ -232,6 +438,217 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         """
         return len(self._blobs)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Prefetched downloads are specific to the process they were started in and cannot be
+        # pickled (e.g., when the dataset is sent to DataLoader worker processes).
+        state = self.__dict__.copy()
+        state["_prefetched_blobs"] = collections.deque()
+        return state
+
+    def _get_blob(self, index: int) -> Blob:
+        self._discard_prefetched_blobs_from_other_process()
+        self._num_retrieved += 1
+        for i, (prefetched_index, blob) in enumerate(self._prefetched_blobs):
+            if prefetched_index == index:
+                # Indices before this one were skipped by the consumer (e.g., the last partial
+                # batch when using drop_last) and are not expected to be retrieved.
+                for _ in range(i):
+                    _, skipped_blob = self._prefetched_blobs.popleft()
+                    skipped_blob._cancel_prefetch()
+                self._prefetched_blobs.popleft()
+                return blob
+        return self._blobs[index]
+
+    def _prefetch_index(self, index: int) -> None:
+        self._discard_prefetched_blobs_from_other_process()
+        self._prefetched_blobs.append((index, _prefetch_blob(self._blobs[index])))
+
+    def _get_num_retrieved(self) -> int:
+        return self._num_retrieved
+
+    def _get_num_prefetched(self) -> int:
+        self._discard_prefetched_blobs_from_other_process()
+        return len(self._prefetched_blobs)
+
+    def _discard_prefetched(self) -> None:
+        for _, blob in self._prefetched_blobs:
+            blob._cancel_prefetch()
+        self._prefetched_blobs.clear()
+
+    def _discard_prefetched_blobs_from_other_process(self) -> None:
+        # A forked process inherits downloads prefetched by its parent, which will never complete
+        # in the child as the threads downloading them do not exist in the child.
+        if self._prefetched_pid != os.getpid():
+            self._prefetched_blobs = collections.deque()
+            self._prefetched_pid = os.getpid()
+
+
+class PrefetchSampler(torch.utils.data.Sampler[int]):
+    """Sampler that prefetches upcoming data samples from a :py:class:`BlobDataset`.
+
+    Wraps a sampler and returns the same indices in the same order. As indices are returned,
+    the blobs for a bounded window of upcoming indices are downloaded in the background, so that
+    they are already downloaded when retrieved from the dataset. This hides request latency for
+    any order of data samples, including shuffled orders. For example::
+
+        import torch.utils.data
+        from azstoragetorch.datasets import BlobDataset, PrefetchSampler
+
+        dataset = BlobDataset.from_container_url(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>"
+        )
+        sampler = PrefetchSampler(torch.utils.data.RandomSampler(dataset), dataset)
+        loader = torch.utils.data.DataLoader(dataset, sampler=sampler, batch_size=32)
+
+    The window is carried across epochs: once the last indices of an epoch are prefetched, the
+    order of the next epoch is drawn from the wrapped sampler and its first indices are
+    prefetched before the epoch starts. If the wrapped sampler has a ``set_epoch()`` method
+    (e.g., :py:class:`~torch.utils.data.distributed.DistributedSampler`), call ``set_epoch()``
+    on this sampler instead, before each epoch. The next epoch's order is then drawn for the epoch
+    following the last one set, and is drawn again if a different epoch is set.
+
+    Data samples are prefetched in the process iterating over the sampler, starting once the
+    dataset in that process retrieves a data sample for a returned index. Use this sampler with a
+    ``DataLoader`` that loads data samples in the main process (i.e., ``num_workers=0``). With
+    ``DataLoader`` worker processes, indices are returned in the main process but data samples are
+    retrieved in the workers, so no data samples are prefetched.
+
+    :param sampler: The sampler or iterable of indices to wrap.
+    :param dataset: The dataset the indices are retrieved from.
+    :param prefetch: The maximum number of data samples that are prefetched but not yet
+        retrieved from the dataset. If not specified, it is the maximum number of concurrent
+        requests made by the process. Only the first 8 MiB of each blob is prefetched; the rest
+        of larger blobs is downloaded when they are opened.
+    """
+
+    def __init__(
+        self,
+        sampler: Iterable[int],
+        dataset: BlobDataset,
+        *,
+        prefetch: Optional[int] = None,
+    ):
+        self._sampler = sampler
+        self._dataset = dataset
+        self._validate_prefetch(prefetch)
+        self._prefetch = prefetch
+        self._epoch: Optional[int] = None
+        self._next_epoch_indices: Optional[_EpochIndices] = None
+        # Number of data samples retrieved from the dataset before indices were first returned.
+        self._num_retrieved_before_iter: Optional[int] = None
+        self._retrieved_in_process = False
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the indices of the wrapped sampler.
+
+        :returns: An iterator over the indices of the wrapped sampler, in the same order.
+        """
+        if self._num_retrieved_before_iter is None:
+            self._num_retrieved_before_iter = self._dataset._get_num_retrieved()
+        epoch_indices = self._next_epoch_indices
+        if epoch_indices is None:
+            epoch_indices = _EpochIndices(iter(self._sampler), self._epoch)
+        self._next_epoch_indices = None
+        while True:
+            self._prefetch_ahead(epoch_indices)
+            if epoch_indices.prefetched:
+                yield epoch_indices.prefetched.popleft()
+                continue
+            # The window is full, so indices are returned without being prefetched until
+            # prefetched data samples are retrieved from the dataset.
+            index = epoch_indices.next_index()
+            if index is None:
+                return
+            yield index
+
+    def __len__(self) -> int:
+        """Return the number of indices in the wrapped sampler.
+
+        :returns: The number of indices in the wrapped sampler.
+        """
+        return len(cast(Sized, self._sampler))
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch of the wrapped sampler, if it supports setting epochs.
+
+        Indices already prefetched for the next epoch are discarded if they were drawn for a
+        different epoch.
+
+        :param epoch: The epoch number.
+        """
+        self._epoch = epoch
+        if not hasattr(self._sampler, "set_epoch"):
+            return
+        next_epoch_indices = self._next_epoch_indices
+        if next_epoch_indices is not None and next_epoch_indices.epoch == epoch:
+            return
+        self._next_epoch_indices = None
+        self._dataset._discard_prefetched()
+        self._sampler.set_epoch(epoch)  # type: ignore[attr-defined]
+
+    def _prefetch_ahead(self, epoch_indices: "_EpochIndices") -> None:
+        if not self._is_retrieved_in_process():
+            return
+        while self._dataset._get_num_prefetched() < self._get_window_size():
+            if epoch_indices.exhausted:
+                epoch_indices = self._get_next_epoch_indices()
+            index = epoch_indices.next_index()
+            if index is None:
+                return
+            self._dataset._prefetch_index(index)
+            epoch_indices.prefetched.append(index)
+
+    def _is_retrieved_in_process(self) -> bool:
+        # With DataLoader worker processes, the sampler is iterated over in the main process while
+        # data samples are retrieved from copies of the dataset in the workers. Data samples prefetched
+        # in the main process would never be retrieved, so prefetching only starts once the dataset in
+        # this process retrieves data samples after indices are returned.
+        if not self._retrieved_in_process:
+            self._retrieved_in_process = (
+                self._dataset._get_num_retrieved() != self._num_retrieved_before_iter
+            )
+        return self._retrieved_in_process
+
+    def _get_next_epoch_indices(self) -> "_EpochIndices":
+        if self._next_epoch_indices is None:
+            next_epoch = None
+            if self._epoch is not None and hasattr(self._sampler, "set_epoch"):
+                next_epoch = self._epoch + 1
+                self._sampler.set_epoch(next_epoch)
+            self._next_epoch_indices = _EpochIndices(iter(self._sampler), next_epoch)
+        return self._next_epoch_indices
+
+    def _get_window_size(self) -> int:
+        if self._prefetch is not None:
+            return self._prefetch
+        return _client.IO_SCHEDULER.max_in_flight_requests
+
+    def _validate_prefetch(self, prefetch: Optional[int]) -> None:
+        if prefetch is None:
+            return
+        if isinstance(prefetch, bool) or not isinstance(prefetch, int):
+            raise TypeError(f"prefetch must be an integer, not: {type(prefetch)}")
+        if prefetch < 1:
+            raise ValueError("prefetch must be greater than or equal to 1")
+
+
+class _EpochIndices:
+    # Indices of a single iteration over a sampler. Indices drawn from the sampler ahead of being
+    # returned, in order to prefetch them, are held in prefetched.
+    def __init__(self, indices: Iterator[int], epoch: Optional[int] = None):
+        self.epoch = epoch
+        self.prefetched: Deque[int] = collections.deque()
+        self.exhausted = False
+        self._indices = indices
+
+    def next_index(self) -> Optional[int]:
+        if self.exhausted:
+            return None
+        index = next(self._indices, None)
+        if index is None:
+            self.exhausted = True
+        return index
+
 
 class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_co]):
     """Iterable-style dataset for blobs in Azure Blob Storage.
@@ -261,6 +678,44 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
     the dataset automatically shards data samples returned across workers to avoid the
     ``DataLoader`` returning duplicate data samples from its workers.
 
+    **Prefetching**
+
+    By default, each blob is downloaded when its ``transform`` reads it. Set ``prefetch`` when
+    creating the dataset to instead download upcoming blobs concurrently, in the background, while
+    earlier blobs are transformed. This allows a single process (or ``DataLoader`` worker) to keep
+    many requests in flight instead of waiting on one request at a time::
+
+        dataset = IterableBlobDataset.from_container_url(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>",
+            prefetch="auto",
+        )
+
+    Data samples are still returned in the same order as without prefetching, and each
+    ``DataLoader`` worker only prefetches blobs from its own shard.
+
+    **Parallel transforms**
+
+    By default, ``transform`` is called for one blob at a time in the thread iterating over the
+    dataset. Set ``transform_threads`` when creating the dataset to instead call ``transform``
+    for multiple blobs concurrently on a pool of threads. This allows a single process (or
+    ``DataLoader`` worker) to use multiple cores when ``transform`` releases the GIL (e.g.,
+    decoding images with PIL or ``torchvision.io``), so fewer ``DataLoader`` workers are needed.
+    Set ``transform_order="unordered"`` to return data samples as soon as they are transformed
+    instead of in the order of the blobs in the dataset.
+
+    **Asynchronous iteration**
+
+    From code running in an :py:mod:`asyncio` event loop, the dataset can also be iterated over
+    using ``async for``. Blobs are then listed and downloaded by the event loop instead of by
+    threads, and the ``transform`` may be an ``async def`` function, which is awaited for each
+    blob. Use :py:meth:`Blob.async_reader` to read blob content from the ``transform``::
+
+        async for sample in dataset:
+            print(sample)
+
+    Asynchronous iteration requires the ``aiohttp`` package, which is installed with the ``aio``
+    extra (i.e., ``pip install azstoragetorch[aio]``).
+
     **Dataset output**
 
     The default output format of the dataset is a dictionary with the keys:
@@ -283,6 +738,9 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
         self,
         blobs: Iterable[Blob],
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        prefetch: Optional[_PREFETCH_TYPE] = None,
+        transform_threads: Optional[int] = None,
+        transform_order: _TRANSFORM_ORDER_TYPE = "ordered",
     ):
         self._blobs = blobs
         if transform is None:
@@ -290,6 +748,14 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
                 Callable[[Blob], _TransformOutputType_co], _default_transform
             )
         self._transform = transform
+        self._validate_prefetch(prefetch)
+        self._prefetch = prefetch
+        _validate_transform_threads(transform_threads)
+        self._transform_pool: Optional[_TransformPool] = None
+        if transform_threads is not None:
+            self._transform_pool = _TransformPool(transform_threads)
+        self._validate_transform_order(transform_order)
+        self._transform_order = transform_order
 
     @classmethod
     def from_blob_urls(
@@ -298,6 +764,9 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
         *,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        prefetch: Optional[_PREFETCH_TYPE] = None,
+        transform_threads: Optional[int] = None,
+        transform_order: _TRANSFORM_ORDER_TYPE = "ordered",
     ) -> Self:
         """Instantiate dataset from provided blob URLs.
 
@@ -321,11 +790,33 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param prefetch: The number of upcoming blobs to download in the background while earlier
+            blobs are transformed. When set to ``"auto"``, the number starts small and grows while
+            data samples are consumed faster than blobs are downloaded. The number is capped at the
+            maximum number of concurrent requests made by the process. Only the first 8 MiB of each
+            blob is prefetched; the rest of larger blobs is downloaded when they are opened.
+            If not specified, blobs are not prefetched. Prefetching does not apply to asynchronous
+            iteration.
+        :param transform_threads: The number of threads to call ``transform`` on concurrently.
+            If not specified, ``transform`` is called in the thread iterating over the dataset.
+            Does not apply to asynchronous iteration.
+        :param transform_order: The order data samples are returned in when ``transform_threads``
+            is specified. Supported values are:
+
+            * ``ordered`` - Data samples are returned in the order of the blobs in the dataset
+              (the default)
+            * ``unordered`` - Data samples are returned in the order they finish being transformed
 
         :returns: Dataset formed from the provided blob URLs.
         """
         blobs = _BlobUrlsBlobIterable(blob_urls, credential=credential)
-        return cls(blobs, transform=transform)
+        return cls(
+            blobs,
+            transform=transform,
+            prefetch=prefetch,
+            transform_threads=transform_threads,
+            transform_order=transform_order,
+        )
 
     @classmethod
     def from_container_url(
@@ -335,6 +826,9 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
         prefix: Optional[str] = None,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        prefetch: Optional[_PREFETCH_TYPE] = None,
+        transform_threads: Optional[int] = None,
+        transform_order: _TRANSFORM_ORDER_TYPE = "ordered",
     ) -> Self:
         """Instantiate dataset by listing blobs from provided container URL.
 
@@ -357,13 +851,35 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param prefetch: The number of upcoming blobs to download in the background while earlier
+            blobs are transformed. When set to ``"auto"``, the number starts small and grows while
+            data samples are consumed faster than blobs are downloaded. The number is capped at the
+            maximum number of concurrent requests made by the process. Only the first 8 MiB of each
+            blob is prefetched; the rest of larger blobs is downloaded when they are opened.
+            If not specified, blobs are not prefetched. Prefetching does not apply to asynchronous
+            iteration.
+        :param transform_threads: The number of threads to call ``transform`` on concurrently.
+            If not specified, ``transform`` is called in the thread iterating over the dataset.
+            Does not apply to asynchronous iteration.
+        :param transform_order: The order data samples are returned in when ``transform_threads``
+            is specified. Supported values are:
+
+            * ``ordered`` - Data samples are returned in the order of the blobs in the dataset
+              (the default)
+            * ``unordered`` - Data samples are returned in the order they finish being transformed
 
         :returns: Dataset formed from the blobs in the provided container URL.
         """
         blobs = _ContainerUrlBlobIterable(
             container_url, prefix=prefix, credential=credential
         )
-        return cls(blobs, transform=transform)
+        return cls(
+            blobs,
+            transform=transform,
+            prefetch=prefetch,
+            transform_threads=transform_threads,
+            transform_order=transform_order,
+        )
 
     def __iter__(self) -> Iterator[_TransformOutputType_co]:
         """Iterate over the blobs in the dataset.
@@ -372,15 +888,61 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
             The ``transform`` is applied lazily to each blob as it is yielded.
         """
         worker_info = torch.utils.data.get_worker_info()
-        for i, blob in enumerate(self._blobs):
+        blobs: Iterable[Blob] = (
+            blob
+            for i, blob in enumerate(self._blobs)
+            if self._should_yield_from_worker_shard(worker_info, i)
+        )
+        if self._prefetch is not None:
+            blobs = _BlobPrefetcher(self._prefetch).iter_blobs(blobs)
+        if self._transform_pool is not None:
+            yield from _ThreadedTransform(
+                self._transform,
+                self._transform_pool,
+                ordered=self._transform_order == "ordered",
+            ).iter_outputs(blobs)
+            return
+        for blob in blobs:
+            yield self._transform(blob)
+
+    async def __aiter__(self) -> AsyncIterator[_TransformOutputType_co]:
+        """Asynchronously iterate over the blobs in the dataset.
+
+        :returns: An asynchronous iterator over the blobs, with ``transform`` applied, in the
+            dataset. If ``transform`` returns an awaitable, it is awaited before being yielded.
+        """
+        transform: Callable = self._transform
+        if transform is _default_transform:
+            transform = _default_async_transform
+        worker_info = torch.utils.data.get_worker_info()
+        i = 0
+        async for blob in cast(_BaseBlobIterable, self._blobs):
             if self._should_yield_from_worker_shard(worker_info, i):
-                yield self._transform(blob)
+                output = transform(blob)
+                if inspect.isawaitable(output):
+                    output = await output
+                yield output
+            i += 1
 
     def _should_yield_from_worker_shard(self, worker_info, blob_index: int) -> bool:
         if worker_info is None:
             return True
         return blob_index % worker_info.num_workers == worker_info.id
 
+    def _validate_prefetch(self, prefetch: Optional[_PREFETCH_TYPE]) -> None:
+        if prefetch is None or prefetch == "auto":
+            return
+        if isinstance(prefetch, bool) or not isinstance(prefetch, int):
+            raise TypeError(
+                f"prefetch must be an integer or 'auto', not: {type(prefetch)}"
+            )
+        if prefetch < 1:
+            raise ValueError("prefetch must be greater than or equal to 1")
+
+    def _validate_transform_order(self, transform_order: str) -> None:
+        if transform_order not in get_args(_TRANSFORM_ORDER_TYPE):
+            raise ValueError(f"Unsupported transform_order: {transform_order}")
+
 
 class _BaseBlobIterable(Iterable[Blob]):
     def __init__(self, credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None):
@@ -392,6 +954,25 @@ class _BaseBlobIterable(Iterable[Blob]):
     def __iter__(self) -> Iterator[Blob]:
         raise NotImplementedError("__iter__")
 
+    async def __aiter__(self) -> AsyncIterator[Blob]:
+        # Asynchronous clients are created from a factory specific to the iteration as their
+        # transport can only be used from the event loop it was created in.
+        blob_client_factory = _aio_client.AsyncAzStorageTorchBlobClientFactory(
+            credential=self._credential
+        )
+        try:
+            async for blob_client in self._yield_async_blob_clients(
+                blob_client_factory
+            ):
+                yield Blob(blob_client)
+        finally:
+            await blob_client_factory.close()
+
+    def _yield_async_blob_clients(
+        self, blob_client_factory: _aio_client.AsyncAzStorageTorchBlobClientFactory
+    ) -> AsyncIterator[_aio_client.AsyncAzStorageTorchBlobClient]:
+        raise NotImplementedError("_yield_async_blob_clients")
+
 
 class _ContainerUrlBlobIterable(_BaseBlobIterable):
     def __init__(
@@ -411,6 +992,13 @@ class _ContainerUrlBlobIterable(_BaseBlobIterable):
         for blob_client in blob_clients:
             yield Blob(blob_client)
 
+    def _yield_async_blob_clients(
+        self, blob_client_factory: _aio_client.AsyncAzStorageTorchBlobClientFactory
+    ) -> AsyncIterator[_aio_client.AsyncAzStorageTorchBlobClient]:
+        return blob_client_factory.yield_blob_clients_from_container_url(
+            self._container_url, prefix=self._prefix
+        )
+
 
 class _BlobUrlsBlobIterable(_BaseBlobIterable):
     def __init__(
@@ -426,3 +1014,197 @@ class _BlobUrlsBlobIterable(_BaseBlobIterable):
     def __iter__(self) -> Iterator[Blob]:
         for blob_url in self._blob_urls:
             yield Blob(self._blob_client_factory.get_blob_client_from_url(blob_url))
+
+    async def _yield_async_blob_clients(
+        self, blob_client_factory: _aio_client.AsyncAzStorageTorchBlobClientFactory
+    ) -> AsyncIterator[_aio_client.AsyncAzStorageTorchBlobClient]:
+        for blob_url in self._blob_urls:
+            yield blob_client_factory.get_blob_client_from_url(blob_url)
+
+
+class _BlobPrefetcher:
+    # Keeps a window of upcoming blobs downloading on their clients' I/O scheduler while earlier
+    # blobs are consumed. Blobs are yielded in the order they are provided in. Each prefetch is a
+    # single ranged GET (see _prefetch_blob()).
+    #
+    # In auto mode, the window starts small and is doubled whenever a blob is consumed before its
+    # prefetch completed, which means data samples are consumed faster than blobs are downloaded.
+    # Consumers slower than downloads keep a small window, which bounds the memory held by
+    # prefetched content. The window is capped at the scheduler's in-flight limit as additional
+    # prefetches would only wait on the scheduler.
+    INITIAL_AUTO_WINDOW_SIZE = 2
+
+    def __init__(self, prefetch: _PREFETCH_TYPE):
+        self._auto = prefetch == "auto"
+        self._max_window_size = _client.IO_SCHEDULER.max_in_flight_requests
+        if self._auto:
+            window_size = self.INITIAL_AUTO_WINDOW_SIZE
+        else:
+            window_size = cast(int, prefetch)
+        self._window_size = min(window_size, self._max_window_size)
+
+    @property
+    def window_size(self) -> int:
+        return self._window_size
+
+    def iter_blobs(self, blobs: Iterable[Blob]) -> Iterator[Blob]:
+        blobs_iter = iter(blobs)
+        window: Deque[Blob] = collections.deque()
+        try:
+            self._fill_window(window, blobs_iter)
+            while window:
+                blob = window.popleft()
+                self._adjust_window_size(blob)
+                self._fill_window(window, blobs_iter)
+                yield blob
+        finally:
+            for blob in window:
+                blob._cancel_prefetch()
+
+    def _fill_window(self, window: Deque[Blob], blobs_iter: Iterator[Blob]) -> None:
+        while len(window) < self._window_size:
+            blob = next(blobs_iter, None)
+            if blob is None:
+                return
+            window.append(_prefetch_blob(blob))
+
+    def _adjust_window_size(self, blob: Blob) -> None:
+        if not self._auto or blob._prefetched_download is None:
+            return
+        if not blob._prefetched_download.done():
+            self._window_size = min(2 * self._window_size, self._max_window_size)
+
+
+_PREFETCH_RANGE_SIZE = 8 * 1024 * 1024
+
+
+def _prefetch_blob(blob: Blob) -> Blob:
+    # Starts downloading the start of the blob on its client's I/O scheduler. The download is a single
+    # ranged GET, instead of a partitioned download, so that prefetches never wait on other tasks in the
+    # scheduler. The rest of larger blobs is downloaded when they are opened (see Blob.reader()).
+    if blob._prefetched_download is not None:
+        return blob
+    blob_client = cast(_client.AzStorageTorchBlobClient, blob._blob_client)
+    return Blob(blob_client, blob_client.submit_download(0, _PREFETCH_RANGE_SIZE))
+
+
+class _TransformPool:
+    # Thread pool that a dataset's transforms are run on. The pool is shared by all batches and
+    # iterations over the dataset instead of creating and tearing down threads for each one. Like
+    # the I/O scheduler, threads are only created once needed and the pool is dropped in forked
+    # child processes (e.g., DataLoader workers), which create their own pool on first use. The
+    # pool is not pickled; unpickled copies also create their own pool on first use.
+    def __init__(self, num_threads: int):
+        self.num_threads = num_threads
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        _TRANSFORM_POOLS.add(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"num_threads": self.num_threads}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.num_threads = state["num_threads"]
+        self._executor = None
+        self._lock = threading.Lock()
+        _TRANSFORM_POOLS.add(self)
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any
+    ) -> concurrent.futures.Future[Any]:
+        return self._get_executor().submit(fn, *args)
+
+    def reset(self) -> None:
+        # Drops the executor without shutting it down since, in a forked child process, its worker
+        # threads do not exist. The lock is replaced as well since it may have been inherited while
+        # held by a thread that does not exist in the child.
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self.num_threads)
+            return self._executor
+
+
+_TRANSFORM_POOLS: "weakref.WeakSet[_TransformPool]" = weakref.WeakSet()
+
+
+def _reset_transform_pools() -> None:
+    for transform_pool in _TRANSFORM_POOLS:
+        transform_pool.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_transform_pools)
+
+
+class _ThreadedTransform:
+    # Applies a transform to blobs on a dataset's transform pool instead of the calling thread, so that
+    # transforms releasing the GIL (e.g., decoders) can use multiple cores. The pool is separate from the
+    # I/O scheduler's as transforms wait on downloads submitted to the scheduler. At most twice as many
+    # blobs as threads are submitted at once, which bounds the number of transformed outputs held when the
+    # consumer is slower than the transforms, while leaving threads work to do when the next output in
+    # order is still in progress.
+    def __init__(
+        self,
+        transform: Callable[[Blob], Any],
+        transform_pool: _TransformPool,
+        ordered: bool = True,
+    ):
+        self._transform = transform
+        self._transform_pool = transform_pool
+        self._ordered = ordered
+
+    def iter_outputs(self, blobs: Iterable[Blob]) -> Iterator[Any]:
+        blobs_iter = iter(blobs)
+        in_progress: Deque[concurrent.futures.Future[Any]] = collections.deque()
+        try:
+            self._submit_transforms(in_progress, blobs_iter)
+            while in_progress:
+                future = self._pop_next_future(in_progress)
+                output = future.result()
+                self._submit_transforms(in_progress, blobs_iter)
+                yield output
+        finally:
+            # Stop transforms that have not started if the consumer stops early or a transform
+            # failed, instead of transforming blobs whose outputs will never be consumed.
+            for future in in_progress:
+                future.cancel()
+
+    def _submit_transforms(
+        self,
+        in_progress: Deque[concurrent.futures.Future[Any]],
+        blobs_iter: Iterator[Blob],
+    ) -> None:
+        while len(in_progress) < 2 * self._transform_pool.num_threads:
+            blob = next(blobs_iter, None)
+            if blob is None:
+                return
+            in_progress.append(self._transform_pool.submit(self._transform, blob))
+
+    def _pop_next_future(
+        self, in_progress: Deque[concurrent.futures.Future[Any]]
+    ) -> concurrent.futures.Future[Any]:
+        if self._ordered:
+            return in_progress.popleft()
+        concurrent.futures.wait(
+            in_progress, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        # Of the completed futures, return the earliest submitted one so that outputs finishing
+        # at the same time are returned in order.
+        future = next(future for future in in_progress if future.done())
+        in_progress.remove(future)
+        return future
+
+
+def _validate_transform_threads(transform_threads: Optional[int]) -> None:
+    if transform_threads is None:
+        return
+    if isinstance(transform_threads, bool) or not isinstance(transform_threads, int):
+        raise TypeError(
+            f"transform_threads must be an integer, not: {type(transform_threads)}"
+        )
+    if transform_threads < 1:
+        raise ValueError("transform_threads must be greater than or equal to 1")
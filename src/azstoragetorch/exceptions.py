@@ -34,21 +34,17 @@ class FatalBlobIOWriteError(AZStorageTorchError):
 class ClientRequestIdMismatchError(AZStorageTorchError):
     """Raised when a client request ID in a response does not match the ID in it's originating request.
 
-    If receiving this error as part of using both an azstoragetorch dataset and a
-    PyTorch DataLoader, it may be because the dataset is being accessed in both the
-    main process and a DataLoader's worker process. This can cause unintentional
-    sharing of resources. To fix this error, consider not accessing the dataset's
-    samples in the main process or not using workers with the DataLoader.
+    This indicates that the response was read from a connection that was also used for another
+    request, for example, a connection shared with another process. ``azstoragetorch`` opens new
+    connections in processes created with :py:func:`os.fork` (e.g., PyTorch DataLoader worker
+    processes), so this error is not expected when using datasets with a DataLoader.
     """
 
     _MSG_FORMAT = (
         "Client request ID: {request_client_id} does not match echoed client request ID: "
         "{response_client_id}.  Service request ID: {service_request_id}. "
-        "If receiving this error as part of using both an azstoragetorch dataset and a "
-        "PyTorch DataLoader, it may be because the dataset is being accessed in both the "
-        "main process and a DataLoader's worker process. This can cause unintentional "
-        "sharing of resources. To fix this error, consider not accessing the dataset's "
-        "samples in the main process or not using workers with the DataLoader."
+        "The response may have been read from a connection that was also used for another "
+        "request, for example, a connection shared with another process."
     )
 
     def __init__(
@@ -4,19 +4,101 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import asyncio
+import collections
 import concurrent.futures
 import io
 import os
-from typing import get_args, Optional, Literal, List
-
+from typing import (
+    get_args,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Literal,
+    List,
+    NamedTuple,
+)
+
+from azstoragetorch import _aio_client
 from azstoragetorch import _client
+from azstoragetorch import _zip
 from azstoragetorch.exceptions import FatalBlobIOWriteError
 
 
 _SUPPORTED_MODES = Literal["rb", "wb"]
+_SUPPORTED_PREFETCH_STRATEGIES = Literal["zip"]
+
+
+class _BaseBlobIO:
+    # Validation shared by BlobIO and AsyncBlobIO. Subclasses set _mode and _stage_block_exception
+    # and implement closed.
+    _mode: str
+    _stage_block_exception: Optional[BaseException]
+
+    @property
+    def closed(self) -> bool:
+        raise NotImplementedError("closed")
+
+    def _validate_mode(self, mode: str) -> None:
+        if mode not in get_args(_SUPPORTED_MODES):
+            raise ValueError(f"Unsupported mode: {mode}")
+
+    def _validate_is_integer(self, param_name: str, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError(f"{param_name} must be an integer, not: {type(value)}")
+
+    def _validate_min(self, param_name: str, value: int, min_value: int) -> None:
+        if value < min_value:
+            raise ValueError(
+                f"{param_name} must be greater than or equal to {min_value}"
+            )
+
+    def _validate_supported_write_type(
+        self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE
+    ) -> None:
+        if not isinstance(b, get_args(_client.SUPPORTED_WRITE_BYTES_LIKE_TYPE)):
+            raise TypeError(
+                f"Unsupported type for write: {type(b)}. Supported types: {get_args(_client.SUPPORTED_WRITE_BYTES_LIKE_TYPE)}"
+            )
+
+    def _validate_readable(self) -> None:
+        if not self._is_read_mode():
+            raise io.UnsupportedOperation("read")
+
+    def _validate_seekable(self) -> None:
+        if not self._is_read_mode():
+            raise io.UnsupportedOperation("seek")
+
+    def _validate_writable(self) -> None:
+        if not self._is_write_mode():
+            raise io.UnsupportedOperation("write")
+
+    def _is_read_mode(self) -> bool:
+        return self._mode == "rb"
+
+    def _is_write_mode(self) -> bool:
+        return self._mode == "wb"
+
+    def _validate_not_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
 
+    def _raise_if_duplicate_block_ids(self, block_ids: List[str]) -> None:
+        # An additional safety measure to ensure we never reuse block IDs within a BlobIO instance. This
+        # should not be an issue with UUID4 for block IDs, but that may not always be the case if
+        # block ID generation changes in the future.
+        if len(block_ids) != len(set(block_ids)):
+            raise RuntimeError(
+                "Unexpected duplicate block IDs detected. Not committing blob."
+            )
+
+    def _raise_if_fatal_write_error(self) -> None:
+        if self._stage_block_exception is not None:
+            raise FatalBlobIOWriteError(self._stage_block_exception)
 
-class BlobIO(io.IOBase):
+
+class BlobIO(_BaseBlobIO, io.RawIOBase):
     """File-like object for reading and writing blobs in Azure Blob Storage.
 
     Use this class directly for PyTorch checkpointing by passing it directly to
@@ -32,6 +114,9 @@ class BlobIO(io.IOBase):
         .. literalinclude:: ../../samples/load_model.py
             :lines: 9-
 
+    In read mode, :py:class:`BlobIO` is a raw binary stream and can be wrapped with
+    :py:class:`io.BufferedReader` to buffer many small reads.
+
     :param blob_url: The full endpoint URL to the blob. The URL respects
         SAS tokens, snapshots, and version IDs in its query string.
     :param mode: The mode in which to open the blob. Supported modes are:
@@ -43,11 +128,37 @@ class BlobIO(io.IOBase):
         :py:class:`azure.identity.DefaultAzureCredential` will be used. When set to
         ``False``, anonymous requests will be made. If the ``blob_url`` contains a SAS token,
         this parameter is ignored.
+    :param prefetch: The strategy to use for prefetching blob content in read mode. If not
+        specified, content is downloaded as it is read. Supported strategies are:
+
+        * ``zip`` - Intended for loading checkpoints saved with :py:func:`torch.save()` using
+          :py:func:`torch.load()`. On first read, the end of the blob is downloaded to locate
+          the ZIP central directory. If found, the rest of the blob is then downloaded using concurrent
+          ranged requests and all subsequent reads are served from memory. If the blob is not
+          a ZIP archive, content is downloaded as it is read. The entire blob is held in memory
+          until the :py:class:`BlobIO` is closed.
+
+    :param partition_size: The size, in bytes, of the ranges that blob content is split into
+        when downloading it using concurrent ranged requests in read mode. If not specified, range
+        sizes are chosen based on the amount of content to download, the number of concurrent
+        requests available, and the throughput measured for previous downloads.
+    :param speculative_partitions: The number of ranges to request concurrently for the first
+        download from the blob in read mode, before the size of the blob is known. Ranges that turn
+        out to be past the end of the blob are discarded. If not specified, a single range is
+        requested to determine the size of the blob before downloading the rest of it concurrently.
+        Increasing this value reduces the time to download large blobs at the cost of additional
+        requests for small blobs.
+    :param hedge_requests: Whether to hedge ranged requests made when downloading blob content
+        concurrently in read mode. When enabled, if a range takes much longer to download than
+        previously downloaded ranges, a duplicate request is made for it and whichever request
+        finishes first is used. This reduces the impact of slow connections on the total download
+        time at the cost of a limited number of additional requests.
     """
 
     _READLINE_PREFETCH_SIZE = 4 * 1024 * 1024
     _READLINE_TERMINATOR = b"\n"
     _WRITE_BUFFER_SIZE = 32 * 1024 * 1024
+    _PREFETCHED_CHUNK_SIZE = 16 * 1024 * 1024
 
     def __init__(
         self,
@@ -55,14 +166,23 @@ class BlobIO(io.IOBase):
         mode: _SUPPORTED_MODES,
         *,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        prefetch: Optional[_SUPPORTED_PREFETCH_STRATEGIES] = None,
+        partition_size: Optional[int] = None,
+        speculative_partitions: Optional[int] = None,
+        hedge_requests: bool = False,
         **_internal_only_kwargs,
     ):
         self._blob_url = blob_url
         self._validate_mode(mode)
         self._mode = mode
+        self._validate_prefetch(prefetch)
+        self._prefetch = prefetch
         self._client = self._get_azstoragetorch_blob_client(
             blob_url,
             credential,
+            self._get_blob_client_kwargs(
+                partition_size, speculative_partitions, hedge_requests
+            ),
             _internal_only_kwargs.get("_azstoragetorch_blob_client"),
         )
 
@@ -78,6 +198,13 @@ class BlobIO(io.IOBase):
         ] = []
         self._stage_block_exception: Optional[BaseException] = None
         self._blob_size: Optional[int] = None
+        self._last_read_end: Optional[int] = None
+        self._read_ahead: Optional[_SequentialReadAhead] = None
+        self._prefetch_attempted = False
+        # Datasets provide content already downloaded ahead of the blob being opened.
+        self._prefetched_content: Optional[memoryview] = _internal_only_kwargs.get(
+            "_prefetched_content"
+        )
 
     def close(self) -> None:
         """Close the file-like object.
@@ -99,6 +226,8 @@ class BlobIO(io.IOBase):
             if self.writable():
                 self._commit_blob()
         finally:
+            self._reset_read_ahead()
+            self._prefetched_content = None
             self._close_client()
             self._closed = True
 
@@ -127,6 +256,22 @@ class BlobIO(io.IOBase):
         self._validate_not_closed()
         self._flush()
 
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over the blob's content, from the current position to the end, in chunks.
+
+        Chunks are downloaded concurrently in the background and yielded in order as soon as each
+        is ready. Only a bounded number of chunks are held in memory at a time, regardless of the
+        blob's size. This is useful for streaming a large blob to another consumer (e.g., a hash or
+        decompressor) at full download throughput. The position is advanced past each chunk as it
+        is yielded. Do not read from or seek the :py:class:`BlobIO` while iterating.
+
+        :returns: An iterator of the blob's content as :py:class:`bytes` chunks.
+        """
+        self._validate_readable()
+        self._validate_not_closed()
+        self._invalidate_readline_buffer()
+        return self._iter_chunks()
+
     def read(self, size: Optional[int] = -1, /) -> bytes:
         """Read bytes from the blob.
 
@@ -142,6 +287,37 @@ class BlobIO(io.IOBase):
         self._invalidate_readline_buffer()
         return self._read(size)
 
+    def readall(self) -> bytes:
+        """Read all remaining bytes from the blob.
+
+        :return: The bytes read from the blob.
+        """
+        return self.read()
+
+    def readinto(self, b: _client.SUPPORTED_READ_INTO_BUFFER_TYPE, /) -> int:
+        """Read bytes from the blob directly into a pre-allocated, writable bytes-like object.
+
+        :param b: The writable bytes-like object to read into (e.g., :py:class:`bytearray`,
+            :py:class:`memoryview`, or :py:class:`mmap.mmap`). Up to ``len(b)`` bytes are read.
+
+        :return: The number of bytes read. Returns ``0`` when at the end of the blob.
+        """
+        self._validate_readable()
+        self._validate_not_closed()
+        self._invalidate_readline_buffer()
+        return self._readinto(b)
+
+    def readinto1(self, b: _client.SUPPORTED_READ_INTO_BUFFER_TYPE, /) -> int:
+        """Read bytes from the blob directly into a pre-allocated, writable bytes-like object.
+
+        Equivalent to :py:meth:`readinto` as :py:class:`BlobIO` does not buffer reads.
+
+        :param b: The writable bytes-like object to read into.
+
+        :return: The number of bytes read. Returns ``0`` when at the end of the blob.
+        """
+        return self.readinto(b)
+
     def readable(self) -> bool:
         """Return whether file-like object is readable.
 
@@ -204,7 +380,7 @@ class BlobIO(io.IOBase):
         self._validate_not_closed()
         return self._position
 
-    def write(self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE, /) -> int:
+    def write(self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE, /) -> int:  # type: ignore[override]
         """Writes a bytes-like object to the blob
 
         Data written may not be immediately uploaded. Instead, data may be uploaded
@@ -239,49 +415,13 @@ class BlobIO(io.IOBase):
             return True
         return False
 
-    def _validate_mode(self, mode: str) -> None:
-        if mode not in get_args(_SUPPORTED_MODES):
-            raise ValueError(f"Unsupported mode: {mode}")
-
-    def _validate_is_integer(self, param_name: str, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError(f"{param_name} must be an integer, not: {type(value)}")
-
-    def _validate_min(self, param_name: str, value: int, min_value: int) -> None:
-        if value < min_value:
-            raise ValueError(
-                f"{param_name} must be greater than or equal to {min_value}"
-            )
-
-    def _validate_supported_write_type(
-        self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE
-    ) -> None:
-        if not isinstance(b, get_args(_client.SUPPORTED_WRITE_BYTES_LIKE_TYPE)):
-            raise TypeError(
-                f"Unsupported type for write: {type(b)}. Supported types: {get_args(_client.SUPPORTED_WRITE_BYTES_LIKE_TYPE)}"
-            )
-
-    def _validate_readable(self) -> None:
-        if not self._is_read_mode():
-            raise io.UnsupportedOperation("read")
-
-    def _validate_seekable(self) -> None:
+    def _validate_prefetch(self, prefetch: Optional[str]) -> None:
+        if prefetch is None:
+            return
+        if prefetch not in get_args(_SUPPORTED_PREFETCH_STRATEGIES):
+            raise ValueError(f"Unsupported prefetch: {prefetch}")
         if not self._is_read_mode():
-            raise io.UnsupportedOperation("seek")
-
-    def _validate_writable(self) -> None:
-        if not self._is_write_mode():
-            raise io.UnsupportedOperation("write")
-
-    def _is_read_mode(self) -> bool:
-        return self._mode == "rb"
-
-    def _is_write_mode(self) -> bool:
-        return self._mode == "wb"
-
-    def _validate_not_closed(self) -> None:
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
+            raise ValueError("Prefetch is only supported in read mode")
 
     def _invalidate_readline_buffer(self) -> None:
         # NOTE: We invalidate the readline buffer for any out-of-band read() or seek() in order to simplify
@@ -292,12 +432,35 @@ class BlobIO(io.IOBase):
         self,
         blob_url: str,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE,
+        client_kwargs: _client.BlobClientKwargsType,
         azstoragetorch_blob_client: Optional[_client.AzStorageTorchBlobClient] = None,
     ) -> _client.AzStorageTorchBlobClient:
         if azstoragetorch_blob_client is not None:
             return azstoragetorch_blob_client
-        client_factory = _client.AzStorageTorchBlobClientFactory(credential=credential)
-        return client_factory.get_blob_client_from_url(blob_url)
+        return _client.BLOB_CLIENT_FACTORY_CACHE.get_blob_client_from_url(
+            blob_url, credential, **client_kwargs
+        )
+
+    def _get_blob_client_kwargs(
+        self,
+        partition_size: Optional[int],
+        speculative_partitions: Optional[int],
+        hedge_requests: bool,
+    ) -> _client.BlobClientKwargsType:
+        client_kwargs: _client.BlobClientKwargsType = {}
+        # Clients use the process-wide planner, which shares measured throughput across clients,
+        # unless the partitioning is customized for this BlobIO.
+        if speculative_partitions is not None:
+            client_kwargs["partition_planner"] = _client.PartitionPlanner(
+                partition_size, speculative_partitions
+            )
+        elif partition_size is not None:
+            client_kwargs["partition_planner"] = _client.PartitionPlanner(
+                partition_size
+            )
+        if hedge_requests:
+            client_kwargs["request_hedger"] = _client.REQUEST_HEDGER
+        return client_kwargs
 
     def _get_blob_size(self):
         if self._blob_size is None:
@@ -308,11 +471,12 @@ class BlobIO(io.IOBase):
         consumed = b""
         if size == 0 or self._is_at_end_of_blob(fetch_blob_size=False):
             return consumed
+        self._prefetch_if_needed()
         limit = self._get_limit(size)
         if self._readline_buffer:
             consumed = self._consume_from_readline_buffer(consumed, limit)
         while self._should_download_more_for_readline(consumed, limit):
-            self._readline_buffer = self._client.download(
+            self._readline_buffer = self._download(
                 offset=self._position, length=self._READLINE_PREFETCH_SIZE
             )
             consumed = self._consume_from_readline_buffer(consumed, limit)
@@ -352,11 +516,118 @@ class BlobIO(io.IOBase):
         download_length = size
         if size is not None and size < 0:
             download_length = None
-        content = self._client.download(offset=self._position, length=download_length)
+        self._prefetch_if_needed()
+        if (
+            self._prefetched_content is None
+            and download_length is not None
+            and self._should_read_ahead(download_length)
+        ):
+            content = self._get_read_ahead().read(self._position, download_length)
+        else:
+            self._reset_read_ahead()
+            content = self._download(offset=self._position, length=download_length)
         self._position += len(content)
+        self._last_read_end = self._position
         self._blob_size = self._get_blob_size()
         return content
 
+    def _readinto(self, b: _client.SUPPORTED_READ_INTO_BUFFER_TYPE) -> int:
+        view = memoryview(b).cast("B")
+        if not view or self._is_at_end_of_blob(fetch_blob_size=False):
+            return 0
+        self._prefetch_if_needed()
+        if self._prefetched_content is not None:
+            prefetched = self._prefetched_content[
+                self._position : self._position + len(view)
+            ]
+            read_length = len(prefetched)
+            view[:read_length] = prefetched
+        elif self._should_read_ahead(len(view)):
+            content = self._get_read_ahead().read(self._position, len(view))
+            read_length = len(content)
+            view[:read_length] = content
+        else:
+            self._reset_read_ahead()
+            read_length = self._client.download_into(
+                view, offset=self._position, length=len(view)
+            )
+        self._position += read_length
+        self._last_read_end = self._position
+        self._blob_size = self._get_blob_size()
+        return read_length
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        self._reset_read_ahead()
+        self._prefetch_if_needed()
+        chunks: Iterable[bytes]
+        if self._prefetched_content is not None:
+            chunks = self._iter_prefetched_chunks()
+        else:
+            chunks = self._client.iter_chunks(offset=self._position)
+        for chunk in chunks:
+            self._position += len(chunk)
+            self._last_read_end = self._position
+            yield chunk
+        self._blob_size = self._get_blob_size()
+
+    def _iter_prefetched_chunks(self) -> Iterator[bytes]:
+        assert self._prefetched_content is not None
+        for pos in range(
+            self._position, len(self._prefetched_content), self._PREFETCHED_CHUNK_SIZE
+        ):
+            yield bytes(
+                self._prefetched_content[pos : pos + self._PREFETCHED_CHUNK_SIZE]
+            )
+
+    def _download(self, offset: int, length: Optional[int]) -> bytes:
+        if self._prefetched_content is not None:
+            end = None if length is None else offset + length
+            return bytes(self._prefetched_content[offset:end])
+        return self._client.download(offset=offset, length=length)
+
+    def _prefetch_if_needed(self) -> None:
+        if self._prefetch is None or self._prefetch_attempted:
+            return
+        self._prefetch_attempted = True
+        if self._prefetch == "zip":
+            self._prefetch_zip()
+
+    def _prefetch_zip(self) -> None:
+        # PyTorch's ZIP reader first reads the end of central directory and central directory at the end
+        # of the archive and then seeks back to read each record, which results in many small, serial
+        # ranged requests. Instead, download the end of the blob to confirm it is a ZIP archive and then
+        # download the rest of the blob, which contains all of the records, using concurrent ranged requests.
+        blob_size = self._get_blob_size()
+        tail_offset = max(blob_size - _zip.MAX_END_OF_CENTRAL_DIRECTORY_SIZE, 0)
+        tail = self._client.download(offset=tail_offset)
+        if _zip.find_central_directory(tail, tail_offset) is None:
+            return
+        content = bytearray(blob_size)
+        content[tail_offset:] = tail
+        view = memoryview(content)
+        self._client.download_into(view[:tail_offset], offset=0)
+        self._prefetched_content = view
+
+    def _should_read_ahead(self, size: int) -> bool:
+        # Only reads that are smaller than the maximum read-ahead window are served from read-ahead.
+        # Larger reads already use parallel partitioned downloads and are best served directly.
+        if size >= _SequentialReadAhead.MAX_WINDOW_SIZE:
+            return False
+        if self._read_ahead is not None and self._read_ahead.contains(self._position):
+            return True
+        # Similar to Linux readahead, only start reading ahead once a read continues exactly where the
+        # prior read ended. This avoids downloading extra data for one-off or random access reads.
+        return self._position == self._last_read_end
+
+    def _get_read_ahead(self) -> "_SequentialReadAhead":
+        if self._read_ahead is None:
+            self._read_ahead = _SequentialReadAhead(self._client, self._get_blob_size())
+        return self._read_ahead
+
+    def _reset_read_ahead(self) -> None:
+        if self._read_ahead is not None:
+            self._read_ahead.reset()
+
     def _seek(self, offset: int, whence: int) -> int:
         if self._blob_size is None:
             self._blob_size = self._get_blob_size()
@@ -402,15 +673,6 @@ class BlobIO(io.IOBase):
         self._raise_if_duplicate_block_ids(block_ids)
         self._client.commit_block_list(block_ids)
 
-    def _raise_if_duplicate_block_ids(self, block_ids: List[str]) -> None:
-        # An additional safety measure to ensure we never reuse block IDs within a BlobIO instance. This
-        # should not be an issue with UUID4 for block IDs, but that may not always be the case if
-        # block ID generation changes in the future.
-        if len(block_ids) != len(set(block_ids)):
-            raise RuntimeError(
-                "Unexpected duplicate block IDs detected. Not committing blob."
-            )
-
     def _check_for_stage_block_exceptions(self, wait: bool = True) -> None:
         # Before doing any additional processing, raise if an exception has already
         # been processed especially if it is going to require us to wait for all
@@ -437,10 +699,6 @@ class BlobIO(io.IOBase):
         self._in_progress_stage_block_futures = futures_still_in_progress
         self._raise_if_fatal_write_error()
 
-    def _raise_if_fatal_write_error(self) -> None:
-        if self._stage_block_exception is not None:
-            raise FatalBlobIOWriteError(self._stage_block_exception)
-
     def _close_client(self) -> None:
         self._client.close()
 
@@ -448,3 +706,443 @@ class BlobIO(io.IOBase):
         if fetch_blob_size:
             self._get_blob_size()
         return self._blob_size is not None and self._position >= self._blob_size
+
+
+class AsyncBlobIO(_BaseBlobIO):
+    """Asynchronous file-like object for reading and writing blobs in Azure Blob Storage.
+
+    Use this class instead of :py:class:`BlobIO` from code running in an :py:mod:`asyncio` event
+    loop (e.g., an inference service fetching many blobs concurrently). Transfers are made by the
+    event loop instead of by threads, so many blobs can be read or written at once without a thread
+    per request. For example::
+
+        from azstoragetorch.io import AsyncBlobIO
+
+        async def read_blob(blob_url):
+            async with AsyncBlobIO(blob_url, "rb") as f:
+                return await f.read()
+
+    Credentials and connections are shared by all :py:class:`AsyncBlobIO` instances opened in
+    the same event loop for the same storage account and credential. They are closed when the
+    event loop shuts down (e.g., when :py:func:`asyncio.run` returns). Instances must be created
+    from a running event loop.
+
+    Using :py:class:`AsyncBlobIO` requires the ``aiohttp`` package, which is installed with the
+    ``aio`` extra (i.e., ``pip install azstoragetorch[aio]``).
+
+    :param blob_url: The full endpoint URL to the blob. The URL respects
+        SAS tokens, snapshots, and version IDs in its query string.
+    :param mode: The mode in which to open the blob. Supported modes are:
+
+        * ``rb`` - Opens blob for reading
+        * ``wb`` - Opens blob for writing
+
+    :param credential: The credential to use for authentication. If not specified,
+        :py:class:`azure.identity.aio.DefaultAzureCredential` will be used. When set to
+        ``False``, anonymous requests will be made. Both asynchronous and synchronous token
+        credentials are supported. If the ``blob_url`` contains a SAS token, this parameter
+        is ignored.
+    :param partition_size: The size, in bytes, of the ranges that blob content is split into
+        when downloading it using concurrent ranged requests in read mode. If not specified, range
+        sizes are chosen based on the amount of content to download, the number of concurrent
+        requests available, and the throughput measured for previous downloads.
+    """
+
+    _WRITE_BUFFER_SIZE = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        blob_url: str,
+        mode: _SUPPORTED_MODES,
+        *,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+        partition_size: Optional[int] = None,
+        **_internal_only_kwargs,
+    ):
+        self._blob_url = blob_url
+        self._validate_mode(mode)
+        self._mode = mode
+        self._client = self._get_azstoragetorch_blob_client(
+            blob_url,
+            credential,
+            partition_size,
+            _internal_only_kwargs.get("_azstoragetorch_blob_client"),
+        )
+
+        self._position = 0
+        self._closed = False
+        self._write_buffer = bytearray()
+        self._all_stage_block_tasks: List[_aio_client.STAGE_BLOCK_TASK_TYPE] = []
+        self._in_progress_stage_block_tasks: List[
+            _aio_client.STAGE_BLOCK_TASK_TYPE
+        ] = []
+        self._stage_block_exception: Optional[BaseException] = None
+        self._blob_size: Optional[int] = None
+
+    async def __aenter__(self) -> "AsyncBlobIO":
+        self._validate_not_closed()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the file-like object.
+
+        In write mode, this will :py:meth:`flush` and commit the blob.
+
+        :raises FatalBlobIOWriteError: if a fatal error occurs when writing to blob. If
+            raised, no data written, nor uploaded, using this :py:class:`AsyncBlobIO` instance will
+            be committed to the blob. It is recommended to create a new :py:class:`AsyncBlobIO`
+            instance and retry all writes when attempting retries.
+        """
+        if self.closed:
+            return
+        try:
+            if self.writable():
+                await self._commit_blob()
+        finally:
+            self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file-like object is closed.
+
+        Is ``True`` if the file-like is closed, ``False`` otherwise.
+        """
+        return self._closed
+
+    async def flush(self) -> None:
+        """Flush all written data to the blob.
+
+        When awaited, any unstaged data will be uploaded and the method will wait until all
+        uploads complete. In read mode, this method has no effect.
+
+        :raises FatalBlobIOWriteError: if a fatal error occurs when writing to blob. If
+            raised, no data written, nor uploaded, using this :py:class:`AsyncBlobIO` instance will
+            be committed to the blob. It is recommended to create a new :py:class:`AsyncBlobIO`
+            instance and retry all writes when attempting retries.
+        """
+        self._validate_not_closed()
+        if self._is_write_mode():
+            await self._flush()
+
+    async def read(self, size: Optional[int] = -1, /) -> bytes:
+        """Read bytes from the blob.
+
+        :param size: The maximum number of bytes to read. If not specified, all bytes will be read.
+
+        :return: The bytes read from the blob.
+        """
+        if size is not None:
+            self._validate_is_integer("size", size)
+            self._validate_min("size", size, -1)
+        self._validate_readable()
+        self._validate_not_closed()
+        return await self._read(size)
+
+    async def readinto(self, b: _client.SUPPORTED_READ_INTO_BUFFER_TYPE, /) -> int:
+        """Read bytes from the blob directly into a pre-allocated, writable bytes-like object.
+
+        :param b: The writable bytes-like object to read into (e.g., :py:class:`bytearray`,
+            :py:class:`memoryview`, or :py:class:`mmap.mmap`). Up to ``len(b)`` bytes are read.
+
+        :return: The number of bytes read. Returns ``0`` when at the end of the blob.
+        """
+        self._validate_readable()
+        self._validate_not_closed()
+        return await self._readinto(b)
+
+    def readable(self) -> bool:
+        """Return whether file-like object is readable.
+
+        :returns: ``True`` if opened in read mode, ``False`` otherwise.
+        """
+        if self._is_read_mode():
+            self._validate_not_closed()
+            return True
+        return False
+
+    async def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the file-like position to a given byte offset.
+
+        :param offset: The offset to seek to
+        :param whence: The reference point for the offset. Accepted values are:
+
+            * :py:data:`os.SEEK_SET` - The start of the file-like object (the default)
+            * :py:data:`os.SEEK_CUR` - The current position in the file-like object
+            * :py:data:`os.SEEK_END` - The end of the file-like object
+
+        :returns: The new absolute position in the file-like object.
+        """
+        self._validate_is_integer("offset", offset)
+        self._validate_is_integer("whence", whence)
+        self._validate_seekable()
+        self._validate_not_closed()
+        return await self._seek(offset, whence)
+
+    def seekable(self) -> bool:
+        """Return whether file-like object supports random access.
+
+        :returns: ``True`` if can seek, ``False`` otherwise. Seeking
+            is only supported in read mode.
+        """
+        return self.readable()
+
+    def tell(self) -> int:
+        """Return the current position in the file-like object.
+
+        :returns: The current position in the file-like object.
+        """
+        self._validate_not_closed()
+        return self._position
+
+    async def write(self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE, /) -> int:
+        """Writes a bytes-like object to the blob
+
+        Data written may not be immediately uploaded. Instead, data may be uploaded
+        in the background after :py:meth:`write` has returned. Awaiting :py:meth:`flush`
+        or :py:meth:`close` will upload all pending data, wait until all data is uploaded,
+        and propagate any errors.
+
+        :param b: The bytes-like object to write to the blob.
+
+        :returns: The number of bytes written
+
+        :raises FatalBlobIOWriteError: if a fatal error occurs when writing to blob. If
+            raised, no data written, nor uploaded, using this :py:class:`AsyncBlobIO` instance will
+            be committed to the blob. It is recommended to create a new :py:class:`AsyncBlobIO`
+            instance and retry all writes when attempting retries.
+        """
+        self._validate_supported_write_type(b)
+        self._validate_writable()
+        self._validate_not_closed()
+        return await self._write(b)
+
+    def writable(self) -> bool:
+        """Return whether file-like object is writeable.
+
+        :returns: ``True`` if opened in write mode, ``False`` otherwise.
+        """
+        if self._is_write_mode():
+            self._validate_not_closed()
+            return True
+        return False
+
+    def _get_azstoragetorch_blob_client(
+        self,
+        blob_url: str,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE,
+        partition_size: Optional[int],
+        azstoragetorch_blob_client: Optional[
+            _aio_client.AsyncAzStorageTorchBlobClient
+        ] = None,
+    ) -> _aio_client.AsyncAzStorageTorchBlobClient:
+        if azstoragetorch_blob_client is not None:
+            return azstoragetorch_blob_client
+        client_kwargs: _aio_client.AsyncBlobClientKwargsType = {}
+        if partition_size is not None:
+            client_kwargs["partition_planner"] = _client.PartitionPlanner(
+                partition_size
+            )
+        return _aio_client.ASYNC_BLOB_CLIENT_FACTORY_CACHE.get_blob_client_from_url(
+            blob_url, credential, **client_kwargs
+        )
+
+    async def _read(self, size: Optional[int]) -> bytes:
+        if size == 0 or self._is_at_end_of_blob():
+            return b""
+        download_length = size
+        if size is not None and size < 0:
+            download_length = None
+        content = await self._client.download(
+            offset=self._position, length=download_length
+        )
+        self._position += len(content)
+        self._blob_size = await self._client.get_blob_size()
+        return content
+
+    async def _readinto(self, b: _client.SUPPORTED_READ_INTO_BUFFER_TYPE) -> int:
+        view = memoryview(b).cast("B")
+        if not view or self._is_at_end_of_blob():
+            return 0
+        read_length = await self._client.download_into(
+            view, offset=self._position, length=len(view)
+        )
+        self._position += read_length
+        self._blob_size = await self._client.get_blob_size()
+        return read_length
+
+    async def _seek(self, offset: int, whence: int) -> int:
+        if self._blob_size is None:
+            self._blob_size = await self._client.get_blob_size()
+        if whence == os.SEEK_SET:
+            new_position = offset
+        elif whence == os.SEEK_CUR:
+            new_position = self._position + offset
+        elif whence == os.SEEK_END:
+            new_position = self._blob_size + offset
+        else:
+            raise ValueError(f"Unsupported whence: {whence}")
+        if new_position < 0:
+            raise ValueError("Cannot seek to negative position")
+        self._position = new_position
+        return self._position
+
+    async def _flush(self) -> None:
+        self._check_for_stage_block_exceptions()
+        await self._flush_write_buffer()
+        await self._wait_for_stage_blocks()
+
+    async def _flush_write_buffer(self) -> None:
+        if self._write_buffer:
+            tasks = await self._client.stage_blocks(memoryview(self._write_buffer))
+            self._all_stage_block_tasks.extend(tasks)
+            self._in_progress_stage_block_tasks.extend(tasks)
+            self._write_buffer = bytearray()
+
+    async def _write(self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> int:
+        self._check_for_stage_block_exceptions()
+        write_length = len(b)
+        self._write_buffer.extend(b)
+        if len(self._write_buffer) >= self._WRITE_BUFFER_SIZE:
+            await self._flush_write_buffer()
+        self._position += write_length
+        return write_length
+
+    async def _commit_blob(self) -> None:
+        await self._flush()
+        block_ids = [task.result() for task in self._all_stage_block_tasks]
+        self._raise_if_duplicate_block_ids(block_ids)
+        await self._client.commit_block_list(block_ids)
+
+    async def _wait_for_stage_blocks(self) -> None:
+        if self._in_progress_stage_block_tasks:
+            await asyncio.wait(
+                self._in_progress_stage_block_tasks,
+                return_when=asyncio.FIRST_EXCEPTION,
+            )
+        self._check_for_stage_block_exceptions()
+
+    def _check_for_stage_block_exceptions(self) -> None:
+        self._raise_if_fatal_write_error()
+        tasks_still_in_progress = []
+        for task in self._in_progress_stage_block_tasks:
+            if task.done():
+                if (
+                    self._stage_block_exception is None
+                    and not task.cancelled()
+                    and task.exception() is not None
+                ):
+                    self._stage_block_exception = task.exception()
+            else:
+                tasks_still_in_progress.append(task)
+        self._in_progress_stage_block_tasks = tasks_still_in_progress
+        self._raise_if_fatal_write_error()
+
+    def _is_at_end_of_blob(self) -> bool:
+        return self._blob_size is not None and self._position >= self._blob_size
+
+
+def warm_up_connections(url: str, num_connections: Optional[int] = None) -> None:
+    """Open connections to a storage account ahead of time.
+
+    Connections to a storage account are pooled and reused across :py:class:`BlobIO` instances
+    and datasets in the same process. Use this function to open pooled connections before they
+    are needed so that the first reads do not wait on TLS handshakes. For example, from a
+    :py:class:`~torch.utils.data.DataLoader`'s ``worker_init_fn``::
+
+        from azstoragetorch.io import warm_up_connections
+
+        def worker_init_fn(worker_id):
+            warm_up_connections(
+                "https://<storage-account-name>.blob.core.windows.net/<container-name>"
+            )
+
+    Warming up connections is best effort. If connections cannot be opened, no error is raised.
+
+    :param url: The URL of the storage account, or of a container or blob in the storage account,
+        to open connections to.
+    :param num_connections: The number of connections to open. If not specified, as many
+        connections are opened as the number of concurrent requests made to the account.
+    """
+    _client.CONNECTION_POOL_MANAGER.warm_up(url, num_connections)
+
+
+class _ReadAheadWindow(NamedTuple):
+    start: int
+    length: int
+    future: _client.DOWNLOAD_FUTURE_TYPE
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+
+class _SequentialReadAhead:
+    # Serves sequential reads from windows of blob content that are downloaded ahead of the reader
+    # using the client's I/O scheduler. This follows the same approach as Linux's on-demand readahead:
+    # the first window is sized from the read that triggered it and, whenever the reader starts
+    # consuming from the last outstanding window, the next window is asynchronously requested with
+    # double the size (up to a maximum). This way sequential readers issuing many small reads only
+    # pay for a round trip on the very first read and windows grow to amortize request overhead.
+    INITIAL_WINDOW_SIZE = 256 * 1024
+    MAX_WINDOW_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, client: _client.AzStorageTorchBlobClient, blob_size: int):
+        self._client = client
+        self._blob_size = blob_size
+        self._window_size = self.INITIAL_WINDOW_SIZE
+        self._windows: Deque[_ReadAheadWindow] = collections.deque()
+
+    def contains(self, position: int) -> bool:
+        return bool(self._windows) and (
+            self._windows[0].start <= position < self._windows[-1].end
+        )
+
+    def read(self, position: int, size: int) -> bytes:
+        if not self.contains(position):
+            self.reset()
+            self._window_size = min(
+                max(self.INITIAL_WINDOW_SIZE, 2 * size), self.MAX_WINDOW_SIZE
+            )
+            self._schedule_window(position)
+        chunks = []
+        remaining = size
+        try:
+            while remaining and self._windows:
+                window = self._windows[0]
+                if position >= window.end:
+                    self._windows.popleft()
+                    continue
+                if len(self._windows) == 1:
+                    self._schedule_window(window.end)
+                content = window.future.result()
+                window_pos = position - window.start
+                chunk = content[window_pos : window_pos + remaining]
+                if not chunk:
+                    # The blob was shorter than expected for this window. Stop reading ahead as there
+                    # is nothing more to serve.
+                    self.reset()
+                    break
+                chunks.append(chunk)
+                position += len(chunk)
+                remaining -= len(chunk)
+        except BaseException:
+            self.reset()
+            raise
+        return b"".join(chunks)
+
+    def reset(self) -> None:
+        for window in self._windows:
+            window.future.cancel()
+        self._windows.clear()
+
+    def _schedule_window(self, start: int) -> None:
+        if start >= self._blob_size:
+            return
+        length = min(self._window_size, self._blob_size - start)
+        self._windows.append(
+            _ReadAheadWindow(start, length, self._client.submit_download(start, length))
+        )
+        self._window_size = min(2 * self._window_size, self.MAX_WINDOW_SIZE)
@@ -1,5 +1,36 @@
 import pytest
 
+from azstoragetorch._aio_client import ASYNC_BLOB_CLIENT_FACTORY_CACHE
+from azstoragetorch._client import (
+    BANDWIDTH_LIMITER,
+    BLOB_CLIENT_FACTORY_CACHE,
+    CONCURRENCY_CONTROLLER,
+    CONNECTION_POOL_MANAGER,
+    DOWNLOAD_PARTITION_PLANNER,
+    FAST_DOWNLOAD_TRANSPORT,
+    IO_SCHEDULER,
+    REQUEST_HEDGER,
+    RETRY_POLICY,
+)
+
+PROCESS_WIDE_SINGLETONS = [
+    BLOB_CLIENT_FACTORY_CACHE,
+    ASYNC_BLOB_CLIENT_FACTORY_CACHE,
+    CONNECTION_POOL_MANAGER,
+    IO_SCHEDULER,
+    DOWNLOAD_PARTITION_PLANNER,
+    REQUEST_HEDGER,
+    RETRY_POLICY,
+    CONCURRENCY_CONTROLLER,
+    BANDWIDTH_LIMITER,
+    FAST_DOWNLOAD_TRANSPORT,
+]
+PROCESS_WIDE_ENV_VARS = [
+    "AZSTORAGETORCH_MAX_BANDWIDTH",
+    "AZSTORAGETORCH_MAX_UPLOAD_BANDWIDTH",
+    "AZSTORAGETORCH_FAST_DOWNLOADS",
+]
+
 
 @pytest.fixture
 def container_name():
@@ -29,3 +60,17 @@ def blob_content():
 @pytest.fixture
 def blob_length(blob_content):
     return len(blob_content)
+
+
+@pytest.fixture(autouse=True)
+def reset_process_wide_state(monkeypatch):
+    # Avoid sharing process-wide state, which may be mocked or recorded in one test, across tests
+    # and avoid configuring it from the environment running the tests. Any new process-wide
+    # singleton or environment variable it reads should be added to the lists below.
+    for env_var in PROCESS_WIDE_ENV_VARS:
+        monkeypatch.delenv(env_var, raising=False)
+    for singleton in PROCESS_WIDE_SINGLETONS:
+        singleton.reset()
+    yield
+    for singleton in PROCESS_WIDE_SINGLETONS:
+        singleton.reset()
@@ -0,0 +1,696 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+import sys
+import threading
+import tracemalloc
+from unittest import mock
+
+import pytest
+
+from azure.core.credentials import AccessToken, AzureSasCredential, TokenCredential
+from azure.core.credentials_async import AsyncTokenCredential
+import azure.core.exceptions
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.transport import AsyncHttpTransport, HttpResponse
+from azure.storage.blob import BlobBlock, BlobProperties
+from azure.storage.blob.aio import BlobClient, ContainerClient
+from azure.storage.blob._generated.aio import AzureBlobStorage
+from azure.storage.blob._generated.aio.operations import BlobOperations
+from azure.storage.blob._generated.models import ModifiedAccessConditions
+
+import azstoragetorch._aio_client
+from azstoragetorch._aio_client import (
+    ASYNC_BLOB_CLIENT_FACTORY_CACHE,
+    AsyncAzStorageTorchBlobClient,
+    AsyncAzStorageTorchBlobClientFactory,
+    AsyncBlobClientFactoryCache,
+)
+from azstoragetorch._client import (
+    CONCURRENCY_CONTROLLER,
+    PartitionPlanner,
+    RetryPolicy,
+    RetryStats,
+    EchoClientRequestIdPolicy,
+)
+from azstoragetorch._version import __version__
+from tests.unit.utils import random_bytes
+
+MB = 1024 * 1024
+SAS_TOKEN = "sp=r&st=2024-10-28T20:22:30Z&se=2024-10-29T04:22:30Z&spr=https&sv=2022-11-02&sr=c&sig=signature"
+
+
+@pytest.fixture(autouse=True)
+def sleep_patch():
+    with mock.patch("azstoragetorch._aio_client.asyncio.sleep") as patched_sleep:
+        yield patched_sleep
+
+
+@pytest.fixture
+def blob_etag():
+    return "blob-etag"
+
+
+@pytest.fixture
+def blob_properties(blob_length, blob_etag):
+    return BlobProperties(**{"Content-Length": blob_length, "ETag": blob_etag})
+
+
+@pytest.fixture
+def mock_aiohttp_transport_cls():
+    mock_transport_cls = mock.Mock()
+    mock_transport_cls.side_effect = lambda **kwargs: mock.Mock(AsyncHttpTransport)
+    with mock.patch(
+        "azstoragetorch._aio_client._get_aiohttp_transport_cls",
+        return_value=mock_transport_cls,
+    ):
+        yield mock_transport_cls
+
+
+@pytest.fixture
+def mock_default_credential():
+    with mock.patch("azure.identity.aio.DefaultAzureCredential") as mock_credential_cls:
+        mock_credential_cls.return_value = mock.AsyncMock(AsyncTokenCredential)
+        yield mock_credential_cls.return_value
+
+
+@pytest.fixture
+def mock_generated_sdk_storage_client():
+    mock_generated_sdk_client = mock.Mock(AzureBlobStorage)
+    mock_generated_sdk_client.blob = mock.Mock(BlobOperations)
+    return mock_generated_sdk_client
+
+
+@pytest.fixture
+def mock_sdk_blob_client(mock_generated_sdk_storage_client, blob_properties, blob_url):
+    mock_sdk_client = mock.Mock(BlobClient)
+    mock_sdk_client._client = mock_generated_sdk_storage_client
+    mock_sdk_client._pipeline = mock.Mock(AsyncPipeline)
+    mock_sdk_client.get_blob_properties.return_value = blob_properties
+    mock_sdk_client.url = blob_url
+    mock_sdk_client.version_id = None
+    return mock_sdk_client
+
+
+@pytest.fixture
+def client(mock_sdk_blob_client):
+    return AsyncAzStorageTorchBlobClient(
+        mock_sdk_blob_client, partition_planner=PartitionPlanner(4 * MB)
+    )
+
+
+def http_error_with_status(status_code, headers=None):
+    mock_http_response = mock.Mock(HttpResponse)
+    mock_http_response.reason = "message"
+    mock_http_response.status_code = status_code
+    mock_http_response.headers = headers or {}
+    mock_http_response.content_type = "application/xml"
+    mock_http_response.text.return_value = ""
+    return azure.core.exceptions.HttpResponseError(response=mock_http_response)
+
+
+class AsyncDownloadStream:
+    def __init__(self, content, headers, chunk_size=64 * 1024, exception=None):
+        self.response = mock.Mock()
+        self.response.headers = headers
+        self._content = content
+        self._chunk_size = chunk_size
+        self._exception = exception
+
+    async def __aiter__(self):
+        for i in range(0, len(self._content), self._chunk_size):
+            yield self._content[i : i + self._chunk_size]
+            if self._exception is not None:
+                raise self._exception
+
+
+def download_side_effect(content, etag="blob-etag", exceptions=None):
+    # Serves ranged downloads of the content. Each provided exception is raised mid-stream by a
+    # successive download.
+    exceptions = list(exceptions or [])
+
+    async def _download(range, **kwargs):
+        start, end = range[len("bytes=") :].split("-")
+        start, end = int(start), int(end)
+        if start >= len(content):
+            raise http_error_with_status(
+                416, {"Content-Range": f"bytes */{len(content)}"}
+            )
+        return AsyncDownloadStream(
+            content[start : end + 1],
+            {
+                "Content-Range": f"bytes {start}-{min(end, len(content) - 1)}/{len(content)}",
+                "ETag": etag,
+            },
+            exception=exceptions.pop(0) if exceptions else None,
+        )
+
+    return _download
+
+
+def get_download_ranges(mock_generated_sdk_storage_client):
+    return [
+        call.kwargs["range"]
+        for call in mock_generated_sdk_storage_client.blob.download.call_args_list
+    ]
+
+
+def test_get_aiohttp_transport_cls_raises_helpful_error_without_aiohttp():
+    with mock.patch.dict(
+        sys.modules,
+        {"aiohttp": None, "azure.core.pipeline.transport._aiohttp": None},
+    ):
+        with pytest.raises(ImportError, match=r"azstoragetorch\[aio\]"):
+            azstoragetorch._aio_client._get_aiohttp_transport_cls()
+
+
+class TestAsyncAzStorageTorchBlobClientFactory:
+    @pytest.fixture(autouse=True)
+    def transport_patch(self, mock_aiohttp_transport_cls):
+        yield mock_aiohttp_transport_cls
+
+    @pytest.fixture
+    def sdk_blob_client_patch(self, mock_sdk_blob_client):
+        with mock.patch.object(
+            BlobClient, "from_blob_url", return_value=mock_sdk_blob_client
+        ) as patched:
+            yield patched
+
+    def test_default_credential(self, mock_default_credential):
+        factory = AsyncAzStorageTorchBlobClientFactory()
+        assert factory._sdk_credential is mock_default_credential
+
+    def test_anonymous_credential(self):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        assert factory._sdk_credential is None
+
+    @pytest.mark.parametrize(
+        "credential",
+        [
+            AzureSasCredential(SAS_TOKEN),
+            mock.AsyncMock(AsyncTokenCredential),
+        ],
+    )
+    def test_passes_through_async_credentials(self, credential):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=credential)
+        assert factory._sdk_credential is credential
+
+    def test_adapts_sync_token_credential(self):
+        token = AccessToken("token", 0)
+        sync_credential = mock.Mock(TokenCredential)
+        get_token_threads = []
+
+        def get_token(*scopes, **kwargs):
+            get_token_threads.append(threading.current_thread())
+            return token
+
+        sync_credential.get_token.side_effect = get_token
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=sync_credential)
+        assert isinstance(factory._sdk_credential, AsyncTokenCredential)
+        assert (
+            asyncio.run(factory._sdk_credential.get_token("scope", tenant_id="t"))
+            is token
+        )
+        sync_credential.get_token.assert_called_once_with("scope", tenant_id="t")
+        # Tokens are retrieved off of the event loop's thread.
+        assert get_token_threads != [threading.current_thread()]
+
+    def test_raises_for_unsupported_credential(self):
+        with pytest.raises(TypeError, match="Unsupported credential"):
+            AsyncAzStorageTorchBlobClientFactory(credential=object())
+
+    def test_get_blob_client_from_url(
+        self, sdk_blob_client_patch, mock_sdk_blob_client, blob_url
+    ):
+        credential = mock.AsyncMock(AsyncTokenCredential)
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=credential)
+        client = factory.get_blob_client_from_url(blob_url)
+        assert isinstance(client, AsyncAzStorageTorchBlobClient)
+        assert client._sdk_blob_client is mock_sdk_blob_client
+        sdk_blob_client_patch.assert_called_once_with(
+            blob_url,
+            credential=credential,
+            transport=mock.ANY,
+            user_agent=f"azstoragetorch/{__version__}",
+            _additional_pipeline_policies=[mock.ANY],
+        )
+        assert isinstance(
+            sdk_blob_client_patch.call_args.kwargs["_additional_pipeline_policies"][0],
+            EchoClientRequestIdPolicy,
+        )
+
+    def test_transport_defaults(self, sdk_blob_client_patch, blob_url, transport_patch):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        factory.get_blob_client_from_url(blob_url)
+        transport_patch.assert_called_once_with(
+            connection_timeout=20,
+            read_timeout=60,
+            connection_data_block_size=256 * 1024,
+        )
+
+    def test_reuses_transport_and_pipeline(
+        self, sdk_blob_client_patch, mock_sdk_blob_client, blob_url
+    ):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        factory.get_blob_client_from_url(blob_url)
+        factory.get_blob_client_from_url(blob_url)
+        first_kwargs, second_kwargs = [
+            call.kwargs for call in sdk_blob_client_patch.call_args_list
+        ]
+        assert first_kwargs["transport"] is second_kwargs["transport"]
+        assert "_pipeline" not in first_kwargs
+        assert second_kwargs["_pipeline"] is mock_sdk_blob_client._pipeline
+
+    def test_sas_url_does_not_use_factory_credential(
+        self, sdk_blob_client_patch, blob_url
+    ):
+        factory = AsyncAzStorageTorchBlobClientFactory(
+            credential=mock.AsyncMock(AsyncTokenCredential)
+        )
+        factory.get_blob_client_from_url(f"{blob_url}?{SAS_TOKEN}")
+        assert sdk_blob_client_patch.call_args.kwargs["credential"] is None
+
+    def test_yield_blob_clients_from_container_url(
+        self, sdk_blob_client_patch, container_url
+    ):
+        blob_names = ["blob1", "blob2"]
+
+        async def list_blob_names(**kwargs):
+            for blob_name in blob_names:
+                yield blob_name
+
+        mock_container_client = mock.Mock(ContainerClient)
+        mock_container_client.list_blob_names.side_effect = list_blob_names
+        mock_container_client.get_blob_client.side_effect = lambda name: mock.Mock(
+            url=f"{container_url}/{name}"
+        )
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+
+        async def collect():
+            return [
+                client
+                async for client in factory.yield_blob_clients_from_container_url(
+                    container_url, prefix="blob"
+                )
+            ]
+
+        with mock.patch.object(
+            ContainerClient, "from_container_url", return_value=mock_container_client
+        ):
+            clients = asyncio.run(collect())
+        assert len(clients) == 2
+        mock_container_client.list_blob_names.assert_called_once_with(
+            name_starts_with="blob"
+        )
+        assert [call.args[0] for call in sdk_blob_client_patch.call_args_list] == [
+            f"{container_url}/{name}" for name in blob_names
+        ]
+
+    def test_close_closes_owned_transport_and_credential(
+        self, sdk_blob_client_patch, blob_url, mock_default_credential
+    ):
+        factory = AsyncAzStorageTorchBlobClientFactory()
+        factory.get_blob_client_from_url(blob_url)
+        transport = sdk_blob_client_patch.call_args.kwargs["transport"]
+        asyncio.run(factory.close())
+        transport.close.assert_awaited_once()
+        mock_default_credential.close.assert_awaited_once()
+
+    def test_close_does_not_close_provided_transport_and_credential(
+        self, sdk_blob_client_patch, blob_url
+    ):
+        credential = mock.AsyncMock(AsyncTokenCredential)
+        transport = mock.Mock(AsyncHttpTransport)
+        factory = AsyncAzStorageTorchBlobClientFactory(
+            credential=credential, transport=transport
+        )
+        factory.get_blob_client_from_url(blob_url)
+        assert sdk_blob_client_patch.call_args.kwargs["transport"] is transport
+        asyncio.run(factory.close())
+        transport.close.assert_not_called()
+        credential.close.assert_not_called()
+
+
+class TestAsyncBlobClientFactoryCache:
+    @pytest.fixture(autouse=True)
+    def factory_patch(self):
+        with mock.patch(
+            "azstoragetorch._aio_client.AsyncAzStorageTorchBlobClientFactory"
+        ) as patched:
+            patched.side_effect = lambda **kwargs: mock.Mock(
+                AsyncAzStorageTorchBlobClientFactory
+            )
+            yield patched
+
+    def test_reuses_factory_in_same_loop(self, blob_url, container_url):
+        cache = AsyncBlobClientFactoryCache()
+
+        async def get_factories():
+            return (
+                cache.get_factory(blob_url, False),
+                cache.get_factory(f"{container_url}/other", False),
+                cache.get_factory(
+                    "https://otheraccount.blob.core.windows.net/c/b", False
+                ),
+            )
+
+        first, same_account, other_account = asyncio.run(get_factories())
+        assert first is same_account
+        assert first is not other_account
+
+    def test_does_not_share_factories_across_loops(self, blob_url):
+        cache = AsyncBlobClientFactoryCache()
+
+        async def get_factory():
+            return cache.get_factory(blob_url, False)
+
+        assert asyncio.run(get_factory()) is not asyncio.run(get_factory())
+
+    def test_closes_factories_when_loop_shuts_down(self, blob_url):
+        cache = AsyncBlobClientFactoryCache()
+
+        async def get_factory():
+            factory = cache.get_factory(blob_url, False)
+            factory.close.assert_not_called()
+            return factory
+
+        factory = asyncio.run(get_factory())
+        factory.close.assert_awaited_once()
+
+    def test_get_blob_client_from_url(self, blob_url):
+        cache = AsyncBlobClientFactoryCache()
+        planner = PartitionPlanner()
+
+        async def get_client():
+            return cache.get_factory(blob_url, False), cache.get_blob_client_from_url(
+                blob_url, False, partition_planner=planner
+            )
+
+        factory, client = asyncio.run(get_client())
+        assert client is factory.get_blob_client_from_url.return_value
+        factory.get_blob_client_from_url.assert_called_once_with(
+            blob_url, partition_planner=planner
+        )
+
+    def test_reset(self, blob_url):
+        async def get_factories():
+            first = ASYNC_BLOB_CLIENT_FACTORY_CACHE.get_factory(blob_url, False)
+            ASYNC_BLOB_CLIENT_FACTORY_CACHE.reset()
+            return first, ASYNC_BLOB_CLIENT_FACTORY_CACHE.get_factory(blob_url, False)
+
+        first, second = asyncio.run(get_factories())
+        assert first is not second
+
+
+class TestAsyncAzStorageTorchBlobClient:
+    def test_properties(self, client, blob_url, blob_name, container_name):
+        client._sdk_blob_client.url = f"{blob_url}?{SAS_TOKEN}"
+        client._sdk_blob_client.blob_name = blob_name
+        client._sdk_blob_client.container_name = container_name
+        assert client.url == blob_url
+        assert client.blob_name == blob_name
+        assert client.container_name == container_name
+        assert client.retry_stats == RetryStats(0, 0, 0)
+
+    def test_get_blob_size(self, client, mock_sdk_blob_client, blob_length):
+        assert asyncio.run(client.get_blob_size()) == blob_length
+        assert asyncio.run(client.get_blob_size()) == blob_length
+        mock_sdk_blob_client.get_blob_properties.assert_awaited_once()
+
+    def test_download(self, client, mock_generated_sdk_storage_client, blob_content):
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect(blob_content)
+        )
+        assert asyncio.run(client.download()) == blob_content
+        mock_generated_sdk_storage_client.blob.download.assert_awaited_once_with(
+            range=f"bytes=0-{4 * MB - 1}", retry_total=0
+        )
+        # The blob's properties are set from the download.
+        assert asyncio.run(client.get_blob_size()) == len(blob_content)
+        client._sdk_blob_client.get_blob_properties.assert_not_called()
+
+    def test_download_with_offset_and_length(
+        self, client, mock_generated_sdk_storage_client, blob_content
+    ):
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect(blob_content)
+        )
+        assert asyncio.run(client.download(offset=2, length=4)) == blob_content[2:6]
+
+    def test_partitioned_download(self, client, mock_generated_sdk_storage_client):
+        content = random_bytes(10 * MB + 5)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect(content)
+        )
+        assert asyncio.run(client.download()) == content
+        assert sorted(get_download_ranges(mock_generated_sdk_storage_client)) == sorted(
+            [
+                f"bytes=0-{4 * MB - 1}",
+                f"bytes={4 * MB}-{8 * MB - 1}",
+                f"bytes={8 * MB}-{10 * MB + 4}",
+            ]
+        )
+        # Requests after the first are conditioned on the ETag from the first.
+        for call in mock_generated_sdk_storage_client.blob.download.call_args_list[1:]:
+            assert call.kwargs[
+                "modified_access_conditions"
+            ] == ModifiedAccessConditions(if_match="blob-etag")
+
+    @pytest.mark.parametrize("known_blob_size", [True, False])
+    def test_partitioned_download_does_not_copy_content(
+        self, client, mock_generated_sdk_storage_client, known_blob_size
+    ):
+        blob_size = 16 * MB
+        content = random_bytes(blob_size)
+        # Responses are created up front so that only memory allocated by the download is traced.
+        responses = {
+            f"bytes={pos}-{pos + 4 * MB - 1}": AsyncDownloadStream(
+                content[pos : pos + 4 * MB],
+                {
+                    "Content-Range": f"bytes {pos}-{pos + 4 * MB - 1}/{blob_size}",
+                    "ETag": "blob-etag",
+                },
+            )
+            for pos in range(0, blob_size, 4 * MB)
+        }
+
+        async def _download(range, **kwargs):
+            return responses[range]
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = _download
+        client._sdk_blob_client.get_blob_properties.return_value = BlobProperties(
+            **{"Content-Length": blob_size, "ETag": "blob-etag"}
+        )
+
+        async def traced_download():
+            if known_blob_size:
+                await client.get_blob_size()
+            tracemalloc.start()
+            try:
+                downloaded = await client.download()
+                _, peak_traced_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return downloaded, peak_traced_memory
+
+        downloaded, peak_traced_memory = asyncio.run(traced_download())
+        assert downloaded == content
+        # The content is allocated once and returned without being copied (e.g., from a bytearray
+        # to bytes or by joining it with content from the first request).
+        assert peak_traced_memory < 1.5 * blob_size
+
+    def test_bounds_in_flight_partitions(self, mock_sdk_blob_client):
+        content = random_bytes(10 * MB)
+        in_flight = 0
+        max_in_flight = 0
+        download = download_side_effect(content)
+
+        async def tracked_download(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            try:
+                return await download(**kwargs)
+            finally:
+                in_flight -= 1
+
+        mock_sdk_blob_client._client.blob.download.side_effect = tracked_download
+        mock_sdk_blob_client.get_blob_properties.return_value = BlobProperties(
+            **{"Content-Length": len(content), "ETag": "blob-etag"}
+        )
+        client = AsyncAzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            max_in_flight_requests=2,
+            partition_planner=PartitionPlanner(1 * MB),
+        )
+
+        async def download_all():
+            await client.get_blob_size()
+            return await client.download()
+
+        assert asyncio.run(download_all()) == content
+        assert max_in_flight <= 2
+
+    def test_download_into(self, client, mock_generated_sdk_storage_client):
+        content = random_bytes(10 * MB)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect(content)
+        )
+        buffer = bytearray(len(content))
+        assert asyncio.run(client.download_into(buffer)) == len(content)
+        assert buffer == content
+
+    def test_download_into_raises_for_read_only_buffer(self, client):
+        with pytest.raises(TypeError, match="writable"):
+            asyncio.run(client.download_into(b"read only"))
+
+    def test_download_empty_blob(self, client, mock_generated_sdk_storage_client):
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect(b"")
+        )
+        assert asyncio.run(client.download()) == b""
+        assert asyncio.run(client.get_blob_size()) == 0
+
+    def test_resumes_interrupted_download(
+        self, client, mock_generated_sdk_storage_client, sleep_patch
+    ):
+        content = random_bytes(200 * 1024)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect(
+                content,
+                exceptions=[azure.core.exceptions.IncompleteReadError("interrupted")],
+            )
+        )
+        assert asyncio.run(client.download()) == content
+        # The first chunk was received before the stream was interrupted so the download is resumed
+        # after it and conditioned on the blob's ETag.
+        resumed_call = mock_generated_sdk_storage_client.blob.download.call_args_list[1]
+        assert resumed_call.kwargs["range"] == f"bytes={64 * 1024}-{len(content) - 1}"
+        assert resumed_call.kwargs["modified_access_conditions"] == (
+            ModifiedAccessConditions(if_match="blob-etag")
+        )
+        sleep_patch.assert_awaited_once()
+        assert client.retry_stats.retries == 1
+
+    def test_retries_throttled_download(
+        self, client, mock_generated_sdk_storage_client, blob_content, sleep_patch
+    ):
+        download = download_side_effect(blob_content)
+        responses = [http_error_with_status(503, {"Retry-After": "5"})]
+
+        async def throttled_download(**kwargs):
+            if responses:
+                raise responses.pop(0)
+            return await download(**kwargs)
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = throttled_download
+        assert asyncio.run(client.download()) == blob_content
+        assert sleep_patch.call_args.args[0] >= 5
+        assert client.retry_stats.throttled_retries == 1
+        assert CONCURRENCY_CONTROLLER.get_limit("myaccount.blob.core.windows.net") < (
+            CONCURRENCY_CONTROLLER.initial_limit
+        )
+
+    def test_raises_non_retryable_error(
+        self, client, mock_generated_sdk_storage_client, sleep_patch
+    ):
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            http_error_with_status(403)
+        )
+        with pytest.raises(azure.core.exceptions.HttpResponseError):
+            asyncio.run(client.download())
+        sleep_patch.assert_not_called()
+
+    def test_uses_provided_retry_policy(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = AsyncAzStorageTorchBlobClient(
+            mock_sdk_blob_client, retry_policy=RetryPolicy(max_attempts=1)
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            azure.core.exceptions.ServiceRequestError("connection error")
+        )
+        with pytest.raises(azure.core.exceptions.ServiceRequestError):
+            asyncio.run(client.download())
+        mock_generated_sdk_storage_client.blob.download.assert_awaited_once()
+
+    def test_failed_partition_stops_download(self, mock_sdk_blob_client):
+        content = random_bytes(8 * MB)
+        download = download_side_effect(content)
+        cancelled = []
+
+        async def failing_download(range, **kwargs):
+            if range.startswith("bytes=0-"):
+                raise http_error_with_status(403)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(range)
+                raise
+            return await download(range=range)
+
+        mock_sdk_blob_client._client.blob.download.side_effect = failing_download
+        mock_sdk_blob_client.get_blob_properties.return_value = BlobProperties(
+            **{"Content-Length": len(content), "ETag": "blob-etag"}
+        )
+        client = AsyncAzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            max_in_flight_requests=2,
+            partition_planner=PartitionPlanner(1 * MB),
+        )
+
+        async def download_all():
+            await client.get_blob_size()
+            return await client.download()
+
+        with pytest.raises(azure.core.exceptions.HttpResponseError):
+            asyncio.run(download_all())
+        # Only the partition in flight alongside the failed one was started and it was cancelled.
+        assert cancelled == [f"bytes={1 * MB}-{2 * MB - 1}"]
+
+    def test_stage_blocks(self, client, mock_sdk_blob_client):
+        data = random_bytes(40 * MB)
+        block_ids = [f"block-{i}" for i in range(2)]
+
+        async def stage_blocks():
+            with mock.patch("uuid.uuid4", side_effect=block_ids):
+                tasks = await client.stage_blocks(data)
+                return await asyncio.gather(*tasks)
+
+        assert asyncio.run(stage_blocks()) == block_ids
+        assert mock_sdk_blob_client.stage_block.await_args_list == [
+            mock.call("block-0", data[: 32 * MB], retry_total=0),
+            mock.call("block-1", data[32 * MB :], retry_total=0),
+        ]
+
+    def test_stage_blocks_raises_for_empty_data(self, client):
+        with pytest.raises(ValueError, match="must not be empty"):
+            asyncio.run(client.stage_blocks(b""))
+
+    def test_retries_stage_block(self, client, mock_sdk_blob_client, sleep_patch):
+        mock_sdk_blob_client.stage_block.side_effect = [
+            azure.core.exceptions.ServiceResponseError("connection reset"),
+            None,
+        ]
+
+        async def stage_blocks():
+            tasks = await client.stage_blocks(b"data")
+            return await asyncio.gather(*tasks)
+
+        block_ids = asyncio.run(stage_blocks())
+        assert len(block_ids) == 1
+        assert mock_sdk_blob_client.stage_block.await_count == 2
+        # The same block ID is used for the retried request.
+        first, second = mock_sdk_blob_client.stage_block.await_args_list
+        assert first.args[0] == second.args[0] == block_ids[0]
+        sleep_patch.assert_awaited_once()
+
+    def test_commit_block_list(self, client, mock_sdk_blob_client):
+        asyncio.run(client.commit_block_list(["block-0", "block-1"]))
+        mock_sdk_blob_client.commit_block_list.assert_awaited_once_with(
+            [BlobBlock("block-0"), BlobBlock("block-1")]
+        )
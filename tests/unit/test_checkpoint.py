@@ -0,0 +1,605 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import collections
+import concurrent.futures
+import io
+import logging
+import os
+import pickle
+from unittest import mock
+import zipfile
+
+import pytest
+import torch
+
+from azstoragetorch.checkpoint import load_lazy, LazyTensor, LocalCheckpointFile
+from azstoragetorch._client import AzStorageTorchBlobClient
+from tests.unit.utils import random_bytes
+
+
+class UnsupportedObject:
+    pass
+
+
+def create_checkpoint(obj):
+    content = io.BytesIO()
+    torch.save(obj, content)
+    return content.getvalue()
+
+
+def get_record_range(checkpoint, name):
+    with zipfile.ZipFile(io.BytesIO(checkpoint)) as zf:
+        for info in zf.infolist():
+            if info.filename.endswith(name):
+                return info.header_offset, info.compress_size
+    raise AssertionError(f"Record not found: {name}")
+
+
+@pytest.fixture
+def state_dict():
+    return collections.OrderedDict(
+        {
+            "encoder.weight": torch.randn(4, 8),
+            "encoder.bias": torch.randn(8),
+            "decoder.weight": torch.randn(8, 4),
+        }
+    )
+
+
+@pytest.fixture
+def mock_azstoragetorch_blob_client():
+    return mock.Mock(AzStorageTorchBlobClient)
+
+
+@pytest.fixture
+def set_checkpoint(mock_azstoragetorch_blob_client):
+    def _set_checkpoint(content):
+        mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+        mock_azstoragetorch_blob_client.download.side_effect = (
+            lambda offset=0, length=None: content[
+                offset : None if length is None else offset + length
+            ]
+        )
+
+        def _download_into(buffer, offset=0, length=None):
+            if length is None:
+                length = len(buffer)
+            downloaded = content[offset : offset + length]
+            memoryview(buffer).cast("B")[: len(downloaded)] = downloaded
+            return len(downloaded)
+
+        mock_azstoragetorch_blob_client.download_into.side_effect = _download_into
+        return content
+
+    return _set_checkpoint
+
+
+@pytest.fixture
+def load(blob_url, mock_azstoragetorch_blob_client):
+    def _load():
+        return load_lazy(
+            blob_url, _azstoragetorch_blob_client=mock_azstoragetorch_blob_client
+        )
+
+    return _load
+
+
+def get_downloaded_ranges(mock_azstoragetorch_blob_client):
+    return [
+        (call.kwargs["offset"], call.kwargs["length"])
+        for call in mock_azstoragetorch_blob_client.download_into.call_args_list
+    ]
+
+
+def assert_tensors_equal(actual, expected):
+    assert type(actual) is type(expected)
+    assert actual.dtype == expected.dtype
+    assert actual.requires_grad == expected.requires_grad
+    assert torch.equal(actual, expected)
+
+
+class TestLoadLazy:
+    def test_load_lazy(self, load, set_checkpoint, state_dict):
+        set_checkpoint(create_checkpoint(state_dict))
+        loaded = load()
+        assert isinstance(loaded, collections.OrderedDict)
+        assert list(loaded.keys()) == list(state_dict.keys())
+        for key, tensor in state_dict.items():
+            assert isinstance(loaded[key], LazyTensor)
+            assert loaded[key].shape == tensor.shape
+            assert loaded[key].dtype == tensor.dtype
+            assert not loaded[key].is_parameter
+            assert_tensors_equal(loaded[key].materialize(), tensor)
+
+    def test_load_lazy_does_not_download_tensor_data(
+        self, load, set_checkpoint, state_dict, mock_azstoragetorch_blob_client
+    ):
+        checkpoint = set_checkpoint(create_checkpoint(state_dict))
+        load()
+        pickle_offset, _ = get_record_range(checkpoint, "data.pkl")
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=None
+        )
+        assert [
+            offset
+            for offset, _ in get_downloaded_ranges(mock_azstoragetorch_blob_client)
+        ] == [pickle_offset]
+
+    def test_materialize_only_downloads_record(
+        self, load, set_checkpoint, state_dict, mock_azstoragetorch_blob_client
+    ):
+        checkpoint = set_checkpoint(create_checkpoint(state_dict))
+        loaded = load()
+        mock_azstoragetorch_blob_client.download_into.reset_mock()
+
+        loaded["encoder.bias"].materialize()
+        key = list(state_dict.keys()).index("encoder.bias")
+        header_offset, size = get_record_range(checkpoint, f"data/{key}")
+        downloaded_ranges = get_downloaded_ranges(mock_azstoragetorch_blob_client)
+        assert len(downloaded_ranges) == 1
+        offset, length = downloaded_ranges[0]
+        assert offset == header_offset
+        assert length < size + 512
+
+    def test_materialize_large_tensor_downloads_only_record(
+        self, load, set_checkpoint, mock_azstoragetorch_blob_client
+    ):
+        state_dict = {
+            "small": torch.randn(4),
+            "large": torch.randn(1024, 1024),
+        }
+        checkpoint = set_checkpoint(create_checkpoint(state_dict))
+        loaded = load()
+        mock_azstoragetorch_blob_client.download_into.reset_mock()
+
+        assert_tensors_equal(loaded["small"].materialize(), state_dict["small"])
+        downloaded = sum(
+            length
+            for _, length in get_downloaded_ranges(mock_azstoragetorch_blob_client)
+        )
+        assert downloaded < len(checkpoint) // 100
+
+    @pytest.mark.parametrize(
+        "tensor",
+        [
+            torch.randn(4, 8),
+            torch.randn(4, 8).to(torch.bfloat16),
+            torch.randn(4, 8).to(torch.float16),
+            torch.randint(0, 100, (10,)),
+            torch.tensor([True, False]),
+            torch.tensor(3.0),
+            torch.empty(0),
+            torch.randn(4, 8).t(),
+            torch.randn(8, 8)[2:4, 1:3],
+        ],
+    )
+    def test_materialize_tensor_types(self, load, set_checkpoint, tensor):
+        set_checkpoint(create_checkpoint({"tensor": tensor}))
+        loaded = load()
+        assert loaded["tensor"].shape == tensor.shape
+        assert loaded["tensor"].dtype == tensor.dtype
+        materialized = loaded["tensor"].materialize()
+        assert_tensors_equal(materialized, tensor)
+        assert materialized.stride() == tensor.stride()
+
+    def test_materialize_parameter(self, load, set_checkpoint):
+        parameter = torch.nn.Parameter(torch.randn(4, 8))
+        set_checkpoint(create_checkpoint({"parameter": parameter}))
+        loaded = load()
+        assert loaded["parameter"].is_parameter
+        assert_tensors_equal(loaded["parameter"].materialize(), parameter)
+
+    def test_materialize_parameter_without_grad(self, load, set_checkpoint):
+        parameter = torch.nn.Parameter(torch.randn(4, 8), requires_grad=False)
+        set_checkpoint(create_checkpoint({"parameter": parameter}))
+        assert_tensors_equal(load()["parameter"].materialize(), parameter)
+
+    def test_materialize_shared_storage(
+        self, load, set_checkpoint, mock_azstoragetorch_blob_client
+    ):
+        tensor = torch.randn(8, 8)
+        set_checkpoint(
+            create_checkpoint(
+                {"tensor": tensor, "tied": tensor, "view": tensor[2:4]},
+            )
+        )
+        loaded = load()
+        assert loaded["tensor"] is loaded["tied"]
+        mock_azstoragetorch_blob_client.download_into.reset_mock()
+
+        materialized = loaded["tensor"].materialize()
+        view = loaded["view"].materialize()
+        assert_tensors_equal(view, tensor[2:4])
+        assert view.untyped_storage().data_ptr() == (
+            materialized.untyped_storage().data_ptr()
+        )
+        assert mock_azstoragetorch_blob_client.download_into.call_count == 1
+
+    def test_materialize_redownloads_released_storage(
+        self, load, set_checkpoint, state_dict, mock_azstoragetorch_blob_client
+    ):
+        set_checkpoint(create_checkpoint(state_dict))
+        loaded = load()
+        mock_azstoragetorch_blob_client.download_into.reset_mock()
+        loaded["encoder.weight"].materialize()
+        assert_tensors_equal(
+            loaded["encoder.weight"].materialize(), state_dict["encoder.weight"]
+        )
+        assert mock_azstoragetorch_blob_client.download_into.call_count == 2
+
+    def test_load_nested_object(self, load, set_checkpoint, state_dict):
+        checkpoint = {
+            "epoch": 3,
+            "model": state_dict,
+            "optimizer": {
+                "state": {0: {"step": torch.tensor(10.0)}},
+                "param_groups": [{"lr": 0.01, "params": [0]}],
+            },
+            "name": "checkpoint",
+        }
+        set_checkpoint(create_checkpoint(checkpoint))
+        loaded = load()
+        assert loaded["epoch"] == 3
+        assert loaded["name"] == "checkpoint"
+        assert loaded["optimizer"]["param_groups"] == [{"lr": 0.01, "params": [0]}]
+        assert_tensors_equal(
+            loaded["optimizer"]["state"][0]["step"].materialize(), torch.tensor(10.0)
+        )
+        assert_tensors_equal(
+            loaded["model"]["encoder.weight"].materialize(),
+            state_dict["encoder.weight"],
+        )
+
+    def test_load_module_state_dict(self, load, set_checkpoint):
+        model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8))
+        set_checkpoint(create_checkpoint(model.state_dict()))
+        loaded = load()
+        new_model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8))
+        new_model.load_state_dict(
+            {key: tensor.materialize() for key, tensor in loaded.items()}
+        )
+        for key, tensor in model.state_dict().items():
+            assert torch.equal(new_model.state_dict()[key], tensor)
+
+    def test_materialize_from_threads(self, load, set_checkpoint):
+        state_dict = {str(i): torch.randn(16) for i in range(32)}
+        set_checkpoint(create_checkpoint(state_dict))
+        loaded = load()
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = executor.map(lambda key: loaded[key].materialize(), state_dict)
+        for key, result in zip(state_dict, results):
+            assert_tensors_equal(result, state_dict[key])
+
+    def test_central_directory_not_in_tail(
+        self, load, set_checkpoint, state_dict, mock_azstoragetorch_blob_client
+    ):
+        checkpoint = set_checkpoint(create_checkpoint(state_dict))
+        # Only download the end of central directory record in the initial request.
+        with mock.patch("azstoragetorch._zip.MAX_END_OF_CENTRAL_DIRECTORY_SIZE", 22):
+            loaded = load()
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=len(checkpoint) - 22, length=None
+        )
+        assert_tensors_equal(
+            loaded["encoder.weight"].materialize(), state_dict["encoder.weight"]
+        )
+
+    def test_local_file_header_larger_than_expected(
+        self, load, set_checkpoint, state_dict, mock_azstoragetorch_blob_client
+    ):
+        set_checkpoint(create_checkpoint(state_dict))
+        with mock.patch(
+            "azstoragetorch.checkpoint._LOCAL_FILE_HEADER_EXTRA_FIELD_ALLOWANCE", 0
+        ):
+            loaded = load()
+            mock_azstoragetorch_blob_client.download_into.reset_mock()
+            assert_tensors_equal(
+                loaded["encoder.weight"].materialize(), state_dict["encoder.weight"]
+            )
+        assert mock_azstoragetorch_blob_client.download_into.call_count == 2
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            random_bytes(1024),
+        ],
+    )
+    def test_raises_for_non_zip(self, load, set_checkpoint, content, blob_url):
+        set_checkpoint(content)
+        with pytest.raises(ValueError, match=f"not a checkpoint.*{blob_url}"):
+            load()
+
+    def test_raises_for_unsupported_global(self, load, set_checkpoint):
+        set_checkpoint(create_checkpoint({"obj": UnsupportedObject()}))
+        with pytest.raises(pickle.UnpicklingError, match="UnsupportedObject"):
+            load()
+
+    def test_raises_for_compressed_record(self, load, set_checkpoint, state_dict):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(create_checkpoint(state_dict))) as src:
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as dst:
+                for info in src.infolist():
+                    dst.writestr(info.filename, src.read(info))
+        set_checkpoint(archive.getvalue())
+        with pytest.raises(ValueError, match="Compressed"):
+            load()
+
+
+@pytest.fixture
+def small_chunk_size():
+    with mock.patch.object(LocalCheckpointFile, "_CHUNK_SIZE", 1024):
+        yield 1024
+
+
+@pytest.fixture
+def local_path(tmp_path):
+    return tmp_path / "model.pth"
+
+
+@pytest.fixture
+def create_local_file(blob_url, local_path, mock_azstoragetorch_blob_client):
+    def _create_local_file(**kwargs):
+        return LocalCheckpointFile(
+            blob_url,
+            local_path,
+            _azstoragetorch_blob_client=mock_azstoragetorch_blob_client,
+            **kwargs,
+        )
+
+    return _create_local_file
+
+
+class TestLocalCheckpointFile:
+    def test_load_with_mmap(self, create_local_file, set_checkpoint, state_dict):
+        set_checkpoint(create_checkpoint(state_dict))
+        with create_local_file() as f:
+            f.fill()
+            loaded = torch.load(f.path, mmap=True, weights_only=True)
+        for key, tensor in state_dict.items():
+            assert_tensors_equal(loaded[key], tensor)
+
+    def test_background_fill(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        small_chunk_size,
+        mock_azstoragetorch_blob_client,
+    ):
+        checkpoint = set_checkpoint(random_bytes(small_chunk_size * 20 + 10))
+        with create_local_file() as f:
+            f._background_thread.join()
+            assert f.is_filled()
+            num_downloads = mock_azstoragetorch_blob_client.download_into.call_count
+            f.fill()
+        assert mock_azstoragetorch_blob_client.download_into.call_count == num_downloads
+        assert local_path.read_bytes() == checkpoint
+
+    def test_background_fill_downloads_multiple_chunks_per_request(
+        self,
+        create_local_file,
+        set_checkpoint,
+        small_chunk_size,
+        mock_azstoragetorch_blob_client,
+    ):
+        set_checkpoint(random_bytes(small_chunk_size * 20))
+        with create_local_file() as f:
+            f._background_thread.join()
+        assert get_downloaded_ranges(mock_azstoragetorch_blob_client) == [
+            (0, small_chunk_size * 8),
+            (small_chunk_size * 8, small_chunk_size * 8),
+            (small_chunk_size * 16, small_chunk_size * 4),
+        ]
+
+    def test_creates_sparse_file_of_blob_size(
+        self, create_local_file, set_checkpoint, local_path
+    ):
+        set_checkpoint(random_bytes(4096))
+        with create_local_file(background_fill=False) as f:
+            assert f.size == 4096
+            assert os.path.getsize(local_path) == 4096
+            assert not f.is_filled()
+        assert local_path.read_bytes() == b"\x00" * 4096
+
+    def test_fill_range(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        small_chunk_size,
+        mock_azstoragetorch_blob_client,
+    ):
+        checkpoint = set_checkpoint(random_bytes(small_chunk_size * 10))
+        with create_local_file(background_fill=False) as f:
+            f.fill(small_chunk_size * 2 + 100, small_chunk_size)
+            assert get_downloaded_ranges(mock_azstoragetorch_blob_client) == [
+                (small_chunk_size * 2, small_chunk_size * 2)
+            ]
+            assert f.is_filled(small_chunk_size * 2, small_chunk_size * 2)
+            assert not f.is_filled(0, small_chunk_size * 2)
+            assert not f.is_filled()
+        start, end = small_chunk_size * 2, small_chunk_size * 4
+        content = local_path.read_bytes()
+        assert content[start:end] == checkpoint[start:end]
+        assert content[:start] == b"\x00" * start
+
+    def test_fill_skips_filled_chunks(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        small_chunk_size,
+        mock_azstoragetorch_blob_client,
+    ):
+        checkpoint = set_checkpoint(random_bytes(small_chunk_size * 4))
+        with create_local_file(background_fill=False) as f:
+            f.fill(small_chunk_size, small_chunk_size)
+            f.fill(small_chunk_size, small_chunk_size)
+            f.fill()
+        assert get_downloaded_ranges(mock_azstoragetorch_blob_client) == [
+            (small_chunk_size, small_chunk_size),
+            (0, small_chunk_size),
+            (small_chunk_size * 2, small_chunk_size * 2),
+        ]
+        assert local_path.read_bytes() == checkpoint
+
+    @pytest.mark.parametrize(
+        "offset,length",
+        [
+            (4096, None),
+            (5000, 10),
+            (0, 0),
+        ],
+    )
+    def test_fill_empty_range(
+        self,
+        create_local_file,
+        set_checkpoint,
+        offset,
+        length,
+        mock_azstoragetorch_blob_client,
+    ):
+        set_checkpoint(random_bytes(4096))
+        with create_local_file(background_fill=False) as f:
+            f.fill(offset, length)
+            assert f.is_filled(offset, length)
+        mock_azstoragetorch_blob_client.download_into.assert_not_called()
+
+    def test_fill_raises_for_negative_offset(self, create_local_file, set_checkpoint):
+        set_checkpoint(random_bytes(4096))
+        with create_local_file(background_fill=False) as f:
+            with pytest.raises(ValueError, match="Offset must be non-negative"):
+                f.fill(-1)
+
+    def test_empty_blob(self, create_local_file, set_checkpoint, local_path):
+        set_checkpoint(b"")
+        with create_local_file() as f:
+            assert f.is_filled()
+            f.fill()
+        assert local_path.read_bytes() == b""
+
+    def test_fill_raises_download_error_and_can_retry(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        mock_azstoragetorch_blob_client,
+    ):
+        checkpoint = set_checkpoint(random_bytes(4096))
+        download_into = mock_azstoragetorch_blob_client.download_into.side_effect
+        mock_azstoragetorch_blob_client.download_into.side_effect = [
+            ValueError("download failed"),
+            download_into,
+        ]
+        with create_local_file(background_fill=False) as f:
+            with pytest.raises(ValueError, match="download failed"):
+                f.fill()
+            assert not f.is_filled()
+            mock_azstoragetorch_blob_client.download_into.side_effect = download_into
+            f.fill()
+            assert f.is_filled()
+        assert local_path.read_bytes() == checkpoint
+
+    def test_fill_after_background_fill_error(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        small_chunk_size,
+        mock_azstoragetorch_blob_client,
+        caplog,
+    ):
+        checkpoint = set_checkpoint(random_bytes(small_chunk_size * 20))
+        download_into = mock_azstoragetorch_blob_client.download_into.side_effect
+        calls = []
+
+        def fail_first_download(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise ValueError("download failed")
+            return download_into(*args, **kwargs)
+
+        mock_azstoragetorch_blob_client.download_into.side_effect = fail_first_download
+        with caplog.at_level(logging.WARNING, logger="azstoragetorch.checkpoint"):
+            with create_local_file() as f:
+                f._background_thread.join()
+                assert not f.is_filled()
+                f.fill()
+                assert f.is_filled()
+        assert local_path.read_bytes() == checkpoint
+        assert "download failed" in caplog.text
+
+    def test_closes_file_if_mapping_fails(self, create_local_file, set_checkpoint):
+        set_checkpoint(random_bytes(1024))
+        opened_files = []
+
+        def tracked_open(*args, **kwargs):
+            opened_files.append(open(*args, **kwargs))
+            return opened_files[-1]
+
+        with mock.patch("azstoragetorch.checkpoint.open", tracked_open, create=True):
+            with mock.patch("mmap.mmap", side_effect=OSError("mmap failed")):
+                with pytest.raises(OSError, match="mmap failed"):
+                    create_local_file()
+        assert len(opened_files) == 1
+        assert opened_files[0].closed
+
+    def test_fill_from_threads_downloads_each_chunk_once(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        small_chunk_size,
+        mock_azstoragetorch_blob_client,
+    ):
+        checkpoint = set_checkpoint(random_bytes(small_chunk_size * 64))
+        with create_local_file() as f:
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                list(
+                    executor.map(
+                        lambda i: f.fill(i * small_chunk_size, small_chunk_size * 4),
+                        range(64),
+                    )
+                )
+            f.fill()
+        downloaded = sum(
+            length
+            for _, length in get_downloaded_ranges(mock_azstoragetorch_blob_client)
+        )
+        assert downloaded == len(checkpoint)
+        assert local_path.read_bytes() == checkpoint
+
+    def test_close(
+        self,
+        create_local_file,
+        set_checkpoint,
+        local_path,
+        mock_azstoragetorch_blob_client,
+    ):
+        set_checkpoint(random_bytes(4096))
+        f = create_local_file()
+        f.close()
+        mock_azstoragetorch_blob_client.close.assert_called_once()
+        assert local_path.exists()
+        f.close()
+        mock_azstoragetorch_blob_client.close.assert_called_once()
+
+    def test_fill_raises_after_close(self, create_local_file, set_checkpoint):
+        set_checkpoint(random_bytes(4096))
+        f = create_local_file()
+        f.close()
+        with pytest.raises(ValueError, match="I/O operation on closed file"):
+            f.fill()
+
+    def test_overwrites_existing_file(
+        self, create_local_file, set_checkpoint, local_path
+    ):
+        local_path.write_bytes(b"existing content" * 1000)
+        checkpoint = set_checkpoint(random_bytes(100))
+        with create_local_file() as f:
+            f.fill()
+        assert local_path.read_bytes() == checkpoint
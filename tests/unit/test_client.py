@@ -3,15 +3,31 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import array
 import concurrent.futures
 import copy
+import datetime
+import email.utils
+import http.server
+import io
+import mmap
 from unittest import mock
 import os
+import socket
 import threading
+import time
+import tracemalloc
 import urllib.parse
 import pytest
-
-from azure.core.credentials import AzureSasCredential, AzureNamedKeyCredential
+import requests
+import urllib3
+
+from azure.core.credentials import (
+    AccessToken,
+    AzureSasCredential,
+    AzureNamedKeyCredential,
+    TokenCredential,
+)
 import azure.core.exceptions
 from azure.core.pipeline.transport import HttpRequest, HttpResponse
 from azure.identity import DefaultAzureCredential
@@ -29,10 +45,27 @@ from azure.core.pipeline import Pipeline
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from azure.core.pipeline.transport import RequestsTransport
 
+import azstoragetorch._client
 from azstoragetorch._client import (
     AzStorageTorchBlobClient,
     AzStorageTorchBlobClientFactory,
+    BandwidthLimiter,
+    BlobClientFactoryCache,
+    BLOB_CLIENT_FACTORY_CACHE,
+    ConcurrencyController,
+    CONCURRENCY_CONTROLLER,
+    ConnectionPoolManager,
+    CONNECTION_POOL_MANAGER,
     EchoClientRequestIdPolicy,
+    FastDownloadTransport,
+    IOScheduler,
+    IO_SCHEDULER,
+    PartitionPlanner,
+    DOWNLOAD_PARTITION_PLANNER,
+    HedgeStats,
+    RequestHedger,
+    RetryPolicy,
+    RetryStats,
 )
 from azstoragetorch.exceptions import ClientRequestIdMismatchError
 from tests.unit.utils import random_bytes
@@ -101,6 +134,7 @@ def mock_sdk_blob_client(
     mock_sdk_client._pipeline = mock_pipeline
     mock_sdk_client.get_blob_properties.return_value = blob_properties
     mock_sdk_client.url = blob_url
+    mock_sdk_client.version_id = None
     return mock_sdk_client
 
 
@@ -135,9 +169,18 @@ def single_threaded_executor():
 
 
 @pytest.fixture
-def azstoragetorch_blob_client(mock_sdk_blob_client, single_threaded_executor):
+def partition_planner():
+    return PartitionPlanner(DEFAULT_PARTITION_SIZE)
+
+
+@pytest.fixture
+def azstoragetorch_blob_client(
+    mock_sdk_blob_client, single_threaded_executor, partition_planner
+):
     return AzStorageTorchBlobClient(
-        mock_sdk_blob_client, executor=single_threaded_executor
+        mock_sdk_blob_client,
+        executor=single_threaded_executor,
+        partition_planner=partition_planner,
     )
 
 
@@ -248,6 +291,17 @@ class SpySubmitExcecutor(concurrent.futures.ThreadPoolExecutor):
         return super().submit(fn, *args, **kwargs)
 
 
+class InlineExecutor(concurrent.futures.Executor):
+    # Runs submitted functions immediately to make the order of requests deterministic.
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
 class TestEchoClientRequestIdPolicy:
     def test_adds_client_request_id(
         self, echo_client_request_id_policy, mock_pipeline_request, mock_uuid4
@@ -329,7 +383,6 @@ class TestAzStorageTorchBlobClientFactory:
     ):
         self.assert_expected_from_url_call(
             mock_sdk_container_client.from_container_url,
-            expected_transport=None,
             **kwargs,
         )
 
@@ -480,6 +533,17 @@ class TestAzStorageTorchBlobClientFactory:
             mock_sdk_blob_client, expected_url=blob_url
         )
 
+    def test_get_blob_client_from_url_with_partition_planner(
+        self, blob_url, mock_sdk_blob_client, azstoragetorch_blob_client_cls_patch
+    ):
+        factory = AzStorageTorchBlobClientFactory()
+        partition_planner = PartitionPlanner(4)
+        factory.get_blob_client_from_url(blob_url, partition_planner=partition_planner)
+        azstoragetorch_blob_client_cls_patch.assert_called_once_with(
+            mock_sdk_blob_client.from_blob_url.return_value,
+            partition_planner=partition_planner,
+        )
+
     def test_credential_defaults_to_azure_default_credential(
         self, blob_url, mock_sdk_blob_client
     ):
@@ -552,6 +616,12 @@ class TestAzStorageTorchBlobClientFactory:
             self.get_credential_used(mock_sdk_blob_client), DefaultAzureCredential
         )
 
+    def test_passes_version_id_from_blob_url(self, blob_url, mock_sdk_blob_client):
+        version_url = f"{blob_url}?versionid={VERSION_ID}"
+        factory = AzStorageTorchBlobClientFactory()
+        factory.get_blob_client_from_url(version_url)
+        assert self.get_sdk_kwarg_used(mock_sdk_blob_client, "version_id") == VERSION_ID
+
     @pytest.mark.parametrize(
         "credential",
         [
@@ -587,6 +657,8 @@ class TestAzStorageTorchBlobClientFactory:
                 expected_transport=mock_requests_transport_cls.return_value,
             )
             mock_requests_transport_cls.assert_called_once_with(
+                session=mock.ANY,
+                session_owner=True,
                 connection_timeout=20,
                 read_timeout=60,
                 connection_data_block_size=256 * 1024,
@@ -603,6 +675,30 @@ class TestAzStorageTorchBlobClientFactory:
         second_transport_used = self.get_transport_used(mock_sdk_blob_client)
         assert first_transport_used is second_transport_used
 
+    def test_shares_transport_across_factories_for_same_account(
+        self, blob_url, mock_sdk_blob_client
+    ):
+        AzStorageTorchBlobClientFactory().get_blob_client_from_url(blob_url)
+        first_transport_used = self.get_transport_used(mock_sdk_blob_client)
+
+        AzStorageTorchBlobClientFactory(credential=False).get_blob_client_from_url(
+            blob_url
+        )
+        assert self.get_transport_used(mock_sdk_blob_client) is first_transport_used
+        assert first_transport_used is CONNECTION_POOL_MANAGER.get_transport(blob_url)
+
+    def test_uses_provided_connection_pool_manager(
+        self, blob_url, mock_sdk_blob_client
+    ):
+        connection_pool_manager = ConnectionPoolManager(pool_size=2)
+        factory = AzStorageTorchBlobClientFactory(
+            connection_pool_manager=connection_pool_manager
+        )
+        factory.get_blob_client_from_url(blob_url)
+        assert self.get_transport_used(
+            mock_sdk_blob_client
+        ) is connection_pool_manager.get_transport(blob_url)
+
     def test_reuses_pipeline(self, blob_url, mock_sdk_blob_client, mock_pipeline):
         factory = AzStorageTorchBlobClientFactory()
         factory.get_blob_client_from_url(blob_url)
@@ -640,7 +736,7 @@ class TestAzStorageTorchBlobClientFactory:
             mock.call(blob_url_with_sas, **self.get_expected_from_url_kwargs()),
         ]
 
-    def test_does_not_reuse_pipeline_for_container_clients(
+    def test_container_clients_share_transport_and_cached_pipeline(
         self,
         container_url,
         blob_url,
@@ -660,15 +756,23 @@ class TestAzStorageTorchBlobClientFactory:
         factory.get_blob_client_from_url(blob_url)
         list(factory.yield_blob_clients_from_container_url(container_url))
 
-        # None of the container clients created should use a shared pipeline
-        # nor a shared transport.
-        expected_from_container_url_kwargs = self.get_expected_from_url_kwargs(
-            expected_transport=None,
-            expected_pipeline=None,
-        )
+        # Container clients share the transport of blob clients for the same account. They
+        # only use a pipeline once one has been cached from a blob client.
+        expected_transport = CONNECTION_POOL_MANAGER.get_transport(container_url)
         assert mock_sdk_container_client.from_container_url.call_args_list == [
-            mock.call(container_url, **expected_from_container_url_kwargs),
-            mock.call(container_url, **expected_from_container_url_kwargs),
+            mock.call(
+                container_url,
+                **self.get_expected_from_url_kwargs(
+                    expected_transport=expected_transport
+                ),
+            ),
+            mock.call(
+                container_url,
+                **self.get_expected_from_url_kwargs(
+                    expected_transport=expected_transport,
+                    expected_pipeline=mock_pipeline,
+                ),
+            ),
         ]
 
         # For the blob clients, we still want to share pipelines so we will cache the
@@ -809,209 +913,1517 @@ class TestAzStorageTorchBlobClientFactory:
         )
 
 
-class TestAzStorageTorchBlobClient:
-    def assert_expected_download_calls(
-        self,
-        mock_generated_sdk_storage_client,
-        expected_ranges,
-        expected_etag,
-        known_blob_size=False,
+class TestBlobClientFactoryCache:
+    @pytest.fixture(autouse=True)
+    def factory_cls_patch(self):
+        with mock.patch(
+            "azstoragetorch._client.AzStorageTorchBlobClientFactory",
+            side_effect=lambda **kwargs: mock.Mock(AzStorageTorchBlobClientFactory),
+        ) as factory_cls_patch:
+            yield factory_cls_patch
+
+    @pytest.fixture
+    def cache(self):
+        return BlobClientFactoryCache()
+
+    def test_get_blob_client_from_url(self, cache, blob_url, factory_cls_patch):
+        credential = DefaultAzureCredential()
+        client = cache.get_blob_client_from_url(blob_url, credential)
+        factory_cls_patch.assert_called_once_with(credential=credential)
+        factory = cache.get_factory(blob_url, credential)
+        assert client is factory.get_blob_client_from_url.return_value
+        factory.get_blob_client_from_url.assert_called_once_with(blob_url)
+
+    def test_get_blob_client_from_url_with_partition_planner(self, cache, blob_url):
+        partition_planner = PartitionPlanner(4)
+        cache.get_blob_client_from_url(blob_url, partition_planner=partition_planner)
+        cache.get_factory(blob_url).get_blob_client_from_url.assert_called_once_with(
+            blob_url, partition_planner=partition_planner
+        )
+
+    @pytest.mark.parametrize(
+        "credential",
+        [
+            None,
+            False,
+            DefaultAzureCredential(),
+            AzureSasCredential("sas"),
+        ],
+    )
+    def test_reuses_factory_for_same_account_and_credential(
+        self, cache, container_url, factory_cls_patch, credential
     ):
-        expected_download_calls = []
-        for i, expected_range in enumerate(expected_ranges):
-            download_kwargs = {
-                "range": f"bytes={expected_range}",
-            }
-            if i != 0 or known_blob_size:
-                download_kwargs["modified_access_conditions"] = (
-                    ModifiedAccessConditions(if_match=expected_etag)
-                )
-            expected_download_calls.append(mock.call(**download_kwargs))
+        factory = cache.get_factory(f"{container_url}/blob1", credential)
+        assert cache.get_factory(f"{container_url}/blob2", credential) is factory
+        factory_cls_patch.assert_called_once_with(credential=credential)
+
+    def test_account_is_case_insensitive(self, cache):
+        assert cache.get_factory(
+            "https://myaccount.blob.core.windows.net/container/blob"
+        ) is cache.get_factory("https://MyAccount.blob.core.windows.net/container/blob")
+
+    def test_different_accounts_use_different_factories(self, cache):
+        assert cache.get_factory(
+            "https://account1.blob.core.windows.net/container/blob"
+        ) is not cache.get_factory(
+            "https://account2.blob.core.windows.net/container/blob"
+        )
+
+    @pytest.mark.parametrize(
+        "credential,other_credential",
+        [
+            (None, False),
+            (None, DefaultAzureCredential()),
+            (DefaultAzureCredential(), DefaultAzureCredential()),
+            (AzureSasCredential("sas"), AzureSasCredential("sas")),
+        ],
+    )
+    def test_different_credentials_use_different_factories(
+        self, cache, blob_url, credential, other_credential
+    ):
+        assert cache.get_factory(blob_url, credential) is not cache.get_factory(
+            blob_url, other_credential
+        )
+
+    def test_reset(self, cache, blob_url, factory_cls_patch):
+        factory = cache.get_factory(blob_url)
+        cache.reset()
+        assert cache.get_factory(blob_url) is not factory
+        assert factory_cls_patch.call_count == 2
+
+    def test_get_factory_from_threads(self, cache, blob_url, factory_cls_patch):
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            factories = list(
+                executor.map(lambda _: cache.get_factory(blob_url), range(100))
+            )
+        assert all(factory is factories[0] for factory in factories)
+        factory_cls_patch.assert_called_once()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork()")
+    def test_reset_in_forked_child_process(self, blob_url):
+        factory = BLOB_CLIENT_FACTORY_CACHE.get_factory(blob_url)
+        pid = os.fork()
+        if pid == 0:
+            os._exit(
+                0
+                if BLOB_CLIENT_FACTORY_CACHE.get_factory(blob_url) is not factory
+                else 1
+            )
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert BLOB_CLIENT_FACTORY_CACHE.get_factory(blob_url) is factory
+
+
+class TestConnectionPoolManager:
+    @pytest.fixture
+    def manager(self):
+        return ConnectionPoolManager()
+
+    def get_adapter(self, transport, url="https://"):
+        transport.open()
+        return transport.session.get_adapter(url)
+
+    def test_default_pool_size_follows_max_in_flight_requests(self, manager):
+        assert manager.pool_size == IO_SCHEDULER.max_in_flight_requests + 4
+
+    def test_pool_size(self, blob_url):
+        manager = ConnectionPoolManager(pool_size=8)
+        assert manager.pool_size == 8
+        adapter = self.get_adapter(manager.get_transport(blob_url))
+        assert adapter._pool_maxsize == 8
+
+    def test_transport_defaults(self, manager, blob_url):
+        transport = manager.get_transport(blob_url)
+        assert isinstance(transport, RequestsTransport)
+        assert transport.connection_config.timeout == 20
+        assert transport.connection_config.read_timeout == 60
+        assert transport.connection_config.data_block_size == 256 * 1024
+        for url in ("http://", "https://"):
+            adapter = self.get_adapter(transport, url)
+            assert adapter._pool_maxsize == manager.pool_size
+            assert adapter.max_retries.total is False
+
+    def test_enables_tcp_keepalive(self, manager, blob_url):
+        adapter = self.get_adapter(manager.get_transport(blob_url))
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60) in socket_options
+
+    def test_reuses_transport_for_same_account(self, manager, container_url):
+        transport = manager.get_transport(f"{container_url}/blob1")
+        assert manager.get_transport(f"{container_url}/blob2") is transport
         assert (
-            mock_generated_sdk_storage_client.blob.download.call_args_list
-            == expected_download_calls
+            manager.get_transport(
+                "https://MyAccount.blob.core.windows.net/container/blob"
+            )
+            is transport
         )
 
-    def assert_stage_block_ids(self, stage_block_futures, expected_block_ids):
-        actual_block_ids = [future.result() for future in stage_block_futures]
-        assert actual_block_ids == expected_block_ids
+    def test_different_accounts_use_different_transports(self, manager):
+        assert manager.get_transport(
+            "https://account1.blob.core.windows.net/container/blob"
+        ) is not manager.get_transport(
+            "https://account2.blob.core.windows.net/container/blob"
+        )
+
+    def test_reset(self, blob_url):
+        manager = ConnectionPoolManager()
+        transport = manager.get_transport(blob_url)
+        with mock.patch.object(IO_SCHEDULER, "_max_in_flight_requests", 1):
+            manager.reset()
+            assert manager.get_transport(blob_url) is not transport
+            assert manager.pool_size == 5
 
     @pytest.mark.parametrize(
-        "cpu_count,process_cpu_count,expected_max_workers",
+        "num_connections,expected_requests",
         [
-            (1, PROCESS_CPU_COUNT_UNAVAILABLE, 5),
-            (4, PROCESS_CPU_COUNT_UNAVAILABLE, 8),
-            (16, PROCESS_CPU_COUNT_UNAVAILABLE, 20),
-            # cpu_count reaches max_workers ceiling
-            (64, PROCESS_CPU_COUNT_UNAVAILABLE, 32),
-            # max_workers are still set even if cpu_count is None or 0
-            (None, PROCESS_CPU_COUNT_UNAVAILABLE, 5),
-            (0, PROCESS_CPU_COUNT_UNAVAILABLE, 5),
-            # proccess_cpu_count overrides cpu_count
-            (64, 1, 5),
-            # process_cpu_count reaches max_workers ceiling
-            (1, 64, 32),
-            # max_workers are set when both cpu_count and process_cpu_count are None or 0
-            (None, None, 5),
-            (0, 0, 5),
+            (1, 1),
+            (4, 4),
+            # Capped to the pool size as more connections would not be kept pooled.
+            (20, 8),
+            (0, 0),
         ],
     )
-    def test_default_worker_count(
-        self,
-        mock_sdk_blob_client,
-        monkeypatch,
-        cpu_count,
-        process_cpu_count,
-        expected_max_workers,
-    ):
-        if process_cpu_count is PROCESS_CPU_COUNT_UNAVAILABLE:
-            monkeypatch.delattr(os, "process_cpu_count", raising=False)
-        else:
-            monkeypatch.setattr(
-                os, "process_cpu_count", lambda: process_cpu_count, raising=False
+    def test_warm_up(self, blob_url, num_connections, expected_requests):
+        manager = ConnectionPoolManager(pool_size=8)
+        transport = manager.get_transport(blob_url)
+        with mock.patch.object(transport.session, "head") as mock_head:
+            manager.warm_up(blob_url, num_connections)
+        assert (
+            mock_head.call_args_list
+            == [
+                mock.call(
+                    "https://myaccount.blob.core.windows.net/",
+                    headers={"User-Agent": f"azstoragetorch/{__version__}"},
+                    timeout=(20, 60),
+                )
+            ]
+            * expected_requests
+        )
+
+    def test_warm_up_makes_requests_concurrently(self, blob_url):
+        manager = ConnectionPoolManager(pool_size=8)
+        transport = manager.get_transport(blob_url)
+        # Each request only completes once all of the requests are in flight.
+        in_flight_barrier = threading.Barrier(4)
+        completed = []
+
+        def head(*args, **kwargs):
+            in_flight_barrier.wait(timeout=5)
+            completed.append(True)
+
+        with mock.patch.object(transport.session, "head", side_effect=head):
+            manager.warm_up(blob_url, 4)
+        assert completed == [True] * 4
+
+    def test_warm_up_defaults_to_account_concurrency(self, manager, blob_url):
+        transport = manager.get_transport(blob_url)
+        with mock.patch.object(transport.session, "head") as mock_head:
+            manager.warm_up(blob_url)
+        assert mock_head.call_count == IO_SCHEDULER.get_concurrency(
+            "myaccount.blob.core.windows.net"
+        )
+
+    def test_warm_up_ignores_request_errors(self, manager, blob_url):
+        transport = manager.get_transport(blob_url)
+        with mock.patch.object(
+            transport.session,
+            "head",
+            side_effect=requests.ConnectionError("Connection refused"),
+        ) as mock_head:
+            manager.warm_up(blob_url, 2)
+        assert mock_head.call_count == 2
+
+    def test_reset_connection_pools(self, blob_url):
+        manager = ConnectionPoolManager()
+        transport = manager.get_transport(blob_url)
+        session = transport.session
+        with mock.patch.object(IO_SCHEDULER, "_max_in_flight_requests", 1):
+            manager.reset_connection_pools()
+            assert manager.pool_size == 5
+        assert manager.get_transport(blob_url) is transport
+        assert transport.session is not session
+        assert self.get_adapter(transport)._pool_maxsize == 5
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork()")
+    def test_reset_connection_pools_in_forked_child_process(self, blob_url):
+        transport = CONNECTION_POOL_MANAGER.get_transport(blob_url)
+        session = transport.session
+        pid = os.fork()
+        if pid == 0:
+            os._exit(
+                0
+                if CONNECTION_POOL_MANAGER.get_transport(blob_url) is transport
+                and transport.session is not session
+                else 1
             )
-        monkeypatch.setattr(os, "cpu_count", lambda: cpu_count)
-        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
-            client = AzStorageTorchBlobClient(mock_sdk_blob_client)
-            # Executor instantiation is lazy. Stage some content to instantiate it
-            # and determine what the max_workers value is.
-            client.stage_blocks(b"content")
-            mock_executor.assert_called_once_with(expected_max_workers)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert transport.session is session
 
+
+class TestPartitionPlanner:
     @pytest.mark.parametrize(
-        "sdk_blob_client_url, expected_url",
+        "offset,length,expected_partitions",
         [
-            (
-                "https://account.blob.core.windows.net/container/blob",
-                "https://account.blob.core.windows.net/container/blob",
-            ),
-            # Cases to make sure query string is not included in returned URL.
-            (
-                f"https://account.blob.core.windows.net/container/blob?{SAS_TOKEN}",
-                "https://account.blob.core.windows.net/container/blob",
-            ),
-            (
-                f"https://account.blob.core.windows.net/container/blob?snapshot={SNAPSHOT}&versionid={VERSION_ID}&{SAS_TOKEN}",
-                "https://account.blob.core.windows.net/container/blob",
-            ),
-            (
-                "https://account.blob.core.windows.net/container/blob?unknown1=val1&unknown2=val2",
-                "https://account.blob.core.windows.net/container/blob",
-            ),
+            (0, 0, [(0, 0)]),
+            (0, 10, [(0, 4), (4, 4), (8, 2)]),
+            (5, 10, [(5, 4), (9, 4), (13, 2)]),
+            (0, 4, [(0, 4)]),
+            (0, 3, [(0, 3)]),
         ],
     )
-    def test_url(
-        self,
-        azstoragetorch_blob_client,
-        mock_sdk_blob_client,
-        sdk_blob_client_url,
-        expected_url,
-    ):
-        mock_sdk_blob_client.url = sdk_blob_client_url
-        assert azstoragetorch_blob_client.url == expected_url
+    def test_plan_with_fixed_partition_size(self, offset, length, expected_partitions):
+        planner = PartitionPlanner(4)
+        assert planner.plan(offset, length, 32) == expected_partitions
 
-    def test_blob_name(self, azstoragetorch_blob_client, mock_sdk_blob_client):
-        mock_sdk_blob_client.blob_name = "blob-name"
-        assert azstoragetorch_blob_client.blob_name == "blob-name"
+    @pytest.mark.parametrize("partition_size", [0, -1])
+    def test_raises_for_invalid_partition_size(self, partition_size):
+        with pytest.raises(ValueError, match="Partition size must be greater than 0"):
+            PartitionPlanner(partition_size)
 
-    def test_container_name(self, azstoragetorch_blob_client, mock_sdk_blob_client):
-        mock_sdk_blob_client.container_name = "container-name"
-        assert azstoragetorch_blob_client.container_name == "container-name"
+    @pytest.mark.parametrize(
+        "length,max_concurrency,expected_partition_sizes",
+        [
+            # Small downloads are not split
+            (0, 32, [0]),
+            (4 * MB, 32, [4 * MB]),
+            # Medium downloads are split to use available connections but
+            # not into partitions smaller than the minimum size.
+            (20 * MB, 32, [4 * MB] * 5),
+            (10 * MB, 32, [5 * MB] * 2),
+            (100 * MB, 8, [12.5 * MB] * 8),
+            # Large downloads use the default partition size until throughput is measured.
+            (1024 * MB, 8, [16 * MB] * 64),
+            # Concurrency of one still splits large downloads.
+            (64 * MB, 1, [16 * MB] * 4),
+        ],
+    )
+    def test_plan_adaptive(self, length, max_concurrency, expected_partition_sizes):
+        planner = PartitionPlanner()
+        partitions = planner.plan(10, length, max_concurrency)
+        assert [size for _, size in partitions] == expected_partition_sizes
+        assert [start for start, _ in partitions] == [
+            10 + sum(expected_partition_sizes[:i])
+            for i in range(len(expected_partition_sizes))
+        ]
 
-    def test_get_blob_size(
-        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+    def test_plan_adaptive_evens_out_partition_sizes(self):
+        planner = PartitionPlanner()
+        partitions = planner.plan(0, 20 * MB + 1, 2)
+        assert partitions == [(0, 10 * MB + 1), (10 * MB + 1, 10 * MB)]
+
+    @pytest.mark.parametrize(
+        "throughput,expected_partition_size",
+        [
+            # Partitions are sized to take around half a second.
+            (64 * MB, 32 * MB),
+            # Fast connections are capped at the maximum partition size.
+            (1024 * MB, 64 * MB),
+            # Slow connections are capped at the minimum partition size.
+            (MB, 4 * MB),
+        ],
+    )
+    def test_plan_adaptive_uses_measured_throughput(
+        self, throughput, expected_partition_size
     ):
-        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
-        assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
-        mock_sdk_blob_client.get_blob_properties.assert_called_once_with()
+        planner = PartitionPlanner()
+        planner.record_throughput(throughput, 1)
+        partitions = planner.plan(0, 1024 * MB, 8)
+        assert {size for _, size in partitions} == {expected_partition_size}
 
-    def test_get_blob_size_caches_result(
-        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+    @pytest.mark.parametrize(
+        "partition_size,speculative_partitions,offset,length,expected_partitions",
+        [
+            (4, 1, 0, None, [(0, 4)]),
+            (4, 1, 5, 2, [(5, 2)]),
+            (4, 3, 0, None, [(0, 4), (4, 4), (8, 4)]),
+            (4, 3, 5, None, [(5, 4), (9, 4), (13, 4)]),
+            (4, 3, 0, 10, [(0, 4), (4, 4), (8, 2)]),
+            (4, 3, 0, 4, [(0, 4)]),
+            (4, 3, 0, 100, [(0, 4), (4, 4), (8, 4)]),
+            (None, 1, 0, None, [(0, 16 * MB)]),
+            (None, 2, 0, None, [(0, 16 * MB), (16 * MB, 16 * MB)]),
+        ],
+    )
+    def test_plan_unknown_size(
+        self,
+        partition_size,
+        speculative_partitions,
+        offset,
+        length,
+        expected_partitions,
     ):
-        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
-        assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
-        assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
-        mock_sdk_blob_client.get_blob_properties.assert_called_once_with()
+        planner = PartitionPlanner(partition_size, speculative_partitions)
+        assert planner.plan_unknown_size(offset, length) == expected_partitions
+
+    def test_plan_unknown_size_uses_measured_throughput(self):
+        planner = PartitionPlanner(speculative_partitions=2)
+        planner.record_throughput(64 * MB, 1)
+        assert planner.plan_unknown_size(0) == [(0, 32 * MB), (32 * MB, 32 * MB)]
+
+    @pytest.mark.parametrize("speculative_partitions", [0, -1])
+    def test_raises_for_invalid_speculative_partitions(self, speculative_partitions):
+        with pytest.raises(
+            ValueError, match="Speculative partitions must be at least 1"
+        ):
+            PartitionPlanner(speculative_partitions=speculative_partitions)
 
-    def test_close(self, mock_sdk_blob_client):
-        mock_executor = mock.Mock(concurrent.futures.Executor)
-        client = AzStorageTorchBlobClient(mock_sdk_blob_client, mock_executor)
-        client.close()
-        mock_executor.shutdown.assert_called_once_with()
+    def test_record_throughput(self):
+        planner = PartitionPlanner()
+        assert planner.throughput is None
+        planner.record_throughput(10 * MB, 2)
+        assert planner.throughput == 5 * MB
+        planner.record_throughput(30 * MB, 2)
+        assert planner.throughput == 7 * MB
 
-    def test_no_executor_used_when_no_transfers(self, mock_sdk_blob_client):
-        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
-            client = AzStorageTorchBlobClient(mock_sdk_blob_client)
-            client.close()
-            mock_executor.assert_not_called()
-            mock_executor.return_value.shutdown.assert_not_called()
+    @pytest.mark.parametrize(
+        "num_bytes,elapsed_time",
+        [
+            (MB - 1, 1),
+            (10 * MB, 0),
+        ],
+    )
+    def test_record_throughput_ignores_unusable_samples(self, num_bytes, elapsed_time):
+        planner = PartitionPlanner()
+        planner.record_throughput(num_bytes, elapsed_time)
+        assert planner.throughput is None
+
+    def test_reset(self):
+        planner = PartitionPlanner()
+        planner.record_throughput(10 * MB, 1)
+        planner.reset()
+        assert planner.throughput is None
+
+
+class TestRequestHedger:
+    def record_samples(self, hedger, num_samples, seconds_per_byte=0.01):
+        for i in range(num_samples):
+            hedger.record_download(100, (i + 1) * seconds_per_byte * 100)
+
+    def test_get_deadline_requires_min_samples(self):
+        hedger = RequestHedger()
+        self.record_samples(hedger, 19)
+        assert hedger.get_deadline(100) is None
+        self.record_samples(hedger, 1)
+        assert hedger.get_deadline(100) is not None
 
     @pytest.mark.parametrize(
-        "blob_size, download_offset, download_length, expected_ranges, known_blob_size",
+        "percentile,expected_seconds_per_byte",
         [
-            # Download an empty blob
-            (0, None, None, ["0--1"], True),
-            (0, None, None, [f"0-{DEFAULT_PARTITION_SIZE - 1}"], False),
-            # Small single GET full, download
-            (10, None, None, ["0-9"], True),
-            (10, None, None, [f"0-{DEFAULT_PARTITION_SIZE - 1}"], False),
-            # Small download with offset
-            (10, 5, None, ["5-9"], True),
-            (10, 5, None, [f"5-{DEFAULT_PARTITION_SIZE + 5 - 1}"], False),
-            # Small download with length
-            (10, 0, 5, ["0-4"], True),
-            (10, 0, 5, ["0-4"], False),
-            # Small download with offset and length
-            (10, 3, 4, ["3-6"], True),
-            (10, 3, 4, ["3-6"], False),
-            # Small download with length past blob size
-            (10, 5, 10, ["5-9"], True),
-            (10, 5, 10, ["5-14"], False),
-            # Small download of portion of large blob
-            (32 * MB, 10, 10, ["10-19"], True),
-            (32 * MB, 10, 10, ["10-19"], False),
-            # Download just below partitioned threshold
-            (
-                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1,
-                None,
-                None,
-                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 2}"],
-                True,
-            ),
-            (
-                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1,
-                None,
-                None,
-                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}"],
-                False,
-            ),
-            # Download at partitioned threshold
-            (
-                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD,
-                None,
-                None,
-                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}"],
-                True,
-            ),
-            (
-                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD,
-                None,
-                None,
-                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}"],
-                False,
-            ),
-            # Download just above partitioned threshold
-            (
-                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD + 1,
-                None,
-                None,
-                [
-                    f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}",
-                    f"{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD}-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD}",
-                ],
-                True,
-            ),
-            (
+            (95, 0.19),
+            (50, 0.10),
+            (99, 0.20),
+        ],
+    )
+    def test_get_deadline(self, percentile, expected_seconds_per_byte):
+        hedger = RequestHedger(percentile=percentile)
+        self.record_samples(hedger, 20)
+        assert hedger.get_deadline(100) == pytest.approx(
+            expected_seconds_per_byte * 100
+        )
+
+    def test_get_deadline_has_minimum(self):
+        hedger = RequestHedger()
+        self.record_samples(hedger, 20, seconds_per_byte=0)
+        assert hedger.get_deadline(100) == 0.05
+
+    def test_try_reserve_hedge_caps_hedged_bytes(self):
+        hedger = RequestHedger(max_hedged_bytes_ratio=0.1)
+        assert not hedger.try_reserve_hedge(1)
+        hedger.record_download(100, 1)
+        assert hedger.try_reserve_hedge(6)
+        assert hedger.try_reserve_hedge(4)
+        assert not hedger.try_reserve_hedge(1)
+        assert hedger.stats == HedgeStats(
+            hedged_requests=2, hedges_won=0, hedged_bytes=10
+        )
+
+    def test_record_hedge_won(self):
+        hedger = RequestHedger()
+        hedger.record_download(100, 1)
+        hedger.try_reserve_hedge(10)
+        hedger.record_hedge_won()
+        assert hedger.stats == HedgeStats(
+            hedged_requests=1, hedges_won=1, hedged_bytes=10
+        )
+
+    def test_reset(self):
+        hedger = RequestHedger()
+        self.record_samples(hedger, 20)
+        hedger.try_reserve_hedge(10)
+        hedger.reset()
+        assert hedger.get_deadline(100) is None
+        assert hedger.stats == HedgeStats(0, 0, 0)
+
+    @pytest.mark.parametrize("percentile", [0, 100, -1, 101])
+    def test_raises_for_invalid_percentile(self, percentile):
+        with pytest.raises(ValueError, match="Percentile must be between 0 and 100"):
+            RequestHedger(percentile=percentile)
+
+    def test_raises_for_negative_max_hedged_bytes_ratio(self):
+        with pytest.raises(ValueError, match="must not be negative"):
+            RequestHedger(max_hedged_bytes_ratio=-0.1)
+
+
+def http_error_with_status(status_code, headers=None):
+    mock_http_response = mock.Mock(HttpResponse)
+    mock_http_response.reason = "message"
+    mock_http_response.status_code = status_code
+    mock_http_response.headers = headers or {}
+    mock_http_response.content_type = "application/xml"
+    mock_http_response.text.return_value = ""
+    return azure.core.exceptions.HttpResponseError(response=mock_http_response)
+
+
+class TestRetryPolicy:
+    ACCOUNT = "myaccount.blob.core.windows.net"
+
+    @pytest.mark.parametrize(
+        "error,expected_retried",
+        [
+            (azure.core.exceptions.IncompleteReadError(), True),
+            (azure.core.exceptions.DecodeError(), True),
+            (azure.core.exceptions.HttpResponseError(), True),
+            (azure.core.exceptions.ServiceRequestError("error"), True),
+            (azure.core.exceptions.ServiceResponseError("error"), True),
+            (http_error_with_status(500), True),
+            (http_error_with_status(503), True),
+            (http_error_with_status(403), False),
+            (http_error_with_status(404), False),
+            (http_error_with_status(412), False),
+            (azure.core.exceptions.AzureError("error"), False),
+            (NonRetryableException(), False),
+        ],
+    )
+    def test_classifies_errors(self, error, expected_retried):
+        policy = RetryPolicy()
+        delay = policy.get_retry_delay(self.ACCOUNT, error, 0)
+        assert (delay is not None) == expected_retried
+
+    def test_transient_errors_limited_to_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        error = azure.core.exceptions.IncompleteReadError()
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is not None
+        assert policy.get_retry_delay(self.ACCOUNT, error, 1) is not None
+        assert policy.get_retry_delay(self.ACCOUNT, error, 2) is None
+
+    def test_throttling_errors_limited_to_max_throttled_attempts(self):
+        policy = RetryPolicy(max_attempts=1, max_throttled_attempts=3)
+        error = http_error_with_status(503)
+        assert policy.get_retry_delay(self.ACCOUNT, error, 1) is not None
+        assert policy.get_retry_delay(self.ACCOUNT, error, 2) is None
+
+    @pytest.mark.parametrize(
+        "headers,expected_min_delay",
+        [
+            ({"Retry-After": "10"}, 10),
+            ({"retry-after-ms": "2500"}, 2.5),
+            ({"x-ms-retry-after-ms": "500"}, 0.5),
+        ],
+    )
+    def test_honors_retry_after(self, headers, expected_min_delay):
+        policy = RetryPolicy()
+        error = http_error_with_status(503, headers)
+        for _ in range(20):
+            delay = policy.get_retry_delay(self.ACCOUNT, error, 0)
+            assert expected_min_delay <= delay <= expected_min_delay * 1.5 + 0.5
+
+    def test_honors_retry_after_http_date(self):
+        policy = RetryPolicy()
+        retry_after = email.utils.format_datetime(
+            datetime.datetime.now(datetime.timezone.utc)
+            + datetime.timedelta(seconds=30),
+            usegmt=True,
+        )
+        error = http_error_with_status(503, {"Retry-After": retry_after})
+        assert 28 <= policy.get_retry_delay(self.ACCOUNT, error, 0) <= 46
+
+    def test_throttling_backoff_without_retry_after(self):
+        policy = RetryPolicy()
+        error = http_error_with_status(503)
+        for attempt in range(5):
+            delay = policy.get_retry_delay(self.ACCOUNT, error, attempt)
+            assert 1 <= delay <= min(4 * 2**attempt, 60)
+
+    def test_transient_backoff(self):
+        policy = RetryPolicy()
+        error = azure.core.exceptions.IncompleteReadError()
+        assert 0 <= policy.get_retry_delay(self.ACCOUNT, error, 1) <= 2
+
+    def test_retry_budget(self):
+        policy = RetryPolicy(retry_budget=2, retry_budget_refill_ratio=0.5)
+        error = http_error_with_status(503)
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is not None
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is not None
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is None
+        # Budgets are kept per account.
+        assert policy.get_retry_delay("other-account", error, 0) is not None
+        policy.record_success(self.ACCOUNT)
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is None
+        policy.record_success(self.ACCOUNT)
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is not None
+
+    def test_record_success_does_not_exceed_budget(self):
+        policy = RetryPolicy(retry_budget=1, retry_budget_refill_ratio=1)
+        error = http_error_with_status(503)
+        policy.get_retry_delay(self.ACCOUNT, error, 0)
+        for _ in range(5):
+            policy.record_success(self.ACCOUNT)
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is not None
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is None
+
+    def test_get_stats(self):
+        policy = RetryPolicy(retry_budget=2)
+        assert policy.get_stats(self.ACCOUNT) == RetryStats(0, 0, 0)
+        policy.get_retry_delay(self.ACCOUNT, azure.core.exceptions.DecodeError(), 0)
+        policy.get_retry_delay(self.ACCOUNT, http_error_with_status(503), 0)
+        policy.get_retry_delay(self.ACCOUNT, http_error_with_status(503), 0)
+        policy.get_retry_delay(self.ACCOUNT, http_error_with_status(404), 0)
+        assert policy.get_stats(self.ACCOUNT) == RetryStats(
+            retries=2, throttled_retries=1, retries_over_budget=1
+        )
+        assert policy.get_stats("other-account") == RetryStats(0, 0, 0)
+
+    def test_reset(self):
+        policy = RetryPolicy(retry_budget=1)
+        error = http_error_with_status(503)
+        policy.get_retry_delay(self.ACCOUNT, error, 0)
+        policy.reset()
+        assert policy.get_stats(self.ACCOUNT) == RetryStats(0, 0, 0)
+        assert policy.get_retry_delay(self.ACCOUNT, error, 0) is not None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_attempts": 0},
+            {"max_throttled_attempts": 0},
+        ],
+    )
+    def test_raises_for_invalid_max_attempts(self, kwargs):
+        with pytest.raises(ValueError, match="Max attempts must be at least 1"):
+            RetryPolicy(**kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"retry_budget": -1},
+            {"retry_budget_refill_ratio": -0.1},
+        ],
+    )
+    def test_raises_for_negative_retry_budget(self, kwargs):
+        with pytest.raises(ValueError, match="must not be negative"):
+            RetryPolicy(**kwargs)
+
+
+class TestConcurrencyController:
+    ACCOUNT = "myaccount.blob.core.windows.net"
+
+    @pytest.fixture(autouse=True)
+    def monotonic_patch(self):
+        with mock.patch("time.monotonic", return_value=0) as patched_monotonic:
+            yield patched_monotonic
+
+    def complete_round(self, controller, monotonic_patch, elapsed_time, num_bytes=MB):
+        limit = controller.get_limit(self.ACCOUNT)
+        monotonic_patch.return_value += elapsed_time
+        for _ in range(limit):
+            controller.record_transfer(self.ACCOUNT, num_bytes, elapsed_time)
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(os, "process_cpu_count", lambda: 4, raising=False)
+        monkeypatch.setattr(
+            azstoragetorch._client, "_get_cgroup_cpu_quota", lambda: None
+        )
+        controller = ConcurrencyController()
+        assert controller.initial_limit == 8
+        assert controller.max_limit == 32
+        assert controller.get_limit(self.ACCOUNT) == 8
+
+    def test_max_limit_defaults_from_initial_limit(self):
+        controller = ConcurrencyController(initial_limit=2)
+        assert controller.max_limit == 8
+
+    def test_increases_limit_while_throughput_increases(self, monotonic_patch):
+        controller = ConcurrencyController(initial_limit=2, max_limit=10)
+        # The first round has no previous round to compare to so it increases the limit.
+        self.complete_round(controller, monotonic_patch, 1)
+        assert controller.get_limit(self.ACCOUNT) == 3
+        # Each round has one more transfer in the same amount of time.
+        self.complete_round(controller, monotonic_patch, 1)
+        assert controller.get_limit(self.ACCOUNT) == 4
+
+    def test_holds_limit_when_throughput_does_not_increase(self, monotonic_patch):
+        controller = ConcurrencyController(initial_limit=2, max_limit=10)
+        self.complete_round(controller, monotonic_patch, 1)
+        assert controller.get_limit(self.ACCOUNT) == 3
+        # The round has more transfers but takes proportionally longer.
+        self.complete_round(controller, monotonic_patch, 1.5)
+        assert controller.get_limit(self.ACCOUNT) == 3
+
+    def test_periodically_probes_for_higher_limit(self, monotonic_patch):
+        controller = ConcurrencyController(initial_limit=2, max_limit=10)
+        self.complete_round(controller, monotonic_patch, 1)
+        for _ in range(8):
+            self.complete_round(controller, monotonic_patch, 1.5)
+        assert controller.get_limit(self.ACCOUNT) == 3
+        self.complete_round(controller, monotonic_patch, 1.5)
+        assert controller.get_limit(self.ACCOUNT) == 4
+
+    def test_does_not_exceed_max_limit(self, monotonic_patch):
+        controller = ConcurrencyController(initial_limit=2, max_limit=3)
+        for i in range(5):
+            self.complete_round(controller, monotonic_patch, 1 / (i + 1))
+        assert controller.get_limit(self.ACCOUNT) == 3
+
+    def test_record_throttled_decreases_limit(self):
+        controller = ConcurrencyController(initial_limit=8)
+        controller.record_throttled(self.ACCOUNT)
+        assert controller.get_limit(self.ACCOUNT) == 4
+
+    def test_decreases_limit_at_most_once_per_round(self, monotonic_patch):
+        controller = ConcurrencyController(initial_limit=8)
+        controller.record_throttled(self.ACCOUNT)
+        controller.record_throttled(self.ACCOUNT)
+        assert controller.get_limit(self.ACCOUNT) == 4
+        self.complete_round(controller, monotonic_patch, 1)
+        controller.record_throttled(self.ACCOUNT)
+        assert controller.get_limit(self.ACCOUNT) == 2
+
+    def test_does_not_decrease_below_min_limit(self):
+        controller = ConcurrencyController(initial_limit=3, min_limit=2)
+        controller.record_throttled(self.ACCOUNT)
+        assert controller.get_limit(self.ACCOUNT) == 2
+
+    def test_latency_spike_decreases_limit(self):
+        controller = ConcurrencyController(initial_limit=8, max_limit=8)
+        controller.record_transfer(self.ACCOUNT, MB, 1)
+        controller.record_transfer(self.ACCOUNT, MB, 1)
+        assert controller.get_limit(self.ACCOUNT) == 8
+        controller.record_transfer(self.ACCOUNT, MB, 10)
+        assert controller.get_limit(self.ACCOUNT) == 4
+
+    def test_small_transfers_are_not_latency_spikes(self):
+        controller = ConcurrencyController(initial_limit=8, max_limit=8)
+        controller.record_transfer(self.ACCOUNT, 10, 0.01)
+        controller.record_transfer(self.ACCOUNT, 10, 1)
+        assert controller.get_limit(self.ACCOUNT) == 8
+
+    def test_limits_are_per_account(self):
+        controller = ConcurrencyController(initial_limit=8)
+        controller.record_throttled(self.ACCOUNT)
+        assert controller.get_limit(self.ACCOUNT) == 4
+        assert controller.get_limit("otheraccount.blob.core.windows.net") == 8
+
+    def test_acquire_blocks_at_limit(self):
+        controller = ConcurrencyController(initial_limit=1)
+        controller.acquire(self.ACCOUNT)
+        acquired = threading.Event()
+
+        def acquire():
+            controller.acquire(self.ACCOUNT)
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.1)
+        controller.release(self.ACCOUNT)
+        assert acquired.wait(10)
+        thread.join()
+
+    def test_reset(self):
+        controller = ConcurrencyController(initial_limit=8)
+        controller.record_throttled(self.ACCOUNT)
+        controller.reset()
+        assert controller.get_limit(self.ACCOUNT) == 8
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_message",
+        [
+            ({"min_limit": 0}, "Min limit must be at least 1"),
+            ({"initial_limit": 0}, "Initial limit must be at least the min limit"),
+            ({"max_limit": 1, "min_limit": 2}, "Max limit must be at least"),
+        ],
+    )
+    def test_raises_for_invalid_limits(self, kwargs, expected_message):
+        with pytest.raises(ValueError, match=expected_message):
+            ConcurrencyController(**kwargs)
+
+
+class TestBandwidthLimiter:
+    def acquire_in_thread(self, limiter, num_bytes, priority, completed):
+        def acquire():
+            limiter.acquire(num_bytes, priority)
+            completed.append(priority)
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        return thread
+
+    def test_does_not_limit_by_default(self):
+        limiter = BandwidthLimiter()
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire(100 * MB, "interactive")
+            limiter.acquire(100 * MB, "bulk")
+        assert time.monotonic() - start < 1
+
+    def test_paces_transfers(self):
+        limiter = BandwidthLimiter(max_bytes_per_second=10 * MB)
+        start = time.monotonic()
+        # The bucket holds 0.1 seconds of bytes and may go below zero, so the first
+        # two acquires do not wait and each one after waits for 0.1 seconds of bytes.
+        for _ in range(4):
+            limiter.acquire(MB, "interactive")
+        assert time.monotonic() - start >= 0.15
+
+    def test_bulk_limit_does_not_apply_to_interactive_transfers(self):
+        limiter = BandwidthLimiter(max_bulk_bytes_per_second=MB)
+        start = time.monotonic()
+        for _ in range(10):
+            limiter.acquire(MB, "interactive")
+        assert time.monotonic() - start < 0.1
+        limiter.acquire(MB, "bulk")
+        limiter.acquire(MB, "bulk")
+        assert time.monotonic() - start >= 0.5
+
+    def test_interactive_transfers_acquire_before_bulk_transfers(self):
+        limiter = BandwidthLimiter(max_bytes_per_second=10 * MB)
+        limiter.acquire(2 * MB, "bulk")
+        completed = []
+        interactive_thread = self.acquire_in_thread(
+            limiter, MB, "interactive", completed
+        )
+        # Give the interactive transfer time to start waiting.
+        time.sleep(0.02)
+        bulk_thread = self.acquire_in_thread(limiter, MB, "bulk", completed)
+        interactive_thread.join()
+        bulk_thread.join()
+        assert completed == ["interactive", "bulk"]
+
+    def test_reads_limits_from_environment(self, monkeypatch):
+        monkeypatch.setenv("AZSTORAGETORCH_MAX_BANDWIDTH", str(10 * MB))
+        limiter = BandwidthLimiter()
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire(MB, "interactive")
+        assert time.monotonic() - start >= 0.15
+
+    def test_reset_reloads_limits_from_environment(self, monkeypatch):
+        limiter = BandwidthLimiter()
+        limiter.acquire(MB, "bulk")
+        monkeypatch.setenv("AZSTORAGETORCH_MAX_UPLOAD_BANDWIDTH", str(10 * MB))
+        limiter.reset()
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire(MB, "bulk")
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.parametrize(
+        "env_var",
+        ["AZSTORAGETORCH_MAX_BANDWIDTH", "AZSTORAGETORCH_MAX_UPLOAD_BANDWIDTH"],
+    )
+    @pytest.mark.parametrize("value", ["fast", "0", "-1"])
+    def test_raises_for_invalid_limit_in_environment(self, monkeypatch, env_var, value):
+        monkeypatch.setenv(env_var, value)
+        with pytest.raises(ValueError, match=env_var):
+            BandwidthLimiter().acquire(1, "interactive")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_bytes_per_second": 0},
+            {"max_bulk_bytes_per_second": -1},
+        ],
+    )
+    def test_raises_for_invalid_limits(self, kwargs):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            BandwidthLimiter(**kwargs)
+
+
+class _BlobRequestHandler(http.server.BaseHTTPRequestHandler):
+    # Serves ranged GET requests for the server's blob content. Each request pops the next
+    # action from the server, which can override how the request is responded to.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.received_requests.append(
+            (self.path, dict(self.headers), self.client_address)
+        )
+        action = self.server.actions.pop(0) if self.server.actions else {}
+        client_request_id = action.get(
+            "client_request_id", self.headers.get("x-ms-client-request-id")
+        )
+        if "status" in action:
+            body = (
+                b'<?xml version="1.0" encoding="utf-8"?><Error>'
+                b"<Code>%s</Code><Message>Error</Message></Error>"
+                % action["error_code"].encode()
+            )
+            self.send_response(action["status"])
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("x-ms-error-code", action["error_code"])
+            self.send_header("x-ms-client-request-id", client_request_id)
+            for name, value in action.get("headers", {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        content = self.server.blob_content
+        start, end = self.headers["x-ms-range"].split("=")[1].split("-")
+        body = content[int(start) : int(end) + 1]
+        self.send_response(206)
+        self.send_header(
+            "Content-Range",
+            f"bytes {start}-{int(start) + len(body) - 1}/{len(content)}",
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"etag"')
+        self.send_header("x-ms-client-request-id", client_request_id)
+        self.send_header("x-ms-request-id", "service-request-id")
+        if "content_encoding" in action:
+            self.send_header("Content-Encoding", action["content_encoding"])
+        self.end_headers()
+        if "truncate_to" in action:
+            self.wfile.write(body[: action["truncate_to"]])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestFastDownloadTransport:
+    @pytest.fixture
+    def blob_content(self):
+        return random_bytes(256 * 1024)
+
+    @pytest.fixture
+    def blob_server(self, blob_content):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _BlobRequestHandler)
+        server.blob_content = blob_content
+        server.received_requests = []
+        server.actions = []
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def server_blob_url(self, blob_server):
+        # Hosts that are IP addresses use path-style URLs, which include the account name.
+        return f"http://127.0.0.1:{blob_server.server_address[1]}/myaccount/mycontainer/myblob"
+
+    @pytest.fixture
+    def fast_download_transport(self):
+        return FastDownloadTransport(enabled=True)
+
+    @pytest.fixture
+    def client(self, server_blob_url, fast_download_transport):
+        return self.get_client(server_blob_url, fast_download_transport)
+
+    def get_client(self, url, fast_download_transport, credential=False):
+        return AzStorageTorchBlobClientFactory(
+            credential=credential
+        ).get_blob_client_from_url(url, fast_download_transport=fast_download_transport)
+
+    def get_user_agents(self, blob_server):
+        return [
+            headers["User-Agent"] for _, headers, _ in blob_server.received_requests
+        ]
+
+    def is_fast_path_user_agent(self, user_agent):
+        return user_agent == f"azstoragetorch/{__version__}"
+
+    def test_download(self, client, blob_server, blob_content):
+        assert client.download() == blob_content
+        assert blob_server.received_requests
+        for path, headers, _ in blob_server.received_requests:
+            assert path == "/myaccount/mycontainer/myblob"
+            assert self.is_fast_path_user_agent(headers["User-Agent"])
+            assert headers["x-ms-version"] == client._sdk_blob_client.api_version
+            assert "x-ms-date" in headers
+            assert "Authorization" not in headers
+
+    def test_download_range(self, client, blob_server, blob_content):
+        assert client.download(offset=10, length=100) == blob_content[10:110]
+        _, headers, _ = blob_server.received_requests[0]
+        assert headers["x-ms-range"] == "bytes=10-109"
+
+    def test_download_into(self, client, blob_content):
+        buffer = bytearray(len(blob_content))
+        assert client.download_into(buffer) == len(blob_content)
+        assert buffer == blob_content
+
+    def test_subsequent_requests_are_conditioned_on_etag(self, client, blob_server):
+        client.download(length=10)
+        client.download(offset=10, length=10)
+        _, headers, _ = blob_server.received_requests[-1]
+        assert headers["If-Match"] == '"etag"'
+
+    def test_reuses_pooled_connections(self, client, blob_server):
+        for i in range(5):
+            client.download(offset=i, length=1)
+        client_addresses = {address for _, _, address in blob_server.received_requests}
+        assert len(client_addresses) == 1
+
+    def test_sas_token_in_url(
+        self, server_blob_url, fast_download_transport, blob_server
+    ):
+        client = self.get_client(
+            f"{server_blob_url}?{SAS_TOKEN}", fast_download_transport
+        )
+        client.download(length=1)
+        path, _, _ = blob_server.received_requests[0]
+        assert urllib.parse.parse_qs(urllib.parse.urlparse(path).query) == (
+            urllib.parse.parse_qs(SAS_TOKEN)
+        )
+
+    def test_version_id_in_url(
+        self, server_blob_url, fast_download_transport, blob_server
+    ):
+        client = self.get_client(
+            f"{server_blob_url}?versionid={VERSION_ID}&{SAS_TOKEN}",
+            fast_download_transport,
+        )
+        client.download(length=1)
+        path, headers, _ = blob_server.received_requests[0]
+        assert self.is_fast_path_user_agent(headers["User-Agent"])
+        assert urllib.parse.parse_qs(urllib.parse.urlparse(path).query) == {
+            "versionid": [VERSION_ID],
+            **urllib.parse.parse_qs(SAS_TOKEN),
+        }
+
+    def test_sas_credential(
+        self, server_blob_url, fast_download_transport, blob_server
+    ):
+        client = self.get_client(
+            server_blob_url,
+            fast_download_transport,
+            credential=AzureSasCredential(SAS_TOKEN),
+        )
+        client.download(length=1)
+        path, headers, _ = blob_server.received_requests[0]
+        assert self.is_fast_path_user_agent(headers["User-Agent"])
+        assert urllib.parse.parse_qs(urllib.parse.urlparse(path).query) == (
+            urllib.parse.parse_qs(SAS_TOKEN)
+        )
+
+    def test_raises_storage_errors(self, client, blob_server):
+        blob_server.actions = [{"status": 404, "error_code": "BlobNotFound"}]
+        with pytest.raises(azure.core.exceptions.ResourceNotFoundError) as exc_info:
+            client.download()
+        assert exc_info.value.error_code == StorageErrorCode.BLOB_NOT_FOUND
+        assert len(blob_server.received_requests) == 1
+
+    def test_retries_throttled_requests(self, client, blob_server, blob_content):
+        blob_server.actions = [
+            {
+                "status": 503,
+                "error_code": "ServerBusy",
+                "headers": {"Retry-After": "1"},
+            }
+        ]
+        assert client.download() == blob_content
+        assert client.retry_stats.throttled_retries == 1
+        assert all(
+            self.is_fast_path_user_agent(user_agent)
+            for user_agent in self.get_user_agents(blob_server)
+        )
+
+    def test_resumes_interrupted_download(self, client, blob_server, blob_content):
+        blob_server.actions = [{"truncate_to": 1000}]
+        assert client.download() == blob_content
+        ranges = [
+            headers["x-ms-range"] for _, headers, _ in blob_server.received_requests
+        ]
+        assert ranges[0].startswith("bytes=0-")
+        assert ranges[1].startswith("bytes=1000-")
+
+    def test_raises_for_client_request_id_mismatch(self, client, blob_server):
+        blob_server.actions = [{"client_request_id": "other-id"}]
+        with pytest.raises(ClientRequestIdMismatchError):
+            client.download()
+
+    def test_sends_encoded_content_through_pipeline(
+        self, client, blob_server, blob_content
+    ):
+        blob_server.actions = [{"content_encoding": "identity"}]
+        assert client.download(length=10) == blob_content[:10]
+        user_agents = self.get_user_agents(blob_server)
+        assert len(user_agents) == 2
+        assert self.is_fast_path_user_agent(user_agents[0])
+        assert not self.is_fast_path_user_agent(user_agents[1])
+
+    def test_disabled(self, server_blob_url, blob_server, blob_content):
+        client = self.get_client(server_blob_url, FastDownloadTransport(enabled=False))
+        assert client.download() == blob_content
+        assert not any(
+            self.is_fast_path_user_agent(user_agent)
+            for user_agent in self.get_user_agents(blob_server)
+        )
+
+    def test_disabled_by_default(self):
+        assert not FastDownloadTransport().enabled
+
+    @pytest.mark.parametrize(
+        "env_value,expected_enabled",
+        [
+            ("1", True),
+            ("true", True),
+            ("Yes", True),
+            ("0", False),
+            ("false", False),
+            ("", False),
+        ],
+    )
+    def test_enabled_from_env(self, monkeypatch, env_value, expected_enabled):
+        monkeypatch.setenv("AZSTORAGETORCH_FAST_DOWNLOADS", env_value)
+        assert FastDownloadTransport().enabled is expected_enabled
+
+    def test_raises_for_invalid_env_value(self, monkeypatch):
+        monkeypatch.setenv("AZSTORAGETORCH_FAST_DOWNLOADS", "fast")
+        with pytest.raises(ValueError, match="AZSTORAGETORCH_FAST_DOWNLOADS"):
+            _ = FastDownloadTransport().enabled
+
+    def test_reset_reloads_enabled_from_env(self, monkeypatch):
+        fast_download_transport = FastDownloadTransport()
+        assert not fast_download_transport.enabled
+        monkeypatch.setenv("AZSTORAGETORCH_FAST_DOWNLOADS", "1")
+        fast_download_transport.reset()
+        assert fast_download_transport.enabled
+
+    @pytest.fixture
+    def mock_token_credential(self):
+        credential = mock.Mock(TokenCredential)
+        credential.get_token.return_value = AccessToken(
+            "token", int(time.time()) + 3600
+        )
+        return credential
+
+    @pytest.fixture
+    def mock_connection_pool(self, blob_content):
+        # Bearer tokens are only sent over HTTPS, so responses are returned from a mocked
+        # connection pool instead of the local server.
+        def urlopen(method, url, headers, **kwargs):
+            return urllib3.HTTPResponse(
+                body=io.BytesIO(blob_content),
+                headers={
+                    "Content-Range": f"bytes 0-{len(blob_content) - 1}/{len(blob_content)}",
+                    "Content-Length": str(len(blob_content)),
+                    "x-ms-client-request-id": headers["x-ms-client-request-id"],
+                },
+                status=206,
+                preload_content=False,
+            )
+
+        connection_pool = mock.Mock()
+        connection_pool.urlopen.side_effect = urlopen
+        with mock.patch.object(
+            requests.adapters.HTTPAdapter,
+            "get_connection_with_tls_context",
+            return_value=connection_pool,
+        ):
+            yield connection_pool
+
+    def test_token_credential(
+        self,
+        blob_url,
+        fast_download_transport,
+        mock_token_credential,
+        mock_connection_pool,
+        blob_content,
+    ):
+        client = self.get_client(
+            blob_url, fast_download_transport, credential=mock_token_credential
+        )
+        assert client.download() == blob_content
+        headers = mock_connection_pool.urlopen.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer token"
+        mock_token_credential.get_token.assert_called_once_with(
+            "https://storage.azure.com/.default"
+        )
+
+    def test_caches_token_across_clients(
+        self,
+        blob_url,
+        fast_download_transport,
+        mock_token_credential,
+        mock_connection_pool,
+    ):
+        for _ in range(3):
+            self.get_client(
+                blob_url, fast_download_transport, credential=mock_token_credential
+            ).download()
+        assert mock_token_credential.get_token.call_count == 1
+
+    def test_refreshes_token_close_to_expiry(
+        self,
+        blob_url,
+        fast_download_transport,
+        mock_token_credential,
+        mock_connection_pool,
+    ):
+        mock_token_credential.get_token.return_value = AccessToken(
+            "token", int(time.time()) + 60
+        )
+        for _ in range(2):
+            self.get_client(
+                blob_url, fast_download_transport, credential=mock_token_credential
+            ).download()
+        assert mock_token_credential.get_token.call_count == 2
+
+
+class TestIOScheduler:
+    def test_submit(self):
+        scheduler = IOScheduler()
+        assert scheduler.submit(lambda x: x + 1, 1).result() == 2
+        scheduler.shutdown()
+
+    def test_lazily_creates_executor(self):
+        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+            scheduler = IOScheduler(5)
+            mock_executor.assert_not_called()
+            scheduler.submit(lambda: None)
+            scheduler.submit(lambda: None)
+            mock_executor.assert_called_once_with(5)
+
+    def test_bounds_submitted_and_in_progress_futures(self):
+        max_in_flight_requests = 5
+        spy_submit_executor = SpySubmitExcecutor(max_in_flight_requests)
+        scheduler = IOScheduler(max_in_flight_requests, spy_submit_executor)
+        in_flight_counts = []
+
+        def task():
+            in_flight_counts.append(spy_submit_executor.counter.decrement())
+
+        def submit_tasks():
+            return [scheduler.submit(task) for _ in range(500)]
+
+        # Submit from multiple threads to simulate multiple clients sharing the scheduler.
+        with concurrent.futures.ThreadPoolExecutor(4) as submitters:
+            submitted = list(submitters.map(lambda _: submit_tasks(), range(4)))
+        for futures in submitted:
+            for future in futures:
+                future.result()
+        scheduler.shutdown()
+        assert spy_submit_executor.counter.value == 0
+        assert max(in_flight_counts) <= max_in_flight_requests
+
+    def test_submit_bounds_in_flight_requests_per_account(self):
+        controller = ConcurrencyController(initial_limit=2, max_limit=2)
+        scheduler = IOScheduler(concurrency_controller=controller)
+        assert scheduler.max_in_flight_requests == 2
+        counter = AtomicCounter()
+        in_flight_counts = []
+
+        def task():
+            in_flight_counts.append(counter.increment())
+            time.sleep(0.001)
+            counter.decrement()
+
+        futures = [scheduler.submit(task, account="account") for _ in range(50)]
+        for future in futures:
+            future.result()
+        scheduler.shutdown()
+        assert max(in_flight_counts) <= 2
+
+    def test_get_concurrency(self):
+        controller = ConcurrencyController(initial_limit=4, max_limit=8)
+        scheduler = IOScheduler(concurrency_controller=controller)
+        assert scheduler.get_concurrency("account") == 4
+        scheduler.record_throttled("account")
+        assert scheduler.get_concurrency("account") == 2
+        assert scheduler.get_concurrency() == 8
+
+    def test_get_concurrency_without_controller(self):
+        scheduler = IOScheduler(5)
+        scheduler.record_throttled("account")
+        assert scheduler.get_concurrency("account") == 5
+
+    def test_releases_in_flight_slot_when_submit_fails(self):
+        mock_executor = mock.Mock(concurrent.futures.Executor)
+        mock_executor.submit.side_effect = RuntimeError("cannot schedule")
+        scheduler = IOScheduler(1, mock_executor)
+        for _ in range(3):
+            with pytest.raises(RuntimeError, match="cannot schedule"):
+                scheduler.submit(lambda: None)
+
+    def test_releases_in_flight_slot_when_task_fails(self):
+        scheduler = IOScheduler(1)
+
+        def fail():
+            raise NonRetryableException()
+
+        for _ in range(3):
+            with pytest.raises(NonRetryableException):
+                scheduler.submit(fail).result()
+        scheduler.shutdown()
+
+    def test_shutdown(self):
+        mock_executor = mock.Mock(concurrent.futures.Executor)
+        scheduler = IOScheduler(executor=mock_executor)
+        scheduler.shutdown()
+        mock_executor.shutdown.assert_called_once_with()
+
+    def test_reset(self):
+        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+            scheduler = IOScheduler()
+            scheduler.submit(lambda: None)
+            scheduler.reset()
+            scheduler.submit(lambda: None)
+            assert mock_executor.call_count == 2
+            mock_executor.return_value.shutdown.assert_not_called()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork()")
+    def test_process_wide_scheduler_usable_in_forked_child_process(self):
+        assert IO_SCHEDULER.submit(lambda: 1).result() == 1
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if IO_SCHEDULER.submit(lambda: 1).result(timeout=10) == 1 else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+
+class TestAzStorageTorchBlobClient:
+    def assert_expected_download_calls(
+        self,
+        mock_generated_sdk_storage_client,
+        expected_ranges,
+        expected_etag,
+        known_blob_size=False,
+    ):
+        expected_download_calls = []
+        for i, expected_range in enumerate(expected_ranges):
+            download_kwargs = {
+                "range": f"bytes={expected_range}",
+                "retry_total": 0,
+            }
+            if i != 0 or known_blob_size:
+                download_kwargs["modified_access_conditions"] = (
+                    ModifiedAccessConditions(if_match=expected_etag)
+                )
+            expected_download_calls.append(mock.call(**download_kwargs))
+        assert (
+            mock_generated_sdk_storage_client.blob.download.call_args_list
+            == expected_download_calls
+        )
+
+    def assert_stage_block_ids(self, stage_block_futures, expected_block_ids):
+        actual_block_ids = [future.result() for future in stage_block_futures]
+        assert actual_block_ids == expected_block_ids
+
+    @pytest.mark.parametrize(
+        "cpu_count,process_cpu_count,expected_initial_concurrency,expected_max_workers",
+        [
+            (1, PROCESS_CPU_COUNT_UNAVAILABLE, 5, 20),
+            (4, PROCESS_CPU_COUNT_UNAVAILABLE, 8, 32),
+            (16, PROCESS_CPU_COUNT_UNAVAILABLE, 20, 64),
+            # cpu_count reaches concurrency and max_workers ceiling
+            (64, PROCESS_CPU_COUNT_UNAVAILABLE, 32, 64),
+            # concurrency and max_workers are still set even if cpu_count is None or 0
+            (None, PROCESS_CPU_COUNT_UNAVAILABLE, 5, 20),
+            (0, PROCESS_CPU_COUNT_UNAVAILABLE, 5, 20),
+            # proccess_cpu_count overrides cpu_count
+            (64, 1, 5, 20),
+            # process_cpu_count reaches concurrency and max_workers ceiling
+            (1, 64, 32, 64),
+            # concurrency and max_workers are set when both cpu_count and process_cpu_count are None or 0
+            (None, None, 5, 20),
+            (0, 0, 5, 20),
+        ],
+    )
+    def test_default_worker_count(
+        self,
+        mock_sdk_blob_client,
+        monkeypatch,
+        cpu_count,
+        process_cpu_count,
+        expected_initial_concurrency,
+        expected_max_workers,
+    ):
+        if process_cpu_count is PROCESS_CPU_COUNT_UNAVAILABLE:
+            monkeypatch.delattr(os, "process_cpu_count", raising=False)
+        else:
+            monkeypatch.setattr(
+                os, "process_cpu_count", lambda: process_cpu_count, raising=False
+            )
+        monkeypatch.setattr(os, "cpu_count", lambda: cpu_count)
+        monkeypatch.setattr(
+            azstoragetorch._client, "_get_cgroup_cpu_quota", lambda: None
+        )
+        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+            client = AzStorageTorchBlobClient(mock_sdk_blob_client)
+            # Executor instantiation is lazy. Stage some content to instantiate it
+            # and determine what the max_workers value is.
+            client.stage_blocks(b"content")
+            mock_executor.assert_called_once_with(expected_max_workers)
+        assert (
+            IO_SCHEDULER.get_concurrency("myaccount.blob.core.windows.net")
+            == expected_initial_concurrency
+        )
+
+    def test_default_concurrency_respects_cgroup_cpu_quota(
+        self, mock_sdk_blob_client, monkeypatch
+    ):
+        monkeypatch.setattr(os, "cpu_count", lambda: 64)
+        monkeypatch.setattr(os, "process_cpu_count", lambda: 64, raising=False)
+        monkeypatch.setattr(
+            azstoragetorch._client, "_get_cgroup_cpu_quota", lambda: 3.5
+        )
+        assert IO_SCHEDULER.get_concurrency("myaccount.blob.core.windows.net") == 8
+
+    @pytest.mark.parametrize(
+        "sdk_blob_client_url, expected_url",
+        [
+            (
+                "https://account.blob.core.windows.net/container/blob",
+                "https://account.blob.core.windows.net/container/blob",
+            ),
+            # Cases to make sure query string is not included in returned URL.
+            (
+                f"https://account.blob.core.windows.net/container/blob?{SAS_TOKEN}",
+                "https://account.blob.core.windows.net/container/blob",
+            ),
+            (
+                f"https://account.blob.core.windows.net/container/blob?snapshot={SNAPSHOT}&versionid={VERSION_ID}&{SAS_TOKEN}",
+                "https://account.blob.core.windows.net/container/blob",
+            ),
+            (
+                "https://account.blob.core.windows.net/container/blob?unknown1=val1&unknown2=val2",
+                "https://account.blob.core.windows.net/container/blob",
+            ),
+        ],
+    )
+    def test_url(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        sdk_blob_client_url,
+        expected_url,
+    ):
+        mock_sdk_blob_client.url = sdk_blob_client_url
+        assert azstoragetorch_blob_client.url == expected_url
+
+    def test_blob_name(self, azstoragetorch_blob_client, mock_sdk_blob_client):
+        mock_sdk_blob_client.blob_name = "blob-name"
+        assert azstoragetorch_blob_client.blob_name == "blob-name"
+
+    def test_container_name(self, azstoragetorch_blob_client, mock_sdk_blob_client):
+        mock_sdk_blob_client.container_name = "container-name"
+        assert azstoragetorch_blob_client.container_name == "container-name"
+
+    def test_get_blob_size(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+    ):
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
+        mock_sdk_blob_client.get_blob_properties.assert_called_once_with()
+
+    def test_get_blob_size_caches_result(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+    ):
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
+        assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
+        mock_sdk_blob_client.get_blob_properties.assert_called_once_with()
+
+    def test_close(self, mock_sdk_blob_client):
+        mock_executor = mock.Mock(concurrent.futures.Executor)
+        client = AzStorageTorchBlobClient(mock_sdk_blob_client, mock_executor)
+        client.close()
+        mock_executor.shutdown.assert_called_once_with()
+
+    def test_clients_share_process_wide_executor(self, mock_sdk_blob_client):
+        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+            clients = [AzStorageTorchBlobClient(mock_sdk_blob_client) for _ in range(3)]
+            for client in clients:
+                client.stage_blocks(b"content")
+                client.close()
+            mock_executor.assert_called_once()
+            mock_executor.return_value.shutdown.assert_not_called()
+
+    def test_no_executor_used_when_no_transfers(self, mock_sdk_blob_client):
+        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+            client = AzStorageTorchBlobClient(mock_sdk_blob_client)
+            client.close()
+            mock_executor.assert_not_called()
+            mock_executor.return_value.shutdown.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "blob_size, download_offset, download_length, expected_ranges, known_blob_size",
+        [
+            # Download an empty blob
+            (0, None, None, ["0--1"], True),
+            (0, None, None, [f"0-{DEFAULT_PARTITION_SIZE - 1}"], False),
+            # Small single GET full, download
+            (10, None, None, ["0-9"], True),
+            (10, None, None, [f"0-{DEFAULT_PARTITION_SIZE - 1}"], False),
+            # Small download with offset
+            (10, 5, None, ["5-9"], True),
+            (10, 5, None, [f"5-{DEFAULT_PARTITION_SIZE + 5 - 1}"], False),
+            # Small download with length
+            (10, 0, 5, ["0-4"], True),
+            (10, 0, 5, ["0-4"], False),
+            # Small download with offset and length
+            (10, 3, 4, ["3-6"], True),
+            (10, 3, 4, ["3-6"], False),
+            # Small download with length past blob size
+            (10, 5, 10, ["5-9"], True),
+            (10, 5, 10, ["5-14"], False),
+            # Small download of portion of large blob
+            (32 * MB, 10, 10, ["10-19"], True),
+            (32 * MB, 10, 10, ["10-19"], False),
+            # Download just below partitioned threshold
+            (
+                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1,
+                None,
+                None,
+                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 2}"],
+                True,
+            ),
+            (
+                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1,
+                None,
+                None,
+                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}"],
+                False,
+            ),
+            # Download at partitioned threshold
+            (
+                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD,
+                None,
+                None,
+                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}"],
+                True,
+            ),
+            (
+                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD,
+                None,
+                None,
+                [f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}"],
+                False,
+            ),
+            # Download just above partitioned threshold
+            (
+                DEFAULT_PARTITION_DOWNLOAD_THRESHOLD + 1,
+                None,
+                None,
+                [
+                    f"0-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD - 1}",
+                    f"{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD}-{DEFAULT_PARTITION_DOWNLOAD_THRESHOLD}",
+                ],
+                True,
+            ),
+            (
                 DEFAULT_PARTITION_DOWNLOAD_THRESHOLD + 1,
                 None,
                 None,
@@ -1084,9 +2496,155 @@ class TestAzStorageTorchBlobClient:
                 True,
             ),
             (
-                4 * DEFAULT_PARTITION_SIZE,
-                None,
+                4 * DEFAULT_PARTITION_SIZE,
+                None,
+                2 * DEFAULT_PARTITION_SIZE + 5,
+                [
+                    f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                    f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{2 * DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE + 4}",
+                ],
+                False,
+            ),
+            # Large download with offset and length
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                10,
+                2 * DEFAULT_PARTITION_SIZE + 5,
+                [
+                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (2 * DEFAULT_PARTITION_SIZE + 4)}",
+                ],
+                True,
+            ),
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                10,
+                2 * DEFAULT_PARTITION_SIZE + 5,
+                [
+                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (2 * DEFAULT_PARTITION_SIZE + 4)}",
+                ],
+                False,
+            ),
+            # Large download with length past blob size
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                10,
+                5 * DEFAULT_PARTITION_SIZE,
+                [
+                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (3 * DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + (3 * DEFAULT_PARTITION_SIZE)}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                True,
+            ),
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                10,
+                5 * DEFAULT_PARTITION_SIZE,
+                [
+                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (3 * DEFAULT_PARTITION_SIZE - 1)}",
+                    f"{10 + (3 * DEFAULT_PARTITION_SIZE)}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                False,
+            ),
+        ],
+    )
+    def test_download(
+        self,
+        blob_size,
+        download_offset,
+        download_length,
+        expected_ranges,
+        known_blob_size,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        blob_properties.size = blob_size
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        if known_blob_size:
+            azstoragetorch_blob_client.get_blob_size()
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                expected_range, blob_size, content, etag=blob_properties.etag
+            )
+            for expected_range in expected_ranges
+        ]
+        download_kwargs = {}
+        expected_download_content = content
+        if download_offset is not None:
+            download_kwargs["offset"] = download_offset
+            expected_download_content = expected_download_content[download_offset:]
+        if download_length is not None:
+            download_kwargs["length"] = download_length
+            expected_download_content = expected_download_content[:download_length]
+        assert (
+            azstoragetorch_blob_client.download(**download_kwargs)
+            == expected_download_content
+        )
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges=expected_ranges,
+            expected_etag=blob_properties.etag,
+            known_blob_size=known_blob_size,
+        )
+
+    def test_download_version_id(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+    ):
+        mock_sdk_blob_client.version_id = VERSION_ID
+        content = b"0123456789"
+        mock_generated_sdk_storage_client.blob.download.return_value = (
+            mock_download_response("0-9", len(content), content)
+        )
+        assert azstoragetorch_blob_client.download(length=len(content)) == content
+        assert (
+            mock_generated_sdk_storage_client.blob.download.call_args[1]["version_id"]
+            == VERSION_ID
+        )
+
+    @pytest.mark.parametrize(
+        "blob_size, buffer_size, download_offset, download_length, expected_ranges, known_blob_size",
+        [
+            # Small download filling entire buffer
+            (10, 10, 0, None, ["0-9"], True),
+            (10, 10, 0, None, ["0-9"], False),
+            # Buffer larger than remaining blob content
+            (10, 20, 5, None, ["5-9"], True),
+            (10, 20, 5, None, ["5-24"], False),
+            # Explicit length smaller than buffer
+            (10, 20, 3, 4, ["3-6"], True),
+            (10, 20, 3, 4, ["3-6"], False),
+            # Partitioned download
+            (
+                2 * DEFAULT_PARTITION_SIZE + 5,
+                2 * DEFAULT_PARTITION_SIZE + 5,
+                0,
+                None,
+                [
+                    f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                    f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{2 * DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE + 4}",
+                ],
+                True,
+            ),
+            (
+                2 * DEFAULT_PARTITION_SIZE + 5,
                 2 * DEFAULT_PARTITION_SIZE + 5,
+                0,
+                None,
                 [
                     f"0-{DEFAULT_PARTITION_SIZE - 1}",
                     f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
@@ -1094,59 +2652,24 @@ class TestAzStorageTorchBlobClient:
                 ],
                 False,
             ),
-            # Large download with offset and length
-            (
-                4 * DEFAULT_PARTITION_SIZE,
-                10,
-                2 * DEFAULT_PARTITION_SIZE + 5,
-                [
-                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (2 * DEFAULT_PARTITION_SIZE + 4)}",
-                ],
-                True,
-            ),
-            (
-                4 * DEFAULT_PARTITION_SIZE,
-                10,
-                2 * DEFAULT_PARTITION_SIZE + 5,
-                [
-                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (2 * DEFAULT_PARTITION_SIZE + 4)}",
-                ],
-                False,
-            ),
-            # Large download with length past blob size
+            # Partitioned download with offset
             (
-                4 * DEFAULT_PARTITION_SIZE,
+                2 * DEFAULT_PARTITION_SIZE,
+                2 * DEFAULT_PARTITION_SIZE,
                 10,
-                5 * DEFAULT_PARTITION_SIZE,
+                None,
                 [
-                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (3 * DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + (3 * DEFAULT_PARTITION_SIZE)}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"10-{10 + DEFAULT_PARTITION_SIZE - 1}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
                 ],
                 True,
             ),
-            (
-                4 * DEFAULT_PARTITION_SIZE,
-                10,
-                5 * DEFAULT_PARTITION_SIZE,
-                [
-                    f"10-{10 + (DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + (2 * DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + (2 * DEFAULT_PARTITION_SIZE)}-{10 + (3 * DEFAULT_PARTITION_SIZE - 1)}",
-                    f"{10 + (3 * DEFAULT_PARTITION_SIZE)}-{4 * DEFAULT_PARTITION_SIZE - 1}",
-                ],
-                False,
-            ),
         ],
     )
-    def test_download(
+    def test_download_into(
         self,
         blob_size,
+        buffer_size,
         download_offset,
         download_length,
         expected_ranges,
@@ -1157,34 +2680,681 @@ class TestAzStorageTorchBlobClient:
         blob_properties,
     ):
         blob_properties.size = blob_size
-        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        if known_blob_size:
+            azstoragetorch_blob_client.get_blob_size()
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                expected_range, blob_size, content, etag=blob_properties.etag
+            )
+            for expected_range in expected_ranges
+        ]
+        expected_content = content[download_offset:]
+        if download_length is not None:
+            expected_content = expected_content[:download_length]
+        buffer = bytearray(buffer_size)
+        assert azstoragetorch_blob_client.download_into(
+            buffer, offset=download_offset, length=download_length
+        ) == len(expected_content)
+        assert buffer[: len(expected_content)] == expected_content
+        assert buffer[len(expected_content) :] == bytes(
+            buffer_size - len(expected_content)
+        )
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges=expected_ranges,
+            expected_etag=blob_properties.etag,
+            known_blob_size=known_blob_size,
+        )
+
+    @pytest.mark.parametrize(
+        "create_buffer",
+        [
+            bytearray,
+            lambda size: memoryview(bytearray(size)),
+            lambda size: mmap.mmap(-1, size),
+            lambda size: array.array("i", bytes(size)),
+        ],
+    )
+    def test_download_into_supported_buffer_types(
+        self,
+        create_buffer,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(16)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response("0-15", len(content), content)
+        ]
+        buffer = create_buffer(len(content))
+        assert azstoragetorch_blob_client.download_into(buffer) == len(content)
+        assert bytes(memoryview(buffer).cast("B")) == content
+
+    def test_download_into_raises_for_readonly_buffer(self, azstoragetorch_blob_client):
+        with pytest.raises(TypeError, match="must be writable"):
+            azstoragetorch_blob_client.download_into(b"readonly")
+
+    def test_download_into_raises_for_length_larger_than_buffer(
+        self, azstoragetorch_blob_client
+    ):
+        with pytest.raises(ValueError, match="larger than the provided buffer"):
+            azstoragetorch_blob_client.download_into(bytearray(5), length=6)
+
+    def test_download_into_offset_past_end_of_blob(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        assert (
+            azstoragetorch_blob_client.download_into(
+                bytearray(5), offset=blob_properties.size + 1
+            )
+            == 0
+        )
+        mock_generated_sdk_storage_client.blob.download.assert_not_called()
+
+    @pytest.fixture
+    def small_partitions(self, partition_planner):
+        with mock.patch.object(partition_planner, "_partition_size", 4):
+            yield 4
+
+    def get_ranged_download_side_effect(self, content, failing_range=None):
+        def _download(range, **kwargs):
+            start, end = (int(pos) for pos in range[len("bytes=") :].split("-"))
+            if range == failing_range:
+                return to_bytes_iterator(
+                    content[start : end + 1], exception_to_raise=NonRetryableException()
+                )
+            return to_bytes_iterator(content[start : end + 1])
+
+        return _download
+
+    @pytest.fixture
+    def speculative_client(self, mock_sdk_blob_client, single_threaded_executor):
+        return AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            single_threaded_executor,
+            partition_planner=PartitionPlanner(4, speculative_partitions=3),
+        )
+
+    def get_unknown_size_download_side_effect(
+        self, content, http_response_error, etag, modified_range=None
+    ):
+        http_response_error.response.text.return_value = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            " <Error><Code>InvalidRange</Code>"
+            " <Message>message</Message>"
+            "</Error>"
+        )
+
+        def _download(range, **kwargs):
+            start, end = (int(pos) for pos in range[len("bytes=") :].split("-"))
+            if start >= len(content):
+                http_response_error.status_code = 416
+                http_response_error.response.headers = {
+                    "Content-Range": f"bytes */{len(content)}"
+                }
+                raise http_response_error
+            response_etag = etag
+            if range == modified_range:
+                response_etag = "modified-etag"
+            end = min(end, len(content) - 1)
+            return mock_download_response(
+                f"{start}-{end}", len(content), content, etag=response_etag
+            )
+
+        return _download
+
+    @pytest.mark.parametrize(
+        "blob_size,expected_ranges,possible_speculative_ranges",
+        [
+            (0, ["0-3"], ["4-7", "8-11"]),
+            (2, ["0-3"], ["4-7", "8-11"]),
+            (10, ["0-3", "4-7", "8-11"], []),
+            (12, ["0-3", "4-7", "8-11"], []),
+            (20, ["0-3", "4-7", "8-11", "12-15", "16-19"], []),
+        ],
+    )
+    def test_download_with_speculative_partitions(
+        self,
+        speculative_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        blob_etag,
+        blob_size,
+        expected_ranges,
+        possible_speculative_ranges,
+    ):
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_unknown_size_download_side_effect(
+                content, http_response_error, blob_etag
+            )
+        )
+        assert speculative_client.download() == content
+        assert speculative_client.get_blob_size() == blob_size
+        requested_ranges = [
+            download_call.kwargs["range"][len("bytes=") :]
+            for download_call in mock_generated_sdk_storage_client.blob.download.call_args_list
+        ]
+        # Speculative partitions past the end of the blob may be cancelled before
+        # they are requested once the first partition shows the blob ended.
+        assert [
+            requested_range
+            for requested_range in requested_ranges
+            if requested_range not in possible_speculative_ranges
+        ] == expected_ranges
+
+    @pytest.fixture
+    def primed_request_hedger(self):
+        hedger = RequestHedger(max_hedged_bytes_ratio=1)
+        for _ in range(20):
+            hedger.record_download(1024, 0)
+        return hedger
+
+    @pytest.fixture
+    def hedging_client(
+        self, mock_sdk_blob_client, blob_properties, primed_request_hedger
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(4),
+            partition_planner=PartitionPlanner(4),
+            request_hedger=primed_request_hedger,
+        )
+        yield client
+        client.close()
+
+    def get_stalled_download_side_effect(self, content, stalled_range, release):
+        # The first request for the stalled range does not return content until released
+        # while all other requests, including duplicate requests for the range, return immediately.
+        stalled_requests = []
+
+        def stalled_iterator(content):
+            release.wait(timeout=5)
+            yield from to_bytes_iterator(content)
+
+        def _download(range, **kwargs):
+            start, end = (int(pos) for pos in range[len("bytes=") :].split("-"))
+            if range == stalled_range and not stalled_requests:
+                stalled_requests.append(range)
+                return stalled_iterator(content[start : end + 1])
+            return to_bytes_iterator(content[start : end + 1])
+
+        return _download
+
+    @pytest.mark.parametrize("method", ["download", "download_into", "iter_chunks"])
+    def test_hedges_stalled_partition(
+        self,
+        hedging_client,
+        primed_request_hedger,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        method,
+    ):
+        content = random_bytes(16)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            hedging_client, mock_sdk_blob_client, blob_properties
+        )
+        release = threading.Event()
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_stalled_download_side_effect(content, "bytes=4-7", release)
+        )
+        try:
+            if method == "download":
+                assert hedging_client.download() == content
+            elif method == "download_into":
+                buffer = bytearray(len(content))
+                assert hedging_client.download_into(buffer) == len(content)
+                assert buffer == content
+            else:
+                assert b"".join(hedging_client.iter_chunks()) == content
+        finally:
+            release.set()
+        assert primed_request_hedger.stats == HedgeStats(
+            hedged_requests=1, hedges_won=1, hedged_bytes=4
+        )
+        assert [
+            download_call.kwargs["range"]
+            for download_call in mock_generated_sdk_storage_client.blob.download.call_args_list
+        ].count("bytes=4-7") == 2
+
+    def test_does_not_hedge_when_hedged_bytes_exceed_cap(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        request_hedger = RequestHedger(max_hedged_bytes_ratio=0)
+        for _ in range(20):
+            request_hedger.record_download(1024, 0)
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(4),
+            partition_planner=PartitionPlanner(4),
+            request_hedger=request_hedger,
+        )
+        content = random_bytes(16)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        release = threading.Event()
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_stalled_download_side_effect(content, "bytes=4-7", release)
+        )
+        release_timer = threading.Timer(0.2, release.set)
+        release_timer.start()
+        try:
+            assert client.download() == content
+        finally:
+            release_timer.cancel()
+            release.set()
+            client.close()
+        assert request_hedger.stats == HedgeStats(0, 0, 0)
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 4
+
+    def test_does_not_hedge_without_enough_samples(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        request_hedger = RequestHedger(max_hedged_bytes_ratio=1)
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            single_threaded_executor,
+            partition_planner=PartitionPlanner(4),
+            request_hedger=request_hedger,
+        )
+        content = random_bytes(16)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content)
+        )
+        assert client.download() == content
+        client.close()
+        assert request_hedger.stats == HedgeStats(0, 0, 0)
+        assert request_hedger.get_deadline(4) is None
+
+    @pytest.mark.parametrize("blob_size", [0, 2, 6])
+    def test_ignores_speculative_partitions_past_end_of_blob(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        blob_etag,
+        blob_size,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            InlineExecutor(),
+            partition_planner=PartitionPlanner(4, speculative_partitions=3),
+        )
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_unknown_size_download_side_effect(
+                content, http_response_error, blob_etag
+            )
+        )
+        assert client.download() == content
+        assert client.get_blob_size() == blob_size
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 3
+
+    @pytest.mark.parametrize(
+        "blob_size,offset,length",
+        [
+            (2, 0, None),
+            (10, 0, None),
+            (20, 0, None),
+            (20, 3, None),
+            (20, 0, 9),
+        ],
+    )
+    def test_download_into_with_speculative_partitions(
+        self,
+        speculative_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        blob_etag,
+        blob_size,
+        offset,
+        length,
+    ):
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_unknown_size_download_side_effect(
+                content, http_response_error, blob_etag
+            )
+        )
+        expected_content = content[offset:]
+        if length is not None:
+            expected_content = expected_content[:length]
+        buffer = bytearray(len(expected_content) + 5)
+        written = speculative_client.download_into(buffer, offset, length)
+        assert written == len(expected_content)
+        assert buffer[:written] == expected_content
+
+    def test_speculative_partition_from_modified_blob_raises(
+        self,
+        speculative_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        blob_etag,
+    ):
+        content = random_bytes(20)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_unknown_size_download_side_effect(
+                content, http_response_error, blob_etag, modified_range="bytes=4-7"
+            )
+        )
+        with pytest.raises(azure.core.exceptions.ResourceModifiedError):
+            speculative_client.download()
+
+    def test_download_at_offset_past_end_with_speculative_partitions_raises(
+        self,
+        speculative_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        blob_etag,
+    ):
+        content = random_bytes(10)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_unknown_size_download_side_effect(
+                content, http_response_error, blob_etag
+            )
+        )
+        with pytest.raises(azure.core.exceptions.HttpResponseError) as exc_info:
+            speculative_client.download(offset=20)
+        assert exc_info.value.error_code == StorageErrorCode.INVALID_RANGE
+
+    def test_partitioned_download_with_more_partitions_than_in_flight_requests(
+        self,
+        small_partitions,
+        partition_planner,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(2),
+            max_in_flight_requests=2,
+            partition_planner=partition_planner,
+        )
+        content = random_bytes(small_partitions * 50 + 1)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content)
+        )
+        buffer = bytearray(len(content))
+        assert client.download_into(buffer) == len(content)
+        assert buffer == content
+        assert client.download() == content
+        client.close()
+
+    @pytest.mark.parametrize("known_blob_size", [True, False])
+    def test_partitioned_download_does_not_copy_content(
+        self,
+        known_blob_size,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        blob_size = 4 * DEFAULT_PARTITION_SIZE
+        content = random_bytes(blob_size)
+        blob_properties.size = blob_size
         if known_blob_size:
-            azstoragetorch_blob_client.get_blob_size()
-        content = random_bytes(blob_size)
+            preset_blob_size_on_clients(
+                azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+            )
+        # Responses are created up front so that only memory allocated by the download is traced.
         mock_generated_sdk_storage_client.blob.download.side_effect = [
             mock_download_response(
-                expected_range, blob_size, content, etag=blob_properties.etag
+                f"{pos}-{pos + DEFAULT_PARTITION_SIZE - 1}",
+                blob_size,
+                content,
+                etag=blob_properties.etag,
             )
-            for expected_range in expected_ranges
+            for pos in range(0, blob_size, DEFAULT_PARTITION_SIZE)
         ]
-        download_kwargs = {}
-        expected_download_content = content
-        if download_offset is not None:
-            download_kwargs["offset"] = download_offset
-            expected_download_content = expected_download_content[download_offset:]
-        if download_length is not None:
-            download_kwargs["length"] = download_length
-            expected_download_content = expected_download_content[:download_length]
-        assert (
-            azstoragetorch_blob_client.download(**download_kwargs)
-            == expected_download_content
+        tracemalloc.start()
+        try:
+            downloaded = azstoragetorch_blob_client.download()
+            _, peak_traced_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert downloaded == content
+        # The content is allocated once and returned without being copied (e.g., from a bytearray
+        # to bytes or by joining it with content from the first request).
+        assert peak_traced_memory < 1.5 * blob_size
+
+    def test_partitioned_download_stops_after_failed_partition(
+        self,
+        small_partitions,
+        partition_planner,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(1),
+            max_in_flight_requests=2,
+            partition_planner=partition_planner,
+        )
+        content = random_bytes(small_partitions * 50)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content, failing_range="bytes=0-3")
+        )
+        with pytest.raises(NonRetryableException):
+            client.download_into(bytearray(len(content)))
+        client.close()
+        # Only partitions in the in-flight window can have been downloaded. No
+        # additional partitions are submitted after a partition fails.
+        assert mock_generated_sdk_storage_client.blob.download.call_count <= 2
+
+    def test_partitioned_download_waits_for_in_flight_partitions_after_failure(
+        self,
+        small_partitions,
+        partition_planner,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(2),
+            max_in_flight_requests=2,
+            partition_planner=partition_planner,
+        )
+        content = b"01234567"
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        second_partition_writing = threading.Event()
+        release_second_partition = threading.Event()
+
+        def blocked_mid_write():
+            yield content[4:6]
+            second_partition_writing.set()
+            release_second_partition.wait(timeout=10)
+            yield content[6:8]
+
+        def _download(range, **kwargs):
+            if range == "bytes=0-3":
+                second_partition_writing.wait(timeout=10)
+                raise NonRetryableException()
+            return blocked_mid_write()
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = _download
+        buffer = bytearray(len(content))
+        timer = threading.Timer(0.2, release_second_partition.set)
+        timer.start()
+        with pytest.raises(NonRetryableException):
+            client.download_into(buffer)
+        # The failure is only raised once the partition still writing into the buffer is done.
+        assert release_second_partition.is_set()
+        assert buffer[4:] == content[4:]
+        timer.join()
+        client.close()
+
+    def test_download_uses_process_wide_partition_planner(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client, single_threaded_executor, max_in_flight_requests=32
         )
+        content = random_bytes(20 * MB)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content)
+        )
+        assert client.download() == content
+        # Medium sized blobs are spread across available connections instead of using
+        # a single 16 MiB partition followed by a 4 MiB partition.
         self.assert_expected_download_calls(
             mock_generated_sdk_storage_client,
-            expected_ranges=expected_ranges,
+            expected_ranges=[f"{i * 4 * MB}-{(i + 1) * 4 * MB - 1}" for i in range(5)],
             expected_etag=blob_properties.etag,
-            known_blob_size=known_blob_size,
+            known_blob_size=True,
+        )
+        assert DOWNLOAD_PARTITION_PLANNER.throughput is not None
+
+    def test_download_records_throughput_on_client_partition_planner(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        partition_planner = PartitionPlanner()
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            single_threaded_executor,
+            partition_planner=partition_planner,
+        )
+        content = random_bytes(2 * MB)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content)
+        )
+        assert client.download() == content
+        assert partition_planner.throughput is not None
+        assert DOWNLOAD_PARTITION_PLANNER.throughput is None
+
+    @pytest.mark.parametrize(
+        "blob_size,offset,length,expected_chunks",
+        [
+            (10, 0, None, [(0, 4), (4, 8), (8, 10)]),
+            (12, 0, None, [(0, 4), (4, 8), (8, 12)]),
+            (10, 2, None, [(2, 6), (6, 10)]),
+            (10, 2, 5, [(2, 6), (6, 7)]),
+            (10, 0, 100, [(0, 4), (4, 8), (8, 10)]),
+            (10, 10, None, []),
+            (10, 20, None, []),
+            (0, 0, None, []),
+        ],
+    )
+    def test_iter_chunks(
+        self,
+        small_partitions,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_size,
+        offset,
+        length,
+        expected_chunks,
+    ):
+        content = random_bytes(blob_size)
+        blob_properties.size = blob_size
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content)
+        )
+        assert list(
+            azstoragetorch_blob_client.iter_chunks(offset=offset, length=length)
+        ) == [content[start:end] for start, end in expected_chunks]
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges=[f"{start}-{end - 1}" for start, end in expected_chunks],
+            expected_etag=blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    def test_iter_chunks_stops_downloading_when_closed(
+        self,
+        small_partitions,
+        partition_planner,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(1),
+            max_in_flight_requests=2,
+            partition_planner=partition_planner,
+        )
+        content = random_bytes(small_partitions * 50)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content)
+        )
+        chunks = client.iter_chunks()
+        assert next(chunks) == content[:small_partitions]
+        chunks.close()
+        client.close()
+        # The first partition, the rest of the in-flight window and the partition submitted
+        # when the first was consumed.
+        assert mock_generated_sdk_storage_client.blob.download.call_count <= 3
+
+    def test_iter_chunks_raises_failed_partition(
+        self,
+        small_partitions,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(small_partitions * 3)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            self.get_ranged_download_side_effect(content, failing_range="bytes=4-7")
         )
+        chunks = azstoragetorch_blob_client.iter_chunks()
+        assert next(chunks) == content[:small_partitions]
+        with pytest.raises(NonRetryableException):
+            next(chunks)
 
     @pytest.mark.parametrize(
         "response_error_code,expected_sdk_exception,expected_storage_error_code,headers",
@@ -1281,13 +3451,15 @@ class TestAzStorageTorchBlobClient:
             azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
         )
         mock_generated_sdk_storage_client.blob.download.side_effect = [
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-            to_bytes_iterator(content),
+            to_bytes_iterator(
+                content, chunk_size=4, exception_to_raise=retryable_exception_cls()
+            ),
+            to_bytes_iterator(content[4:]),
         ]
         assert azstoragetorch_blob_client.download(**download_kwargs) == content
         self.assert_expected_download_calls(
             mock_generated_sdk_storage_client,
-            ["0-9", "0-9"],
+            ["0-9", "4-9"],
             blob_properties.etag,
             True,
         )
@@ -1313,20 +3485,225 @@ class TestAzStorageTorchBlobClient:
             azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
         )
         mock_generated_sdk_storage_client.blob.download.side_effect = [
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
+            to_bytes_iterator(
+                content[pos:],
+                chunk_size=2,
+                exception_to_raise=retryable_exception_cls(),
+            )
+            for pos in (0, 2, 4)
         ]
         with pytest.raises(retryable_exception_cls):
             azstoragetorch_blob_client.download(**download_kwargs)
         self.assert_expected_download_calls(
             mock_generated_sdk_storage_client,
-            ["0-9", "0-9", "0-9"],
+            ["0-9", "2-9", "4-9"],
             blob_properties.etag,
             True,
         )
         assert sleep_patch.call_count == 2
 
+    def test_resumes_download_into_from_last_received_byte(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content,
+                chunk_size=3,
+                exception_to_raise=azure.core.exceptions.IncompleteReadError(),
+            ),
+            to_bytes_iterator(content[3:]),
+        ]
+        buffer = bytearray(len(content))
+        assert azstoragetorch_blob_client.download_into(buffer) == len(content)
+        assert buffer == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "3-9"],
+            blob_properties.etag,
+            True,
+        )
+
+    def test_does_not_resume_after_entire_range_received(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content, exception_to_raise=azure.core.exceptions.IncompleteReadError()
+            ),
+        ]
+        assert azstoragetorch_blob_client.download() == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client, ["0-9"], blob_properties.etag, True
+        )
+        assert sleep_patch.call_count == 0
+
+    def test_resume_stops_at_end_of_blob_for_range_past_end(
+        self,
+        azstoragetorch_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                "0-9",
+                len(content),
+                content,
+                exception=azure.core.exceptions.IncompleteReadError(),
+                etag=blob_properties.etag,
+            ),
+        ]
+        assert azstoragetorch_blob_client.download() == content
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 1
+        assert sleep_patch.call_count == 0
+
+    def test_retries_throttled_download_request(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            http_error_with_status(503, {"Retry-After": "5"}),
+            to_bytes_iterator(content),
+        ]
+        assert azstoragetorch_blob_client.download() == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "0-9"],
+            blob_properties.etag,
+            True,
+        )
+        assert sleep_patch.call_count == 1
+        assert sleep_patch.call_args.args[0] >= 5
+        assert azstoragetorch_blob_client.retry_stats == RetryStats(
+            retries=1, throttled_retries=1, retries_over_budget=0
+        )
+
+    def test_throttling_decreases_process_wide_concurrency(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        client = AzStorageTorchBlobClient(mock_sdk_blob_client)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        account = "myaccount.blob.core.windows.net"
+        initial_concurrency = CONCURRENCY_CONTROLLER.get_limit(account)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            http_error_with_status(503),
+            to_bytes_iterator(b"content"),
+        ]
+        client.download(length=7)
+        assert CONCURRENCY_CONTROLLER.get_limit(account) == max(
+            initial_concurrency // 2, 1
+        )
+
+    def test_paces_downloads_and_staged_blocks(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+        partition_planner,
+    ):
+        mock_bandwidth_limiter = mock.Mock(BandwidthLimiter)
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=single_threaded_executor,
+            partition_planner=partition_planner,
+            bandwidth_limiter=mock_bandwidth_limiter,
+        )
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.return_value = (
+            to_bytes_iterator(content, chunk_size=4)
+        )
+        assert client.download() == content
+        assert mock_bandwidth_limiter.acquire.call_args_list == [
+            mock.call(4, "interactive"),
+            mock.call(4, "interactive"),
+            mock.call(2, "interactive"),
+        ]
+        mock_bandwidth_limiter.reset_mock()
+        for future in client.stage_blocks(content):
+            future.result()
+        mock_bandwidth_limiter.acquire.assert_called_once_with(len(content), "bulk")
+
+    def test_does_not_retry_fatal_download_request_errors(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            http_error_with_status(404)
+        )
+        with pytest.raises(azure.core.exceptions.HttpResponseError):
+            azstoragetorch_blob_client.download()
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 1
+        assert sleep_patch.call_count == 0
+
+    def test_uses_provided_retry_policy(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+        partition_planner,
+        sleep_patch,
+    ):
+        retry_policy = RetryPolicy(retry_budget=0)
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=single_threaded_executor,
+            partition_planner=partition_planner,
+            retry_policy=retry_policy,
+        )
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            http_error_with_status(503)
+        )
+        with pytest.raises(azure.core.exceptions.HttpResponseError):
+            client.download()
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 1
+        assert client.retry_stats == RetryStats(0, 0, 1)
+
     def test_does_not_retry_on_non_retryable_exceptions(
         self,
         azstoragetorch_blob_client,
@@ -1407,7 +3784,7 @@ class TestAzStorageTorchBlobClient:
         mock_uuid4.side_effect = expected_block_ids
         content = bytes_like_type(random_bytes(content_length))
         expected_stage_block_calls = [
-            mock.call(str(i), content[start:end])
+            mock.call(str(i), content[start:end], retry_total=0)
             for i, (start, end) in enumerate(expected_block_start_ends)
         ]
         stage_block_futures = azstoragetorch_blob_client.stage_blocks(content)
@@ -1418,6 +3795,35 @@ class TestAzStorageTorchBlobClient:
         )
         assert mock_uuid4.call_count == len(expected_block_start_ends)
 
+    def test_stage_blocks_retries_throttled_requests(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, mock_uuid4, sleep_patch
+    ):
+        mock_uuid4.return_value = "block-id"
+        content = random_bytes(10)
+        mock_sdk_blob_client.stage_block.side_effect = [
+            http_error_with_status(503, {"Retry-After": "2"}),
+            None,
+        ]
+        stage_block_futures = azstoragetorch_blob_client.stage_blocks(content)
+        self.assert_stage_block_ids(stage_block_futures, ["block-id"])
+        assert mock_sdk_blob_client.stage_block.call_args_list == [
+            mock.call("block-id", content, retry_total=0),
+            mock.call("block-id", content, retry_total=0),
+        ]
+        assert sleep_patch.call_args.args[0] >= 2
+
+    def test_stage_blocks_raises_after_retries_exhausted(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, sleep_patch
+    ):
+        mock_sdk_blob_client.stage_block.side_effect = (
+            azure.core.exceptions.ServiceResponseError("connection reset")
+        )
+        stage_block_futures = azstoragetorch_blob_client.stage_blocks(random_bytes(10))
+        with pytest.raises(azure.core.exceptions.ServiceResponseError):
+            stage_block_futures[0].result()
+        assert mock_sdk_blob_client.stage_block.call_count == 3
+        assert sleep_patch.call_count == 2
+
     def test_stage_blocks_returns_error_in_future(
         self, azstoragetorch_blob_client, mock_sdk_blob_client
     ):
@@ -1457,7 +3863,7 @@ class TestAzStorageTorchBlobClient:
 
         in_flight_counts = []
 
-        def stage_block_side_effect(*args):
+        def stage_block_side_effect(*args, **kwargs):
             in_flight_counts.append(spy_submit_executor.counter.decrement())
 
         mock_sdk_blob_client.stage_block.side_effect = stage_block_side_effect
@@ -3,12 +3,29 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import asyncio
+import itertools
+import os
+import pickle
+from concurrent.futures import Future
+import threading
 from unittest import mock
 import pytest
+import torch.utils.data
 
 from azure.core.credentials import AzureSasCredential
 
-from azstoragetorch.datasets import BlobDataset, IterableBlobDataset, Blob
+from azstoragetorch.datasets import (
+    BlobDataset,
+    IterableBlobDataset,
+    Blob,
+    PrefetchSampler,
+)
+from azstoragetorch import _client
+from azstoragetorch._aio_client import (
+    AsyncAzStorageTorchBlobClient,
+    AsyncAzStorageTorchBlobClientFactory,
+)
 from azstoragetorch._client import (
     AzStorageTorchBlobClient,
     AzStorageTorchBlobClientFactory,
@@ -26,6 +43,16 @@ def create_mock_azstoragetorch_blob_client(blob_url, blob_content):
         client.url = url
         client.get_blob_size.return_value = len(data)
         client.download.return_value = data
+        client.submit_download.side_effect = lambda offset, length: completed_future(
+            data[offset : offset + length]
+        )
+
+        def download_into(buffer, offset=0, length=None):
+            content = data[offset : offset + len(buffer)]
+            buffer[: len(content)] = content
+            return len(content)
+
+        client.download_into.side_effect = download_into
         return client
 
     return _create_mock_azstoragetorch_blob_client
@@ -58,6 +85,33 @@ def azstoragetorch_blob_factory_patch(mock_azstoragetorch_blob_client_factory):
         yield mock_azstoragetorch_blob_client_factory
 
 
+@pytest.fixture
+def create_mock_async_azstoragetorch_blob_client(blob_url, blob_content):
+    def _create_mock_async_azstoragetorch_blob_client(url=None, data=None):
+        if url is None:
+            url = blob_url
+        if data is None:
+            data = blob_content
+        client = mock.Mock(AsyncAzStorageTorchBlobClient)
+        client.url = url
+        client.get_blob_size.return_value = len(data)
+        client.download.return_value = data
+        return client
+
+    return _create_mock_async_azstoragetorch_blob_client
+
+
+@pytest.fixture
+def mock_async_azstoragetorch_blob_client_factory():
+    mock_factory = mock.Mock(AsyncAzStorageTorchBlobClientFactory)
+    with mock.patch(
+        "azstoragetorch._aio_client.AsyncAzStorageTorchBlobClientFactory",
+        return_value=mock_factory,
+    ) as mock_factory_cls:
+        mock_factory.factory_cls = mock_factory_cls
+        yield mock_factory
+
+
 @pytest.fixture
 def data_samples(container_url):
     return [
@@ -79,6 +133,31 @@ def data_sample_blob_clients(data_samples, create_mock_azstoragetorch_blob_clien
     ]
 
 
+@pytest.fixture
+def data_sample_async_blob_clients(
+    data_samples, create_mock_async_azstoragetorch_blob_client
+):
+    return [
+        create_mock_async_azstoragetorch_blob_client(**data_sample)
+        for data_sample in data_samples
+    ]
+
+
+def completed_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
+async def async_list(dataset):
+    return [sample async for sample in dataset]
+
+
 class TestBlob:
     def test_url(self, blob, mock_azstoragetorch_blob_client, blob_url):
         mock_azstoragetorch_blob_client.url = blob_url
@@ -106,6 +185,67 @@ class TestBlob:
                 _azstoragetorch_blob_client=mock_azstoragetorch_blob_client,
             )
 
+    def test_reader_raises_for_async_blob(
+        self, create_mock_async_azstoragetorch_blob_client
+    ):
+        blob = Blob(create_mock_async_azstoragetorch_blob_client())
+        with pytest.raises(RuntimeError, match="async_reader"):
+            blob.reader()
+
+    def test_reader_with_prefetched_download(
+        self, mock_azstoragetorch_blob_client, blob_content
+    ):
+        blob = Blob(mock_azstoragetorch_blob_client, completed_future(blob_content))
+        with blob.reader() as f:
+            assert f.read() == blob_content
+        mock_azstoragetorch_blob_client.download.assert_not_called()
+
+    def test_reader_with_partially_prefetched_download(
+        self, mock_azstoragetorch_blob_client, blob_content
+    ):
+        blob = Blob(mock_azstoragetorch_blob_client, completed_future(blob_content[:4]))
+        with blob.reader() as f:
+            assert f.read() == blob_content
+        # Only the rest of the blob is downloaded.
+        mock_azstoragetorch_blob_client.download_into.assert_called_once_with(
+            mock.ANY, offset=4
+        )
+        mock_azstoragetorch_blob_client.download.assert_not_called()
+
+    def test_reader_downloads_rest_of_partially_prefetched_download_once(
+        self, mock_azstoragetorch_blob_client, blob_content
+    ):
+        blob = Blob(mock_azstoragetorch_blob_client, completed_future(blob_content[:4]))
+        for _ in range(2):
+            with blob.reader() as f:
+                assert f.read() == blob_content
+        mock_azstoragetorch_blob_client.download_into.assert_called_once()
+
+    def test_reader_raises_prefetch_error(self, mock_azstoragetorch_blob_client):
+        future = Future()
+        future.set_exception(ValueError("prefetch error"))
+        blob = Blob(mock_azstoragetorch_blob_client, future)
+        with pytest.raises(ValueError, match="prefetch error"):
+            blob.reader()
+
+    def test_async_reader(self, create_mock_async_azstoragetorch_blob_client):
+        mock_async_blob_client = create_mock_async_azstoragetorch_blob_client()
+        blob = Blob(mock_async_blob_client)
+        with mock.patch(
+            "azstoragetorch.datasets.AsyncBlobIO", spec=True
+        ) as mock_async_blob_io_cls:
+            reader = blob.async_reader()
+            assert reader is mock_async_blob_io_cls.return_value
+            mock_async_blob_io_cls.assert_called_once_with(
+                blob.url,
+                "rb",
+                _azstoragetorch_blob_client=mock_async_blob_client,
+            )
+
+    def test_async_reader_raises_for_sync_blob(self, blob):
+        with pytest.raises(RuntimeError, match="reader"):
+            blob.async_reader()
+
 
 class TestBlobDataset:
     def assert_expected_dataset(self, dataset, expected_data_samples):
@@ -284,6 +424,515 @@ class TestBlobDataset:
             expected_blob_urls=data_sample_blob_urls,
         )
 
+    def test_getitems(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_blob_urls(data_sample_blob_urls)
+        indices = [3, 0, 7, 3]
+        assert dataset.__getitems__(indices) == [data_samples[i] for i in indices]
+        for i, client in enumerate(data_sample_blob_clients):
+            if i in indices:
+                assert client.submit_download.call_args_list == [
+                    mock.call(0, 8 * 1024 * 1024)
+                ] * indices.count(i)
+            else:
+                client.submit_download.assert_not_called()
+            client.download.assert_not_called()
+
+    def test_getitems_submits_all_downloads_before_transform(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        submitted_counts = []
+
+        def transform(blob):
+            submitted_counts.append(
+                sum(
+                    client.submit_download.called for client in data_sample_blob_clients
+                )
+            )
+            return blob.url
+
+        dataset = BlobDataset.from_blob_urls(data_sample_blob_urls, transform=transform)
+        assert dataset.__getitems__([0, 1, 2, 3]) == data_sample_blob_urls[:4]
+        assert submitted_counts == [4, 4, 4, 4]
+
+    def test_getitems_with_batch_transform(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+
+        def batch_transform(blobs):
+            contents = []
+            for blob in blobs:
+                with blob.reader() as f:
+                    contents.append(f.read())
+            return b",".join(contents)
+
+        transform = mock.Mock()
+        dataset = BlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=transform, batch_transform=batch_transform
+        )
+        assert dataset.__getitems__([1, 2]) == b",".join(
+            [data_samples[1]["data"], data_samples[2]["data"]]
+        )
+        transform.assert_not_called()
+        # Single data samples are still retrieved using the transform.
+        assert dataset[1] is transform.return_value
+
+    def test_getitems_empty_indices(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_blob_urls(data_sample_blob_urls)
+        assert dataset.__getitems__([]) == []
+
+    def test_getitems_raises_for_out_of_range_index(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_blob_urls(data_sample_blob_urls)
+        with pytest.raises(IndexError):
+            dataset.__getitems__([0, len(data_sample_blob_urls)])
+        for client in data_sample_blob_clients:
+            client.submit_download.assert_not_called()
+
+    def test_data_loader_uses_getitems(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        container_url,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = data_sample_blob_clients
+        dataset = BlobDataset.from_container_url(
+            container_url, batch_transform=lambda blobs: [blob.url for blob in blobs]
+        )
+        loader = torch.utils.data.DataLoader(
+            dataset, batch_size=4, collate_fn=lambda batch: batch
+        )
+        assert list(loader) == [
+            [client.url for client in data_sample_blob_clients[i : i + 4]]
+            for i in range(0, len(data_sample_blob_clients), 4)
+        ]
+
+
+class TestBlobDatasetTransformThreads:
+    @pytest.fixture
+    def create_dataset(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+
+        def _create_dataset(**kwargs):
+            return BlobDataset.from_blob_urls(data_sample_blob_urls, **kwargs)
+
+        return _create_dataset
+
+    def test_getitems_with_transform_threads(self, create_dataset, data_samples):
+        dataset = create_dataset(transform_threads=4)
+        indices = [5, 2, 9, 0, 3]
+        assert dataset.__getitems__(indices) == [data_samples[i] for i in indices]
+
+    def test_getitems_transforms_concurrently(
+        self, create_dataset, data_sample_blob_urls
+    ):
+        barrier = threading.Barrier(3, timeout=10)
+        transform_threads = set()
+
+        def transform(blob):
+            transform_threads.add(threading.current_thread())
+            # Only returns once three transforms are running at the same time.
+            barrier.wait()
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=3)
+        assert dataset.__getitems__([0, 1, 2]) == data_sample_blob_urls[:3]
+        assert len(transform_threads) == 3
+        assert threading.current_thread() not in transform_threads
+
+    def test_getitem_not_affected_by_transform_threads(
+        self, create_dataset, data_samples
+    ):
+        transform_threads = []
+
+        def transform(blob):
+            transform_threads.append(threading.current_thread())
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=3)
+        assert dataset[4] == data_samples[4]["url"]
+        assert transform_threads == [threading.current_thread()]
+
+    def test_getitems_reuses_transform_threads_across_batches(self, create_dataset):
+        transform_threads = set()
+
+        def transform(blob):
+            transform_threads.add(threading.current_thread())
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=2)
+        for indices in ([0, 1, 2, 3], [4, 5, 6, 7], [8, 9]):
+            dataset.__getitems__(indices)
+        assert len(transform_threads) <= 2
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork()")
+    def test_getitems_with_transform_threads_in_forked_child_process(
+        self, create_dataset, data_samples
+    ):
+        dataset = create_dataset(transform_threads=2)
+        assert dataset.__getitems__([0, 1]) == data_samples[:2]
+        pid = os.fork()
+        if pid == 0:
+            # The parent's transform threads do not exist in the child.
+            os._exit(0 if dataset.__getitems__([2, 3]) == data_samples[2:4] else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    def test_transform_pool_not_pickled(self, create_dataset, data_samples):
+        dataset = create_dataset(transform_threads=2)
+        dataset.__getitems__([0, 1])
+        transform_pool = pickle.loads(pickle.dumps(dataset._transform_pool))
+        assert transform_pool.num_threads == 2
+        assert transform_pool.submit(lambda: 1).result() == 1
+
+    def test_getitems_propagates_transform_error(self, create_dataset):
+        def transform(blob):
+            raise ValueError("transform error")
+
+        dataset = create_dataset(transform=transform, transform_threads=2)
+        with pytest.raises(ValueError, match="transform error"):
+            dataset.__getitems__([0, 1, 2])
+
+    @pytest.mark.parametrize(
+        "transform_threads,expected_exception",
+        [
+            (0, ValueError),
+            (-1, ValueError),
+            ("4", TypeError),
+            (True, TypeError),
+        ],
+    )
+    def test_raises_for_invalid_transform_threads(
+        self, create_dataset, transform_threads, expected_exception
+    ):
+        with pytest.raises(expected_exception, match="transform_threads"):
+            create_dataset(transform_threads=transform_threads)
+
+
+class TestPrefetchSampler:
+    @pytest.fixture
+    def dataset(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        return BlobDataset.from_blob_urls(data_sample_blob_urls)
+
+    @pytest.fixture
+    def pending_futures(self, data_sample_blob_clients):
+        # Prefetched downloads that do not complete unless explicitly resolved.
+        pending_futures = {}
+
+        def submit_download_side_effect(i):
+            def submit_download(offset, length):
+                future = Future()
+                pending_futures.setdefault(i, []).append(future)
+                return future
+
+            return submit_download
+
+        for i, client in enumerate(data_sample_blob_clients):
+            client.submit_download.side_effect = submit_download_side_effect(i)
+        return pending_futures
+
+    def get_prefetched_indices(self, data_sample_blob_clients):
+        return [
+            i
+            for i, client in enumerate(data_sample_blob_clients)
+            for _ in range(client.submit_download.call_count)
+        ]
+
+    def iter_retrieved_in_process(self, sampler, dataset):
+        # Data samples are only prefetched once a data sample for a returned index is retrieved
+        # in the same process.
+        iterator = iter(sampler)
+        dataset._get_blob(next(iterator))
+        return iterator
+
+    def test_yields_sampler_indices(
+        self, dataset, data_samples, data_sample_blob_clients
+    ):
+        indices = [4, 1, 8, 0]
+        sampler = PrefetchSampler(indices, dataset, prefetch=2)
+        assert [dataset[i] for i in sampler] == [data_samples[i] for i in indices]
+        # Only the first data sample is retrieved before prefetching starts.
+        data_sample_blob_clients[4].download.assert_called_once()
+        for client in data_sample_blob_clients[:4] + data_sample_blob_clients[5:]:
+            client.download.assert_not_called()
+        # The first indices of the next epoch are prefetched as well.
+        assert sorted(self.get_prefetched_indices(data_sample_blob_clients)) == [
+            0,
+            1,
+            1,
+            4,
+            8,
+        ]
+
+    def test_len(self, dataset):
+        sampler = PrefetchSampler(torch.utils.data.SequentialSampler(dataset), dataset)
+        assert len(sampler) == len(dataset)
+
+    def test_prefetches_ahead_of_consumer(
+        self, dataset, data_sample_blob_clients, pending_futures
+    ):
+        sampler = PrefetchSampler([9, 4, 1, 8, 0, 2], dataset, prefetch=3)
+        iterator = self.iter_retrieved_in_process(sampler, dataset)
+        assert next(iterator) == 4
+        assert self.get_prefetched_indices(data_sample_blob_clients) == [1, 4, 8]
+        dataset._get_blob(4)
+        assert next(iterator) == 1
+        assert self.get_prefetched_indices(data_sample_blob_clients) == [0, 1, 4, 8]
+
+    def test_window_bounds_unretrieved_prefetches(
+        self, dataset, data_sample_blob_clients
+    ):
+        # Indices are still returned when data samples are not retrieved from the dataset, but no
+        # more than the window of data samples are prefetched.
+        sampler = PrefetchSampler(range(10), dataset, prefetch=2)
+        iterator = self.iter_retrieved_in_process(sampler, dataset)
+        assert list(iterator) == list(range(1, 10))
+        assert self.get_prefetched_indices(data_sample_blob_clients) == [1, 2]
+
+    def test_does_not_prefetch_when_not_retrieved_in_process(
+        self, dataset, data_sample_blob_clients
+    ):
+        # With DataLoader worker processes, data samples are retrieved from copies of the dataset
+        # in the workers instead of the process iterating over the sampler.
+        sampler = PrefetchSampler(range(10), dataset, prefetch=2)
+        for _ in range(2):
+            assert list(sampler) == list(range(10))
+        assert self.get_prefetched_indices(data_sample_blob_clients) == []
+
+    def test_data_samples_retrieved_before_iterating_do_not_start_prefetching(
+        self, dataset, data_sample_blob_clients
+    ):
+        dataset[0]
+        sampler = PrefetchSampler(range(10), dataset, prefetch=2)
+        assert list(sampler) == list(range(10))
+        assert self.get_prefetched_indices(data_sample_blob_clients) == []
+
+    def test_default_window_is_max_in_flight_requests(
+        self, dataset, data_sample_blob_clients
+    ):
+        sampler = PrefetchSampler(range(10), dataset)
+        with mock.patch.object(_client.IO_SCHEDULER, "_max_in_flight_requests", 4):
+            next(self.iter_retrieved_in_process(sampler, dataset))
+        assert self.get_prefetched_indices(data_sample_blob_clients) == [1, 2, 3, 4]
+
+    def test_carries_window_across_epochs(
+        self, dataset, data_samples, data_sample_blob_clients
+    ):
+        epochs = iter([[0, 1, 2, 3], [7, 6, 5, 4], [9, 8]])
+        sampler = mock.MagicMock(torch.utils.data.Sampler)
+        sampler.__iter__.side_effect = lambda: iter(next(epochs))
+        prefetch_sampler = PrefetchSampler(sampler, dataset, prefetch=3)
+        assert [dataset[i] for i in prefetch_sampler] == data_samples[:4]
+        # The first indices of the next epoch are prefetched before the epoch starts.
+        assert self.get_prefetched_indices(data_sample_blob_clients) == [
+            1,
+            2,
+            3,
+            5,
+            6,
+            7,
+        ]
+        assert [dataset[i] for i in prefetch_sampler] == [
+            data_samples[i] for i in [7, 6, 5, 4]
+        ]
+        assert sampler.__iter__.call_count == 3
+        # Only the first data sample is retrieved before prefetching starts.
+        data_sample_blob_clients[0].download.assert_called_once()
+        for client in data_sample_blob_clients[1:]:
+            client.download.assert_not_called()
+
+    def test_set_epoch_keeps_next_epoch_drawn_for_same_epoch(self, dataset):
+        sampler = torch.utils.data.distributed.DistributedSampler(
+            dataset, num_replicas=1, rank=0
+        )
+        prefetch_sampler = PrefetchSampler(sampler, dataset, prefetch=3)
+        prefetch_sampler.set_epoch(0)
+        for i in prefetch_sampler:
+            dataset[i]
+        with mock.patch.object(
+            sampler, "__iter__", wraps=sampler.__iter__
+        ) as iter_patch:
+            prefetch_sampler.set_epoch(1)
+            epoch_indices = list(prefetch_sampler)
+            iter_patch.assert_not_called()
+        sampler.set_epoch(1)
+        assert epoch_indices == list(sampler)
+
+    def test_set_epoch_redraws_next_epoch_for_different_epoch(
+        self, dataset, pending_futures
+    ):
+        sampler = torch.utils.data.distributed.DistributedSampler(
+            dataset, num_replicas=1, rank=0
+        )
+        prefetch_sampler = PrefetchSampler(sampler, dataset, prefetch=3)
+        prefetch_sampler.set_epoch(0)
+        for i in prefetch_sampler:
+            for future in pending_futures.get(i, []):
+                future.set_result(b"")
+            dataset._get_blob(i)
+        next_epoch_futures = [
+            future
+            for futures in pending_futures.values()
+            for future in futures
+            if not future.done()
+        ]
+        assert len(next_epoch_futures) == 3
+        prefetch_sampler.set_epoch(5)
+        assert all(future.cancelled() for future in next_epoch_futures)
+        epoch_indices = list(prefetch_sampler)
+        sampler.set_epoch(5)
+        assert epoch_indices == list(sampler)
+
+    def test_set_epoch_without_sampler_support(self, dataset):
+        prefetch_sampler = PrefetchSampler([2, 1], dataset, prefetch=1)
+        prefetch_sampler.set_epoch(3)
+        assert list(prefetch_sampler) == [2, 1]
+
+    def test_skipped_indices_are_cancelled(self, dataset, pending_futures):
+        sampler = PrefetchSampler([9, 0, 1, 2, 3], dataset, prefetch=4)
+        iterator = self.iter_retrieved_in_process(sampler, dataset)
+        assert next(iterator) == 0
+        # Retrieving index 2 means 0 and 1 were skipped by the consumer.
+        dataset._get_blob(2)
+        assert pending_futures[0][0].cancelled()
+        assert pending_futures[1][0].cancelled()
+        assert not pending_futures[3][0].cancelled()
+
+    def test_retrieving_index_not_prefetched(
+        self, dataset, data_samples, pending_futures, data_sample_blob_clients
+    ):
+        sampler = PrefetchSampler([0, 1, 2], dataset, prefetch=2)
+        next(self.iter_retrieved_in_process(sampler, dataset))
+        assert dataset[9] == data_samples[9]
+        assert not any(
+            future.cancelled()
+            for futures in pending_futures.values()
+            for future in futures
+        )
+        data_sample_blob_clients[9].download.assert_called_once()
+
+    def test_data_loader(self, dataset, data_samples, data_sample_blob_clients):
+        sampler = PrefetchSampler(
+            torch.utils.data.RandomSampler(dataset), dataset, prefetch=4
+        )
+        loader = torch.utils.data.DataLoader(
+            dataset,
+            sampler=sampler,
+            batch_size=3,
+            collate_fn=lambda batch: batch,
+        )
+        for _ in range(2):
+            samples = [sample for batch in loader for sample in batch]
+            assert sorted(samples, key=lambda sample: sample["url"]) == sorted(
+                data_samples, key=lambda sample: sample["url"]
+            )
+        for client in data_sample_blob_clients:
+            client.download.assert_not_called()
+
+    def test_data_loader_with_workers_does_not_prefetch(
+        self, dataset, data_samples, data_sample_blob_clients
+    ):
+        sampler = PrefetchSampler(
+            torch.utils.data.RandomSampler(dataset), dataset, prefetch=4
+        )
+        loader = torch.utils.data.DataLoader(
+            dataset,
+            sampler=sampler,
+            batch_size=3,
+            collate_fn=lambda batch: batch,
+            num_workers=1,
+            multiprocessing_context="fork",
+        )
+        samples = [sample for batch in loader for sample in batch]
+        assert sorted(samples, key=lambda sample: sample["url"]) == sorted(
+            data_samples, key=lambda sample: sample["url"]
+        )
+        # Data samples are retrieved in the workers, so none are prefetched in this process.
+        assert self.get_prefetched_indices(data_sample_blob_clients) == []
+
+    def test_prefetched_blobs_not_pickled(self, dataset, pending_futures):
+        sampler = PrefetchSampler(range(10), dataset, prefetch=2)
+        next(self.iter_retrieved_in_process(sampler, dataset))
+        state = dataset.__getstate__()
+        assert len(state["_prefetched_blobs"]) == 0
+        assert dataset._get_num_prefetched() == 2
+
+    def test_discards_prefetched_blobs_from_parent_process(
+        self, dataset, data_samples, pending_futures, data_sample_blob_clients
+    ):
+        sampler = PrefetchSampler(range(10), dataset, prefetch=2)
+        next(self.iter_retrieved_in_process(sampler, dataset))
+        with mock.patch("os.getpid", return_value=-1):
+            # Prefetched downloads from the parent never complete in a forked child so they must
+            # not be waited on.
+            assert dataset[1] == data_samples[1]
+            assert dataset._get_num_prefetched() == 0
+        data_sample_blob_clients[1].download.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "prefetch,expected_exception",
+        [
+            (0, ValueError),
+            (-1, ValueError),
+            ("auto", TypeError),
+            (True, TypeError),
+        ],
+    )
+    def test_raises_for_invalid_prefetch(self, dataset, prefetch, expected_exception):
+        with pytest.raises(expected_exception, match="prefetch"):
+            PrefetchSampler(range(10), dataset, prefetch=prefetch)
+
 
 class TestIterableBlobDataset:
     def assert_expected_dataset_instantiation(
@@ -544,3 +1193,443 @@ class TestIterableBlobDataset:
             self.assert_expected_dataset(
                 dataset, expected_data_samples=expected_data_samples
             )
+
+    def test_async_iteration_from_container_url(
+        self,
+        container_url,
+        mock_async_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_async_blob_clients,
+    ):
+        mock_async_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = async_iter(
+            data_sample_async_blob_clients
+        )
+        credential = AzureSasCredential("sas")
+        dataset = IterableBlobDataset.from_container_url(
+            container_url, prefix="blob", credential=credential
+        )
+        assert asyncio.run(async_list(dataset)) == data_samples
+        mock_async_azstoragetorch_blob_client_factory.factory_cls.assert_called_once_with(
+            credential=credential
+        )
+        mock_async_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.assert_called_once_with(
+            container_url, prefix="blob"
+        )
+        mock_async_azstoragetorch_blob_client_factory.close.assert_awaited_once()
+
+    def test_async_iteration_from_blob_urls(
+        self,
+        data_sample_blob_urls,
+        mock_async_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_async_blob_clients,
+    ):
+        mock_async_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = data_sample_async_blob_clients
+        dataset = IterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        assert asyncio.run(async_list(dataset)) == data_samples
+        assert (
+            mock_async_azstoragetorch_blob_client_factory.get_blob_client_from_url.call_args_list
+            == [mock.call(url) for url in data_sample_blob_urls]
+        )
+        mock_async_azstoragetorch_blob_client_factory.close.assert_awaited_once()
+
+    @pytest.mark.parametrize("is_async_transform", [True, False])
+    def test_async_iteration_with_transform(
+        self,
+        data_sample_blob_urls,
+        mock_async_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_async_blob_clients,
+        is_async_transform,
+    ):
+        mock_async_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = data_sample_async_blob_clients
+
+        if is_async_transform:
+
+            async def transform(blob):
+                async with blob.async_reader() as f:
+                    return await f.read()
+        else:
+
+            def transform(blob):
+                return blob.url
+
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=transform
+        )
+        expected_key = "data" if is_async_transform else "url"
+        assert asyncio.run(async_list(dataset)) == [
+            sample[expected_key] for sample in data_samples
+        ]
+
+    def test_async_iteration_worker_sharding(
+        self,
+        data_sample_blob_urls,
+        mock_async_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_async_blob_clients,
+    ):
+        mock_async_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = data_sample_async_blob_clients
+        dataset = IterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        with mock.patch(
+            "torch.utils.data.get_worker_info", spec=True
+        ) as mock_get_worker_info:
+            mock_get_worker_info.return_value = mock.Mock(id=1, num_workers=4)
+            assert asyncio.run(async_list(dataset)) == [
+                data_samples[i] for i in [1, 5, 9]
+            ]
+
+    def test_async_iteration_closes_factory_on_error(
+        self,
+        data_sample_blob_urls,
+        mock_async_azstoragetorch_blob_client_factory,
+        data_sample_async_blob_clients,
+    ):
+        mock_async_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = data_sample_async_blob_clients
+
+        def transform(blob):
+            raise ValueError("transform error")
+
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=transform
+        )
+        with pytest.raises(ValueError, match="transform error"):
+            asyncio.run(async_list(dataset))
+        mock_async_azstoragetorch_blob_client_factory.close.assert_awaited_once()
+
+    @pytest.mark.parametrize("prefetch", [1, 3, "auto"])
+    def test_prefetch(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+        prefetch,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, prefetch=prefetch
+        )
+        assert list(dataset) == data_samples
+        for client in data_sample_blob_clients:
+            client.submit_download.assert_called_once_with(0, 8 * 1024 * 1024)
+            client.download.assert_not_called()
+
+    def test_prefetch_blobs_larger_than_prefetched_range(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(data_sample_blob_urls, prefetch=2)
+        with mock.patch("azstoragetorch.datasets._PREFETCH_RANGE_SIZE", 2):
+            assert list(dataset) == data_samples
+        for client in data_sample_blob_clients:
+            client.submit_download.assert_called_once_with(0, 2)
+            # Only the rest of the blob is downloaded after the prefetched range.
+            client.download_into.assert_called_once_with(mock.ANY, offset=2)
+            client.download.assert_not_called()
+
+    def test_prefetch_from_container_url(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = data_sample_blob_clients
+        dataset = IterableBlobDataset.from_container_url(container_url, prefetch=2)
+        assert list(dataset) == data_samples
+        for client in data_sample_blob_clients:
+            client.download.assert_not_called()
+
+    def test_prefetch_downloads_ahead_of_consumer(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(data_sample_blob_urls, prefetch=3)
+        iterator = iter(dataset)
+        assert next(iterator) == data_samples[0]
+        # The first blob and the three blobs after it are prefetched.
+        assert [
+            client.submit_download.called for client in data_sample_blob_clients
+        ] == [True] * 4 + [False] * 6
+
+    def test_prefetch_window_capped_at_max_in_flight_requests(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, prefetch=100
+        )
+        with mock.patch.object(_client.IO_SCHEDULER, "_max_in_flight_requests", 2):
+            next(iter(dataset))
+        assert [
+            client.submit_download.called for client in data_sample_blob_clients
+        ] == [True] * 3 + [False] * 7
+
+    def test_auto_prefetch_grows_when_consumer_waits(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        pending_futures = []
+
+        def submit_download(offset, length):
+            future = Future()
+            pending_futures.append(future)
+            return future
+
+        for client in data_sample_blob_clients:
+            client.submit_download.side_effect = submit_download
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+
+        def transform(blob):
+            return blob.url
+
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=transform, prefetch="auto"
+        )
+        iterator = iter(dataset)
+        next(iterator)
+        # The first blob was not yet downloaded when consumed so the window doubles from 2 to 4.
+        assert len(pending_futures) == 5
+        for future in pending_futures:
+            future.set_result(b"")
+        next(iterator)
+        # Prefetches were complete for the next blob so the window stays the same.
+        assert len(pending_futures) == 6
+
+    def test_prefetch_with_worker_sharding(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(data_sample_blob_urls, prefetch=4)
+        with mock.patch(
+            "torch.utils.data.get_worker_info", spec=True
+        ) as mock_get_worker_info:
+            mock_get_worker_info.return_value = mock.Mock(id=1, num_workers=4)
+            assert list(dataset) == [data_samples[i] for i in [1, 5, 9]]
+        assert [
+            i
+            for i, client in enumerate(data_sample_blob_clients)
+            if client.submit_download.called
+        ] == [1, 5, 9]
+
+    def test_prefetch_cancelled_when_iteration_stops(
+        self,
+        data_sample_blob_urls,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_clients,
+    ):
+        pending_futures = []
+
+        def submit_download(offset, length):
+            future = Future()
+            pending_futures.append(future)
+            return future
+
+        for client in data_sample_blob_clients:
+            client.submit_download.side_effect = submit_download
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=lambda blob: blob.url, prefetch=2
+        )
+        iterator = iter(dataset)
+        next(iterator)
+        iterator.close()
+        assert [future.cancelled() for future in pending_futures] == [
+            False,
+            True,
+            True,
+        ]
+
+    @pytest.mark.parametrize(
+        "prefetch,expected_exception",
+        [
+            (0, ValueError),
+            (-1, ValueError),
+            ("all", TypeError),
+            (1.5, TypeError),
+            (True, TypeError),
+        ],
+    )
+    def test_raises_for_invalid_prefetch(
+        self, data_sample_blob_urls, prefetch, expected_exception
+    ):
+        with pytest.raises(expected_exception, match="prefetch"):
+            IterableBlobDataset.from_blob_urls(data_sample_blob_urls, prefetch=prefetch)
+
+
+class TestIterableBlobDatasetTransformThreads:
+    @pytest.fixture
+    def create_dataset(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+
+        def _create_dataset(**kwargs):
+            return IterableBlobDataset.from_blob_urls(data_sample_blob_urls, **kwargs)
+
+        return _create_dataset
+
+    @pytest.mark.parametrize("prefetch", [None, 2])
+    def test_transform_threads(self, create_dataset, data_samples, prefetch):
+        dataset = create_dataset(transform_threads=3, prefetch=prefetch)
+        assert list(dataset) == data_samples
+
+    def test_transforms_concurrently(self, create_dataset, data_sample_blob_urls):
+        barrier = threading.Barrier(4, timeout=10)
+        transform_threads = set()
+
+        def transform(blob):
+            transform_threads.add(threading.current_thread())
+            # The first four blobs are only returned once their transforms run at the same time.
+            if blob.url in data_sample_blob_urls[:4]:
+                barrier.wait()
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=4)
+        assert list(dataset) == data_sample_blob_urls
+        assert threading.current_thread() not in transform_threads
+
+    def test_ordered_waits_for_earlier_blobs(
+        self, create_dataset, data_sample_blob_urls
+    ):
+        second_transformed = threading.Event()
+
+        def transform(blob):
+            if blob.url == data_sample_blob_urls[0]:
+                assert second_transformed.wait(timeout=10)
+            elif blob.url == data_sample_blob_urls[1]:
+                second_transformed.set()
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=2)
+        assert list(dataset) == data_sample_blob_urls
+
+    def test_unordered_returns_outputs_as_completed(
+        self, create_dataset, data_sample_blob_urls
+    ):
+        first_returned = threading.Event()
+
+        def transform(blob):
+            if blob.url == data_sample_blob_urls[0]:
+                assert first_returned.wait(timeout=10)
+            return blob.url
+
+        dataset = create_dataset(
+            transform=transform, transform_threads=2, transform_order="unordered"
+        )
+        iterator = iter(dataset)
+        # The first blob's transform does not complete until another output is returned.
+        first_output = next(iterator)
+        assert first_output != data_sample_blob_urls[0]
+        first_returned.set()
+        outputs = [first_output] + list(iterator)
+        assert sorted(outputs) == sorted(data_sample_blob_urls)
+
+    def test_bounds_transforms_submitted_ahead_of_consumer(
+        self, create_dataset, data_sample_blob_urls
+    ):
+        transformed = []
+        lock = threading.Lock()
+
+        def transform(blob):
+            with lock:
+                transformed.append(blob.url)
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=2)
+        iterator = iter(dataset)
+        assert next(iterator) == data_sample_blob_urls[0]
+        iterator.close()
+        # At most twice as many blobs as threads are submitted, plus one more once the first output
+        # is returned.
+        assert len(transformed) <= 5 < len(data_sample_blob_urls)
+
+    def test_propagates_transform_error(self, create_dataset):
+        def transform(blob):
+            raise ValueError("transform error")
+
+        dataset = create_dataset(transform=transform, transform_threads=2)
+        with pytest.raises(ValueError, match="transform error"):
+            list(dataset)
+
+    def test_reuses_transform_threads_across_iterations(
+        self,
+        create_dataset,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        transform_threads = set()
+
+        def transform(blob):
+            transform_threads.add(threading.current_thread())
+            return blob.url
+
+        dataset = create_dataset(transform=transform, transform_threads=2)
+        # Blob clients are created for each iteration.
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            itertools.cycle(data_sample_blob_clients)
+        )
+        for _ in range(3):
+            assert list(dataset) == data_sample_blob_urls
+        assert len(transform_threads) <= 2
+
+    def test_worker_sharding(self, create_dataset, data_samples):
+        dataset = create_dataset(transform_threads=2)
+        with mock.patch(
+            "torch.utils.data.get_worker_info", spec=True
+        ) as mock_get_worker_info:
+            mock_get_worker_info.return_value = mock.Mock(id=0, num_workers=3)
+            assert list(dataset) == [data_samples[i] for i in [0, 3, 6, 9]]
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_exception,match",
+        [
+            ({"transform_threads": 0}, ValueError, "transform_threads"),
+            ({"transform_threads": 1.0}, TypeError, "transform_threads"),
+            ({"transform_order": "random"}, ValueError, "transform_order"),
+        ],
+    )
+    def test_raises_for_invalid_arguments(
+        self, create_dataset, kwargs, expected_exception, match
+    ):
+        with pytest.raises(expected_exception, match=match):
+            create_dataset(**kwargs)
@@ -4,26 +4,35 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import asyncio
 from concurrent.futures import Future
 import io
+import mmap
 import os
 import random
 import string
 from unittest import mock
+import zipfile
+
 import pytest
+import torch
 
 from azure.core.credentials import AzureSasCredential
 from azure.core.exceptions import AzureError
 from azure.identity import DefaultAzureCredential
 
 from azstoragetorch.exceptions import FatalBlobIOWriteError
-from azstoragetorch.io import BlobIO
-from azstoragetorch._client import AzStorageTorchBlobClient
+from azstoragetorch.io import AsyncBlobIO, BlobIO
+from azstoragetorch._aio_client import AsyncAzStorageTorchBlobClient
+from azstoragetorch._client import AzStorageTorchBlobClient, REQUEST_HEDGER
 from tests.unit.utils import random_bytes
 
 
 EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE = 4 * 1024 * 1024
 EXPECTED_FLUSH_THRESHOLD = 32 * 1024 * 1024
+EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE = 256 * 1024
+EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE = 8 * 1024 * 1024
+EXPECTED_MAX_ZIP_END_OF_CENTRAL_DIRECTORY_SIZE = 22 + 65535 + 20 + 56
 
 
 @pytest.fixture
@@ -31,17 +40,23 @@ def mock_azstoragetorch_blob_client(blob_content, blob_length):
     mock_blob_client = mock.Mock(AzStorageTorchBlobClient)
     mock_blob_client.get_blob_size.return_value = blob_length
     mock_blob_client.download.return_value = blob_content
+    mock_blob_client.download_into.side_effect = download_into_side_effect(blob_content)
+    mock_blob_client.submit_download.side_effect = submit_download_side_effect(
+        blob_content
+    )
+    mock_blob_client.iter_chunks.side_effect = iter_chunks_side_effect(blob_content)
     mock_blob_client.stage_blocks.return_value = []
     return mock_blob_client
 
 
 @pytest.fixture
 def create_blob_io(blob_url, mock_azstoragetorch_blob_client):
-    def _create_blob_io(url=blob_url, mode="rb"):
+    def _create_blob_io(url=blob_url, mode="rb", **kwargs):
         return BlobIO(
             url,
             mode=mode,
             _azstoragetorch_blob_client=mock_azstoragetorch_blob_client,
+            **kwargs,
         )
 
     return _create_blob_io
@@ -68,6 +83,67 @@ def writable_blob_io(create_blob_io):
         pass
 
 
+def download_into_side_effect(content):
+    def _download_into(buffer, offset=0, length=None):
+        if length is None:
+            length = len(buffer)
+        downloaded = content[offset : offset + length]
+        memoryview(buffer).cast("B")[: len(downloaded)] = downloaded
+        return len(downloaded)
+
+    return _download_into
+
+
+def submit_download_side_effect(content):
+    def _submit_download(offset, length):
+        future = Future()
+        future.set_result(content[offset : offset + length])
+        return future
+
+    return _submit_download
+
+
+def iter_chunks_side_effect(content, chunk_size=4):
+    def _iter_chunks(offset=0, length=None):
+        end = len(content) if length is None else min(offset + length, len(content))
+        for pos in range(offset, end, chunk_size):
+            yield content[pos : min(pos + chunk_size, end)]
+
+    return _iter_chunks
+
+
+def set_blob_content(mock_azstoragetorch_blob_client, content):
+    mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+    mock_azstoragetorch_blob_client.download.side_effect = (
+        lambda offset=0, length=None: content[
+            offset : None if length is None else offset + length
+        ]
+    )
+    mock_azstoragetorch_blob_client.download_into.side_effect = (
+        download_into_side_effect(content)
+    )
+    mock_azstoragetorch_blob_client.submit_download.side_effect = (
+        submit_download_side_effect(content)
+    )
+    mock_azstoragetorch_blob_client.iter_chunks.side_effect = iter_chunks_side_effect(
+        content
+    )
+
+
+def create_zip_content(num_files, file_size):
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, "w") as zf:
+        for i in range(num_files):
+            zf.writestr(f"archive/data/{i}", random_bytes(file_size))
+    return content.getvalue()
+
+
+def create_torch_checkpoint_content(state_dict):
+    content = io.BytesIO()
+    torch.save(state_dict, content)
+    return content.getvalue()
+
+
 def random_ascii_letter_bytes(size):
     return "".join(random.choices(string.ascii_letters, k=size)).encode("utf-8")
 
@@ -107,6 +183,76 @@ class TestBlobIO:
                 blob_url
             )
 
+    def test_reuses_blob_client_factory(self, blob_url, container_url):
+        with mock.patch(
+            "azstoragetorch._client.AzStorageTorchBlobClientFactory", spec=True
+        ) as mock_factory:
+            BlobIO(blob_url, "rb")
+            BlobIO(f"{container_url}/other-blob", "rb")
+            mock_factory.assert_called_once_with(credential=None)
+            assert (
+                mock_factory.return_value.get_blob_client_from_url.call_args_list
+                == [
+                    mock.call(blob_url),
+                    mock.call(f"{container_url}/other-blob"),
+                ]
+            )
+
+    def test_partition_size(self, blob_url):
+        with mock.patch(
+            "azstoragetorch._client.AzStorageTorchBlobClientFactory", spec=True
+        ) as mock_factory:
+            BlobIO(blob_url, "rb", partition_size=4)
+            get_blob_client_mock = mock_factory.return_value.get_blob_client_from_url
+            get_blob_client_mock.assert_called_once_with(
+                blob_url, partition_planner=mock.ANY
+            )
+            partition_planner = get_blob_client_mock.call_args.kwargs[
+                "partition_planner"
+            ]
+            assert partition_planner.plan(0, 10, 32) == [(0, 4), (4, 4), (8, 2)]
+
+    def test_speculative_partitions(self, blob_url):
+        with mock.patch(
+            "azstoragetorch._client.AzStorageTorchBlobClientFactory", spec=True
+        ) as mock_factory:
+            BlobIO(blob_url, "rb", partition_size=4, speculative_partitions=3)
+            get_blob_client_mock = mock_factory.return_value.get_blob_client_from_url
+            partition_planner = get_blob_client_mock.call_args.kwargs[
+                "partition_planner"
+            ]
+            assert partition_planner.plan_unknown_size(0) == [(0, 4), (4, 4), (8, 4)]
+
+    @pytest.mark.parametrize(
+        "hedge_requests,expected_client_kwargs",
+        [
+            (False, {}),
+            (True, {"request_hedger": REQUEST_HEDGER}),
+        ],
+    )
+    def test_hedge_requests(self, blob_url, hedge_requests, expected_client_kwargs):
+        with mock.patch(
+            "azstoragetorch._client.AzStorageTorchBlobClientFactory", spec=True
+        ) as mock_factory:
+            BlobIO(blob_url, "rb", hedge_requests=hedge_requests)
+            mock_factory.return_value.get_blob_client_from_url.assert_called_once_with(
+                blob_url, **expected_client_kwargs
+            )
+
+    @pytest.mark.parametrize("speculative_partitions", [0, -1])
+    def test_raises_for_invalid_speculative_partitions(
+        self, blob_url, speculative_partitions
+    ):
+        with pytest.raises(
+            ValueError, match="Speculative partitions must be at least 1"
+        ):
+            BlobIO(blob_url, "rb", speculative_partitions=speculative_partitions)
+
+    @pytest.mark.parametrize("partition_size", [0, -1])
+    def test_raises_for_invalid_partition_size(self, blob_url, partition_size):
+        with pytest.raises(ValueError, match="Partition size must be greater than 0"):
+            BlobIO(blob_url, "rb", partition_size=partition_size)
+
     @pytest.mark.parametrize(
         "unsupported_mode",
         [
@@ -136,6 +282,7 @@ class TestBlobIO:
         [
             ("rb", "write", [b""]),
             ("wb", "read", []),
+            ("wb", "readinto", [bytearray(1)]),
             ("wb", "readline", []),
             ("wb", "seek", [0]),
         ],
@@ -224,6 +371,7 @@ class TestBlobIO:
             ("isatty", [], "rb"),
             ("flush", [], "wb"),
             ("read", [], "rb"),
+            ("readinto", [bytearray(1)], "rb"),
             ("readable", [], "rb"),
             ("readline", [], "rb"),
             ("seek", [1], "rb"),
@@ -306,17 +454,19 @@ class TestBlobIO:
     ):
         mock_azstoragetorch_blob_client.download.side_effect = [
             blob_content[:1],
-            blob_content[1:2],
             blob_content[2:],
         ]
         assert blob_io.read(1) == blob_content[:1]
+        # Second read is sequential so it is served from read-ahead
         assert blob_io.read(1) == blob_content[1:2]
         assert blob_io.read() == blob_content[2:]
         assert mock_azstoragetorch_blob_client.download.call_args_list == [
             mock.call(offset=0, length=1),
-            mock.call(offset=1, length=1),
             mock.call(offset=2, length=None),
         ]
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            1, len(blob_content) - 1
+        )
         assert blob_io.tell() == len(blob_content)
 
     def test_read_after_seek(
@@ -368,6 +518,359 @@ class TestBlobIO:
         with pytest.raises(ValueError, match="must be greater than or equal to -1"):
             blob_io.read(-2)
 
+    @pytest.mark.parametrize(
+        "create_buffer",
+        [
+            bytearray,
+            lambda size: memoryview(bytearray(size)),
+            lambda size: mmap.mmap(-1, size),
+        ],
+    )
+    def test_readinto(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client, create_buffer
+    ):
+        buffer = create_buffer(len(blob_content))
+        assert blob_io.readinto(buffer) == len(blob_content)
+        assert bytes(buffer) == blob_content
+        assert blob_io.tell() == len(blob_content)
+        mock_azstoragetorch_blob_client.download_into.assert_called_once_with(
+            mock.ANY, offset=0, length=len(blob_content)
+        )
+        mock_azstoragetorch_blob_client.download.assert_not_called()
+
+    def test_readinto_multiple_times(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client
+    ):
+        first = bytearray(4)
+        second = bytearray(len(blob_content))
+        assert blob_io.readinto(first) == 4
+        assert blob_io.readinto(second) == len(blob_content) - 4
+        assert first == blob_content[:4]
+        assert second[: len(blob_content) - 4] == blob_content[4:]
+        assert blob_io.tell() == len(blob_content)
+        mock_azstoragetorch_blob_client.download_into.assert_called_once_with(
+            mock.ANY, offset=0, length=4
+        )
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            4, len(blob_content) - 4
+        )
+
+    def test_readinto_beyond_end(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client
+    ):
+        blob_io.seek(0, os.SEEK_END)
+        assert blob_io.readinto(bytearray(1)) == 0
+        mock_azstoragetorch_blob_client.download_into.assert_not_called()
+
+    def test_readinto_empty_buffer(self, blob_io, mock_azstoragetorch_blob_client):
+        assert blob_io.readinto(bytearray()) == 0
+        assert blob_io.tell() == 0
+        mock_azstoragetorch_blob_client.download_into.assert_not_called()
+
+    def test_readinto1(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        buffer = bytearray(len(blob_content))
+        assert blob_io.readinto1(buffer) == len(blob_content)
+        assert buffer == blob_content
+        assert blob_io.tell() == len(blob_content)
+
+    def test_readall(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        assert blob_io.readall() == blob_content
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=None
+        )
+
+    def test_iter_chunks(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        chunks = blob_io.iter_chunks()
+        assert next(chunks) == blob_content[:4]
+        assert blob_io.tell() == 4
+        assert list(chunks) == [blob_content[4:8], blob_content[8:]]
+        assert blob_io.tell() == len(blob_content)
+        assert blob_io.read() == b""
+        mock_azstoragetorch_blob_client.iter_chunks.assert_called_once_with(offset=0)
+
+    def test_iter_chunks_from_current_position(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client
+    ):
+        blob_io.seek(2)
+        assert b"".join(blob_io.iter_chunks()) == blob_content[2:]
+        mock_azstoragetorch_blob_client.iter_chunks.assert_called_once_with(offset=2)
+
+    def test_iter_chunks_at_end_of_blob(self, blob_io, blob_content):
+        blob_io.seek(0, os.SEEK_END)
+        assert list(blob_io.iter_chunks()) == []
+        assert blob_io.tell() == len(blob_content)
+
+    def test_iter_chunks_after_readline(self, blob_io, blob_content):
+        assert blob_io.readline() == blob_content
+        blob_io.seek(5)
+        assert b"".join(blob_io.iter_chunks()) == blob_content[5:]
+
+    def test_iter_chunks_with_prefetch(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = create_zip_content(num_files=10, file_size=64 * 1024)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        blob_io = create_blob_io(prefetch="zip")
+        blob_io.seek(10)
+        with mock.patch.object(BlobIO, "_PREFETCHED_CHUNK_SIZE", 1024):
+            chunks = list(blob_io.iter_chunks())
+        assert b"".join(chunks) == content[10:]
+        assert all(len(chunk) <= 1024 for chunk in chunks)
+        assert blob_io.tell() == len(content)
+        mock_azstoragetorch_blob_client.iter_chunks.assert_not_called()
+
+    def test_iter_chunks_raises_when_closed(self, blob_io):
+        blob_io.close()
+        with pytest.raises(ValueError, match="I/O operation on closed file"):
+            blob_io.iter_chunks()
+
+    def test_iter_chunks_raises_in_write_mode(self, create_blob_io):
+        blob_io = create_blob_io(mode="wb")
+        with pytest.raises(io.UnsupportedOperation, match="read"):
+            blob_io.iter_chunks()
+
+    def test_buffered_reader(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client
+    ):
+        buffered_reader = io.BufferedReader(blob_io)
+        assert buffered_reader.read(1) == blob_content[:1]
+        assert buffered_reader.read(2) == blob_content[1:3]
+        assert buffered_reader.seek(5) == 5
+        assert buffered_reader.read() == blob_content[5:]
+        buffered_reader.close()
+        assert blob_io.closed
+
+    def test_sequential_reads_use_read_ahead(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(4 * EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        read_size = 1024
+        for i in range(len(content) // read_size):
+            assert (
+                blob_io.read(read_size) == content[i * read_size : (i + 1) * read_size]
+            )
+        assert blob_io.read(read_size) == b""
+        assert blob_io.tell() == len(content)
+        # Only the first read goes directly to the blob. All subsequent reads are served
+        # from read-ahead windows that double in size.
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=read_size
+        )
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
+            mock.call(read_size, EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE),
+            mock.call(
+                read_size + EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE,
+                2 * EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE,
+            ),
+            mock.call(
+                read_size + 3 * EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE,
+                EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE - read_size,
+            ),
+        ]
+
+    def test_read_ahead_window_capped_at_max_size(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(4 * EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        read_size = 64 * 1024
+        for _ in range(len(content) // read_size):
+            blob_io.read(read_size)
+        window_sizes = [
+            call.args[1]
+            for call in mock_azstoragetorch_blob_client.submit_download.call_args_list
+        ]
+        assert max(window_sizes) == EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE
+        assert sum(window_sizes) == len(content) - read_size
+
+    def test_random_reads_do_not_use_read_ahead(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        for offset in [512, 0, 768, 256]:
+            blob_io.seek(offset)
+            assert blob_io.read(10) == content[offset : offset + 10]
+        assert mock_azstoragetorch_blob_client.download.call_count == 4
+        mock_azstoragetorch_blob_client.submit_download.assert_not_called()
+
+    def test_seek_within_read_ahead_window(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(10)
+        blob_io.read(10)
+        blob_io.seek(500)
+        assert blob_io.read(10) == content[500:510]
+        blob_io.seek(100)
+        assert blob_io.read(10) == content[100:110]
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=10
+        )
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            10, len(content) - 10
+        )
+
+    def test_large_sequential_reads_bypass_read_ahead(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(2 * EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        assert (
+            blob_io.read(EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE)
+            == (content[:EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE])
+        )
+        assert (
+            blob_io.read(EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE)
+            == (content[EXPECTED_MAX_READ_AHEAD_WINDOW_SIZE:])
+        )
+        assert mock_azstoragetorch_blob_client.download.call_count == 2
+        mock_azstoragetorch_blob_client.submit_download.assert_not_called()
+
+    def test_read_ahead_propagates_download_errors(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        failed_future = Future()
+        failed_future.set_exception(AzureError("error"))
+        mock_azstoragetorch_blob_client.submit_download.side_effect = [failed_future]
+        blob_io.read(10)
+        with pytest.raises(AzureError):
+            blob_io.read(10)
+        assert blob_io.tell() == 10
+
+    def test_close_cancels_pending_read_ahead(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(4 * EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        pending_futures = []
+
+        def submit_download(offset, length):
+            future = Future()
+            if not pending_futures:
+                future.set_result(content[offset : offset + length])
+            pending_futures.append(future)
+            return future
+
+        mock_azstoragetorch_blob_client.submit_download.side_effect = submit_download
+        blob_io.read(10)
+        blob_io.read(10)
+        assert len(pending_futures) == 2
+        blob_io.close()
+        assert pending_futures[1].cancelled()
+
+    def test_buffered_reader_uses_read_ahead(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(EXPECTED_INITIAL_READ_AHEAD_WINDOW_SIZE)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        buffered_reader = io.BufferedReader(blob_io)
+        chunks = []
+        while chunk := buffered_reader.read(100):
+            chunks.append(chunk)
+        assert b"".join(chunks) == content
+        mock_azstoragetorch_blob_client.download_into.assert_called_once()
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once()
+
+    def test_prefetch_zip(self, create_blob_io, mock_azstoragetorch_blob_client):
+        content = create_zip_content(num_files=10, file_size=64 * 1024)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        tail_offset = len(content) - EXPECTED_MAX_ZIP_END_OF_CENTRAL_DIRECTORY_SIZE
+        blob_io = create_blob_io(prefetch="zip")
+        assert blob_io.read(10) == content[:10]
+        blob_io.seek(-100, os.SEEK_END)
+        assert blob_io.read(50) == content[-100:-50]
+        blob_io.seek(5000)
+        buffer = bytearray(100)
+        assert blob_io.readinto(buffer) == 100
+        assert buffer == content[5000:5100]
+        assert blob_io.read() == content[5100:]
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=tail_offset
+        )
+        mock_azstoragetorch_blob_client.download_into.assert_called_once_with(
+            mock.ANY, offset=0
+        )
+        assert (
+            len(mock_azstoragetorch_blob_client.download_into.call_args[0][0])
+            == tail_offset
+        )
+        mock_azstoragetorch_blob_client.submit_download.assert_not_called()
+
+    def test_prefetch_zip_smaller_than_end_of_central_directory(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = create_zip_content(num_files=2, file_size=10)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        blob_io = create_blob_io(prefetch="zip")
+        assert blob_io.read() == content
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(offset=0)
+
+    def test_prefetch_zip_readline(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = create_zip_content(num_files=2, file_size=10)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        blob_io = create_blob_io(prefetch="zip")
+        assert blob_io.readlines() == io.BytesIO(content).readlines()
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(offset=0)
+
+    def test_prefetch_zip_falls_back_for_non_zip_blob(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(2 * EXPECTED_MAX_ZIP_END_OF_CENTRAL_DIRECTORY_SIZE)
+        set_blob_content(mock_azstoragetorch_blob_client, content)
+        blob_io = create_blob_io(prefetch="zip")
+        assert blob_io.read(10) == content[:10]
+        assert mock_azstoragetorch_blob_client.download.call_args_list == [
+            mock.call(
+                offset=len(content) - EXPECTED_MAX_ZIP_END_OF_CENTRAL_DIRECTORY_SIZE
+            ),
+            mock.call(offset=0, length=10),
+        ]
+        mock_azstoragetorch_blob_client.download_into.assert_not_called()
+
+    def test_prefetch_zip_with_torch_load(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        state_dict = {f"layer{i}.weight": torch.rand(64, 64) for i in range(20)}
+        set_blob_content(
+            mock_azstoragetorch_blob_client,
+            create_torch_checkpoint_content(state_dict),
+        )
+        with create_blob_io(prefetch="zip") as f:
+            loaded_state_dict = torch.load(f)
+        assert loaded_state_dict.keys() == state_dict.keys()
+        for key in state_dict:
+            assert torch.equal(loaded_state_dict[key], state_dict[key])
+        assert mock_azstoragetorch_blob_client.download.call_count == 1
+        assert mock_azstoragetorch_blob_client.download_into.call_count == 1
+
+    def test_torch_load_without_prefetch(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        state_dict = {f"layer{i}.weight": torch.rand(64, 64) for i in range(20)}
+        set_blob_content(
+            mock_azstoragetorch_blob_client,
+            create_torch_checkpoint_content(state_dict),
+        )
+        loaded_state_dict = torch.load(blob_io)
+        assert loaded_state_dict.keys() == state_dict.keys()
+        for key in state_dict:
+            assert torch.equal(loaded_state_dict[key], state_dict[key])
+
+    def test_raises_for_unsupported_prefetch(self, create_blob_io):
+        with pytest.raises(ValueError, match="Unsupported prefetch"):
+            create_blob_io(prefetch="unknown")
+
+    def test_raises_for_prefetch_in_write_mode(self, create_blob_io):
+        with pytest.raises(ValueError, match="only supported in read mode"):
+            create_blob_io(mode="wb", prefetch="zip")
+
     @pytest.mark.parametrize(
         "lines",
         [
@@ -974,3 +1477,316 @@ class TestBlobIO:
         writable_blob_io.flush()
         with pytest.raises(RuntimeError, match="duplicate block IDs"):
             writable_blob_io.close()
+
+
+@pytest.fixture
+def mock_async_azstoragetorch_blob_client(blob_content, blob_length):
+    mock_blob_client = mock.Mock(AsyncAzStorageTorchBlobClient)
+    mock_blob_client.get_blob_size.return_value = blob_length
+    mock_blob_client.download.side_effect = async_download_side_effect(blob_content)
+    mock_blob_client.download_into.side_effect = async_download_into_side_effect(
+        blob_content
+    )
+    mock_blob_client.stage_blocks.return_value = []
+    return mock_blob_client
+
+
+@pytest.fixture
+def create_async_blob_io(blob_url, mock_async_azstoragetorch_blob_client):
+    def _create_async_blob_io(url=blob_url, mode="rb", **kwargs):
+        return AsyncBlobIO(
+            url,
+            mode=mode,
+            _azstoragetorch_blob_client=mock_async_azstoragetorch_blob_client,
+            **kwargs,
+        )
+
+    return _create_async_blob_io
+
+
+def async_download_side_effect(content):
+    async def _download(offset=0, length=None):
+        if length is None:
+            return content[offset:]
+        return content[offset : offset + length]
+
+    return _download
+
+
+def async_download_into_side_effect(content):
+    async def _download_into(buffer, offset=0, length=None):
+        read_content = content[offset : offset + len(buffer)]
+        buffer[: len(read_content)] = read_content
+        return len(read_content)
+
+    return _download_into
+
+
+def add_async_stage_blocks_results(mock_blob_client, *stage_blocks_results):
+    # Each stage_blocks() call returns tasks that resolve, in order, to the block IDs or
+    # exceptions in one of the provided lists.
+    results = list(stage_blocks_results)
+
+    async def _result(result):
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def _stage_blocks(data):
+        return [asyncio.ensure_future(_result(result)) for result in results.pop(0)]
+
+    mock_blob_client.stage_blocks.side_effect = _stage_blocks
+
+
+class TestAsyncBlobIO:
+    def test_uses_async_blob_client_factory_cache(self, blob_url):
+        with mock.patch(
+            "azstoragetorch._aio_client.ASYNC_BLOB_CLIENT_FACTORY_CACHE"
+        ) as mock_cache:
+            blob_io = AsyncBlobIO(blob_url, "rb", credential=False)
+        assert blob_io._client is mock_cache.get_blob_client_from_url.return_value
+        mock_cache.get_blob_client_from_url.assert_called_once_with(blob_url, False)
+
+    def test_partition_size(self, blob_url):
+        with mock.patch(
+            "azstoragetorch._aio_client.ASYNC_BLOB_CLIENT_FACTORY_CACHE"
+        ) as mock_cache:
+            AsyncBlobIO(blob_url, "rb", partition_size=4)
+        planner = mock_cache.get_blob_client_from_url.call_args.kwargs[
+            "partition_planner"
+        ]
+        assert planner.plan(0, 10, 32) == [(0, 4), (4, 4), (8, 2)]
+
+    @pytest.mark.parametrize("unsupported_mode", ["r", "w", "ab", "rb+", "wb+"])
+    def test_raises_for_unsupported_mode(self, create_async_blob_io, unsupported_mode):
+        with pytest.raises(ValueError, match="Unsupported mode"):
+            create_async_blob_io(mode=unsupported_mode)
+
+    def test_read(
+        self, create_async_blob_io, blob_content, mock_async_azstoragetorch_blob_client
+    ):
+        async def read():
+            async with create_async_blob_io() as blob_io:
+                content = await blob_io.read()
+                assert blob_io.tell() == len(blob_content)
+                assert await blob_io.read() == b""
+            return content
+
+        assert asyncio.run(read()) == blob_content
+        mock_async_azstoragetorch_blob_client.download.assert_awaited_once_with(
+            offset=0, length=None
+        )
+
+    def test_read_with_size(self, create_async_blob_io, blob_content):
+        async def read():
+            blob_io = create_async_blob_io()
+            return await blob_io.read(2), await blob_io.read(3), blob_io.tell()
+
+        assert asyncio.run(read()) == (blob_content[:2], blob_content[2:5], 5)
+
+    def test_read_size_zero(
+        self, create_async_blob_io, mock_async_azstoragetorch_blob_client
+    ):
+        assert asyncio.run(create_async_blob_io().read(0)) == b""
+        mock_async_azstoragetorch_blob_client.download.assert_not_called()
+
+    def test_read_raises_for_less_than_negative_one_size(self, create_async_blob_io):
+        with pytest.raises(ValueError, match="must be greater than or equal to -1"):
+            asyncio.run(create_async_blob_io().read(-2))
+
+    def test_readinto(self, create_async_blob_io, blob_content):
+        async def readinto():
+            blob_io = create_async_blob_io()
+            buffer = bytearray(4)
+            assert await blob_io.readinto(buffer) == 4
+            assert blob_io.tell() == 4
+            return buffer
+
+        assert asyncio.run(readinto()) == blob_content[:4]
+
+    def test_readinto_beyond_end(self, create_async_blob_io, blob_content):
+        async def readinto():
+            blob_io = create_async_blob_io()
+            buffer = bytearray(len(blob_content) + 4)
+            first_read = await blob_io.readinto(buffer)
+            return first_read, await blob_io.readinto(buffer), buffer
+
+        first_read, second_read, buffer = asyncio.run(readinto())
+        assert first_read == len(blob_content)
+        assert second_read == 0
+        assert buffer[: len(blob_content)] == blob_content
+
+    @pytest.mark.parametrize(
+        "offset,whence,expected_position",
+        [
+            (2, os.SEEK_SET, 2),
+            (2, os.SEEK_CUR, 3),
+            (-2, os.SEEK_END, len(b"blob content") - 2),
+        ],
+    )
+    def test_seek(
+        self, create_async_blob_io, blob_content, offset, whence, expected_position
+    ):
+        async def seek_and_read():
+            blob_io = create_async_blob_io()
+            await blob_io.read(1)
+            assert await blob_io.seek(offset, whence) == expected_position
+            return await blob_io.read()
+
+        assert asyncio.run(seek_and_read()) == blob_content[expected_position:]
+
+    def test_seek_raises_for_negative_position(self, create_async_blob_io):
+        with pytest.raises(ValueError, match="negative position"):
+            asyncio.run(create_async_blob_io().seek(-1))
+
+    def test_readable_seekable_writable(self, create_async_blob_io):
+        read_blob_io = create_async_blob_io(mode="rb")
+        assert read_blob_io.readable()
+        assert read_blob_io.seekable()
+        assert not read_blob_io.writable()
+        write_blob_io = create_async_blob_io(mode="wb")
+        assert not write_blob_io.readable()
+        assert not write_blob_io.seekable()
+        assert write_blob_io.writable()
+
+    @pytest.mark.parametrize(
+        "method,args,blob_io_mode",
+        [
+            ("read", [], "rb"),
+            ("readinto", [bytearray(1)], "rb"),
+            ("seek", [0], "rb"),
+            ("flush", [], "rb"),
+            ("write", [b"content"], "wb"),
+        ],
+    )
+    def test_raises_after_close(self, create_async_blob_io, method, args, blob_io_mode):
+        async def call_after_close():
+            blob_io = create_async_blob_io(mode=blob_io_mode)
+            await blob_io.close()
+            assert blob_io.closed
+            await getattr(blob_io, method)(*args)
+
+        with pytest.raises(ValueError, match="I/O operation on closed file"):
+            asyncio.run(call_after_close())
+
+    @pytest.mark.parametrize(
+        "method,args,blob_io_mode",
+        [
+            ("read", [], "wb"),
+            ("readinto", [bytearray(1)], "wb"),
+            ("seek", [0], "wb"),
+            ("write", [b"content"], "rb"),
+        ],
+    )
+    def test_methods_raise_for_unsupported_modes(
+        self, create_async_blob_io, method, args, blob_io_mode
+    ):
+        blob_io = create_async_blob_io(mode=blob_io_mode)
+        with pytest.raises(io.UnsupportedOperation):
+            asyncio.run(getattr(blob_io, method)(*args))
+
+    def test_write(self, create_async_blob_io, mock_async_azstoragetorch_blob_client):
+        add_async_stage_blocks_results(mock_async_azstoragetorch_blob_client, ["00"])
+
+        async def write():
+            async with create_async_blob_io(mode="wb") as blob_io:
+                assert await blob_io.write(b"a") == 1
+                assert await blob_io.write(b"b") == 1
+                assert blob_io.tell() == 2
+                mock_async_azstoragetorch_blob_client.stage_blocks.assert_not_called()
+
+        asyncio.run(write())
+        mock_async_azstoragetorch_blob_client.stage_blocks.assert_awaited_once_with(
+            b"ab"
+        )
+        mock_async_azstoragetorch_blob_client.commit_block_list.assert_awaited_once_with(
+            ["00"]
+        )
+
+    def test_large_writes_staged_before_close(
+        self, create_async_blob_io, mock_async_azstoragetorch_blob_client
+    ):
+        add_async_stage_blocks_results(
+            mock_async_azstoragetorch_blob_client, ["00", "01"], ["02"]
+        )
+        large_write = random_bytes(EXPECTED_FLUSH_THRESHOLD)
+
+        async def write():
+            async with create_async_blob_io(mode="wb") as blob_io:
+                await blob_io.write(large_write)
+                mock_async_azstoragetorch_blob_client.stage_blocks.assert_awaited_once_with(
+                    large_write
+                )
+                await blob_io.write(b"a")
+
+        asyncio.run(write())
+        assert mock_async_azstoragetorch_blob_client.stage_blocks.await_args == (
+            mock.call(b"a")
+        )
+        mock_async_azstoragetorch_blob_client.commit_block_list.assert_awaited_once_with(
+            ["00", "01", "02"]
+        )
+
+    def test_no_writes_result_in_empty_blob(
+        self, create_async_blob_io, mock_async_azstoragetorch_blob_client
+    ):
+        asyncio.run(create_async_blob_io(mode="wb").close())
+        mock_async_azstoragetorch_blob_client.stage_blocks.assert_not_called()
+        mock_async_azstoragetorch_blob_client.commit_block_list.assert_awaited_once_with(
+            []
+        )
+
+    @pytest.mark.parametrize("method", ["flush", "close"])
+    def test_propagates_stage_block_errors(
+        self, create_async_blob_io, mock_async_azstoragetorch_blob_client, method
+    ):
+        add_async_stage_blocks_results(
+            mock_async_azstoragetorch_blob_client, ["00", AzureError("error")]
+        )
+
+        async def write():
+            blob_io = create_async_blob_io(mode="wb")
+            await blob_io.write(b"content")
+            await getattr(blob_io, method)()
+
+        with pytest.raises(FatalBlobIOWriteError):
+            asyncio.run(write())
+        mock_async_azstoragetorch_blob_client.commit_block_list.assert_not_called()
+
+    def test_continues_to_throw_after_first_fatal_error(
+        self, create_async_blob_io, mock_async_azstoragetorch_blob_client
+    ):
+        add_async_stage_blocks_results(
+            mock_async_azstoragetorch_blob_client, [AzureError("error")]
+        )
+
+        async def write():
+            blob_io = create_async_blob_io(mode="wb")
+            await blob_io.write(b"content")
+            with pytest.raises(FatalBlobIOWriteError):
+                await blob_io.flush()
+            with pytest.raises(FatalBlobIOWriteError):
+                await blob_io.write(b"more-content")
+            with pytest.raises(FatalBlobIOWriteError):
+                await blob_io.close()
+            assert blob_io.closed
+
+        asyncio.run(write())
+        mock_async_azstoragetorch_blob_client.commit_block_list.assert_not_called()
+
+    def test_raises_for_duplicate_block_ids(
+        self, create_async_blob_io, mock_async_azstoragetorch_blob_client
+    ):
+        add_async_stage_blocks_results(
+            mock_async_azstoragetorch_blob_client, ["00"], ["00"]
+        )
+
+        async def write():
+            blob_io = create_async_blob_io(mode="wb")
+            await blob_io.write(b"a")
+            await blob_io.flush()
+            await blob_io.write(b"b")
+            await blob_io.close()
+
+        with pytest.raises(RuntimeError, match="duplicate block IDs"):
+            asyncio.run(write())
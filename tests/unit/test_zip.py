@@ -0,0 +1,170 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import io
+from unittest import mock
+import zipfile
+
+import pytest
+
+from azstoragetorch import _zip
+from tests.unit.utils import random_bytes
+
+
+def create_zip(files, comment=b""):
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+        zf.comment = comment
+    return content.getvalue()
+
+
+def get_expected_central_directory(archive):
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        return zf.start_dir, len(zf.infolist())
+
+
+@pytest.fixture
+def files():
+    return {
+        "archive/data.pkl": random_bytes(100),
+        "archive/data/0": random_bytes(1024),
+        "archive/data/1": random_bytes(10),
+    }
+
+
+class TestFindCentralDirectory:
+    @pytest.mark.parametrize(
+        "comment",
+        [
+            b"",
+            b"comment",
+            # Comment containing end of central directory signature
+            b"PK\x05\x06",
+            b"c" * (2**16 - 1),
+        ],
+    )
+    def test_find_central_directory(self, files, comment):
+        archive = create_zip(files, comment=comment)
+        # Comments are appended after the central directory so expected values can be
+        # computed from the archive without a comment. This also avoids relying on zipfile
+        # to parse archives with comments containing signatures, which it does not support.
+        expected_offset, expected_num_entries = get_expected_central_directory(
+            create_zip(files)
+        )
+        location = _zip.find_central_directory(archive, 0)
+        assert location.offset == expected_offset
+        assert location.num_entries == expected_num_entries
+        assert location.size == len(archive) - expected_offset - 22 - len(comment)
+
+    def test_find_central_directory_from_tail(self, files):
+        archive = create_zip(files)
+        tail_offset = len(archive) - 50
+        location = _zip.find_central_directory(archive[tail_offset:], tail_offset)
+        assert location.offset == get_expected_central_directory(archive)[0]
+
+    def test_find_central_directory_zip64(self, files):
+        # Lower the file count limit to force the archive to be written with
+        # ZIP64 end of central directory records.
+        with mock.patch("zipfile.ZIP_FILECOUNT_LIMIT", 1):
+            archive = create_zip(files)
+        assert b"PK\x06\x06" in archive
+        expected_offset, expected_num_entries = get_expected_central_directory(archive)
+        location = _zip.find_central_directory(archive, 0)
+        assert location.offset == expected_offset
+        assert location.num_entries == expected_num_entries
+
+    def test_zip64_record_not_in_tail(self, files):
+        with mock.patch("zipfile.ZIP_FILECOUNT_LIMIT", 1):
+            archive = create_zip(files)
+        # Only the end of central directory and ZIP64 locator are in the tail
+        tail_offset = len(archive) - 42
+        assert _zip.find_central_directory(archive[tail_offset:], tail_offset) is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"not a zip",
+            random_bytes(1024),
+        ],
+    )
+    def test_returns_none_for_non_zip(self, content):
+        assert _zip.find_central_directory(content, 0) is None
+
+    def test_max_end_of_central_directory_size(self):
+        assert _zip.MAX_END_OF_CENTRAL_DIRECTORY_SIZE == 22 + 65535 + 20 + 56
+
+
+class TestParseCentralDirectory:
+    def get_central_directory(self, archive):
+        location = _zip.find_central_directory(archive, 0)
+        return archive[location.offset : location.offset + location.size]
+
+    def assert_entries_match_zipfile(self, archive, entries):
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            assert entries == [
+                _zip.ZipEntry(
+                    info.filename,
+                    info.header_offset,
+                    info.compress_size,
+                    info.compress_type,
+                )
+                for info in zf.infolist()
+            ]
+
+    def test_parse_central_directory(self, files):
+        archive = create_zip(files)
+        entries = _zip.parse_central_directory(self.get_central_directory(archive))
+        self.assert_entries_match_zipfile(archive, entries)
+
+    def test_parse_central_directory_compressed(self, files):
+        content = io.BytesIO()
+        with zipfile.ZipFile(content, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, data in files.items():
+                zf.writestr(name, data)
+        archive = content.getvalue()
+        entries = _zip.parse_central_directory(self.get_central_directory(archive))
+        assert all(entry.compress_type == zipfile.ZIP_DEFLATED for entry in entries)
+        self.assert_entries_match_zipfile(archive, entries)
+
+    def test_parse_central_directory_utf8_name(self):
+        archive = create_zip({"archive/données.pkl": b"data"})
+        entries = _zip.parse_central_directory(self.get_central_directory(archive))
+        assert entries[0].name == "archive/données.pkl"
+
+    def test_parse_central_directory_zip64_extra_field(self, files):
+        # Lower the offset limit to force header offsets to be written to the
+        # ZIP64 extra field.
+        with mock.patch("zipfile.ZIP64_LIMIT", 1):
+            archive = create_zip(files)
+        central_directory = self.get_central_directory(archive)
+        assert b"\x01\x00" in central_directory
+        entries = _zip.parse_central_directory(central_directory)
+        self.assert_entries_match_zipfile(archive, entries)
+
+    def test_raises_for_invalid_central_directory(self):
+        with pytest.raises(ValueError, match="Invalid central directory"):
+            _zip.parse_central_directory(random_bytes(100))
+
+
+class TestGetLocalFileDataOffset:
+    def test_get_local_file_data_offset(self, files):
+        archive = create_zip(files)
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            for info in zf.infolist():
+                data_offset = _zip.get_local_file_data_offset(
+                    archive[info.header_offset :]
+                )
+                data_start = info.header_offset + data_offset
+                assert (
+                    archive[data_start : data_start + info.compress_size]
+                    == files[info.filename]
+                )
+
+    def test_raises_for_invalid_local_file_header(self):
+        with pytest.raises(ValueError, match="Invalid local file header"):
+            _zip.get_local_file_data_offset(random_bytes(_zip.LOCAL_FILE_HEADER_SIZE))